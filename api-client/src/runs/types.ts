@@ -19,12 +19,11 @@ export type RunStatus =
   | typeof RUN_STATUS_FAILED
   | typeof RUN_STATUS_SUCCEEDED
 
-export interface RunData {
+export interface RunSummaryData {
   id: string
   createdAt: string
   status: RunStatus
   actions: RunAction[]
-  commands: RunCommandSummary[]
   errors: Error[]
   pipettes: unknown[]
   labware: unknown[]
@@ -32,6 +31,10 @@ export interface RunData {
   labwareOffsets?: LabwareOffset[]
 }
 
+export interface RunData extends RunSummaryData {
+  commands: RunCommandSummary[]
+}
+
 export interface VectorOffset {
   x: number
   y: number
@@ -56,8 +59,9 @@ export interface Run {
   links?: ResourceLinks
 }
 
+// GET /runs leaves out each run's commands; get a run to see them
 export interface Runs {
-  data: RunData[]
+  data: RunSummaryData[]
   links?: ResourceLinks
 }
 
@@ -0,0 +1,267 @@
+"""Benchmark path-aware arc heights in ProtocolEngine move planning.
+
+Plans the moves of a few typical protocols with `MotionView`, which only
+clears the labware each arc passes over, and with the previous behavior of
+clearing the tallest labware on the deck. Reports the total Z travel of
+each, the Z travel time that saves at the default Z speed, and how long
+planning each move takes.
+
+Usage:
+    python benchmarks/arc_heights.py --repeat 20
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from opentrons_shared_data.deck import load as load_deck
+from opentrons_shared_data.labware import load_definition
+from opentrons.config.robot_configs import Z_MAX_SPEED
+from opentrons.motion_planning import MoveType, Waypoint, get_waypoints
+from opentrons.protocols.api_support.constants import STANDARD_DECK
+from opentrons.protocols.models import LabwareDefinition
+from opentrons.types import DeckSlotName, MountType, Point
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import UpdateCommandAction
+from opentrons.protocol_engine.resources import DeckDataProvider
+from opentrons.protocol_engine.state import StateStore
+from opentrons.protocol_engine.state.pipettes import CurrentWell
+from opentrons.protocol_engine.types import DeckSlotLocation, PipetteName
+
+# the highest a pipette can travel, with a tip attached
+MAX_TRAVEL_Z = 200.0
+HOME = Point(350, 350, MAX_TRAVEL_Z)
+
+
+class Move(NamedTuple):
+    """A move of a pipette to a well."""
+
+    pipette_id: str
+    labware_id: str
+    well_name: str
+
+
+class Protocol(NamedTuple):
+    """The deck layout and moves of a protocol."""
+
+    name: str
+    labware: Dict[str, Tuple[str, DeckSlotName]]
+    pipettes: Dict[str, Tuple[PipetteName, MountType]]
+    moves: List[Move]
+
+
+def _column_wells(column: int) -> List[str]:
+    return [f"{row}{column}" for row in "ABCDEFGH"]
+
+
+def _serial_dilution() -> Protocol:
+    """Dilute across each row of a plate, with a fresh tip for every transfer."""
+    moves = []
+    tips = iter(w for c in range(1, 13) for w in _column_wells(c))
+
+    for row in "ABCDEFGH":
+        for column in range(1, 12):
+            moves += [
+                Move("single", "tips", next(tips, "A1")),
+                Move("single", "plate", f"{row}{column}"),
+                Move("single", "plate", f"{row}{column + 1}"),
+                Move("single", "fixedTrash", "A1"),
+            ]
+
+    return Protocol(
+        name="serial dilution",
+        labware={
+            "tips": ("opentrons_96_tiprack_300ul", DeckSlotName.SLOT_1),
+            "reservoir": ("nest_12_reservoir_15ml", DeckSlotName.SLOT_2),
+            "plate": ("corning_96_wellplate_360ul_flat", DeckSlotName.SLOT_3),
+            "tubes": (
+                "opentrons_15_tuberack_falcon_15ml_conical",
+                DeckSlotName.SLOT_10,
+            ),
+            "big-tips": ("opentrons_96_tiprack_1000ul", DeckSlotName.SLOT_11),
+        },
+        pipettes={"single": (PipetteName.P300_SINGLE_GEN2, MountType.LEFT)},
+        moves=moves,
+    )
+
+
+def _plate_replication() -> Protocol:
+    """Stamp a source plate into three destination plates with a multi-channel."""
+    moves = []
+
+    for column in range(1, 13):
+        moves += [Move("multi", "tips", f"A{column}")]
+        for dest in ("dest-1", "dest-2", "dest-3"):
+            moves += [
+                Move("multi", "source", f"A{column}"),
+                Move("multi", dest, f"A{column}"),
+            ]
+        moves += [Move("multi", "fixedTrash", "A1")]
+
+    return Protocol(
+        name="plate replication",
+        labware={
+            "tips": ("opentrons_96_tiprack_300ul", DeckSlotName.SLOT_4),
+            "source": ("biorad_96_wellplate_200ul_pcr", DeckSlotName.SLOT_1),
+            "dest-1": ("biorad_96_wellplate_200ul_pcr", DeckSlotName.SLOT_2),
+            "dest-2": ("biorad_96_wellplate_200ul_pcr", DeckSlotName.SLOT_3),
+            "dest-3": ("biorad_96_wellplate_200ul_pcr", DeckSlotName.SLOT_5),
+            "tubes": ("opentrons_15_tuberack_falcon_15ml_conical", DeckSlotName.SLOT_9),
+        },
+        pipettes={"multi": (PipetteName.P300_MULTI_GEN2, MountType.RIGHT)},
+        moves=moves,
+    )
+
+
+def _create_state_store(protocol: Protocol) -> StateStore:
+    deck_definition = load_deck(STANDARD_DECK, 2)
+    fixed_labware = asyncio.run(
+        DeckDataProvider().get_deck_fixed_labware(deck_definition)
+    )
+    subject = StateStore(
+        deck_definition=deck_definition,
+        deck_fixed_labware=fixed_labware,
+    )
+
+    for labware_id, (load_name, slot) in protocol.labware.items():
+        definition = LabwareDefinition.parse_obj(load_definition(load_name, 1))
+        subject.handle_action(
+            UpdateCommandAction(
+                command=commands.LoadLabware(
+                    id=f"load-{labware_id}",
+                    status=commands.CommandStatus.SUCCEEDED,
+                    createdAt=datetime.now(),
+                    params=commands.LoadLabwareParams(
+                        loadName=load_name,
+                        namespace=definition.namespace,
+                        version=definition.version,
+                        location=DeckSlotLocation(slotName=slot),
+                    ),
+                    result=commands.LoadLabwareResult(
+                        labwareId=labware_id, definition=definition, offsetId=None
+                    ),
+                )
+            )
+        )
+
+    for pipette_id, (pipette_name, mount) in protocol.pipettes.items():
+        subject.handle_action(
+            UpdateCommandAction(
+                command=commands.LoadPipette(
+                    id=f"load-{pipette_id}",
+                    status=commands.CommandStatus.SUCCEEDED,
+                    createdAt=datetime.now(),
+                    params=commands.LoadPipetteParams(
+                        pipetteName=pipette_name, mount=mount
+                    ),
+                    result=commands.LoadPipetteResult(pipetteId=pipette_id),
+                )
+            )
+        )
+
+    return subject
+
+
+Planner = Callable[[StateStore, Move, Point, Optional[CurrentWell]], List[Waypoint]]
+
+
+def plan_path_aware(
+    subject: StateStore, move: Move, origin: Point, current_well: Optional[CurrentWell]
+) -> List[Waypoint]:
+    """Plan a move with MotionView, clearing labware along the path."""
+    return subject.motion.get_movement_waypoints(
+        pipette_id=move.pipette_id,
+        labware_id=move.labware_id,
+        well_name=move.well_name,
+        well_location=None,
+        origin=origin,
+        origin_cp=None,
+        max_travel_z=MAX_TRAVEL_Z,
+        current_well=current_well,
+    )
+
+
+def plan_deck_highest(
+    subject: StateStore, move: Move, origin: Point, current_well: Optional[CurrentWell]
+) -> List[Waypoint]:
+    """Plan a move that clears the tallest labware on the deck, as before."""
+    if (
+        current_well is not None
+        and current_well.pipette_id == move.pipette_id
+        and current_well.labware_id == move.labware_id
+    ):
+        return plan_path_aware(subject, move, origin, current_well)
+
+    return get_waypoints(
+        move_type=MoveType.GENERAL_ARC,
+        origin=origin,
+        dest=subject.geometry.get_well_position(move.labware_id, move.well_name),
+        min_travel_z=subject.geometry.get_all_labware_highest_z(),
+        max_travel_z=MAX_TRAVEL_Z,
+    )
+
+
+class Result(NamedTuple):
+    """The total Z travel of a protocol's moves, and the time to plan them."""
+
+    z_travel_mm: float
+    planning_sec: float
+
+
+def run_protocol(subject: StateStore, moves: Sequence[Move], plan: Planner) -> Result:
+    """Plan every move of a protocol in order, starting from home."""
+    position = HOME
+    current_well = None
+    z_travel = 0.0
+    planning_sec = 0.0
+
+    for move in moves:
+        start = time.perf_counter()
+        waypoints = plan(subject, move, position, current_well)
+        planning_sec += time.perf_counter() - start
+
+        for waypoint in waypoints:
+            z_travel += abs(waypoint.position.z - position.z)
+            position = waypoint.position
+
+        current_well = CurrentWell(move.pipette_id, move.labware_id, move.well_name)
+
+    return Result(z_travel_mm=z_travel, planning_sec=planning_sec)
+
+
+def main() -> None:
+    """Plan each protocol's moves both ways and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="times to plan each protocol"
+    )
+    args = parser.parse_args()
+
+    for protocol in (_serial_dilution(), _plate_replication()):
+        subject = _create_state_store(protocol)
+        moves = protocol.moves
+        print(f"{protocol.name} ({len(moves)} moves):")
+
+        results = {}
+        for name, plan in (
+            ("deck highest", plan_deck_highest),
+            ("path aware", plan_path_aware),
+        ):
+            runs = [run_protocol(subject, moves, plan) for _ in range(args.repeat)]
+            results[name] = runs[0]
+            planning_us = min(r.planning_sec for r in runs) / len(moves) * 1e6
+            print(
+                f"  {name:<12} z travel: {runs[0].z_travel_mm:9.1f} mm"
+                f" ({runs[0].z_travel_mm / Z_MAX_SPEED:6.1f} s)"
+                f"   planning: {planning_us:6.1f} us/move"
+            )
+
+        saved = results["deck highest"].z_travel_mm - results["path aware"].z_travel_mm
+        print(
+            f"  saved        z travel: {saved:9.1f} mm ({saved / Z_MAX_SPEED:6.1f} s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
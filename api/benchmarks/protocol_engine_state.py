@@ -0,0 +1,116 @@
+"""Benchmark ProtocolEngine state handling for long runs.
+
+Queues a large number of commands into a StateStore, then runs each one
+to completion, dispatching the same actions the engine's QueueWorker and
+CommandExecutor would. Queueing is also timed with every action dispatched
+inside a single `StateStore.batch`, like a plugin's `dispatch_many` would.
+
+Usage:
+    python benchmarks/protocol_engine_state.py --count 50000
+"""
+import argparse
+import time
+from datetime import datetime
+from typing import Callable, Iterator
+
+from opentrons_shared_data.deck import load as load_deck
+from opentrons.protocols.api_support.constants import STANDARD_DECK
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import QueueCommandAction, UpdateCommandAction
+from opentrons.protocol_engine.state import StateStore
+
+
+def _create_state_store() -> StateStore:
+    return StateStore(
+        deck_definition=load_deck(STANDARD_DECK, 2),
+        deck_fixed_labware=[],
+    )
+
+
+def _command_ids(count: int) -> Iterator[str]:
+    return (f"command-{i}" for i in range(count))
+
+
+def queue_commands(subject: StateStore, count: int) -> None:
+    """Queue `count` home commands."""
+    created_at = datetime.now()
+    request = commands.HomeCreate(params=commands.HomeParams())
+
+    for command_id in _command_ids(count):
+        subject.handle_action(
+            QueueCommandAction(
+                command_id=command_id,
+                created_at=created_at,
+                request=request,
+            )
+        )
+
+
+def queue_commands_batched(subject: StateStore, count: int) -> None:
+    """Queue `count` home commands inside a single batch."""
+    with subject.batch():
+        queue_commands(subject, count)
+
+
+def complete_commands(subject: StateStore, count: int) -> None:
+    """Move every queued command through running to succeeded.
+
+    Like the engine's QueueWorker, this asks the state for the next queued
+    command before running each one.
+    """
+    started_at = datetime.now()
+
+    for _ in range(count):
+        command_id = subject.commands.get_next_queued()
+        assert command_id is not None
+        queued_command = subject.commands.get(command_id)
+        running_command = queued_command.copy(
+            update={"status": commands.CommandStatus.RUNNING, "startedAt": started_at}
+        )
+        subject.handle_action(UpdateCommandAction(command=running_command))
+
+        completed_command = running_command.copy(
+            update={
+                "status": commands.CommandStatus.SUCCEEDED,
+                "completedAt": started_at,
+            }
+        )
+        subject.handle_action(UpdateCommandAction(command=completed_command))
+
+
+def _time(name: str, count: int, func: Callable[[], None]) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    per_command_us = elapsed / count * 1e6 if count else 0.0
+    print(f"{name}: {elapsed:.3f} s ({per_command_us:.1f} us/command)")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=50000,
+        help="Number of commands to queue and complete",
+    )
+    args = parser.parse_args()
+    count: int = args.count
+    subject = _create_state_store()
+
+    print(f"protocol_engine_state: {count} commands")
+    _time("queue", count, lambda: queue_commands(subject, count))
+    _time("complete", count, lambda: complete_commands(subject, count))
+
+    assert subject.commands.get_all_complete()
+    assert subject.commands.get_next_queued() is None
+
+    batched_subject = _create_state_store()
+    _time(
+        "queue (batched)", count, lambda: queue_commands_batched(batched_subject, count)
+    )
+
+
+if __name__ == "__main__":
+    main()
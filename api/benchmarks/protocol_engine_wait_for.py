@@ -0,0 +1,123 @@
+"""Benchmark StateStore.wait_for with many concurrent waiters.
+
+Queues a batch of commands, starts one waiter per command that waits for
+that command to complete, then runs every command to completion.
+
+Waiters are run twice: once waiting on the CommandView's `get_is_complete`
+selector, which the StateStore knows to wake only for changes to that
+command, and once through an opaque lambda, which must be re-checked after
+every action.
+
+Usage:
+    python benchmarks/protocol_engine_wait_for.py --waiters 1000
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from typing import List
+
+from opentrons_shared_data.deck import load as load_deck
+from opentrons.protocols.api_support.constants import STANDARD_DECK
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import QueueCommandAction, UpdateCommandAction
+from opentrons.protocol_engine.state import StateStore
+
+
+def _create_state_store(count: int) -> StateStore:
+    subject = StateStore(
+        deck_definition=load_deck(STANDARD_DECK, 2),
+        deck_fixed_labware=[],
+    )
+    created_at = datetime.now()
+    request = commands.HomeCreate(params=commands.HomeParams())
+
+    for i in range(count):
+        subject.handle_action(
+            QueueCommandAction(
+                command_id=f"command-{i}",
+                created_at=created_at,
+                request=request,
+            )
+        )
+
+    return subject
+
+
+async def _run_commands(subject: StateStore) -> None:
+    started_at = datetime.now()
+
+    while True:
+        command_id = subject.commands.get_next_queued()
+
+        if command_id is None:
+            break
+
+        running_command = subject.commands.get(command_id).copy(
+            update={"status": commands.CommandStatus.RUNNING, "startedAt": started_at}
+        )
+        subject.handle_action(UpdateCommandAction(command=running_command))
+        await asyncio.sleep(0)
+
+        completed_command = running_command.copy(
+            update={
+                "status": commands.CommandStatus.SUCCEEDED,
+                "completedAt": started_at,
+            }
+        )
+        subject.handle_action(UpdateCommandAction(command=completed_command))
+        await asyncio.sleep(0)
+
+
+async def run_waiters(count: int, selective: bool) -> float:
+    """Run `count` commands, each with its own waiter, returning elapsed time."""
+    subject = _create_state_store(count)
+    command_ids = [f"command-{i}" for i in range(count)]
+    waiters: List["asyncio.Task[bool]"] = []
+
+    for command_id in command_ids:
+        if selective:
+            waiter = subject.wait_for(
+                subject.commands.get_is_complete,
+                command_id=command_id,
+            )
+        else:
+            waiter = subject.wait_for(
+                lambda command_id=command_id: subject.commands.get_is_complete(
+                    command_id
+                )
+            )
+
+        waiters.append(asyncio.create_task(waiter))
+
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await _run_commands(subject)
+    await asyncio.gather(*waiters)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--waiters",
+        type=int,
+        default=1000,
+        help="Number of commands to run, each with a concurrent waiter",
+    )
+    args = parser.parse_args()
+    count: int = args.waiters
+
+    print(f"protocol_engine_wait_for: {count} waiters")
+
+    for name, selective in [("selective", True), ("broadcast", False)]:
+        elapsed = asyncio.run(run_waiters(count, selective))
+        per_action_us = elapsed / (2 * count) * 1e6 if count else 0.0
+        print(f"{name}: {elapsed:.3f} s ({per_action_us:.1f} us/action)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmark simulating protocols with `opentrons.simulate`.
+
+Simulates each protocol the g-code-testing project runs, the way
+`opentrons_simulate` does, and reports how long each takes, per command in its
+run log. Then times a single call of a method decorated with `@publish`, with
+and without a subscriber to its command messages, to show what publishing
+costs each command.
+
+Usage:
+    python benchmarks/protocol_simulation.py --repeat 3
+"""
+import argparse
+import logging
+import time
+from pathlib import Path
+from typing import List
+
+from opentrons.broker import Broker
+from opentrons.commands import types as command_types
+from opentrons.commands.publisher import CommandPublisher, publish
+from opentrons.protocols.execution.errors import ExceptionInProtocolError
+from opentrons.simulate import simulate
+
+PROTOCOLS_DIR = (
+    Path(__file__).parents[2]
+    / "g-code-testing"
+    / "g_code_test_data"
+    / "protocol"
+    / "protocols"
+)
+
+
+def _get_protocols() -> List[Path]:
+    return sorted(p for p in PROTOCOLS_DIR.glob("*.py") if p.name != "__init__.py")
+
+
+def _simulate(protocol: Path) -> int:
+    with protocol.open() as protocol_file:
+        run_log, _ = simulate(protocol_file, file_name=protocol.name)
+
+    return len(run_log)
+
+
+def _time_protocol(protocol: Path, repeat: int) -> None:
+    # simulate once first, to load labware definitions and warm up caches
+    try:
+        commands = _simulate(protocol)
+    except ExceptionInProtocolError as error:
+        # some protocols use modules only the g-code-testing emulator supports
+        print(
+            f"  {protocol.stem:<28} skipped: {str(error.original_exc).splitlines()[0]}"
+        )
+        return
+
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        _simulate(protocol)
+
+    elapsed = (time.perf_counter() - start) / repeat
+    print(
+        f"  {protocol.stem:<28} {elapsed * 1000:9.1f} ms"
+        f" {commands:>6} commands {elapsed / commands * 1e6:8.1f} us/command"
+    )
+
+
+def _aspirate_command(location: str, volume: float) -> command_types.Command:
+    return {  # type: ignore[return-value]
+        "name": command_types.ASPIRATE,
+        "payload": {"text": f"Aspirating {volume} uL from {location}"},
+    }
+
+
+class _Subject(CommandPublisher):
+    @publish(command=_aspirate_command)
+    def act(self, location: str, volume: float, rate: float = 1.0) -> None:
+        pass
+
+
+def _time_publish(label: str, subject: _Subject, calls: int) -> None:
+    start = time.perf_counter()
+
+    for _ in range(calls):
+        subject.act("A1 of plate", 10, rate=0.5)
+
+    elapsed = (time.perf_counter() - start) / calls
+    print(f"  {label:<28} {elapsed * 1e6:9.2f} us/call")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--calls", type=int, default=100000)
+    args = parser.parse_args()
+
+    # simulate logs warnings, like deprecation notices, that aren't of interest
+    logging.getLogger("opentrons").setLevel(logging.ERROR)
+
+    print("Simulating g-code-testing protocols:")
+    for protocol in _get_protocols():
+        _time_protocol(protocol, args.repeat)
+
+    print("Calling a @publish decorated method:")
+    subscribed = _Subject(broker=Broker())  # type: ignore[no-untyped-call]
+    subscribed.broker.subscribe(command_types.COMMAND, lambda message: None)
+    _time_publish("with a subscriber", subscribed, args.calls)
+    unsubscribed = _Subject(broker=Broker())  # type: ignore[no-untyped-call]
+    _time_publish("without subscribers", unsubscribed, args.calls)
+
+
+if __name__ == "__main__":
+    main()
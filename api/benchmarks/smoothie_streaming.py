@@ -0,0 +1,86 @@
+"""Benchmark SmoothieDriver moves with and without streaming.
+
+Runs a Smoothie emulator in-process, connects a SmoothieDriver to it over a
+local socket, then sends a series of short gantry moves, like the segments
+of an arc, and reads back the position at the end.
+
+The emulator executes moves instantly, so the timings here only reflect the
+cost of round-trips between the driver and the Smoothie. On a robot, each
+M400 also stops the gantry dead until the Smoothie's planner has drained.
+
+Usage:
+    python benchmarks/smoothie_streaming.py --moves 500
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, Tuple
+
+from opentrons.config.robot_configs import build_config
+from opentrons.drivers.smoothie_drivers import SmoothieDriver
+from opentrons.drivers.smoothie_drivers.constants import GCODE
+from opentrons.hardware_control.emulation.connection_handler import (
+    ConnectionHandler,
+)
+from opentrons.hardware_control.emulation.parser import Parser
+from opentrons.hardware_control.emulation.settings import SmoothieSettings
+from opentrons.hardware_control.emulation.smoothie import SmoothieEmulator
+
+
+async def run_moves(count: int, streaming: bool) -> Tuple[float, Dict[str, int]]:
+    """Run `count` moves, returning elapsed time and GCODE counts."""
+    emulator = SmoothieEmulator(parser=Parser(), settings=SmoothieSettings())
+    server = await asyncio.start_server(ConnectionHandler(emulator), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    driver = await SmoothieDriver.build(
+        port=f"socket://127.0.0.1:{port}",
+        config=build_config({}),
+        streaming_moves=streaming,
+    )
+
+    try:
+        await driver.home()
+        emulator.reset()
+
+        start = time.perf_counter()
+
+        for i in range(count):
+            await driver.move({"X": 100 + i % 10, "Y": 100 + i % 7, "Z": 150})
+
+        await driver.update_position()
+        elapsed = time.perf_counter() - start
+    finally:
+        await driver.disconnect()
+        server.close()
+        await server.wait_closed()
+
+    return elapsed, emulator.get_gcode_counts()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--moves",
+        type=int,
+        default=500,
+        help="Number of moves to send",
+    )
+    args = parser.parse_args()
+    count: int = args.moves
+
+    print(f"smoothie_streaming: {count} moves")
+
+    for name, streaming in [("streaming", True), ("synchronized", False)]:
+        elapsed, gcode_counts = asyncio.run(run_moves(count, streaming))
+        per_move_us = elapsed / count * 1e6 if count else 0.0
+        waits = gcode_counts.get(GCODE.WAIT.value, 0)
+        print(
+            f"{name}: {elapsed:.3f} s ({per_move_us:.1f} us/move), "
+            f"{waits} M400 round-trips"
+        )
+
+
+if __name__ == "__main__":
+    main()
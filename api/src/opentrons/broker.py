@@ -124,5 +124,9 @@ class Broker:
     def publish(self, topic, message):
         [handler(message) for handler in self.subscriptions.get(topic, [])]
 
+    def has_subscribers(self, topic: str) -> bool:
+        """Check whether anything is subscribed to messages of a topic."""
+        return len(self.subscriptions.get(topic, ())) > 0
+
     def set_logger(self, logger):
         self.logger = logger
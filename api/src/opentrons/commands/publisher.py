@@ -1,7 +1,8 @@
 import functools
 import inspect
+import logging
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator, Optional, TypeVar, cast
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar, cast
 
 from opentrons.broker import Broker
 from opentrons.config import feature_flags
@@ -42,18 +43,19 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
     """Publish messages before and after the decorated function has run."""
 
     def _decorator(func: FuncT) -> FuncT:
+        get_command_args = _CommandArgsMapper(func, command)
+
         @functools.wraps(func)
         def _decorated(*args: Any, **kwargs: Any) -> Any:
             """Use the args passed to wrapped `func` to build the message payload.
 
-            1. Inspect signature of `func` and bind arguments to signature to map
-               argument names to called (and/or default) values.
-            2. Inspect signature of `command` and map values from `func` call to
-               argument names expected by `command`.
-            3. Map `self` argument of `func` to the `instrument` argument of `command`,
+            1. If nothing would receive the messages, return the value of calling
+               `func` with `*args` and `**kwargs` without building a payload.
+            2. Map the values from the `func` call to the argument names expected
+               by `command`, and `self` to `command`'s `instrument` argument,
                where applicable.
-            4. Construct the command payload and publish it using `publish_context`
-            5. Return the value of calling `func` with `*args` and `**kwargs`
+            3. Construct the command payload and publish it using `publish_context`
+            4. Return the value of calling `func` with `*args` and `**kwargs`
             """
 
             broker = getattr(args[0], "broker", None)
@@ -62,33 +64,10 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
                 broker, Broker
             ), "Only methods of CommandPublisher classes should be decorated."
 
-            func_sig = _inspect_signature(func)
-            bound_func_args = func_sig.bind(*args, **kwargs)
-            bound_func_args.apply_defaults()
-            func_args = bound_func_args.arguments
-
-            message_creator_sig = _inspect_signature(command)
-            message_creator_arg_names = set(message_creator_sig.parameters.keys())
-            message_creator_args = {
-                n: func_args[n] for n in message_creator_arg_names if n in func_args
-            }
-
-            # TODO (artyom, 20170927): we are doing this to be able to use
-            # the decorator in Instrument class methods, in which case
-            # self is effectively an instrument.
-            # To narrow the scope of this hack, we are checking if the
-            # command is expecting instrument first.
-            # We are also checking if call arguments have 'self' and
-            # don't have instruments specified, in which case
-            # instruments should take precedence.
-            if (
-                "instrument" in message_creator_arg_names
-                and "instrument" not in message_creator_args
-                and "self" in func_args
-            ):
-                message_creator_args["instrument"] = func_args["self"]
-
-            command_message = command(**message_creator_args)
+            if not _is_published(broker):
+                return func(*args, **kwargs)
+
+            command_message = command(**get_command_args(args, kwargs))
 
             with publish_context(broker=broker, command=command_message):
                 return func(*args, **kwargs)
@@ -105,6 +84,10 @@ def publish_context(broker: Broker, command: CommandPayload) -> Iterator[None]:
     If an `error` is raised in the `with` block, it will be published in the "after"
     message (if the ProtocolEngine is enabled) and re-raised.
     """
+    if not _is_published(broker):
+        yield
+        return
+
     capture_errors = feature_flags.enable_protocol_engine()
 
     _do_publish(broker=broker, command=command, when="before")
@@ -118,10 +101,114 @@ def publish_context(broker: Broker, command: CommandPayload) -> Iterator[None]:
         _do_publish(broker=broker, command=command, when="after")
 
 
-@functools.lru_cache(maxsize=None)
-def _inspect_signature(func: Callable[..., Any]) -> inspect.Signature:
-    """Inspect function signatures, memoized because it is called very often."""
-    return inspect.signature(func)
+class _CommandArgsMapper:
+    """Map a decorated function's call arguments to its command creator's arguments.
+
+    Binding every call's arguments to the function's signature is slow enough to
+    show up in long protocol simulations, so where each command argument comes
+    from is worked out once, when the function is decorated, and calls are mapped
+    by parameter position, name, and default. Calls that can't be mapped that way,
+    like ones that would fail to bind, fall back to binding the signature.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        command: CommandPayloadCreator,
+    ) -> None:
+        self._func_sig = inspect.signature(func)
+        func_params = self._func_sig.parameters
+        command_arg_names = inspect.signature(command).parameters.keys()
+
+        # (command argument name, func parameter name) pairs
+        self._sources = [(n, n) for n in command_arg_names if n in func_params]
+
+        # TODO (artyom, 20170927): we are doing this to be able to use
+        # the decorator in Instrument class methods, in which case
+        # self is effectively an instrument.
+        # To narrow the scope of this hack, we are checking if the
+        # command is expecting instrument first.
+        # We are also checking if call arguments have 'self' and
+        # don't have instruments specified, in which case
+        # instruments should take precedence.
+        if (
+            "instrument" in command_arg_names
+            and "instrument" not in func_params
+            and "self" in func_params
+        ):
+            self._sources.append(("instrument", "self"))
+
+        self._params = func_params
+        self._positions = {
+            name: index
+            for index, (name, p) in enumerate(func_params.items())
+            if p.kind == p.POSITIONAL_OR_KEYWORD
+        }
+        self._defaults = {
+            name: p.default
+            for name, p in func_params.items()
+            if p.default is not p.empty
+        }
+        self._required = [n for n in func_params if n not in self._defaults]
+        self._always_bind = any(
+            p.kind not in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+            for p in func_params.values()
+        )
+
+    def __call__(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the command creator's arguments for a call of the function."""
+        # let binding raise the TypeError for a call that doesn't match the function
+        if self._always_bind or not self._matches(args, kwargs):
+            return self._bind(args, kwargs)
+
+        arg_count = len(args)
+        command_args = {}
+
+        for name, source in self._sources:
+            position = self._positions.get(source, arg_count)
+
+            if position < arg_count:
+                command_args[name] = args[position]
+            elif source in kwargs:
+                command_args[name] = kwargs[source]
+            else:
+                command_args[name] = self._defaults[source]
+
+        return command_args
+
+    def _matches(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> bool:
+        arg_count = len(args)
+
+        if arg_count > len(self._positions):
+            return False
+
+        for name in kwargs:
+            position = self._positions.get(name, arg_count)
+
+            if name not in self._params or position < arg_count:
+                return False
+
+        for name in self._required:
+            position = self._positions.get(name, arg_count)
+
+            if position >= arg_count and name not in kwargs:
+                return False
+
+        return True
+
+    def _bind(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        bound_func_args = self._func_sig.bind(*args, **kwargs)
+        bound_func_args.apply_defaults()
+        func_args = bound_func_args.arguments
+
+        return {name: func_args[source] for name, source in self._sources}
+
+
+def _is_published(broker: Broker) -> bool:
+    """Check whether command messages would reach any subscriber or log."""
+    return broker.has_subscribers(COMMAND_TOPIC) or broker.logger.isEnabledFor(
+        logging.INFO
+    )
 
 
 def _do_publish(
@@ -140,7 +227,7 @@ def _do_publish(
         "error": error,
     }
 
-    if when == "before":
+    if when == "before" and broker.logger.isEnabledFor(logging.INFO):
         payload_str = ", ".join(f"{k}: {v}" for k, v in payload.items() if k != "text")
         broker.logger.info(f"{name}: {payload_str}")
 
@@ -182,6 +182,16 @@ settings = [
         ),
         restart_required=True,
     ),
+    SettingDefinition(
+        _id="enableStreamingMoves",
+        title="Enable experimental streaming moves",
+        description=(
+            "Send gantry moves to the motor controller without waiting for "
+            "each one to complete, so consecutive moves blend instead of "
+            "stopping in between."
+        ),
+        restart_required=True,
+    ),
 ]
 
 if ARCHITECTURE == SystemArchitecture.BUILDROOT:
@@ -404,6 +414,16 @@ def _migrate9to10(previous: SettingsMap) -> SettingsMap:
     return newmap
 
 
+def _migrate10to11(previous: SettingsMap) -> SettingsMap:
+    """Migrate to version 11 of the feature flags file.
+
+    - Adds the enableStreamingMoves config element.
+    """
+    newmap = {k: v for k, v in previous.items()}
+    newmap["enableStreamingMoves"] = None
+    return newmap
+
+
 _MIGRATIONS = [
     _migrate0to1,
     _migrate1to2,
@@ -415,6 +435,7 @@ _MIGRATIONS = [
     _migrate7to8,
     _migrate8to9,
     _migrate9to10,
+    _migrate10to11,
 ]
 """
 List of all migrations to apply, indexed by (version - 1). See _migrate below
@@ -37,3 +37,9 @@ def enable_protocol_engine() -> bool:
 
 def disable_fast_protocol_upload() -> bool:
     return advs.get_setting_with_env_overload("disableFastProtocolUpload")
+
+
+def enable_streaming_moves() -> bool:
+    """Get if gantry moves should be sent to the Smoothie without waiting."""
+
+    return advs.get_setting_with_env_overload("enableStreamingMoves")
@@ -1,16 +1,31 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
-from concurrent.futures.thread import ThreadPoolExecutor
 from functools import partial
-from typing import Optional, Generator
+from typing import Optional
 
-from serial import Serial, serial_for_url  # type: ignore[import]
+from serial import (  # type: ignore[import]
+    Serial,
+    SerialTimeoutException,
+    serial_for_url,
+)
+
+# The most bytes to take from the port each time it's readable.
+READ_CHUNK_SIZE = 4096
+
+# How often to check a port that the event loop can't watch.
+POLL_INTERVAL_SECONDS = 0.01
 
 
 class AsyncSerial:
-    """Async wrapper around Serial."""
+    """Async wrapper around Serial.
+
+    The port is opened in non-blocking mode and its file descriptor is
+    watched by the event loop, so every connection shares the loop's thread
+    rather than each needing a thread of its own. Data is buffered as it
+    arrives, and reads wait for their match to show up in that buffer.
+    Ports without a file descriptor the loop can watch are polled instead.
+    """
 
     @classmethod
     async def create(
@@ -35,43 +50,55 @@ class AsyncSerial:
              writing to it
         """
         loop = loop or asyncio.get_running_loop()
-        executor = ThreadPoolExecutor(max_workers=1)
         serial = await loop.run_in_executor(
-            executor=executor,
+            executor=None,
             func=partial(
                 serial_for_url,
                 url=port,
                 baudrate=baud_rate,
-                timeout=timeout,
-                write_timeout=write_timeout,
+                timeout=0,
+                write_timeout=0,
             ),
         )
         return cls(
             serial=serial,
-            executor=executor,
             loop=loop,
             reset_buffer_before_write=reset_buffer_before_write,
+            timeout=timeout,
+            write_timeout=write_timeout,
         )
 
     def __init__(
         self,
         serial: Serial,
-        executor: ThreadPoolExecutor,
         loop: asyncio.AbstractEventLoop,
         reset_buffer_before_write: bool,
+        timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
     ) -> None:
         """
         Constructor
 
         Args:
-            serial: connected Serial object
-            executor: a thread pool executor
+            serial: connected Serial object, with zero (non-blocking) timeouts
             loop: event loop
+            reset_buffer_before_write: reset the serial input buffer before
+             writing to it
+            timeout: optional default read timeout in seconds
+            write_timeout: optional default write timeout in seconds
         """
         self._serial = serial
-        self._executor = executor
         self._loop = loop
         self._reset_buffer_before_write = reset_buffer_before_write
+        self._timeout = timeout
+        self._write_timeout = write_timeout
+        self._buffer = bytearray()
+        self._fileno: Optional[int] = None
+        self._read_error: Optional[Exception] = None
+        self._read_waiter: Optional[asyncio.Future[None]] = None
+
+        if serial.is_open:
+            self._add_reader()
 
     async def read_until(self, match: bytes, timeout: Optional[float] = None) -> bytes:
         """
@@ -83,13 +110,36 @@ class AsyncSerial:
                 of parameter supplied to `create`
 
         Returns:
-            read data.
+            read data, up to and including match. if the timeout expires
+            first, whatever has been read so far.
         """
-        with self._timeout_override("timeout", timeout):
-            return await self._loop.run_in_executor(
-                executor=self._executor,
-                func=partial(self._serial.read_until, expected=match),
-            )
+        timeout = self._timeout if timeout is None else timeout
+        deadline = None if timeout is None else self._loop.time() + timeout
+        search_start = 0
+
+        while True:
+            index = self._buffer.find(match, search_start)
+            if index >= 0:
+                end = index + len(match)
+                response = bytes(self._buffer[:end])
+                del self._buffer[:end]
+                return response
+
+            if self._read_error is not None:
+                raise self._read_error
+
+            # Only search new data next time, allowing for a match that
+            # straddles what we already have and what's still to come.
+            search_start = max(0, len(self._buffer) - len(match) + 1)
+            time_left = None if deadline is None else deadline - self._loop.time()
+            if time_left is not None and time_left <= 0:
+                break
+
+            await self._wait_for_data(time_left)
+
+        response = bytes(self._buffer)
+        self._buffer.clear()
+        return response
 
     async def write(self, data: bytes, timeout: Optional[float] = None) -> None:
         """
@@ -102,27 +152,20 @@ class AsyncSerial:
 
         Returns:
             None
-        """
-        await self._loop.run_in_executor(
-            executor=self._executor,
-            func=lambda: self._sync_write(data=data, timeout=timeout),
-        )
 
-    def _sync_write(self, data: bytes, timeout: Optional[float] = None) -> None:
+        Raises:
+            SerialTimeoutException: the data could not all be written in time.
         """
-        The synchronous write function
+        timeout = self._write_timeout if timeout is None else timeout
 
-        Args:
-            data: data to write.
-            timeout: optional timeout in seconds.
+        if self._reset_buffer_before_write:
+            self._serial.reset_input_buffer()
+            self._buffer.clear()
 
-        Returns:
-            None
-        """
-        with self._timeout_override("write_timeout", timeout):
-            if self._reset_buffer_before_write:
-                self._serial.reset_input_buffer()
-            self._serial.write(data=data)
+        try:
+            await asyncio.wait_for(self._write_all(data), timeout)
+        except asyncio.TimeoutError as e:
+            raise SerialTimeoutException("Write timeout") from e
 
     async def open(self) -> None:
         """
@@ -130,9 +173,8 @@ class AsyncSerial:
 
         Returns: None
         """
-        return await self._loop.run_in_executor(
-            executor=self._executor, func=self._serial.open
-        )
+        await self._loop.run_in_executor(executor=None, func=self._serial.open)
+        self._add_reader()
 
     async def close(self) -> None:
         """
@@ -140,9 +182,9 @@ class AsyncSerial:
 
         Returns: None
         """
-        return await self._loop.run_in_executor(
-            executor=self._executor, func=self._serial.close
-        )
+        self._remove_reader()
+        self._buffer.clear()
+        self._serial.close()
 
     async def is_open(self) -> bool:
         """
@@ -152,17 +194,83 @@ class AsyncSerial:
         """
         return self._serial.is_open is True
 
-    @contextlib.contextmanager
-    def _timeout_override(
-        self, timeout_property: str, timeout: Optional[float]
-    ) -> Generator[None, None, None]:
-        """Context manager that will temporarily override the default timeout."""
-        default_timeout = getattr(self._serial, timeout_property)
-        override = timeout is not None and default_timeout != timeout
+    async def _write_all(self, data: bytes) -> None:
+        """Write data as the port accepts it, waiting while its buffer is full."""
+        while data:
+            written = self._serial.write(data)
+            data = data[len(data) if written is None else written :]
+
+            fileno = self._fileno
+            if data and fileno is None:
+                await asyncio.sleep(POLL_INTERVAL_SECONDS)
+            elif data and fileno is not None:
+                writable = self._loop.create_future()
+                self._loop.add_writer(fileno, writable.set_result, None)
+                try:
+                    await writable
+                finally:
+                    self._loop.remove_writer(fileno)
+
+    async def _wait_for_data(self, timeout: Optional[float]) -> None:
+        """Wait until new data has been buffered, or the timeout expires."""
+        if self._fileno is None:
+            await asyncio.sleep(
+                POLL_INTERVAL_SECONDS
+                if timeout is None
+                else min(timeout, POLL_INTERVAL_SECONDS)
+            )
+            self._read_available()
+            return
+
+        self._read_waiter = self._loop.create_future()
         try:
-            if override:
-                setattr(self._serial, timeout_property, timeout)
-            yield
+            await asyncio.wait_for(self._read_waiter, timeout)
+        except asyncio.TimeoutError:
+            pass
         finally:
-            if override:
-                setattr(self._serial, timeout_property, default_timeout)
+            self._read_waiter = None
+
+    def _add_reader(self) -> None:
+        """Start buffering data from the port as soon as it arrives."""
+        self._read_error = None
+
+        try:
+            fileno = self._serial.fileno()
+            self._loop.add_reader(fileno, self._on_readable)
+        except (OSError, NotImplementedError):
+            # The port doesn't have a file descriptor (e.g. a loop:// url),
+            # or the event loop can't watch it; poll it instead.
+            self._fileno = None
+        else:
+            self._fileno = fileno
+
+    def _remove_reader(self) -> None:
+        """Stop watching the port, waking any pending read."""
+        if self._fileno is not None:
+            self._loop.remove_reader(self._fileno)
+            self._fileno = None
+
+        self._wake_read_waiter()
+
+    def _on_readable(self) -> None:
+        """Buffer newly arrived data and wake the pending read."""
+        self._read_available()
+
+        if self._read_error is not None and self._fileno is not None:
+            # A disconnected port always reports that it's readable; stop
+            # watching it so the loop doesn't spin.
+            self._loop.remove_reader(self._fileno)
+            self._fileno = None
+
+        self._wake_read_waiter()
+
+    def _read_available(self) -> None:
+        """Buffer whatever data the port has, without blocking."""
+        try:
+            self._buffer += self._serial.read(READ_CHUNK_SIZE)
+        except Exception as e:
+            self._read_error = e
+
+    def _wake_read_waiter(self) -> None:
+        if self._read_waiter is not None and not self._read_waiter.done():
+            self._read_waiter.set_result(None)
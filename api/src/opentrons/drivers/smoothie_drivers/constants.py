@@ -106,6 +106,9 @@ DEFAULT_STABILIZE_DELAY = 0.1
 
 DEFAULT_COMMAND_RETRIES = 3
 
+DEFAULT_MAX_MOVES_IN_FLIGHT = 8
+"""Most moves to stream to Smoothie before waiting for them to complete"""
+
 MICROSTEPPING_GCODES = {
     "B": {
         "ENABLE": GCODE.MICROSTEPPING_B_ENABLE,
@@ -50,6 +50,7 @@ from opentrons.drivers.smoothie_drivers.constants import (
     SMOOTHIE_BOOT_TIMEOUT,
     DEFAULT_STABILIZE_DELAY,
     DEFAULT_COMMAND_RETRIES,
+    DEFAULT_MAX_MOVES_IN_FLIGHT,
     MICROSTEPPING_GCODES,
     GCODE_ROUNDING_PRECISION,
 )
@@ -92,6 +93,7 @@ class SmoothieDriver:
         port: str,
         config: RobotConfig,
         gpio_chardev: Optional[GPIODriverLike] = None,
+        streaming_moves: bool = False,
     ) -> SmoothieDriver:
         """
         Build a smoothie driver
@@ -100,6 +102,8 @@ class SmoothieDriver:
             port: The port
             config: Robot configuration
             gpio_chardev: Optional GPIO driver
+            streaming_moves: Stream gantry moves without waiting for each one
+                to complete. See `SmoothieDriver.__init__`.
 
         Returns:
             A SmoothieDriver instance.
@@ -114,7 +118,12 @@ class SmoothieDriver:
         )
         gpio_chardev = gpio_chardev or SimulatingGPIOCharDev("simulated")
 
-        instance = cls(config=config, connection=connection, gpio_chardev=gpio_chardev)
+        instance = cls(
+            config=config,
+            connection=connection,
+            gpio_chardev=gpio_chardev,
+            streaming_moves=streaming_moves,
+        )
         await instance._setup()
         return instance
 
@@ -123,6 +132,8 @@ class SmoothieDriver:
         config: RobotConfig,
         gpio_chardev: GPIODriverLike,
         connection: Optional[SerialConnection] = None,
+        streaming_moves: bool = False,
+        max_moves_in_flight: int = DEFAULT_MAX_MOVES_IN_FLIGHT,
     ):
         """
         Constructor
@@ -131,6 +142,14 @@ class SmoothieDriver:
             config: The robot configuration
             gpio_chardev: GPIO device.
             connection: The serial connection.
+            streaming_moves: If set, gantry moves are sent without a
+                following M400, so Smoothie's planner can blend consecutive
+                moves instead of stopping after each one. The driver waits
+                for streamed moves to complete at sync points: any
+                non-move command, a change in motor currents, a pause, an
+                error, or once `max_moves_in_flight` moves are queued.
+            max_moves_in_flight: The most streamed moves to send before
+                waiting for them to complete.
         """
         self.run_flag = asyncio.Event()
         self.run_flag.set()
@@ -202,6 +221,16 @@ class SmoothieDriver:
         #: Cache of currently configured splits from callers
         self._axes_moved_at = AxisMoveTimestamp(AXES)
 
+        # Streamed move state:
+        # Moves-in-flight is the number of moves sent since the last M400.
+        # Streamed-currents are the currents sent with the last streamed move,
+        # which lets following streamed moves skip re-sending them. Any other
+        # current change clears them.
+        self._streaming_moves = streaming_moves
+        self._max_moves_in_flight = max_moves_in_flight
+        self._moves_in_flight = 0
+        self._streamed_currents: Optional[Dict[str, float]] = None
+
     @property
     def gpio_chardev(self) -> GPIODriverLike:
         return self._gpio_chardev
@@ -815,7 +844,6 @@ class SmoothieDriver:
         )
         await self.update_homed_flags()
 
-    # Potential place for command optimization (buffering, flushing, etc)
     async def _send_command(
         self,
         command: CommandBuilder,
@@ -823,6 +851,7 @@ class SmoothieDriver:
         suppress_error_msg: bool = False,
         ack_timeout: float = DEFAULT_ACK_TIMEOUT,
         suppress_home_after_error: bool = False,
+        stream: bool = False,
     ) -> str:
         """
         Submit a GCODE command to the robot, followed by M400 to block until
@@ -858,14 +887,30 @@ class SmoothieDriver:
             like home, it should be long enough to allow the command to
             complete in the worst case. If this is None, the timeout will
             be infinite. This is almost certainly not what you want.
+        :param stream: if True, do not send an M400 after the command, and
+            count it as a move in flight. Any command sent without `stream`,
+            or that changes motor currents, will first wait for every move in
+            flight to complete.
         """
         if self.simulating:
             return ""
+
+        moves_in_flight = self._moves_in_flight
+
         try:
-            return await self._send_command_unsynchronized(
-                command, ack_timeout, timeout
+            await self._sync_moves_before(command, stream, timeout)
+            result = await self._send_command_unsynchronized(
+                command,
+                ack_timeout,
+                timeout,
+                # an M400 is only acked once the moves before it are done
+                wait=not stream and GCODE.WAIT not in command,
             )
         except SmoothieError as se:
+            # moves in flight are lost on an error, and the position of
+            # the gantry may not be where we expect it
+            self._moves_in_flight = 0
+            self._streamed_currents = None
             # XXX: This is a reentrancy error because another command could
             # swoop in here. We're already resetting though and errors (should
             # be) rare so it's probably fine, but the actual solution to this
@@ -875,7 +920,7 @@ class SmoothieDriver:
             if not suppress_error_msg:
                 log.warning(f"alarm/error: command={command}, resp={se.ret_code}")
             if (
-                GCODE.MOVE in command or GCODE.PROBE in command
+                GCODE.MOVE in command or GCODE.PROBE in command or moves_in_flight > 0
             ) and not suppress_home_after_error:
                 if error_axis not in "XYZABC":
                     error_axis = AXES
@@ -883,8 +928,55 @@ class SmoothieDriver:
                 await self.home(error_axis)
             raise SmoothieError(se.ret_code, str(command))
 
+        if stream:
+            self._moves_in_flight += 1
+        elif GCODE.SET_CURRENT in command:
+            self._streamed_currents = None
+
+        return result
+
+    async def _sync_moves(self) -> None:
+        """Wait for every streamed move to complete, if there are any."""
+        if self._moves_in_flight > 0:
+            await self._send_command(
+                _command_builder().add_gcode(gcode=GCODE.WAIT),
+                ack_timeout=DEFAULT_EXECUTE_TIMEOUT,
+            )
+
+    async def _sync_moves_before(
+        self, command: CommandBuilder, stream: bool, execute_timeout: float
+    ) -> None:
+        """Wait for moves in flight, if needed, before sending a command."""
+        if self._moves_in_flight == 0:
+            return
+
+        if GCODE.WAIT in command:
+            # this command will wait for the moves in flight itself
+            self._moves_in_flight = 0
+        elif (
+            not stream
+            or self._moves_in_flight >= self._max_moves_in_flight
+            or GCODE.SET_CURRENT in command
+        ):
+            await self._wait_for_moves_in_flight(execute_timeout)
+
+    async def _wait_for_moves_in_flight(self, execute_timeout: float) -> None:
+        """Send an M400 to wait for every streamed move to complete."""
+        log.debug(f"waiting for {self._moves_in_flight} streamed moves")
+        self._moves_in_flight = 0
+        await self._send_command_unsynchronized(
+            _command_builder().add_gcode(gcode=GCODE.WAIT),
+            ack_timeout=execute_timeout,
+            execute_timeout=execute_timeout,
+            wait=False,
+        )
+
     async def _send_command_unsynchronized(
-        self, command: CommandBuilder, ack_timeout: float, execute_timeout: float
+        self,
+        command: CommandBuilder,
+        ack_timeout: float,
+        execute_timeout: float,
+        wait: bool = True,
     ) -> str:
         assert self._connection, "There is no connection."
         command_result = ""
@@ -892,12 +984,13 @@ class SmoothieDriver:
             command_result = await self._connection.send_command(
                 command=command, retries=DEFAULT_COMMAND_RETRIES, timeout=ack_timeout
             )
-            wait_command = CommandBuilder(
-                terminator=SMOOTHIE_COMMAND_TERMINATOR
-            ).add_gcode(gcode=GCODE.WAIT)
-            await self._connection.send_command(
-                command=wait_command, retries=0, timeout=execute_timeout
-            )
+            if wait:
+                wait_command = CommandBuilder(
+                    terminator=SMOOTHIE_COMMAND_TERMINATOR
+                ).add_gcode(gcode=GCODE.WAIT)
+                await self._connection.send_command(
+                    command=wait_command, retries=0, timeout=execute_timeout
+                )
         except AlarmResponse as e:
             self._handle_return(ret_code=e.response, is_alarm=True)
         except ErrorResponse as e:
@@ -1229,11 +1322,20 @@ class SmoothieDriver:
 
         This command respects the run flag and will wait until it is set.
 
+        If the driver is streaming moves, a move that doesn't need to be
+        split and doesn't involve the plungers is sent without waiting for
+        it to complete. In that case, the gantry may still be moving when
+        this method returns, but `position` already reflects the target.
+
         The function may issue up to 3 moves:
         - if move splitting is required, the split move
         - the actual move, plus a bit extra to give room to preload backlash
         - if we preload backlash we then issue a third move to preload backlash
         """
+        if not self.run_flag.is_set():
+            # let already streamed moves finish before pausing
+            await self._sync_moves()
+
         await self.run_flag.wait()
 
         def valid_movement(axis: str, coord: float) -> bool:
@@ -1311,7 +1413,20 @@ class SmoothieDriver:
         primary_command_string = create_coords_list(moving_target)
         backlash_command_string = create_coords_list(backlash_target)
 
-        self.dwell_axes("".join(non_moving_axes))
+        stream = (
+            self._streaming_moves
+            and not split_command_string
+            and not (set("BC") & set(moving_axes))
+        )
+
+        if stream:
+            # keep gantry axes at their active current between streamed
+            # moves, otherwise every move would be a current change, which
+            # must wait for any moves in flight to complete
+            self.dwell_axes("".join(ax for ax in non_moving_axes if ax in "BC"))
+        else:
+            self.dwell_axes("".join(non_moving_axes))
+
         self.activate_axes("".join(moving_axes))
 
         checked_speed = speed or self._combined_speed
@@ -1361,8 +1476,10 @@ class SmoothieDriver:
         if split_command_string or (checked_speed != self._combined_speed):
             command.add_builder(builder=self._build_speed_command(checked_speed))
 
-        # introduce the standard currents
-        command.add_builder(builder=self._generate_current_command())
+        # introduce the standard currents, unless they were already
+        # sent with the previous streamed move
+        if not stream or self.current != self._streamed_currents:
+            command.add_builder(builder=self._generate_current_command())
 
         if backlash_command_string:
             command.add_gcode(gcode=GCODE.MOVE).add_builder(
@@ -1391,7 +1508,11 @@ class SmoothieDriver:
             # TODO (hmg) a movement's timeout should be calculated by
             # how long the movement is expected to take.
             await _do_split()
-            await self._send_command(command, timeout=DEFAULT_EXECUTE_TIMEOUT)
+            await self._send_command(
+                command, timeout=DEFAULT_EXECUTE_TIMEOUT, stream=stream
+            )
+            if stream:
+                self._streamed_currents = self.current.copy()
         finally:
             # dwell pipette motors because they get hot
             plunger_axis_moved = "".join(set("BC") & set(target.keys()))
@@ -1829,6 +1950,9 @@ class SmoothieDriver:
             pass
         else:
             self._is_hard_halting.set()
+            # halting discards any moves Smoothie has queued
+            self._moves_in_flight = 0
+            self._streamed_currents = None
             self._gpio_chardev.set_halt_pin(False)
             await asyncio.sleep(0.25)
             self._gpio_chardev.set_halt_pin(True)
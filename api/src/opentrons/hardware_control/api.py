@@ -37,6 +37,7 @@ from .constants import (
     SHAKE_OFF_TIPS_PICKUP_DISTANCE,
     DROP_TIP_RELEASE_DISTANCE,
 )
+from .clock import get_clock
 from .execution_manager import ExecutionManager
 from .pause_manager import PauseManager
 from .module_control import AttachedModulesControl
@@ -393,7 +394,7 @@ class API(HardwareAPILike):
             if not self.is_simulator:
 
                 async def sleep_for_seconds(seconds: float):
-                    await asyncio.sleep(seconds)
+                    await get_clock().sleep(seconds)
 
                 delay_task = self._loop.create_task(sleep_for_seconds(duration_s))
                 await self._execution_manager.register_cancellable_task(delay_task)
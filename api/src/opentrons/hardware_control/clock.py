@@ -0,0 +1,106 @@
+"""The clock that hardware waits are measured with.
+
+On a robot, this is always real time. When running against emulators, it
+can run faster than real time, so that long incubations and thermocycler
+profiles finish in a fraction of the time. Emulated temperatures, ramp
+rates and hold times follow the same clock as the delays and pollers that
+wait on them, so they stay consistent with each other.
+"""
+import asyncio
+import time
+from typing import Optional
+
+from opentrons.config import IS_ROBOT
+
+
+class Clock:
+    """A monotonic clock that can run faster than real time."""
+
+    def __init__(self, speed: float = 1.0, jump: bool = False) -> None:
+        """Construct a clock.
+
+        Args:
+            speed: How many times faster than real time the clock runs.
+            jump: Whether to jump the clock ahead to the end of a sleep,
+                rather than waiting for it. Only code sharing this clock
+                object, like emulators running in the same process, will
+                see the jump.
+        """
+        if speed <= 0:
+            raise ValueError(f"Clock speed must be positive, not {speed}")
+
+        self._speed = speed
+        self._jump = jump
+        self._start = time.monotonic()
+        self._offset = 0.0
+
+    @property
+    def speed(self) -> float:
+        """How many times faster than real time the clock runs."""
+        return self._speed
+
+    @property
+    def jump(self) -> bool:
+        """Whether sleeps jump the clock ahead rather than waiting."""
+        return self._jump
+
+    def time(self) -> float:
+        """Get the clock's current time, in seconds."""
+        return self._offset + (time.monotonic() - self._start) * self._speed
+
+    def real_seconds(self, seconds: float) -> float:
+        """Get how long a duration on this clock takes in real time.
+
+        This doesn't account for jumps, so it's suitable for timeouts and
+        poll intervals that should keep pace with the clock without jumping
+        it ahead.
+        """
+        return seconds / self._speed
+
+    def advance(self, seconds: float) -> None:
+        """Jump the clock ahead."""
+        self._offset += max(0.0, seconds)
+
+    async def sleep(self, seconds: float) -> None:
+        """Wait for a duration on this clock."""
+        if self._jump:
+            self.advance(seconds)
+            await asyncio.sleep(0)
+        else:
+            await asyncio.sleep(self.real_seconds(seconds))
+
+
+_clock: Optional[Clock] = None
+
+
+def get_clock() -> Clock:
+    """Get the clock shared by the hardware and any emulators in this process.
+
+    Off of a robot, the clock's speed and jump mode can be configured with
+    the emulator's clock setting, `OT_EMULATOR_clock`.
+    """
+    global _clock
+
+    if _clock is None:
+        _clock = _build_clock()
+
+    return _clock
+
+
+def set_clock(clock: Clock) -> None:
+    """Replace the clock shared by the hardware and any emulators."""
+    global _clock
+    _clock = clock
+
+
+def _build_clock() -> Clock:
+    if IS_ROBOT:
+        return Clock()
+
+    from opentrons.hardware_control.emulation.settings import Settings
+
+    settings = Settings().clock
+    if settings is None:
+        return Clock()
+
+    return Clock(speed=settings.speed, jump=settings.jump)
@@ -13,7 +13,7 @@ except (OSError, ModuleNotFoundError):
 from opentrons.drivers.smoothie_drivers import SmoothieDriver
 from opentrons.drivers.rpi_drivers import build_gpio_chardev
 import opentrons.config
-from opentrons.config import pipette_config
+from opentrons.config import feature_flags as ff, pipette_config
 from opentrons.config.types import RobotConfig
 from opentrons.types import Mount
 
@@ -74,7 +74,9 @@ class Controller:
         self._board_revision: Final = self.gpio_chardev.board_rev
         # We handle our own locks in the hardware controller thank you
         self._smoothie_driver = SmoothieDriver(
-            config=self.config, gpio_chardev=self._gpio_chardev
+            config=self.config,
+            gpio_chardev=self._gpio_chardev,
+            streaming_moves=ff.enable_streaming_moves(),
         )
         self._cached_fw_version: Optional[str] = None
         self._module_controls: Optional[AttachedModulesControl] = None
@@ -22,7 +22,11 @@ class ConnectionHandler:
         emulator_name = self._emulator.__class__.__name__
         logger.debug("%s Connected.", emulator_name)
         while True:
-            line = await reader.readuntil(self._emulator.get_terminator())
+            try:
+                line = await reader.readuntil(self._emulator.get_terminator())
+            except asyncio.IncompleteReadError:
+                logger.debug("%s Disconnected.", emulator_name)
+                break
             logger.debug("%s Received: %s", emulator_name, line)
             try:
                 response = self._emulator.handle(line.decode().strip())
@@ -0,0 +1,150 @@
+"""Run a fleet of emulated robots in one process."""
+import asyncio
+import json
+import logging
+from typing import Dict, List, Sequence
+
+from opentrons.hardware_control.clock import Clock, set_clock
+from opentrons.hardware_control.emulation.app import Application
+from opentrons.hardware_control.emulation.scripts.run_module_emulator import (
+    run as run_module_by_name,
+)
+from opentrons.hardware_control.emulation.settings import ProxySettings, Settings
+
+logger = logging.getLogger(__name__)
+
+# The ports of each robot are offset from the last robot's by this much. The
+# default ports all differ modulo 100, so no two robots' ports overlap.
+PORT_STRIDE = 100
+
+_PROXIES = (
+    "heatershaker_proxy",
+    "thermocycler_proxy",
+    "temperature_proxy",
+    "magdeck_proxy",
+)
+_MODULES = ("magdeck", "tempdeck", "thermocycler")
+
+
+def robot_settings(
+    base: Settings, index: int, port_stride: int = PORT_STRIDE
+) -> Settings:
+    """Get the settings of one robot in a fleet.
+
+    Args:
+        base: The settings of the first robot.
+        index: The robot's position in the fleet, from 0.
+        port_stride: How far apart each robot's ports are.
+
+    Returns:
+        The base settings with every port offset by the robot's index, and
+        its modules' serial numbers suffixed by it.
+    """
+    offset = index * port_stride
+
+    def _proxy(proxy: ProxySettings) -> ProxySettings:
+        return proxy.copy(
+            update={
+                "emulator_port": proxy.emulator_port + offset,
+                "driver_port": proxy.driver_port + offset,
+            }
+        )
+
+    update = {
+        "smoothie": base.smoothie.copy(update={"port": base.smoothie.port + offset}),
+        "module_server": base.module_server.copy(
+            update={"port": base.module_server.port + offset}
+        ),
+    }
+    for name in _PROXIES:
+        update[name] = _proxy(getattr(base, name))
+    for name in _MODULES:
+        module = getattr(base, name)
+        update[name] = module.copy(
+            update={"serial_number": f"{module.serial_number}_{index}"}
+        )
+    return base.copy(update=update, deep=True)
+
+
+def _ports(settings: Settings) -> List[int]:
+    ports = [settings.smoothie.port, settings.module_server.port]
+    for name in _PROXIES:
+        proxy: ProxySettings = getattr(settings, name)
+        ports.extend((proxy.emulator_port, proxy.driver_port))
+    return ports
+
+
+def fleet_settings(
+    base: Settings, count: int, port_stride: int = PORT_STRIDE
+) -> List[Settings]:
+    """Get the settings of every robot in a fleet.
+
+    Raises:
+        ValueError: If two robots would share a port, or a port is out of range.
+    """
+    fleet = [robot_settings(base, i, port_stride) for i in range(count)]
+    ports = [port for settings in fleet for port in _ports(settings)]
+    if len(set(ports)) != len(ports):
+        raise ValueError(f"Port stride {port_stride} makes robots share ports")
+    if ports and max(ports) > 65535:
+        raise ValueError(f"{count} robots need ports up to {max(ports)}")
+    return fleet
+
+
+def robot_environment(settings: Settings, host: str = "localhost") -> Dict[str, str]:
+    """Get the environment a robot server needs to use an emulated robot."""
+    return {
+        "OT_SMOOTHIE_EMULATOR_URI": f"socket://{host}:{settings.smoothie.port}",
+        "OT_EMULATOR_module_server": json.dumps(
+            {"host": host, "port": settings.module_server.port}
+        ),
+    }
+
+
+class Fleet:
+    """Many emulated robots, each with a Smoothie and a set of modules."""
+
+    def __init__(self, settings: Sequence[Settings], modules: Sequence[str]) -> None:
+        """Constructor.
+
+        Args:
+            settings: Each robot's settings, with distinct ports.
+            modules: The module emulators to start for each robot.
+        """
+        self._settings = list(settings)
+        self._modules = list(modules)
+
+    @property
+    def settings(self) -> List[Settings]:
+        """The settings of each robot."""
+        return self._settings
+
+    async def run(self) -> None:
+        """Run every robot's emulators."""
+        clock = self._settings[0].clock if self._settings else None
+        if clock is not None:
+            # All robots share one clock, as with any hardware in this process.
+            set_clock(Clock(speed=clock.speed, jump=clock.jump))
+
+        loop = asyncio.get_event_loop()
+        tasks = []
+        for index, settings in enumerate(self._settings):
+            logger.info(
+                f"Starting robot {index}: smoothie on {settings.smoothie.port}, "
+                f"module server on {settings.module_server.port}"
+            )
+            tasks.append(loop.create_task(Application(settings=settings).run()))
+            tasks.extend(
+                loop.create_task(
+                    run_module_by_name(
+                        settings=settings, emulator_name=name, host="localhost"
+                    )
+                )
+                for name in self._modules
+            )
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
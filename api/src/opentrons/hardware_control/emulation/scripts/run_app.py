@@ -4,6 +4,7 @@ import asyncio
 from argparse import ArgumentParser
 from typing import List
 
+from opentrons.hardware_control.clock import Clock, set_clock
 from opentrons.hardware_control.emulation.app import Application
 from opentrons.hardware_control.emulation.scripts.run_module_emulator import (
     emulator_builder,
@@ -23,6 +24,10 @@ async def run(settings: Settings, modules: List[str]) -> None:
         None
 
     """
+    if settings.clock is not None:
+        # Share the clock with any hardware running in this process.
+        set_clock(Clock(speed=settings.clock.speed, jump=settings.clock.jump))
+
     loop = asyncio.get_event_loop()
 
     app_task = loop.create_task(Application(settings=settings).run())
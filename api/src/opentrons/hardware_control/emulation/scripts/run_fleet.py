@@ -0,0 +1,46 @@
+"""Script for starting a fleet of emulated robots in one process."""
+import logging
+import asyncio
+from argparse import ArgumentParser
+
+from opentrons.hardware_control.emulation.fleet import (
+    PORT_STRIDE,
+    Fleet,
+    fleet_settings,
+    robot_environment,
+)
+from opentrons.hardware_control.emulation.scripts.run_module_emulator import (
+    emulator_builder,
+)
+from opentrons.hardware_control.emulation.settings import Settings
+
+
+def main() -> None:
+    """Entry point."""
+    a = ArgumentParser()
+    a.add_argument("robots", type=int, help="how many robots to emulate.")
+    a.add_argument(
+        "--m",
+        action="append",
+        default=[],
+        choices=emulator_builder.keys(),
+        help="which module(s) to emulate on each robot.",
+    )
+    a.add_argument(
+        "--port-stride",
+        type=int,
+        default=PORT_STRIDE,
+        help="how far apart each robot's ports are.",
+    )
+    args = a.parse_args()
+
+    logging.basicConfig(format="%(asctime)s:%(message)s", level=logging.INFO)
+    fleet = fleet_settings(Settings(), args.robots, args.port_stride)
+    for index, settings in enumerate(fleet):
+        env = " ".join(f"{k}='{v}'" for k, v in robot_environment(settings).items())
+        print(f"robot {index}: {env}", flush=True)
+    asyncio.run(Fleet(fleet, args.m).run())
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,10 @@
 import logging
 import asyncio
 from argparse import ArgumentParser
-from typing import Dict, Callable
+from typing import Dict, Callable, Optional
 from typing_extensions import Final
 
+from opentrons.hardware_control.clock import Clock, get_clock
 from opentrons.hardware_control.emulation.abstract_emulator import AbstractEmulator
 from opentrons.hardware_control.emulation.types import ModuleType
 from opentrons.hardware_control.emulation.magdeck import MagDeckEmulator
@@ -16,11 +17,19 @@ from opentrons.hardware_control.emulation.thermocycler import ThermocyclerEmulat
 from opentrons.hardware_control.emulation.run_emulator import run_emulator_client
 from opentrons.hardware_control.emulation.settings import Settings, ProxySettings
 
+
+def _get_clock(settings: Settings) -> Optional[Clock]:
+    """Get the clock to run emulators on, if they're configured with one."""
+    return get_clock() if settings.clock is not None else None
+
+
 emulator_builder: Final[Dict[str, Callable[[Settings], AbstractEmulator]]] = {
     ModuleType.Magnetic.value: lambda s: MagDeckEmulator(Parser(), s.magdeck),
-    ModuleType.Temperature.value: lambda s: TempDeckEmulator(Parser(), s.tempdeck),
+    ModuleType.Temperature.value: lambda s: TempDeckEmulator(
+        Parser(), s.tempdeck, _get_clock(s)
+    ),
     ModuleType.Thermocycler.value: lambda s: ThermocyclerEmulator(
-        Parser(), s.thermocycler
+        Parser(), s.thermocycler, _get_clock(s)
     ),
 }
 
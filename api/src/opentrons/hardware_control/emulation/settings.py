@@ -1,3 +1,5 @@
+from typing import Optional
+
 from opentrons.hardware_control.emulation.util import TEMPERATURE_ROOM
 from pydantic import BaseSettings, BaseModel
 
@@ -25,6 +27,8 @@ class BaseModuleSettings(BaseModel):
 
 
 class TemperatureModelSettings(BaseModel):
+    # A tick is every read of the temperature or, when the emulators run on
+    # a clock, every second of the clock's time.
     degrees_per_tick: float = 2.0
     starting: float = float(TEMPERATURE_ROOM)
 
@@ -50,6 +54,16 @@ class ProxySettings(BaseModel):
     driver_port: int
 
 
+class ClockSettings(BaseModel):
+    """Settings for the clock shared by the emulators and the hardware."""
+
+    # How many times faster than real time the clock runs.
+    speed: float = 1.0
+    # Whether delays jump the clock ahead rather than waiting. Emulators
+    # only see the jump when they run in the same process as the hardware.
+    jump: bool = False
+
+
 class ModuleServerSettings(BaseModel):
     """Settings for the module server"""
 
@@ -87,6 +101,9 @@ class Settings(BaseSettings):
     )
     magdeck_proxy: ProxySettings = ProxySettings(emulator_port=9004, driver_port=9999)
 
+    # Without a clock, emulated temperatures change each time they're read.
+    clock: Optional[ClockSettings] = None
+
     class Config:
         env_prefix = "OT_EMULATOR_"
 
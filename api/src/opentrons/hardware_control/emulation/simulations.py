@@ -1,5 +1,8 @@
+from math import copysign
 from typing import Optional
 
+from opentrons.hardware_control.clock import Clock
+
 
 class Simulation:
     def tick(self) -> None:
@@ -9,76 +12,118 @@ class Simulation:
 class Temperature(Simulation):
     """A model with a current and target temperature. The current temperate is
     always moving towards the target.
+
+    Without a clock, the temperature moves once per tick. With a clock, it
+    moves continuously, as though it ticked every second of the clock's time.
     """
 
-    def __init__(self, per_tick: float, current: float) -> None:
+    def __init__(
+        self, per_tick: float, current: float, clock: Optional[Clock] = None
+    ) -> None:
         """Construct a temperature simulation.
 
         Args:
             per_tick: amount to move per tick,
             current: the starting temperature
+            clock: optional clock to move the temperature with
         """
         self._per_tick = per_tick
         self._current = current
         self._target: Optional[float] = None
+        self._clock = clock
+        self._last_time = clock.time() if clock is not None else 0.0
 
     def tick(self) -> None:
-        if self._target is None:
-            return
-
-        diff = self._target - self._current
-
-        if abs(diff) < self._per_tick:
-            self._current = self._target
-        elif diff > 0:
-            self._current += self._per_tick
+        if self._clock is None:
+            self._advance(1)
         else:
-            self._current -= self._per_tick
+            self._catch_up()
 
     def deactivate(self, temperature: float) -> None:
         """Deactivate and reset to temperature"""
+        self._catch_up()
         self._target = None
         self._current = temperature
 
     def set_target(self, target: float) -> None:
+        self._catch_up()
         self._target = target
 
     @property
     def current(self) -> float:
+        self._catch_up()
         return self._current
 
     @property
     def target(self) -> Optional[float]:
         return self._target
 
+    def _catch_up(self) -> None:
+        """Advance by the clock time elapsed since the last update, if any."""
+        if self._clock is None:
+            return
+
+        now = self._clock.time()
+        elapsed = now - self._last_time
+        self._last_time = now
+
+        if elapsed > 0:
+            self._advance(elapsed)
+
+    def _advance(self, ticks: float) -> float:
+        """Move towards the target for a number of ticks.
+
+        Returns: How many of those ticks were spent at the target.
+        """
+        if self._target is None:
+            return 0.0
+
+        diff = self._target - self._current
+        ticks_to_target = abs(diff) / self._per_tick
+
+        if ticks_to_target <= ticks:
+            self._current = self._target
+            return ticks - ticks_to_target
+
+        self._current += copysign(self._per_tick * ticks, diff)
+        return 0.0
+
 
 class TemperatureWithHold(Temperature):
     """A model with a current, target temperature and hold time. The current
     temperate is always moving towards the target.
 
     When the current temperature is within close enough from target the hold time
-    decrements once per tick.
+    decrements once per tick, or with a clock, by the time spent at the target.
     """
 
-    def __init__(self, per_tick: float, current: float) -> None:
+    def __init__(
+        self, per_tick: float, current: float, clock: Optional[Clock] = None
+    ) -> None:
         """Construct a temperature with hold simulation."""
-        super().__init__(per_tick=per_tick, current=current)
+        super().__init__(per_tick=per_tick, current=current, clock=clock)
         self._total_hold: Optional[float] = None
         self._hold: Optional[float] = None
 
-    def tick(self) -> None:
-        super().tick()
-        if self.target == self._current and self._hold is not None:
-            self._hold = max(0, self._hold - 1)
-
     def set_hold(self, hold: float) -> None:
+        self._catch_up()
         self._total_hold = hold
         self._hold = hold
 
     @property
     def time_remaining(self) -> Optional[float]:
+        self._catch_up()
         return self._hold
 
     @property
     def total_hold(self) -> Optional[float]:
         return self._total_hold
+
+    def _advance(self, ticks: float) -> float:
+        held = super()._advance(ticks)
+
+        if self._hold is not None and self._target == self._current:
+            # Without a clock, the tick that reaches the target counts as held.
+            self._hold = max(0, self._hold - (held if self._clock else ticks))
+
+        return held
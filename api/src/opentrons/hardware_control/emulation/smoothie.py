@@ -30,6 +30,7 @@ class SmoothieEmulator(AbstractEmulator):
     _speed: float
     _pipette_model: Dict[str, str]
     _pipette_id: Dict[str, str]
+    _gcode_counts: Dict[str, int]
 
     def __init__(self, parser: Parser, settings: SmoothieSettings) -> None:
         """Constructor.
@@ -76,6 +77,7 @@ class SmoothieEmulator(AbstractEmulator):
             "C": False,
         }
         self._speed = 0.0
+        self._gcode_counts = {}
 
         self._pipette_model = {
             "L": utils.string_to_hex(
@@ -98,6 +100,14 @@ class SmoothieEmulator(AbstractEmulator):
     def get_current_position(self) -> Dict[str, float]:
         return self._pos
 
+    def get_gcode_counts(self) -> Dict[str, int]:
+        """Get the number of times each GCODE has been received since reset.
+
+        Useful for measuring how much a driver relies on round-trips, like
+        the M400 it may send after every command to wait for it to complete.
+        """
+        return dict(self._gcode_counts)
+
     def _get_homing_status(self, command: Command) -> str:
         """Get the current homing status of the emulated gantry"""
         return " ".join(f"{k}:{int(v)}" for k, v in self._home_status.items())
@@ -159,6 +169,7 @@ class SmoothieEmulator(AbstractEmulator):
     def _handle(self, command: Command) -> Optional[str]:
         """Handle a command."""
         logger.info(f"Got command {command}")
+        self._gcode_counts[command.gcode] = self._gcode_counts.get(command.gcode, 0) + 1
         func_to_run = self._gcode_to_function_mapping.get(command.gcode)
         return None if func_to_run is None else func_to_run(command)
 
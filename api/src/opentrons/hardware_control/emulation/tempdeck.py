@@ -7,6 +7,7 @@ import logging
 from typing import Optional
 
 from opentrons.drivers.temp_deck.driver import GCODE
+from opentrons.hardware_control.clock import Clock
 from opentrons.hardware_control.emulation import util
 from opentrons.hardware_control.emulation.parser import Parser, Command
 from opentrons.hardware_control.emulation.settings import TempDeckSettings
@@ -23,9 +24,12 @@ class TempDeckEmulator(AbstractEmulator):
 
     _temperature: Temperature
 
-    def __init__(self, parser: Parser, settings: TempDeckSettings) -> None:
+    def __init__(
+        self, parser: Parser, settings: TempDeckSettings, clock: Optional[Clock] = None
+    ) -> None:
         self._settings = settings
         self._parser = parser
+        self._clock = clock
         self.reset()
 
     def handle(self, line: str) -> Optional[str]:
@@ -38,6 +42,7 @@ class TempDeckEmulator(AbstractEmulator):
         self._temperature = Temperature(
             per_tick=self._settings.temperature.degrees_per_tick,
             current=self._settings.temperature.starting,
+            clock=self._clock,
         )
 
     def _handle(self, command: Command) -> Optional[str]:
@@ -7,6 +7,7 @@ import logging
 from typing import Optional
 from opentrons.drivers.thermocycler.driver import GCODE
 from opentrons.drivers.types import ThermocyclerLidStatus
+from opentrons.hardware_control.clock import Clock
 from opentrons.hardware_control.emulation.parser import Parser, Command
 from opentrons.hardware_control.emulation.settings import ThermocyclerSettings
 
@@ -26,9 +27,15 @@ class ThermocyclerEmulator(AbstractEmulator):
     plate_volume: util.OptionalValue[float]
     plate_ramp_rate: util.OptionalValue[float]
 
-    def __init__(self, parser: Parser, settings: ThermocyclerSettings) -> None:
+    def __init__(
+        self,
+        parser: Parser,
+        settings: ThermocyclerSettings,
+        clock: Optional[Clock] = None,
+    ) -> None:
         self._parser = parser
         self._settings = settings
+        self._clock = clock
         self.reset()
 
     def handle(self, line: str) -> Optional[str]:
@@ -41,10 +48,12 @@ class ThermocyclerEmulator(AbstractEmulator):
         self._lid_temperature = Temperature(
             per_tick=self._settings.lid_temperature.degrees_per_tick,
             current=self._settings.lid_temperature.starting,
+            clock=self._clock,
         )
         self._plate_temperature = TemperatureWithHold(
             per_tick=self._settings.plate_temperature.degrees_per_tick,
             current=self._settings.plate_temperature.starting,
+            clock=self._clock,
         )
         self.lid_status = ThermocyclerLidStatus.OPEN
         self.plate_volume = util.OptionalValue[float]()
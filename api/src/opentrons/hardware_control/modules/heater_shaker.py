@@ -5,7 +5,12 @@ from typing import Optional, Mapping, Callable
 from typing_extensions import Final
 from opentrons.drivers.rpi_drivers.types import USBPort
 from opentrons.hardware_control.execution_manager import ExecutionManager
-from opentrons.hardware_control.poller import Reader, WaitableListener, Poller
+from opentrons.hardware_control.poller import (
+    Reader,
+    WaitableListener,
+    Poller,
+    PollStats,
+)
 from opentrons.hardware_control.modules import mod_abc, types, update
 from opentrons.drivers.heater_shaker.driver import HeaterShakerDriver
 from opentrons.drivers.heater_shaker.abstract import AbstractHeaterShakerDriver
@@ -15,6 +20,7 @@ from opentrons.drivers.types import Temperature, RPM, HeaterShakerPlateLockStatu
 log = logging.getLogger(__name__)
 
 POLL_PERIOD = 1
+ACTIVE_POLL_PERIOD = 0.25
 
 
 class HeaterShaker(mod_abc.AbstractModule):
@@ -84,6 +90,8 @@ class HeaterShaker(mod_abc.AbstractModule):
             interval_seconds=poll_time_s,
             listener=self._listener,
             loop=loop,
+            active_interval_seconds=ACTIVE_POLL_PERIOD,
+            is_active=self._is_ramping,
         )
 
     async def cleanup(self) -> None:
@@ -146,6 +154,17 @@ class HeaterShaker(mod_abc.AbstractModule):
                 status = types.SpeedStatus.ACCELERATING
         return status
 
+    @classmethod
+    def _is_ramping(cls, poll_result: "PollResult") -> bool:
+        """Whether the temperature or speed is still moving towards its target."""
+        return cls._get_temperature_status(poll_result.temperature) in (
+            types.TemperatureStatus.HEATING,
+            types.TemperatureStatus.COOLING,
+        ) or cls._get_speed_status(poll_result.rpm) in (
+            types.SpeedStatus.ACCELERATING,
+            types.SpeedStatus.DECELERATING,
+        )
+
     def model(self) -> str:
         return self._model_from_revision(self._device_info.get("model"))
 
@@ -157,6 +176,11 @@ class HeaterShaker(mod_abc.AbstractModule):
         """Wait for the next poll to complete."""
         await self._listener.wait_next_poll()
 
+    @property
+    def poll_stats(self) -> PollStats:
+        """Timing metrics of the module's status polling."""
+        return self._poller.stats
+
     @property
     def device_info(self) -> Mapping[str, str]:
         return self._device_info
@@ -224,6 +248,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_temperature(temperature=celsius)
+        self._poller.request_poll()
         await self.wait_next_poll()
 
         async def _wait():
@@ -255,6 +280,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_temperature(celsius)
+        self._poller.request_poll()
 
     async def await_temperature(self, awaiting_temperature: float) -> None:
         """
@@ -293,6 +319,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_rpm(rpm)
+        self._poller.request_poll()
         await self.wait_next_poll()
 
         async def _wait():
@@ -319,6 +346,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_rpm(rpm)
+        self._poller.request_poll()
 
     async def await_speed(self, awaiting_speed: int) -> None:
         """
@@ -364,6 +392,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         await self.wait_for_is_running()
         await self._driver.set_temperature(0)
         await self._driver.home()
+        self._poller.request_poll()
 
     async def open_plate_lock(self):
         await self.wait_for_is_running()
@@ -3,7 +3,12 @@ import logging
 from typing import Mapping, Optional
 
 from opentrons.hardware_control.modules.types import TemperatureStatus
-from opentrons.hardware_control.poller import Reader, WaitableListener, Poller
+from opentrons.hardware_control.poller import (
+    Reader,
+    WaitableListener,
+    Poller,
+    PollStats,
+)
 from typing_extensions import Final
 from opentrons.drivers.types import Temperature
 from opentrons.drivers.temp_deck import (
@@ -18,6 +23,7 @@ from opentrons.hardware_control.modules import update, mod_abc, types
 log = logging.getLogger(__name__)
 
 TEMP_POLL_INTERVAL_SECS = 1.0
+TEMP_ACTIVE_POLL_INTERVAL_SECS = 0.25
 SIM_TEMP_POLL_INTERVAL_SECS = TEMP_POLL_INTERVAL_SECS / 20.0
 
 
@@ -98,6 +104,8 @@ class TempDeck(mod_abc.AbstractModule):
             interval_seconds=polling_frequency,
             listener=self._listener,
             loop=loop,
+            active_interval_seconds=TEMP_ACTIVE_POLL_INTERVAL_SECS,
+            is_active=self._is_ramping,
         )
 
     async def cleanup(self) -> None:
@@ -120,6 +128,11 @@ class TempDeck(mod_abc.AbstractModule):
         """Wait for the next poll to complete."""
         await self._listener.wait_next_poll()
 
+    @property
+    def poll_stats(self) -> PollStats:
+        """Timing metrics of the module's status polling."""
+        return self._poller.stats
+
     async def set_temperature(self, celsius: float) -> None:
         """
         Set temperature in degree Celsius
@@ -130,6 +143,7 @@ class TempDeck(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_temperature(celsius=celsius)
+        self._poller.request_poll()
         await self.wait_next_poll()
 
         async def _wait():
@@ -151,6 +165,7 @@ class TempDeck(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_temperature(celsius)
+        self._poller.request_poll()
 
     async def await_temperature(self, awaiting_temperature: float) -> None:
         """
@@ -180,6 +195,7 @@ class TempDeck(mod_abc.AbstractModule):
         """Stop heating/cooling and turn off the fan"""
         await self.wait_for_is_running()
         await self._driver.deactivate()
+        self._poller.request_poll()
 
     @property
     def device_info(self) -> Mapping[str, str]:
@@ -254,6 +270,14 @@ class TempDeck(mod_abc.AbstractModule):
                 status = TemperatureStatus.HEATING
         return status
 
+    @classmethod
+    def _is_ramping(cls, temperature: Temperature) -> bool:
+        """Whether the temperature is still moving towards its target."""
+        return cls._get_status(temperature) in (
+            TemperatureStatus.HEATING,
+            TemperatureStatus.COOLING,
+        )
+
     @staticmethod
     def _model_from_revision(revision: Optional[str]) -> str:
         """Defines the revision -> model mapping"""
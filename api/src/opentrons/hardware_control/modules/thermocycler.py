@@ -4,10 +4,16 @@ from typing import Optional, List, Dict, Mapping, Callable
 from dataclasses import dataclass
 from opentrons.drivers.rpi_drivers.types import USBPort
 from opentrons.drivers.types import ThermocyclerLidStatus, Temperature, PlateTemperature
+from opentrons.hardware_control.clock import get_clock
 from opentrons.hardware_control.modules.lid_temp_status import LidTemperatureStatus
 from opentrons.hardware_control.modules.plate_temp_status import PlateTemperatureStatus
 from opentrons.hardware_control.modules.types import TemperatureStatus
-from opentrons.hardware_control.poller import Reader, WaitableListener, Poller
+from opentrons.hardware_control.poller import (
+    Reader,
+    WaitableListener,
+    Poller,
+    PollStats,
+)
 
 from ..execution_manager import ExecutionManager
 from . import types, update, mod_abc
@@ -21,6 +27,7 @@ from opentrons.drivers.thermocycler import (
 MODULE_LOG = logging.getLogger(__name__)
 
 POLLING_FREQUENCY_SEC = 1.0
+ACTIVE_POLLING_FREQUENCY_SEC = 0.25
 SIM_POLLING_FREQUENCY_SEC = POLLING_FREQUENCY_SEC / 20.0
 
 TEMP_UPDATE_RETRIES = 50
@@ -118,8 +125,14 @@ class Thermocycler(mod_abc.AbstractModule):
             listener=self._listener,
             reader=PollerReader(driver=self._driver),
             loop=loop,
+            active_interval_seconds=ACTIVE_POLLING_FREQUENCY_SEC,
+            is_active=_is_active,
+        )
+        # Commands that set a hold time request an immediate poll, and the
+        # poller stays at its active interval while the hold counts down.
+        self._hold_time_fuzzy_seconds = (
+            min(polling_interval_sec, ACTIVE_POLLING_FREQUENCY_SEC) * 5
         )
-        self._hold_time_fuzzy_seconds = polling_interval_sec * 5
 
         self._total_cycle_count: Optional[int] = None
         self._current_cycle_index: Optional[int] = None
@@ -153,24 +166,28 @@ class Thermocycler(mod_abc.AbstractModule):
     async def deactivate_lid(self) -> None:
         """Deactivate the lid heating pad"""
         await self.wait_for_is_running()
-        return await self._driver.deactivate_lid()
+        await self._driver.deactivate_lid()
+        self._poller.request_poll()
 
     async def deactivate_block(self) -> None:
         """Deactivate the block peltiers"""
         await self.wait_for_is_running()
         self._clear_cycle_counters()
-        return await self._driver.deactivate_block()
+        await self._driver.deactivate_block()
+        self._poller.request_poll()
 
     async def deactivate(self) -> None:
         """Deactivate the block peltiers and lid heating pad"""
         await self.wait_for_is_running()
         self._clear_cycle_counters()
-        return await self._driver.deactivate_all()
+        await self._driver.deactivate_all()
+        self._poller.request_poll()
 
     async def open(self) -> str:
         """Open the lid if it is closed"""
         await self.wait_for_is_running()
         await self._driver.open_lid()
+        self._poller.request_poll()
         await self._wait_for_lid_status(ThermocyclerLidStatus.OPEN)
         return ThermocyclerLidStatus.OPEN
 
@@ -178,6 +195,7 @@ class Thermocycler(mod_abc.AbstractModule):
         """Close the lid if it is open"""
         await self.wait_for_is_running()
         await self._driver.close_lid()
+        self._poller.request_poll()
         await self._wait_for_lid_status(ThermocyclerLidStatus.CLOSED)
         return ThermocyclerLidStatus.CLOSED
 
@@ -233,6 +251,7 @@ class Thermocycler(mod_abc.AbstractModule):
         await self._driver.set_plate_temperature(
             temp=temperature, hold_time=hold_time, volume=volume
         )
+        self._poller.request_poll()
 
         # Wait for target temperature to be set.
         retries = 0
@@ -283,6 +302,7 @@ class Thermocycler(mod_abc.AbstractModule):
         """Set the lid temperature in deg Celsius"""
         await self.wait_for_is_running()
         await self._driver.set_lid_temperature(temp=temperature)
+        self._poller.request_poll()
         # Wait for target to be set
         retries = 0
         while self.lid_target != temperature:
@@ -334,7 +354,7 @@ class Thermocycler(mod_abc.AbstractModule):
         # just wait for hold_time time. (Skip if hold_time = 0 since we don't
         # want to wait in that case. Cached self.hold_time would be 0 anyway)
         if 0 < hold_time <= self._hold_time_fuzzy_seconds:
-            await asyncio.sleep(hold_time)
+            await get_clock().sleep(hold_time)
         else:
             while self.hold_time != 0:
                 await self.wait_next_poll()
@@ -348,6 +368,11 @@ class Thermocycler(mod_abc.AbstractModule):
         """Wait for the next poll to complete."""
         await self._listener.wait_next_poll()
 
+    @property
+    def poll_stats(self) -> PollStats:
+        """Timing metrics of the module's status polling."""
+        return self._poller.stats
+
     @property
     def lid_target(self) -> Optional[float]:
         return (
@@ -537,6 +562,18 @@ class PolledData:
     plate_temperature: PlateTemperature
 
 
+def _is_active(data: PolledData) -> bool:
+    """Whether the lid is moving or a hold time is counting down.
+
+    Plate temperature ramps are not treated as active, because the plate's
+    holding status is decided by a fixed number of samples near the target,
+    so polling faster would shorten the time the plate must be stable.
+    """
+    return data.lid_status == ThermocyclerLidStatus.IN_BETWEEN or bool(
+        data.plate_temperature.hold
+    )
+
+
 class PollerReader(Reader[PolledData]):
     """Polled data reader."""
 
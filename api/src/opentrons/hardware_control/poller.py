@@ -1,7 +1,10 @@
 import asyncio
 from abc import abstractmethod, ABC
 from collections import deque
-from typing import TypeVar, Generic, Deque, Optional
+from dataclasses import dataclass, replace
+from typing import Callable, TypeVar, Generic, Deque, Optional
+
+from .clock import get_clock
 
 DataT = TypeVar("DataT")
 
@@ -99,8 +102,38 @@ class WaitableListener(Listener[DataT]):
             f.set_exception(exc)
 
 
+@dataclass(frozen=True)
+class PollStats:
+    """Poll timing metrics.
+
+    The read duration is how long the reader took to get a sample, for
+    example one serial round trip. The poll period is the time between the
+    completion of consecutive polls, which bounds how stale the latest
+    sample can be.
+    """
+
+    poll_count: int = 0
+    error_count: int = 0
+    last_read_duration: Optional[float] = None
+    mean_read_duration: Optional[float] = None
+    max_read_duration: Optional[float] = None
+    last_poll_period: Optional[float] = None
+    mean_poll_period: Optional[float] = None
+    max_poll_period: Optional[float] = None
+
+
 class Poller(Generic[DataT]):
-    """Asyncio poller."""
+    """Asyncio poller.
+
+    By default, the poller reads at a fixed interval. Given an active
+    interval and an `is_active` check, it instead polls at the active
+    interval while the latest sample is active, for example while a
+    temperature is ramping. Once the sample is no longer active, the
+    interval doubles after each poll until it's back to `interval_seconds`.
+
+    Intervals are measured on the hardware clock, so emulated modules are
+    polled faster when the clock runs faster than real time.
+    """
 
     def __init__(
         self,
@@ -108,26 +141,64 @@ class Poller(Generic[DataT]):
         reader: Reader[DataT],
         listener: Listener[DataT],
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        active_interval_seconds: Optional[float] = None,
+        is_active: Optional[Callable[[DataT], bool]] = None,
     ) -> None:
         """
         Constructor.
 
         Args:
-            interval_seconds: time in between polls.
+            interval_seconds: time in between polls at steady state.
             reader: The data reader.
             listener: event listener.
             loop: Optional event loop to use
+            active_interval_seconds: time in between polls while active.
+            is_active: Check whether a poll result is active, like a
+                target that has not been reached yet.
         """
         loop = loop or asyncio.get_running_loop()
-        self._shutdown_event = asyncio.Event(loop=loop)
+        self._loop = loop
+        self._wake_event = asyncio.Event(loop=loop)
+        self._clock = get_clock()
+        self._shutdown = False
         self._interval = interval_seconds
+        self._active_interval = min(
+            active_interval_seconds or interval_seconds, interval_seconds
+        )
+        self._current_interval = interval_seconds
+        self._is_active = is_active
         self._listener = listener
         self._reader = reader
+        self._stats = PollStats()
+        self._read_duration_total = 0.0
+        self._poll_period_total = 0.0
+        self._last_poll_time: Optional[float] = None
         self._task = loop.create_task(self._poller())
 
+    @property
+    def interval(self) -> float:
+        """The time until the next poll, as of the last poll."""
+        return self._current_interval
+
+    @property
+    def stats(self) -> PollStats:
+        """The poller's timing metrics."""
+        return self._stats
+
+    def request_poll(self) -> None:
+        """Poll as soon as possible, then at the active interval.
+
+        Call this after sending a command that is expected to change what
+        the poller reads. If a read is in progress, another one starts as
+        soon as it finishes.
+        """
+        self._current_interval = self._active_interval
+        self._wake_event.set()
+
     def stop(self) -> None:
         """Signal poller to stop."""
-        self._shutdown_event.set()
+        self._shutdown = True
+        self._wake_event.set()
 
     async def stop_and_wait(self) -> None:
         """Stop poller and wait for it to terminate."""
@@ -137,17 +208,72 @@ class Poller(Generic[DataT]):
     async def _poller(self) -> None:
         """Poll task entrypoint."""
         while True:
-            try:
-                poll = await self._reader.read()
-                self._listener.on_poll(poll)
-            except Exception as e:
-                self._listener.on_error(e)
+            self._wake_event.clear()
+            await self._poll_once()
 
             try:
-                await asyncio.wait_for(self._shutdown_event.wait(), self._interval)
+                await asyncio.wait_for(
+                    self._wake_event.wait(),
+                    self._clock.real_seconds(self._current_interval),
+                )
             except asyncio.TimeoutError:
                 pass
-            else:
+
+            if self._shutdown:
                 break
 
         self._listener.on_terminated()
+
+    async def _poll_once(self) -> None:
+        """Read a sample, notify the listener, and pick the next interval."""
+        start = self._loop.time()
+
+        try:
+            poll = await self._reader.read()
+        except Exception as e:
+            self._update_stats(start, error=True)
+            self._listener.on_error(e)
+            return
+
+        self._update_stats(start, error=False)
+        self._update_interval(poll)
+        self._listener.on_poll(poll)
+
+    def _update_interval(self, poll: DataT) -> None:
+        """Poll fast while active, and back off once not."""
+        if self._is_active is not None and self._is_active(poll):
+            self._current_interval = self._active_interval
+        else:
+            self._current_interval = min(self._current_interval * 2, self._interval)
+
+    def _update_stats(self, start: float, error: bool) -> None:
+        """Record the timing of a poll."""
+        stats = self._stats
+
+        if error:
+            self._stats = replace(stats, error_count=stats.error_count + 1)
+            return
+
+        now = self._loop.time()
+        poll_count = stats.poll_count + 1
+        read_duration = now - start
+        self._read_duration_total += read_duration
+        self._stats = replace(
+            stats,
+            poll_count=poll_count,
+            last_read_duration=read_duration,
+            mean_read_duration=self._read_duration_total / poll_count,
+            max_read_duration=max(stats.max_read_duration or 0.0, read_duration),
+        )
+
+        if self._last_poll_time is not None:
+            poll_period = now - self._last_poll_time
+            self._poll_period_total += poll_period
+            self._stats = replace(
+                self._stats,
+                last_poll_period=poll_period,
+                mean_poll_period=self._poll_period_total / (poll_count - 1),
+                max_poll_period=max(stats.max_poll_period or 0.0, poll_period),
+            )
+
+        self._last_poll_time = now
@@ -9,6 +9,8 @@ from .waypoints import (
 
 from .types import Waypoint, MoveType
 
+from .obstacles import Obstacle, ObstacleIndex
+
 from .errors import (
     MotionPlanningError,
     DestinationOutOfBoundsError,
@@ -21,6 +23,8 @@ __all__ = [
     "MINIMUM_Z_MARGIN",
     "Waypoint",
     "MoveType",
+    "Obstacle",
+    "ObstacleIndex",
     "MotionPlanningError",
     "DestinationOutOfBoundsError",
     "ArcOutOfBoundsError",
@@ -0,0 +1,92 @@
+"""Deck obstacles that arc moves must travel over."""
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence, Tuple
+from typing_extensions import final
+
+
+@dataclass(frozen=True)
+@final
+class Obstacle:
+    """An axis-aligned box on the deck, such as a loaded labware."""
+
+    min_x: float
+    min_y: float
+    max_x: float
+    max_y: float
+    top_z: float
+
+
+@final
+class ObstacleIndex:
+    """An index of deck obstacles, to find the tallest one along a path.
+
+    Obstacles are kept in order from tallest to shortest, so a query can
+    stop at the first obstacle the path passes over. For the handful of
+    obstacles on a deck, this is faster than a general spatial tree.
+    """
+
+    def __init__(self, obstacles: Iterable[Obstacle]) -> None:
+        """Initialize an index of the given obstacles."""
+        self._obstacles = sorted(obstacles, key=lambda o: o.top_z, reverse=True)
+
+    def get_highest_z(
+        self,
+        path: Sequence[Tuple[float, float]],
+        xy_clearance: Tuple[float, float] = (0.0, 0.0),
+    ) -> Optional[float]:
+        """Get the top of the tallest obstacle that a path passes over.
+
+        :param path: The XY points the path moves through, in straight lines.
+        :param xy_clearance: How far to stay away from obstacles in the
+            X and Y directions, to account for the width of whatever is
+            moving along the path.
+
+        :returns: The highest obstacle Z, or None if the path is clear.
+        """
+        x_clearance, y_clearance = xy_clearance
+        segments = list(zip(path, path[1:])) if len(path) > 1 else [(path[0],) * 2]
+
+        for obstacle in self._obstacles:
+            min_x = obstacle.min_x - x_clearance
+            min_y = obstacle.min_y - y_clearance
+            max_x = obstacle.max_x + x_clearance
+            max_y = obstacle.max_y + y_clearance
+
+            for start, end in segments:
+                if _segment_intersects_box(start, end, min_x, min_y, max_x, max_y):
+                    return obstacle.top_z
+
+        return None
+
+
+def _segment_intersects_box(
+    start: Tuple[float, float],
+    end: Tuple[float, float],
+    min_x: float,
+    min_y: float,
+    max_x: float,
+    max_y: float,
+) -> bool:
+    """Check whether a line segment passes through a box, using slab clipping."""
+    t_enter = 0.0
+    t_exit = 1.0
+
+    for p0, p1, low, high in (
+        (start[0], end[0], min_x, max_x),
+        (start[1], end[1], min_y, max_y),
+    ):
+        delta = p1 - p0
+
+        if delta == 0:
+            if p0 < low or p0 > high:
+                return False
+        else:
+            t_low = (low - p0) / delta
+            t_high = (high - p0) / delta
+            t_enter = max(t_enter, min(t_low, t_high))
+            t_exit = min(t_exit, max(t_low, t_high))
+
+            if t_enter > t_exit:
+                return False
+
+    return True
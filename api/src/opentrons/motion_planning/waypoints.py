@@ -7,6 +7,7 @@ from opentrons.hardware_control.types import CriticalPoint
 
 from .types import Waypoint, MoveType
 from .errors import DestinationOutOfBoundsError, ArcOutOfBoundsError
+from .obstacles import ObstacleIndex
 
 DEFAULT_GENERAL_ARC_Z_MARGIN: Final[float] = 10.0
 DEFAULT_IN_LABWARE_ARC_Z_MARGIN: Final[float] = 5.0
@@ -23,6 +24,8 @@ def get_waypoints(
     xy_waypoints: Sequence[Tuple[float, float]] = (),
     origin_cp: Optional[CriticalPoint] = None,
     dest_cp: Optional[CriticalPoint] = None,
+    obstacles: Optional[ObstacleIndex] = None,
+    xy_clearance: Tuple[float, float] = (0.0, 0.0),
 ) -> List[Waypoint]:
     """Get waypoints between an origin point and a destination point.
 
@@ -38,6 +41,10 @@ def get_waypoints(
     :param xy_waypoints: Extra XY destination waypoints to place in the path.
     :param origin_cp: Pipette critical point override for origin waypoints.
     :param dest_cp: Pipette critical point override for destination waypoints.
+    :param obstacles: Deck obstacles to clear. If given, an arc only rises
+        above the obstacles its XY path passes over, if any are taller
+        than `min_travel_z`.
+    :param xy_clearance: How far in X and Y to stay away from `obstacles`.
 
     :returns: A list of :py:class:`.Waypoint` locations to move through.
     """
@@ -65,6 +72,16 @@ def get_waypoints(
             message="Destination out of bounds in the Z-axis",
         )
 
+    # raise min_travel_z to clear any obstacles along the XY path
+    if obstacles is not None:
+        obstacle_z = obstacles.get_highest_z(
+            [(origin.x, origin.y), *xy_waypoints, (dest.x, dest.y)],
+            xy_clearance,
+        )
+
+        if obstacle_z is not None:
+            min_travel_z = max(min_travel_z, obstacle_z)
+
     # ensure that the passed in min_travel_z and max_travel_z are compatible
     if min_travel_z + MINIMUM_Z_MARGIN > max_travel_z:
         raise ArcOutOfBoundsError(
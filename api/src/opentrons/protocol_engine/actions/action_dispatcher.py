@@ -1,5 +1,5 @@
 """Action pipeline module."""
-from typing import List
+from typing import Iterable, List, Optional
 
 from .action_handler import ActionHandler
 from .actions import Action
@@ -28,3 +28,25 @@ class ActionDispatcher:
             handler.handle_action(action)
 
         self._sink.handle_action(action)
+
+    def dispatch_many(self, actions: Iterable[Action]) -> None:
+        """Dispatch several actions into the pipeline as a single batch.
+
+        Each action flows through the pipeline in order, as if it had been
+        dispatched on its own, but the sink may wait until every action has
+        been handled to publish its resulting state.
+
+        If an action fails, the rest of the batch is still dispatched, and
+        the first error is raised once the batch is done.
+        """
+        error: Optional[Exception] = None
+
+        with self._sink.batch():
+            for action in actions:
+                try:
+                    self.dispatch(action)
+                except Exception as e:
+                    error = error or e
+
+        if error is not None:
+            raise error
@@ -1,5 +1,7 @@
 """Abstract interfaces for engine plugins."""
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from typing import ContextManager
 
 from .actions import Action
 
@@ -11,3 +13,12 @@ class ActionHandler(ABC):
     def handle_action(self, action: Action) -> None:
         """React to a state-change action."""
         ...
+
+    def batch(self) -> ContextManager[None]:
+        """Get a context manager to group several actions into one batch.
+
+        Handlers that publish the result of each action, like the StateStore,
+        may override this method to defer publishing until the batch is done.
+        By default, actions are not batched.
+        """
+        return nullcontext()
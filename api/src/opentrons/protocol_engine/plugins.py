@@ -2,7 +2,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from anyio import from_thread
-from typing import List
+from typing import Iterable, List
 from typing_extensions import final
 
 from .actions import Action, ActionDispatcher, ActionHandler
@@ -37,6 +37,17 @@ class AbstractPlugin(ActionHandler, ABC):
         """
         return self._action_dispatcher.dispatch(action)
 
+    @final
+    def dispatch_many(self, actions: Iterable[Action]) -> None:
+        """Dispatch several actions into the action pipeline as a single batch.
+
+        Arguments:
+            actions: New ProtocolEngine actions to send into the pipeline,
+                in order. State changes and notifications from the whole
+                batch will be published at once, after the last action.
+        """
+        return self._action_dispatcher.dispatch_many(actions)
+
     @final
     def dispatch_threadsafe(self, action: Action) -> None:
         """Dispatch an action into the action pipeline from a child thread.
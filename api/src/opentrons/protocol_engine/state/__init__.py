@@ -1,7 +1,7 @@
 """Protocol engine state module."""
 
-from .state import State, StateStore, StateView
-from .commands import CommandState, CommandView
+from .state import State, StateStore, StateView, StateTopic, CommandTopic
+from .commands import CommandState, CommandView, CommandSlice
 from .labware import LabwareState, LabwareView
 from .pipettes import PipetteState, PipetteView, HardwarePipette, CurrentWell
 from .geometry import GeometryView, TipGeometry
@@ -13,9 +13,12 @@ __all__ = [
     "State",
     "StateStore",
     "StateView",
+    "StateTopic",
+    "CommandTopic",
     # command state
     "CommandState",
     "CommandView",
+    "CommandSlice",
     # labware state
     "LabwareState",
     "LabwareView",
@@ -1,19 +1,107 @@
 """Simple state change notification interface."""
 import asyncio
+from itertools import count
+from typing import Dict, Hashable, Iterable, List, Optional
 
 
 class ChangeNotifier:
-    """An interface tto emit or subscribe to state change notifications."""
+    """An interface to emit or subscribe to state change notifications.
+
+    Notifications may be scoped to one or more topics, and subscribers may
+    choose to only be woken by changes to specific topics, rather than by
+    every change. A subscriber that doesn't specify any topics is woken by
+    every notification, and a notification without topics wakes everybody.
+
+    Subscribers are woken in the order they subscribed.
+    """
 
     def __init__(self) -> None:
-        """Initialize the ChangeNotifier with an internal Event."""
-        self._event = asyncio.Event()
+        """Initialize the ChangeNotifier with no subscribers."""
+        # waiters that are interested in any change are stored under `None`
+        self._waiters_by_topic: Dict[
+            Optional[Hashable], Dict[int, "asyncio.Future[None]"]
+        ] = {}
+        self._versions_by_topic: Dict[Hashable, int] = {}
+        self._version = 0
+        self._waiter_ids = count()
+
+    def notify(self, topics: Optional[Iterable[Hashable]] = None) -> None:
+        """Notify `wait`'ers that the state has changed.
+
+        Arguments:
+            topics: The topics that have changed. Only subscribers to these
+                topics, plus subscribers to all changes, will be woken. If
+                omitted, all subscribers will be woken.
+        """
+        self._version += 1
+
+        if topics is None:
+            waiters_to_wake = list(self._waiters_by_topic.values())
+            self._waiters_by_topic.clear()
+        else:
+            waiters_to_wake = []
+
+            for topic in (None, *topics):
+                if topic is not None:
+                    self._versions_by_topic[topic] = self.get_version(topic) + 1
+
+                waiters = self._waiters_by_topic.pop(topic, None)
+
+                if waiters is not None:
+                    waiters_to_wake.append(waiters)
+
+        if len(waiters_to_wake) == 1:
+            futures = list(waiters_to_wake[0].values())
+        else:
+            # a subscriber may be waiting on several of the notified topics,
+            # so de-duplicate and restore subscription order
+            futures_by_id = {}
+
+            for waiters in waiters_to_wake:
+                futures_by_id.update(waiters)
+
+            futures = [futures_by_id[i] for i in sorted(futures_by_id)]
+
+        for future in futures:
+            if not future.done():
+                future.set_result(None)
+
+    def get_version(self, topic: Optional[Hashable] = None) -> int:
+        """Get the number of notifications that have been emitted for a topic.
+
+        Arguments:
+            topic: The topic to check. If omitted, get the number of
+                notifications emitted for any topic.
+        """
+        if topic is None:
+            return self._version
+
+        return self._versions_by_topic.get(topic, 0)
+
+    async def wait(self, topics: Optional[Iterable[Hashable]] = None) -> None:
+        """Wait until the next state change notification.
+
+        Arguments:
+            topics: Only wake up for notifications about these topics. If
+                omitted, wake up for any notification.
+        """
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        waiter_id = next(self._waiter_ids)
+        subscribed_topics: List[Optional[Hashable]] = (
+            [None] if topics is None else list(topics)
+        )
+
+        for topic in subscribed_topics:
+            self._waiters_by_topic.setdefault(topic, {})[waiter_id] = future
+
+        try:
+            await future
+        finally:
+            for topic in subscribed_topics:
+                waiters = self._waiters_by_topic.get(topic)
 
-    def notify(self) -> None:
-        """Notify all `wait`'ers that the state has changed."""
-        self._event.set()
+                if waiters is not None:
+                    waiters.pop(waiter_id, None)
 
-    async def wait(self) -> None:
-        """Wait until the next state change notification."""
-        self._event.clear()
-        await self._event.wait()
+                    if not waiters:
+                        del self._waiters_by_topic[topic]
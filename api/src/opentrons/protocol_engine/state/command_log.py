@@ -0,0 +1,464 @@
+"""Persistent, structurally-shared storage for the engine's command history."""
+from __future__ import annotations
+
+from itertools import islice
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    ItemsView,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    ValuesView,
+)
+
+from ..commands import Command, CommandStatus
+
+
+_T = TypeVar("_T")
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+_COMPLETED_STATUSES = frozenset([CommandStatus.SUCCEEDED, CommandStatus.FAILED])
+
+
+class PersistentVector(Generic[_T]):
+    """An immutable sequence with cheap, structurally-shared updates.
+
+    Values are stored in the leaves of a 32-way trie, plus a "tail" leaf that
+    holds the most recently appended values. Appending or replacing a value
+    copies only the nodes along the path to that value, so previous versions
+    of the vector remain valid and unchanged while sharing almost all of their
+    storage with the new version.
+
+    Appends are amortized O(1); replacements and lookups are O(log32(n)).
+    """
+
+    __slots__ = ("_count", "_shift", "_root", "_tail")
+
+    def __init__(self) -> None:
+        """Initialize an empty vector."""
+        self._count = 0
+        self._shift = _BITS
+        self._root: Tuple[object, ...] = ()
+        self._tail: Tuple[_T, ...] = ()
+
+    @classmethod
+    def _create(
+        cls,
+        count: int,
+        shift: int,
+        root: Tuple[object, ...],
+        tail: Tuple[_T, ...],
+    ) -> PersistentVector[_T]:
+        vector: PersistentVector[_T] = cls.__new__(cls)
+        vector._count = count
+        vector._shift = shift
+        vector._root = root
+        vector._tail = tail
+        return vector
+
+    def __len__(self) -> int:
+        """Get the number of values in the vector."""
+        return self._count
+
+    def __getitem__(self, index: int) -> _T:
+        """Get the value at `index`."""
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            raise IndexError(f"Index {index} out of range")
+
+        return self._leaf_for(index)[index & _MASK]
+
+    def __iter__(self) -> Iterator[_T]:
+        """Iterate through the vector's values in order, leaf by leaf."""
+        tail_offset = self._tail_offset()
+
+        for leaf_start in range(0, tail_offset, _WIDTH):
+            yield from self._leaf_for(leaf_start)
+
+        yield from self._tail
+
+    def append(self, value: _T) -> PersistentVector[_T]:
+        """Get a new vector with `value` added to the end."""
+        count = self._count
+
+        if count - self._tail_offset() < _WIDTH:
+            return self._create(
+                count + 1, self._shift, self._root, self._tail + (value,)
+            )
+
+        # the tail is full, so push it into the trie and start a new tail,
+        # adding a new level to the trie if the root is also full
+        if (count >> _BITS) > (1 << self._shift):
+            root: Tuple[object, ...] = (
+                self._root,
+                _new_path(self._shift, self._tail),
+            )
+            shift = self._shift + _BITS
+        else:
+            root = self._push_tail(self._shift, self._root, self._tail)
+            shift = self._shift
+
+        return self._create(count + 1, shift, root, (value,))
+
+    def set(self, index: int, value: _T) -> PersistentVector[_T]:
+        """Get a new vector with the value at `index` replaced by `value`."""
+        if not 0 <= index < self._count:
+            raise IndexError(f"Index {index} out of range")
+
+        if index >= self._tail_offset():
+            tail = list(self._tail)
+            tail[index & _MASK] = value
+            return self._create(self._count, self._shift, self._root, tuple(tail))
+
+        root = _assoc(self._shift, self._root, index, value)
+        return self._create(self._count, self._shift, root, self._tail)
+
+    def _tail_offset(self) -> int:
+        if self._count < _WIDTH:
+            return 0
+
+        return ((self._count - 1) >> _BITS) << _BITS
+
+    def _leaf_for(self, index: int) -> Tuple[_T, ...]:
+        if index >= self._tail_offset():
+            return self._tail
+
+        node = self._root
+        level = self._shift
+
+        while level > 0:
+            node = node[(index >> level) & _MASK]  # type: ignore[assignment]
+            level -= _BITS
+
+        return node  # type: ignore[return-value]
+
+    def _push_tail(
+        self,
+        level: int,
+        parent: Tuple[object, ...],
+        tail: Tuple[_T, ...],
+    ) -> Tuple[object, ...]:
+        sub_index = ((self._count - 1) >> level) & _MASK
+        child: Tuple[object, ...]
+
+        if level == _BITS:
+            child = tail
+        elif sub_index < len(parent):
+            child = self._push_tail(
+                level - _BITS,
+                parent[sub_index],  # type: ignore[arg-type]
+                tail,
+            )
+        else:
+            child = _new_path(level - _BITS, tail)
+
+        return parent[:sub_index] + (child,) + parent[sub_index + 1 :]
+
+
+def _new_path(level: int, node: Tuple[object, ...]) -> Tuple[object, ...]:
+    while level > 0:
+        node = (node,)
+        level -= _BITS
+
+    return node
+
+
+def _assoc(
+    level: int,
+    node: Tuple[object, ...],
+    index: int,
+    value: object,
+) -> Tuple[object, ...]:
+    sub_index = (index >> level) & _MASK
+    child: object
+
+    if level == 0:
+        child = value
+    else:
+        child = _assoc(
+            level - _BITS,
+            node[sub_index],  # type: ignore[arg-type]
+            index,
+            value,
+        )
+
+    return node[:sub_index] + (child,) + node[sub_index + 1 :]
+
+
+class CommandLog(Mapping[str, Command]):
+    """An immutable, insertion-ordered mapping of command IDs to commands.
+
+    Each call to `set` returns a new CommandLog, leaving the original
+    untouched, so a CommandLog may be safely held as part of a state snapshot.
+
+    New versions of the log share their storage with previous versions:
+    commands live in a PersistentVector, and the ID-to-index lookup is an
+    append-only list and dictionary shared by every version in a lineage.
+    A version only considers the first `len(self)` entries of that shared
+    lookup, which is enough to keep older versions consistent because an ID's
+    position never changes once it has been added.
+
+    The log also maintains indexes of command status, so that queue and
+    completion queries don't need to scan every command:
+
+    - A count of commands in each status
+    - The position of the earliest queued command, which acts as the head of
+      the command queue since commands are queued in log order
+    - The position of the earliest incomplete (queued or running) command
+    - The position of the earliest failed command
+
+    The positional indexes are cursors that only move forward as commands
+    progress, so keeping them up to date is amortized O(1) per command.
+    """
+
+    __slots__ = (
+        "_ids",
+        "_index_by_id",
+        "_commands",
+        "_status_counts",
+        "_next_queued_index",
+        "_first_incomplete_index",
+        "_first_failed_index",
+    )
+
+    _ids: List[str]
+    _index_by_id: Dict[str, int]
+    _commands: PersistentVector[Command]
+    _status_counts: Mapping[CommandStatus, int]
+    _next_queued_index: int
+    _first_incomplete_index: int
+    _first_failed_index: Optional[int]
+
+    def __init__(self, commands: Iterable[Command] = ()) -> None:
+        """Initialize a command log, optionally pre-filled with commands."""
+        log = self._create(
+            ids=[],
+            index_by_id={},
+            commands=PersistentVector(),
+            status_counts={},
+            next_queued_index=0,
+            first_incomplete_index=0,
+            first_failed_index=None,
+        )
+
+        for command in commands:
+            log = log.set(command)
+
+        for attr in self.__slots__:
+            setattr(self, attr, getattr(log, attr))
+
+    def set(self, command: Command) -> CommandLog:
+        """Get a new log with `command` added or replaced, keyed by its ID.
+
+        Replacing an existing command keeps its place in the ordering.
+        """
+        count = len(self._commands)
+        index = self._index_by_id.get(command.id)
+        ids = self._ids
+        index_by_id = self._index_by_id
+        prev_status: Optional[CommandStatus] = None
+
+        if index is not None and index < count:
+            prev_status = self._commands[index].status
+            commands = self._commands.set(index, command)
+
+        else:
+            # A newer version of this log has already extended the shared ID
+            # lookup, so this version needs a lookup of its own
+            if len(ids) != count:
+                ids = ids[:count]
+                index_by_id = {command_id: i for i, command_id in enumerate(ids)}
+
+            index = count
+            index_by_id[command.id] = index
+            ids.append(command.id)
+            commands = self._commands.append(command)
+
+        return self._create_reindexed(
+            ids=ids,
+            index_by_id=index_by_id,
+            commands=commands,
+            index=index,
+            prev_status=prev_status,
+        )
+
+    def get_index(self, command_id: str) -> Optional[int]:
+        """Get the position of a command in the log, if present."""
+        index = self._index_by_id.get(command_id)
+        return index if index is not None and index < len(self._commands) else None
+
+    def get_by_index(self, index: int) -> Command:
+        """Get the command at a given position in the log."""
+        return self._commands[index]
+
+    def get_range(self, start: int, stop: int) -> List[Command]:
+        """Get the commands from position `start` up to, but not including, `stop`.
+
+        Positions past the end of the log are ignored.
+        """
+        stop = min(stop, len(self._commands))
+        return [self._commands[index] for index in range(start, stop)]
+
+    def get_status_count(self, status: CommandStatus) -> int:
+        """Get the number of commands with a given status."""
+        return self._status_counts.get(status, 0)
+
+    def get_next_queued_index(self) -> Optional[int]:
+        """Get the position of the earliest queued command, if any."""
+        return self._cursor_to_index(self._next_queued_index)
+
+    def get_first_incomplete_index(self) -> Optional[int]:
+        """Get the position of the earliest queued or running command, if any."""
+        return self._cursor_to_index(self._first_incomplete_index)
+
+    def get_first_failed_index(self) -> Optional[int]:
+        """Get the position of the earliest failed command, if any."""
+        return self._first_failed_index
+
+    def __getitem__(self, command_id: str) -> Command:
+        """Get a command by its ID."""
+        index = self.get_index(command_id)
+
+        if index is None:
+            raise KeyError(command_id)
+
+        return self._commands[index]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate through command IDs in order."""
+        return islice(self._ids, len(self._commands))
+
+    def __len__(self) -> int:
+        """Get the number of commands in the log."""
+        return len(self._commands)
+
+    def __repr__(self) -> str:
+        """Get a string representation of the log."""
+        return f"{type(self).__name__}({list(self._commands)!r})"
+
+    def values(self) -> ValuesView[Command]:
+        """Get a view of the log's commands, in order."""
+        return _CommandLogValues(self)
+
+    def items(self) -> ItemsView[str, Command]:
+        """Get a view of the log's (ID, command) pairs, in order."""
+        return _CommandLogItems(self)
+
+    def _create_reindexed(
+        self,
+        ids: List[str],
+        index_by_id: Dict[str, int],
+        commands: PersistentVector[Command],
+        index: int,
+        prev_status: Optional[CommandStatus],
+    ) -> CommandLog:
+        """Create a new log, updating status indexes for a changed command."""
+        status = commands[index].status
+        status_counts = self._status_counts
+        next_queued_index = self._next_queued_index
+        first_incomplete_index = self._first_incomplete_index
+        first_failed_index = self._first_failed_index
+
+        if status != prev_status:
+            status_counts = dict(status_counts)
+            status_counts[status] = status_counts.get(status, 0) + 1
+
+            if prev_status is not None:
+                status_counts[prev_status] -= 1
+
+        if status == CommandStatus.QUEUED:
+            next_queued_index = min(next_queued_index, index)
+
+        if status not in _COMPLETED_STATUSES:
+            first_incomplete_index = min(first_incomplete_index, index)
+
+        if status == CommandStatus.FAILED:
+            if first_failed_index is None or index < first_failed_index:
+                first_failed_index = index
+
+        elif index == first_failed_index:
+            first_failed_index = next(
+                (i for i, c in enumerate(commands) if c.status == CommandStatus.FAILED),
+                None,
+            )
+
+        next_queued_index = _advance_cursor(
+            commands,
+            next_queued_index,
+            skip=lambda c: c.status != CommandStatus.QUEUED,
+        )
+        first_incomplete_index = _advance_cursor(
+            commands,
+            first_incomplete_index,
+            skip=lambda c: c.status in _COMPLETED_STATUSES,
+        )
+
+        return self._create(
+            ids=ids,
+            index_by_id=index_by_id,
+            commands=commands,
+            status_counts=status_counts,
+            next_queued_index=next_queued_index,
+            first_incomplete_index=first_incomplete_index,
+            first_failed_index=first_failed_index,
+        )
+
+    def _cursor_to_index(self, cursor: int) -> Optional[int]:
+        return cursor if cursor < len(self._commands) else None
+
+    @classmethod
+    def _create(
+        cls,
+        ids: List[str],
+        index_by_id: Dict[str, int],
+        commands: PersistentVector[Command],
+        status_counts: Mapping[CommandStatus, int],
+        next_queued_index: int,
+        first_incomplete_index: int,
+        first_failed_index: Optional[int],
+    ) -> CommandLog:
+        log: CommandLog = cls.__new__(cls)
+        log._ids = ids
+        log._index_by_id = index_by_id
+        log._commands = commands
+        log._status_counts = status_counts
+        log._next_queued_index = next_queued_index
+        log._first_incomplete_index = first_incomplete_index
+        log._first_failed_index = first_failed_index
+        return log
+
+
+def _advance_cursor(
+    commands: PersistentVector[Command],
+    cursor: int,
+    skip: Callable[[Command], bool],
+) -> int:
+    while cursor < len(commands) and skip(commands[cursor]):
+        cursor += 1
+
+    return cursor
+
+
+class _CommandLogValues(ValuesView[Command]):
+    _mapping: CommandLog
+
+    def __iter__(self) -> Iterator[Command]:
+        return iter(self._mapping._commands)
+
+
+class _CommandLogItems(ItemsView[str, Command]):
+    _mapping: CommandLog
+
+    def __iter__(self) -> Iterator[Tuple[str, Command]]:
+        return zip(iter(self._mapping), iter(self._mapping._commands))
@@ -1,6 +1,5 @@
 """Protocol engine commands sub-state."""
 from __future__ import annotations
-from collections import OrderedDict
 from dataclasses import dataclass, replace
 from typing import List, Mapping, Optional, Union
 
@@ -23,6 +22,22 @@ from ..errors import (
 )
 from ..types import EngineStatus
 from .abstract_store import HasState, HandlesActions
+from .command_log import CommandLog
+
+
+@dataclass(frozen=True)
+class CommandSlice:
+    """A contiguous page of the command list.
+
+    Attributes:
+        commands: The commands in the page, in order.
+        cursor: The position of the first command of the page in the full list.
+        total_length: The number of commands in the full list.
+    """
+
+    commands: List[Command]
+    cursor: int
+    total_length: int
 
 
 @dataclass(frozen=True)
@@ -31,8 +46,7 @@ class CommandState:
 
     is_running: bool
     stop_requested: bool
-    # TODO(mc, 2021-06-16): OrderedDict is mutable. Switch to Sequence + Mapping
-    commands_by_id: OrderedDict[str, Command]
+    commands_by_id: CommandLog
     errors_by_id: Mapping[str, ErrorOccurrence]
 
 
@@ -46,7 +60,7 @@ class CommandStore(HasState[CommandState], HandlesActions):
         self._state = CommandState(
             is_running=True,
             stop_requested=False,
-            commands_by_id=OrderedDict(),
+            commands_by_id=CommandLog(),
             errors_by_id={},
         )
 
@@ -65,22 +79,16 @@ class CommandStore(HasState[CommandState], HandlesActions):
                 params=action.request.params,  # type: ignore[arg-type]
                 status=CommandStatus.QUEUED,
             )
-            commands_by_id = self._state.commands_by_id.copy()
-            commands_by_id.update({queued_command.id: queued_command})
-
+            commands_by_id = self._state.commands_by_id.set(queued_command)
             self._state = replace(self._state, commands_by_id=commands_by_id)
 
         elif isinstance(action, UpdateCommandAction):
-            command = action.command
-            commands_by_id = self._state.commands_by_id.copy()
-            commands_by_id.update({command.id: command})
-
+            commands_by_id = self._state.commands_by_id.set(action.command)
             self._state = replace(self._state, commands_by_id=commands_by_id)
 
         elif isinstance(action, FailCommandAction):
-            commands_by_id = self._state.commands_by_id.copy()
             errors_by_id = dict(self._state.errors_by_id)
-            prev_command = commands_by_id[action.command_id]
+            prev_command = self._state.commands_by_id[action.command_id]
             command = prev_command.copy(
                 update={
                     "errorId": action.error_id,
@@ -88,7 +96,7 @@ class CommandStore(HasState[CommandState], HandlesActions):
                     "status": CommandStatus.FAILED,
                 }
             )
-            commands_by_id.update({command.id: command})
+            commands_by_id = self._state.commands_by_id.set(command)
             errors_by_id[action.error_id] = ErrorOccurrence(
                 id=action.error_id,
                 createdAt=action.failed_at,
@@ -163,6 +171,27 @@ class CommandView(HasState[CommandState]):
         """
         return list(self._state.commands_by_id.values())
 
+    def get_slice(self, cursor: int, length: Optional[int] = None) -> CommandSlice:
+        """Get a page of commands, in the same order as `get_all`.
+
+        Commands never change position once added, so a client that has
+        seen every command before `cursor` can ask for just the rest.
+
+        Arguments:
+            cursor: Position of the first command to get.
+            length: Maximum number of commands to get. If omitted, get every
+                command from `cursor` to the end of the list.
+        """
+        commands_by_id = self._state.commands_by_id
+        total_length = len(commands_by_id)
+        stop = total_length if length is None else cursor + length
+
+        return CommandSlice(
+            commands=commands_by_id.get_range(cursor, stop),
+            cursor=cursor,
+            total_length=total_length,
+        )
+
     def get_all_errors(self) -> List[ErrorOccurrence]:
         """Get a list of all errors that have occurred."""
         return list(self._state.errors_by_id.values())
@@ -182,11 +211,17 @@ class CommandView(HasState[CommandState]):
         if not self._state.is_running:
             return None
 
-        for command_id, command in self._state.commands_by_id.items():
-            if command.status == CommandStatus.FAILED:
-                raise ProtocolEngineStoppedError("Previous command failed.")
-            elif command.status == CommandStatus.QUEUED:
-                return command_id
+        commands_by_id = self._state.commands_by_id
+        next_queued_index = commands_by_id.get_next_queued_index()
+        first_failed_index = commands_by_id.get_first_failed_index()
+
+        if first_failed_index is not None and (
+            next_queued_index is None or first_failed_index < next_queued_index
+        ):
+            raise ProtocolEngineStoppedError("Previous command failed.")
+
+        if next_queued_index is not None:
+            return commands_by_id.get_by_index(next_queued_index).id
 
         return None
 
@@ -207,14 +242,19 @@ class CommandView(HasState[CommandState]):
         Arguments:
             command_id: Command to check.
         """
-        for search_id, search_command in self._state.commands_by_id.items():
-            search_status = search_command.status
-            is_failed = search_status == CommandStatus.FAILED
-
-            if search_id == command_id or is_failed:
-                return search_status == CommandStatus.SUCCEEDED or is_failed
-
-        return False
+        commands_by_id = self._state.commands_by_id
+        index = commands_by_id.get_index(command_id)
+        first_failed_index = commands_by_id.get_first_failed_index()
+
+        if first_failed_index is not None and (
+            index is None or first_failed_index <= index
+        ):
+            return True
+
+        return (
+            index is not None
+            and commands_by_id.get_by_index(index).status == CommandStatus.SUCCEEDED
+        )
 
     def get_all_complete(self) -> bool:
         """Get whether all commands have completed.
@@ -224,12 +264,14 @@ class CommandView(HasState[CommandState]):
         - All commands have a status of CommandStatus.SUCCEEDED
         - Any command has a status of CommandStatus.FAILED
         """
-        for command in self._state.commands_by_id.values():
-            if command.status == CommandStatus.FAILED:
-                return True
-            elif command.status != CommandStatus.SUCCEEDED:
-                return False
-        return True
+        commands_by_id = self._state.commands_by_id
+        first_incomplete_index = commands_by_id.get_first_incomplete_index()
+        first_failed_index = commands_by_id.get_first_failed_index()
+
+        return first_incomplete_index is None or (
+            first_failed_index is not None
+            and first_failed_index < first_incomplete_index
+        )
 
     def get_stop_requested(self) -> bool:
         """Get whether an engine stop has been requested.
@@ -240,9 +282,10 @@ class CommandView(HasState[CommandState]):
 
     def get_is_stopped(self) -> bool:
         """Get whether an engine stop has completed."""
-        return self._state.stop_requested and not any(
-            c.status == CommandStatus.RUNNING
-            for c in self._state.commands_by_id.values()
+        commands_by_id = self._state.commands_by_id
+        return (
+            self._state.stop_requested
+            and commands_by_id.get_status_count(CommandStatus.RUNNING) == 0
         )
 
     def validate_action_allowed(self, action: Union[PlayAction, PauseAction]) -> None:
@@ -259,27 +302,28 @@ class CommandView(HasState[CommandState]):
 
     def get_status(self) -> EngineStatus:
         """Get the current execution status of the engine."""
-        all_commands = self._state.commands_by_id.values()
+        commands_by_id = self._state.commands_by_id
         all_errors = self._state.errors_by_id.values()
-        all_statuses = [c.status for c in all_commands]
+        any_running = commands_by_id.get_status_count(CommandStatus.RUNNING) > 0
+        any_queued = commands_by_id.get_status_count(CommandStatus.QUEUED) > 0
+        all_succeeded = commands_by_id.get_status_count(CommandStatus.SUCCEEDED) == len(
+            commands_by_id
+        )
 
         if self._state.stop_requested:
             if any(all_errors):
                 return EngineStatus.FAILED
 
-            if all(s == CommandStatus.SUCCEEDED for s in all_statuses):
+            if all_succeeded:
                 return EngineStatus.SUCCEEDED
 
-            elif any(s == CommandStatus.RUNNING for s in all_statuses):
+            elif any_running:
                 return EngineStatus.STOP_REQUESTED
 
             else:
                 return EngineStatus.STOPPED
 
         elif self._state.is_running:
-            any_running = any(s == CommandStatus.RUNNING for s in all_statuses)
-            any_queued = any(s == CommandStatus.QUEUED for s in all_statuses)
-
             if any_running or any_queued:
                 return EngineStatus.RUNNING
 
@@ -287,7 +331,7 @@ class CommandView(HasState[CommandState]):
                 return EngineStatus.IDLE
 
         else:
-            if any(s == CommandStatus.RUNNING for s in all_statuses):
+            if any_running:
                 return EngineStatus.PAUSE_REQUESTED
 
             else:
@@ -1,10 +1,11 @@
 """Geometry state getters."""
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 
 
 from opentrons.types import Point
 from opentrons.hardware_control.dev_types import PipetteDict
+from opentrons.motion_planning import Obstacle, ObstacleIndex
 
 from .. import errors
 from ..types import (
@@ -14,7 +15,7 @@ from ..types import (
     WellOffset,
     DeckSlotLocation,
 )
-from .labware import LabwareView
+from .labware import LabwareState, LabwareView
 
 
 DEFAULT_TIP_DROP_HEIGHT_FACTOR = 0.5
@@ -31,6 +32,17 @@ class TipGeometry:
     volume: int
 
 
+@dataclass
+class _DerivedGeometryState:
+    """Geometry computed from a single LabwareState, filled in as it's read."""
+
+    labware_state: LabwareState
+    labware_positions: Dict[str, Point] = field(default_factory=dict)
+    labware_highest_z: Dict[str, float] = field(default_factory=dict)
+    all_labware_highest_z: Optional[float] = None
+    obstacles: Optional[ObstacleIndex] = None
+
+
 # TODO(mc, 2021-06-03): continue evaluation of which selectors should go here
 # vs which selectors should be in LabwareView
 class GeometryView:
@@ -41,21 +53,45 @@ class GeometryView:
     def __init__(self, labware_view: LabwareView) -> None:
         """Initialize a GeometryView instance."""
         self._labware = labware_view
+        self._derived = _DerivedGeometryState(labware_state=labware_view.state)
 
     def get_labware_highest_z(self, labware_id: str) -> float:
         """Get the highest Z-point of a labware."""
-        labware_data = self._labware.get(labware_id)
+        derived = self._get_derived()
+        highest_z = derived.labware_highest_z.get(labware_id)
+
+        if highest_z is None:
+            labware_data = self._labware.get(labware_id)
+            highest_z = self._get_highest_z_from_labware_data(labware_data)
+            derived.labware_highest_z[labware_id] = highest_z
 
-        return self._get_highest_z_from_labware_data(labware_data)
+        return highest_z
 
     def get_all_labware_highest_z(self) -> float:
         """Get the highest Z-point across all labware."""
-        return max(
-            [
-                self._get_highest_z_from_labware_data(lw_data)
+        derived = self._get_derived()
+
+        if derived.all_labware_highest_z is None:
+            derived.all_labware_highest_z = max(
+                [
+                    self.get_labware_highest_z(lw_data.id)
+                    for lw_data in self._labware.get_all()
+                ]
+            )
+
+        return derived.all_labware_highest_z
+
+    def get_obstacles(self) -> ObstacleIndex:
+        """Get an index of the bounding boxes of all labware."""
+        derived = self._get_derived()
+
+        if derived.obstacles is None:
+            derived.obstacles = ObstacleIndex(
+                self._get_obstacle_from_labware_data(lw_data)
                 for lw_data in self._labware.get_all()
-            ]
-        )
+            )
+
+        return derived.obstacles
 
     def get_labware_parent_position(self, labware_id: str) -> Point:
         """Get the position of the labware's parent slot (deck or module)."""
@@ -79,14 +115,20 @@ class GeometryView:
 
     def get_labware_position(self, labware_id: str) -> Point:
         """Get the calibrated origin of the labware."""
-        origin_pos = self.get_labware_origin_position(labware_id)
-        cal_offset = self._labware.get_labware_offset_vector(labware_id)
+        derived = self._get_derived()
+        labware_pos = derived.labware_positions.get(labware_id)
+
+        if labware_pos is None:
+            origin_pos = self.get_labware_origin_position(labware_id)
+            cal_offset = self._labware.get_labware_offset_vector(labware_id)
+            labware_pos = Point(
+                x=origin_pos.x + cal_offset.x,
+                y=origin_pos.y + cal_offset.y,
+                z=origin_pos.z + cal_offset.z,
+            )
+            derived.labware_positions[labware_id] = labware_pos
 
-        return Point(
-            x=origin_pos.x + cal_offset.x,
-            y=origin_pos.y + cal_offset.y,
-            z=origin_pos.z + cal_offset.z,
-        )
+        return labware_pos
 
     def get_well_position(
         self,
@@ -121,6 +163,27 @@ class GeometryView:
 
         return labware_pos.z + z_dim
 
+    def _get_obstacle_from_labware_data(self, lw_data: LoadedLabware) -> Obstacle:
+        labware_pos = self.get_labware_position(lw_data.id)
+        dims = self._labware.get_definition(lw_data.id).dimensions
+
+        return Obstacle(
+            min_x=labware_pos.x,
+            min_y=labware_pos.y,
+            max_x=labware_pos.x + dims.xDimension,
+            max_y=labware_pos.y + dims.yDimension,
+            top_z=self.get_labware_highest_z(lw_data.id),
+        )
+
+    def _get_derived(self) -> _DerivedGeometryState:
+        """Get the geometry of the current labware state, resetting it if stale."""
+        labware_state = self._labware.state
+
+        if self._derived.labware_state is not labware_state:
+            self._derived = _DerivedGeometryState(labware_state=labware_state)
+
+        return self._derived
+
     # TODO(mc, 2020-11-12): reconcile with existing protocol logic and include
     # data from tip-length calibration once v4.0.0 is in `edge`
     def get_effective_tip_length(
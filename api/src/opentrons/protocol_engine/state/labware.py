@@ -3,8 +3,8 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-from dataclasses import dataclass, replace
-from typing import Dict, List, Optional, Sequence
+from dataclasses import dataclass, field, replace
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2, SlotDefV2
 from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
@@ -45,6 +45,22 @@ class LabwareState:
     deck_definition: DeckDefinitionV2
 
 
+@dataclass
+class _DerivedLabwareState:
+    """Values computed from a single LabwareState, filled in as they're read.
+
+    LabwareState is never modified, only replaced, so these values are
+    valid for as long as the LabwareState they were computed from is current.
+    """
+
+    labware_state: LabwareState
+    slot_definitions_by_id: Optional[Dict[str, SlotDefV2]] = None
+    slot_positions: Dict[DeckSlotName, Point] = field(default_factory=dict)
+    well_rows_by_uri: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+    well_columns_by_uri: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+    offsets_by_location: Optional[Dict[Tuple[str, Hashable], LabwareOffset]] = None
+
+
 class LabwareStore(HasState[LabwareState], HandlesActions):
     """Labware state container."""
 
@@ -170,6 +186,7 @@ class LabwareView(HasState[LabwareState]):
             state: Labware state dataclass used for all calculations.
         """
         self._state = state
+        self._derived = _DerivedLabwareState(labware_state=state)
 
     def get(self, labware_id: str) -> LoadedLabware:
         """Get labware data by the labware's unique identifier."""
@@ -192,22 +209,33 @@ class LabwareView(HasState[LabwareState]):
 
     def get_slot_definition(self, slot: DeckSlotName) -> SlotDefV2:
         """Get the definition of a slot in the deck."""
-        deck_def = self.get_deck_definition()
+        derived = self._get_derived()
 
-        for slot_def in deck_def["locations"]["orderedSlots"]:
-            if slot_def["id"] == str(slot):
-                return slot_def
+        if derived.slot_definitions_by_id is None:
+            derived.slot_definitions_by_id = {
+                slot_def["id"]: slot_def
+                for slot_def in self._state.deck_definition["locations"]["orderedSlots"]
+            }
 
-        raise errors.SlotDoesNotExistError(
-            f"Slot ID {slot} does not exist in deck {deck_def['otId']}"
-        )
+        try:
+            return derived.slot_definitions_by_id[str(slot)]
+        except KeyError as e:
+            raise errors.SlotDoesNotExistError(
+                f"Slot ID {slot} does not exist in deck "
+                f"{self._state.deck_definition['otId']}"
+            ) from e
 
     def get_slot_position(self, slot: DeckSlotName) -> Point:
         """Get the position of a deck slot."""
-        slot_def = self.get_slot_definition(slot)
-        position = slot_def["position"]
+        derived = self._get_derived()
+        slot_position = derived.slot_positions.get(slot)
+
+        if slot_position is None:
+            position = self.get_slot_definition(slot)["position"]
+            slot_position = Point(x=position[0], y=position[1], z=position[2])
+            derived.slot_positions[slot] = slot_position
 
-        return Point(x=position[0], y=position[1], z=position[2])
+        return slot_position
 
     def get_definition_by_uri(self, uri: LabwareUri) -> LabwareDefinition:
         """Get the labware definition matching loadName namespace and version."""
@@ -261,22 +289,36 @@ class LabwareView(HasState[LabwareState]):
 
     def get_well_columns(self, labware_id: str) -> Dict[str, List[str]]:
         """Get well columns."""
-        definition = self.get_definition(labware_id=labware_id)
-        wells_by_cols = defaultdict(list)
-        for i, col in enumerate(definition.ordering):
-            wells_by_cols[f"{i+1}"] = col
+        derived = self._get_derived()
+        uri = self.get_definition_uri(labware_id)
+        wells_by_cols = derived.well_columns_by_uri.get(uri)
+
+        if wells_by_cols is None:
+            definition = self.get_definition_by_uri(LabwareUri(uri))
+            wells_by_cols = defaultdict(list)
+            for i, col in enumerate(definition.ordering):
+                wells_by_cols[f"{i+1}"] = col
+            derived.well_columns_by_uri[uri] = wells_by_cols
+
         return wells_by_cols
 
     def get_well_rows(self, labware_id: str) -> Dict[str, List[str]]:
         """Get well rows."""
-        definition = self.get_definition(labware_id=labware_id)
-        wells_by_rows = defaultdict(list)
-        pattern = re.compile(WELL_NAME_PATTERN, re.X)
-        for col in definition.ordering:
-            for well_name in col:
-                match = pattern.match(well_name)
-                assert match, f"Well name did not match pattern {pattern}"
-                wells_by_rows[match.group(1)].append(well_name)
+        derived = self._get_derived()
+        uri = self.get_definition_uri(labware_id)
+        wells_by_rows = derived.well_rows_by_uri.get(uri)
+
+        if wells_by_rows is None:
+            definition = self.get_definition_by_uri(LabwareUri(uri))
+            wells_by_rows = defaultdict(list)
+            pattern = re.compile(WELL_NAME_PATTERN, re.X)
+            for col in definition.ordering:
+                for well_name in col:
+                    match = pattern.match(well_name)
+                    assert match, f"Well name did not match pattern {pattern}"
+                    wells_by_rows[match.group(1)].append(well_name)
+            derived.well_rows_by_uri[uri] = wells_by_rows
+
         return wells_by_rows
 
     def get_tip_length(self, labware_id: str) -> float:
@@ -349,10 +391,27 @@ class LabwareView(HasState[LabwareState]):
 
         Returns ``None`` if no offsets match at all.
         """
-        for candidate in reversed(list(self._state.labware_offsets_by_id.values())):
-            if (
-                candidate.definitionUri == definition_uri
-                and candidate.location == location
-            ):
-                return candidate
-        return None
+        derived = self._get_derived()
+
+        if derived.offsets_by_location is None:
+            # later offsets overwrite earlier ones with the same key
+            derived.offsets_by_location = {
+                (offset.definitionUri, _get_location_key(offset.location)): offset
+                for offset in self._state.labware_offsets_by_id.values()
+            }
+
+        return derived.offsets_by_location.get(
+            (definition_uri, _get_location_key(location))
+        )
+
+    def _get_derived(self) -> _DerivedLabwareState:
+        """Get the derived values of the current state, resetting them if stale."""
+        if self._derived.labware_state is not self._state:
+            self._derived = _DerivedLabwareState(labware_state=self._state)
+
+        return self._derived
+
+
+def _get_location_key(location: LabwareLocation) -> Hashable:
+    """Get a hashable key that is equal for equal labware locations."""
+    return (type(location), tuple(location))
@@ -1,6 +1,9 @@
 """Motion state store and getters."""
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from typing_extensions import Final
+
+from opentrons_shared_data.pipette import name_config
 
 from opentrons.types import MountType, Point
 from opentrons.hardware_control.types import CriticalPoint
@@ -18,6 +21,13 @@ from .pipettes import PipetteView, CurrentWell
 from .geometry import GeometryView
 
 
+ARC_XY_CLEARANCE: Final = 10.0
+"""How far in X and Y to keep a pipette's nozzles away from labware it arcs over."""
+
+MULTI_CHANNEL_NOZZLE_SPACING: Final = 9.0
+"""The distance between adjacent nozzles of a multi-channel pipette."""
+
+
 @dataclass(frozen=True)
 class PipetteLocationData:
     """Pipette data used to determine the current gantry position."""
@@ -94,6 +104,9 @@ class MotionView:
         )
         dest_cp = CriticalPoint.XY_CENTER if center_dest else None
 
+        obstacles = None
+        xy_clearance = (0.0, 0.0)
+
         if (
             location is not None
             and pipette_id == location.pipette_id
@@ -106,8 +119,11 @@ class MotionView:
             )
             min_travel_z = self._geometry.get_labware_highest_z(labware_id)
         else:
+            # only clear the labware that the pipette actually passes over
             move_type = MoveType.GENERAL_ARC
-            min_travel_z = self._geometry.get_all_labware_highest_z()
+            min_travel_z = 0.0
+            obstacles = self._geometry.get_obstacles()
+            xy_clearance = self._get_xy_clearance(pipette_id)
 
         try:
             # TODO(mc, 2021-01-08): inject `get_waypoints` via constructor
@@ -120,6 +136,21 @@ class MotionView:
                 min_travel_z=min_travel_z,
                 max_travel_z=max_travel_z,
                 xy_waypoints=[],
+                obstacles=obstacles,
+                xy_clearance=xy_clearance,
             )
         except MotionPlanningError as error:
             raise errors.FailedToPlanMoveError(str(error))
+
+    def _get_xy_clearance(self, pipette_id: str) -> Tuple[float, float]:
+        """Get how far in X and Y a pipette must stay from labware it arcs over.
+
+        A multi-channel's nozzles span the Y axis. The critical point may be
+        at either end or the center of that span, so clear all of it on
+        both sides.
+        """
+        pipette_name = self._pipettes.get(pipette_id).pipetteName
+        channels = name_config()[pipette_name.value]["channels"]
+        y_span = (channels - 1) * MULTI_CHANNEL_NOZZLE_SPACING
+
+        return (ARC_XY_CLEARANCE, ARC_XY_CLEARANCE + y_span)
@@ -1,14 +1,32 @@
 """Protocol engine state management."""
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
+from enum import Enum
 from functools import partial
-from typing import Any, Callable, List, Optional, Sequence, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+)
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
 
 from ..resources import DeckFixedLabware
-from ..actions import Action, ActionHandler
+from ..actions import (
+    Action,
+    ActionHandler,
+    QueueCommandAction,
+    UpdateCommandAction,
+    FailCommandAction,
+)
 from .abstract_store import HasState, HandlesActions
 from .change_notifier import ChangeNotifier
 from .commands import CommandState, CommandStore, CommandView
@@ -22,6 +40,30 @@ from .configs import EngineConfigs
 ReturnT = TypeVar("ReturnT")
 
 
+class StateTopic(str, Enum):
+    """Change notification topics for each piece of engine state.
+
+    Attributes:
+        COMMANDS: Any change to command state.
+        COMMAND_FAILURES: A command has failed, which may also complete
+            every command queued after it.
+        LABWARE: Any change to labware state.
+        PIPETTES: Any change to pipette state.
+    """
+
+    COMMANDS = "commands"
+    COMMAND_FAILURES = "commandFailures"
+    LABWARE = "labware"
+    PIPETTES = "pipettes"
+
+
+@dataclass(frozen=True)
+class CommandTopic:
+    """Change notification topic for a single command."""
+
+    command_id: str
+
+
 @dataclass(frozen=True)
 class State:
     """Underlying engine state."""
@@ -41,6 +83,7 @@ class StateView(HasState[State]):
     _geometry: GeometryView
     _motion: MotionView
     _configs: EngineConfigs
+    _change_notifier: ChangeNotifier
 
     @property
     def commands(self) -> CommandView:
@@ -72,6 +115,15 @@ class StateView(HasState[State]):
         """Get Protocol Engine configurations."""
         return self._configs
 
+    def get_version(self, topic: Optional[Hashable] = None) -> int:
+        """Get a counter that increments every time a piece of state changes.
+
+        Arguments:
+            topic: A StateTopic or CommandTopic to check. If omitted, get the
+                number of times any state action has been handled.
+        """
+        return self._change_notifier.get_version(topic)
+
 
 class StateStore(StateView, ActionHandler):
     """ProtocolEngine state store.
@@ -112,6 +164,8 @@ class StateStore(StateView, ActionHandler):
         ]
         self._configs = configs
         self._change_notifier = change_notifier or ChangeNotifier()
+        self._batch_depth = 0
+        self._pending_topics: Optional[Set[Hashable]] = None
         self._initialize_state()
 
     def handle_action(self, action: Action) -> None:
@@ -124,7 +178,28 @@ class StateStore(StateView, ActionHandler):
         for substore in self._substores:
             substore.handle_action(action)
 
-        self._update_state_views()
+        self._update_state_views(action)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group the actions handled inside this context into one batch.
+
+        Every action is still applied as soon as it's handled, so selectors
+        read inside the batch see up-to-date state. Change notifications,
+        however, are deferred and merged, so `wait_for` callers are woken
+        at most once, after the outermost batch exits.
+        """
+        self._batch_depth += 1
+
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+
+            if self._batch_depth == 0 and self._pending_topics is not None:
+                topics = self._pending_topics
+                self._pending_topics = None
+                self._change_notifier.notify(topics=topics)
 
     async def wait_for(
         self,
@@ -134,6 +209,10 @@ class StateStore(StateView, ActionHandler):
     ) -> ReturnT:
         """Wait for a condition to become true, checking whenever state changes.
 
+        If `condition` is a selector method of one of this store's views,
+        it will only be re-checked when the state backing that view changes.
+        Otherwise, it will be re-checked after every action.
+
         !!! Warning:
             In general, callers should not trigger a state change via
             `handle_action` directly after a `wait_for`, as it may interfere
@@ -152,12 +231,52 @@ class StateStore(StateView, ActionHandler):
         predicate = partial(condition, *args, **kwargs)
         is_done = predicate()
 
+        if is_done:
+            return is_done
+
+        topics = self._get_condition_topics(condition, *args, **kwargs)
+
         while not is_done:
-            await self._change_notifier.wait()
+            await self._change_notifier.wait(topics=topics)
             is_done = predicate()
 
         return is_done
 
+    def _get_condition_topics(
+        self,
+        condition: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Optional[Set[Hashable]]:
+        """Get the change notification topics that a condition depends on.
+
+        Returns:
+            The set of topics, or None if the condition's dependencies are
+            unknown and it must be re-checked after every change.
+        """
+        view = getattr(condition, "__self__", None)
+        func = getattr(condition, "__func__", None)
+
+        if view is self._commands:
+            # a command's completion only depends on that command,
+            # or the failure of any command before it
+            if func is CommandView.get_is_complete:
+                command_id = args[0] if args else kwargs["command_id"]
+                return {CommandTopic(command_id), StateTopic.COMMAND_FAILURES}
+
+            return {StateTopic.COMMANDS}
+
+        if view is self._labware:
+            return {StateTopic.LABWARE}
+
+        if view is self._pipettes:
+            return {StateTopic.PIPETTES}
+
+        if view is self._geometry or view is self._motion:
+            return {StateTopic.LABWARE, StateTopic.PIPETTES}
+
+        return None
+
     def _get_next_state(self) -> State:
         """Get a new instance of the state value object."""
         return State(
@@ -184,13 +303,54 @@ class StateStore(StateView, ActionHandler):
             geometry_view=self._geometry,
         )
 
-    def _update_state_views(self) -> None:
+    def _update_state_views(self, action: Action) -> None:
         """Update state view interfaces to use latest underlying values."""
-        state = state = self._get_next_state()
+        prev_state = self._state
+        state = self._get_next_state()
 
         self._state = state
         self._commands._state = state.commands
         self._labware._state = state.labware
         self._pipettes._state = state.pipettes
 
-        self._change_notifier.notify()
+        topics = _get_changed_topics(prev_state, state, action)
+
+        if self._batch_depth == 0:
+            self._change_notifier.notify(topics=topics)
+        elif self._pending_topics is None:
+            self._pending_topics = topics
+        else:
+            self._pending_topics.update(topics)
+
+
+def _get_changed_topics(
+    prev_state: State, state: State, action: Action
+) -> Set[Hashable]:
+    """Get the change notification topics of any state changed by an action.
+
+    Substores only replace their state values when something changes,
+    so an identity check is enough to detect a change.
+    """
+    topics: Set[Hashable] = set()
+
+    if state.commands is not prev_state.commands:
+        topics.add(StateTopic.COMMANDS)
+
+        if isinstance(action, (QueueCommandAction, FailCommandAction)):
+            topics.add(CommandTopic(action.command_id))
+        elif isinstance(action, UpdateCommandAction):
+            topics.add(CommandTopic(action.command.id))
+
+        if (
+            state.commands.commands_by_id.get_first_failed_index()
+            != prev_state.commands.commands_by_id.get_first_failed_index()
+        ):
+            topics.add(StateTopic.COMMAND_FAILURES)
+
+    if state.labware is not prev_state.labware:
+        topics.add(StateTopic.LABWARE)
+
+    if state.pipettes is not prev_state.pipettes:
+        topics.add(StateTopic.PIPETTES)
+
+    return topics
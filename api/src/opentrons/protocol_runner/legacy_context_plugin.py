@@ -1,6 +1,9 @@
 """Customize the ProtocolEngine to monitor and control legacy (APIv2) protocols."""
 from __future__ import annotations
-from typing import Callable, Optional, NamedTuple
+import asyncio
+import logging
+from threading import Lock
+from typing import Callable, List, Optional, NamedTuple
 
 from opentrons.commands.types import CommandMessage as LegacyCommand
 from opentrons.hardware_control import API as HardwareAPI
@@ -15,6 +18,8 @@ from .legacy_wrappers import (
 )
 from .legacy_command_mapper import LegacyCommandMapper
 
+log = logging.getLogger(__name__)
+
 
 class ContextUnsubscribe(NamedTuple):
     """Unsubscribe functions for broker messages."""
@@ -42,6 +47,11 @@ class LegacyContextPlugin(AbstractPlugin):
     2. Subscribe to what is being done with the legacy ProtocolContext,
        and insert matching commands into ProtocolEngine state for
        purely progress-tracking purposes.
+
+    Commands are sent from the protocol's thread without waiting for the
+    event loop. Any commands that pile up while the loop is busy are
+    dispatched together, in order, as a single batch. Call `flush` before
+    stopping the engine, so the protocol's commands come before the stop.
     """
 
     def __init__(
@@ -55,11 +65,20 @@ class LegacyContextPlugin(AbstractPlugin):
         self._protocol_context = protocol_context
         self._legacy_command_mapper = legacy_command_mapper or LegacyCommandMapper()
         self._unsubcribe: Optional[ContextUnsubscribe] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending_actions: List[pe_actions.Action] = []
+        self._pending_actions_lock = Lock()
+        self._dispatch_error: Optional[BaseException] = None
 
     def setup(self) -> None:
         """Set up subscriptions to the context's message brokers."""
         context = self._protocol_context
 
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+
         command_unsubscribe = context.broker.subscribe(
             topic="command",
             handler=self._dispatch_legacy_command,
@@ -82,12 +101,34 @@ class LegacyContextPlugin(AbstractPlugin):
         )
 
     def teardown(self) -> None:
-        """Unsubscribe from the context's message brokers."""
+        """Unsubscribe from the context's message brokers.
+
+        Any commands from the protocol that have not been dispatched yet
+        will be dispatched before the plugin is torn down. An error
+        dispatching commands that the protocol was not given is logged,
+        since the engine must not raise while stopping.
+        """
         if self._unsubscribe:
             for unsubscribe in self._unsubscribe:
                 unsubscribe()
 
         self._unsubcribe = None
+        self._flush_from_loop()
+
+        with self._pending_actions_lock:
+            error = self._dispatch_error
+            self._dispatch_error = None
+
+        if error is not None:
+            log.error("Failed to dispatch protocol commands", exc_info=error)
+
+    def flush(self) -> None:
+        """Dispatch any commands from the protocol that are still buffered.
+
+        Must be called from the event loop. An error dispatching them is
+        raised to the protocol the next time it sends a command.
+        """
+        self._flush_from_loop()
 
     def handle_action(self, action: pe_actions.Action) -> None:
         """React to a ProtocolEngine action."""
@@ -99,7 +140,7 @@ class LegacyContextPlugin(AbstractPlugin):
 
     def _dispatch_legacy_command(self, command: LegacyCommand) -> None:
         pe_action = self._legacy_command_mapper.map_command(command=command)
-        self.dispatch_threadsafe(pe_action)
+        self._dispatch_from_protocol_thread(pe_action)
 
     def _dispatch_labware_loaded(
         self, labware_load_info: LegacyLabwareLoadInfo
@@ -107,7 +148,9 @@ class LegacyContextPlugin(AbstractPlugin):
         pe_command = self._legacy_command_mapper.map_labware_load(
             labware_load_info=labware_load_info
         )
-        self.dispatch_threadsafe(pe_actions.UpdateCommandAction(command=pe_command))
+        self._dispatch_from_protocol_thread(
+            pe_actions.UpdateCommandAction(command=pe_command)
+        )
 
     def _dispatch_instrument_loaded(
         self, instrument_load_info: LegacyInstrumentLoadInfo
@@ -115,10 +158,54 @@ class LegacyContextPlugin(AbstractPlugin):
         pe_command = self._legacy_command_mapper.map_instrument_load(
             instrument_load_info=instrument_load_info
         )
-        self.dispatch_threadsafe(pe_actions.UpdateCommandAction(command=pe_command))
+        self._dispatch_from_protocol_thread(
+            pe_actions.UpdateCommandAction(command=pe_command)
+        )
 
     def _dispatch_module_loaded(self, module_load_info: LegacyModuleLoadInfo) -> None:
         pe_command = self._legacy_command_mapper.map_module_load(
             module_load_info=module_load_info
         )
-        self.dispatch_threadsafe(pe_actions.UpdateCommandAction(command=pe_command))
+        self._dispatch_from_protocol_thread(
+            pe_actions.UpdateCommandAction(command=pe_command)
+        )
+
+    def _dispatch_from_protocol_thread(self, action: pe_actions.Action) -> None:
+        """Queue an action from the protocol thread to be dispatched in a batch.
+
+        Rather than blocking the protocol thread until the event loop has
+        dispatched each action, actions are buffered, and a flush is scheduled
+        on the loop whenever the buffer goes from empty to non-empty.
+        """
+        if self._loop is None:
+            self.dispatch_threadsafe(action)
+            return
+
+        with self._pending_actions_lock:
+            error = self._dispatch_error
+            self._dispatch_error = None
+            should_schedule_flush = len(self._pending_actions) == 0
+            self._pending_actions.append(action)
+
+        if should_schedule_flush:
+            self._loop.call_soon_threadsafe(self._flush_from_loop)
+
+        # surface any failure of a previous batch to the protocol
+        if error is not None:
+            raise error
+
+    def _flush_from_loop(self) -> None:
+        try:
+            self._flush_pending_actions()
+        except Exception as e:
+            with self._pending_actions_lock:
+                # keep the first error until the protocol or teardown gets it
+                self._dispatch_error = self._dispatch_error or e
+
+    def _flush_pending_actions(self) -> None:
+        with self._pending_actions_lock:
+            actions = self._pending_actions
+            self._pending_actions = []
+
+        if len(actions) > 0:
+            self.dispatch_many(actions)
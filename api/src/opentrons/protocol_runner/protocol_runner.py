@@ -84,6 +84,7 @@ class ProtocolRunner:
         self._legacy_executor = legacy_executor or LegacyExecutor(
             hardware_api=hardware_api
         )
+        self._legacy_context_plugin: Optional[LegacyContextPlugin] = None
 
     def load(self, protocol_source: ProtocolSource) -> None:
         """Load a ProtocolSource into managed ProtocolEngine.
@@ -112,7 +113,7 @@ class ProtocolRunner:
         # ensure the engine is stopped gracefully once the
         # protocol file stops issuing commands
         self._task_queue.set_cleanup_func(
-            func=self._protocol_engine.stop,
+            func=self._stop_engine,
         )
 
     def play(self) -> None:
@@ -127,6 +128,7 @@ class ProtocolRunner:
     async def stop(self) -> None:
         """Stop (cancel) the run."""
         self._task_queue.stop()
+        self._flush_legacy_commands()
         await self._protocol_engine.halt()
 
     async def join(self) -> None:
@@ -150,6 +152,15 @@ class ProtocolRunner:
             pipettes=self._protocol_engine.state_view.pipettes.get_all(),
         )
 
+    async def _stop_engine(self, error: Optional[Exception] = None) -> None:
+        self._flush_legacy_commands()
+        await self._protocol_engine.stop(error=error)
+
+    def _flush_legacy_commands(self) -> None:
+        # get the protocol's commands into state before the run stops
+        if self._legacy_context_plugin is not None:
+            self._legacy_context_plugin.flush()
+
     def _load_json(self, protocol_source: ProtocolSource) -> None:
         raise NotImplementedError("JSON schema v6 execution not yet implemented.")
 
@@ -169,12 +180,11 @@ class ProtocolRunner:
         protocol = self._legacy_file_reader.read(protocol_source)
         context = self._legacy_context_creator.create(protocol.api_level)
 
-        self._protocol_engine.add_plugin(
-            LegacyContextPlugin(
-                hardware_api=self._hardware_api,
-                protocol_context=context,
-            )
+        self._legacy_context_plugin = LegacyContextPlugin(
+            hardware_api=self._hardware_api,
+            protocol_context=context,
         )
+        self._protocol_engine.add_plugin(self._legacy_context_plugin)
 
         self._task_queue.set_run_func(
             func=self._legacy_executor.execute,
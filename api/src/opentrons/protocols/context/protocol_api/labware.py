@@ -1,3 +1,4 @@
+import copy
 from typing import List, Dict, Optional
 
 from opentrons.calibration_storage import helpers
@@ -101,7 +102,12 @@ class LabwareImplementation(AbstractLabware):
         return self._parameters["tipLength"]
 
     def set_tip_length(self, length: float):
+        # Definitions are shared by every labware loaded from them, so this
+        # labware gets its own copies of the parts that change.
+        self._parameters = copy.copy(self._parameters)
         self._parameters["tipLength"] = length
+        self._definition = copy.copy(self._definition)
+        self._definition["parameters"] = self._parameters
 
     def reset_tips(self) -> None:
         if self.is_tiprack():
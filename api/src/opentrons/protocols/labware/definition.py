@@ -23,6 +23,8 @@ from opentrons.protocols.api_support.constants import (
 )
 from opentrons_shared_data.labware.dev_types import LabwareDefinition
 
+from .definition_cache import get_definition_cache
+
 
 MODULE_LOG = logging.getLogger(__name__)
 
@@ -72,20 +74,18 @@ def get_all_labware_definitions() -> List[str]:
     Return a list of standard and custom labware definitions with load_name +
         name_space + version existing on the robot
     """
-    labware_list = ModifiedList()
-
-    def _check_for_subdirectories(path):
-        with os.scandir(path) as top_path:
-            for sub_dir in top_path:
-                if sub_dir.is_dir():
-                    labware_list.append(sub_dir.name)
+    cache = get_definition_cache()
 
     # check for standard labware
-    _check_for_subdirectories(get_shared_data_root() / STANDARD_DEFS_PATH)
+    labware_list = ModifiedList(
+        cache.get_load_names(get_shared_data_root() / STANDARD_DEFS_PATH)
+    )
 
     # check for custom labware
-    for namespace in os.scandir(USER_DEFS_PATH):
-        _check_for_subdirectories(namespace)
+    with os.scandir(USER_DEFS_PATH) as namespaces:
+        for namespace in namespaces:
+            if namespace.is_dir():
+                labware_list.extend(cache.get_load_names(Path(namespace.path)))
 
     return labware_list
 
@@ -242,25 +242,34 @@ def _get_standard_labware_definition(
         uploading your protocol.
         """
 
+    cache = get_definition_cache()
+
     if namespace is None:
-        for fallback_namespace in [OPENTRONS_NAMESPACE, CUSTOM_NAMESPACE]:
+        # look in the opentrons namespace's index before trying the
+        # custom namespace on disk
+        if cache.has_version(
+            get_shared_data_root() / STANDARD_DEFS_PATH, load_name, checked_version
+        ):
+            namespace = OPENTRONS_NAMESPACE
+        else:
             try:
                 return _get_standard_labware_definition(
-                    load_name, fallback_namespace, checked_version
+                    load_name, CUSTOM_NAMESPACE, checked_version
                 )
             except FileNotFoundError:
-                pass
-
-        raise FileNotFoundError(
-            error_msg_string.format(load_name, checked_version, OPENTRONS_NAMESPACE)
-        )
+                raise FileNotFoundError(
+                    error_msg_string.format(
+                        load_name, checked_version, OPENTRONS_NAMESPACE
+                    )
+                )
 
     namespace = namespace.lower()
     def_path = _get_path_to_labware(load_name, namespace, checked_version)
 
     try:
-        with open(def_path, "rb") as f:
-            labware_def = json.loads(f.read().decode("utf-8"))
+        labware_def = cache.get_definition(
+            namespace, load_name, checked_version, def_path
+        )
     except FileNotFoundError:
         raise FileNotFoundError(
             f'Labware "{load_name}" not found with version {checked_version} '
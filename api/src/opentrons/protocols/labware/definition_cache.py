@@ -0,0 +1,191 @@
+"""A process-wide cache of labware definitions loaded from disk.
+
+Definitions are parsed once and shared by every caller, so they are
+frozen: mutating one raises a TypeError. Callers that need to modify a
+definition should ``copy.deepcopy`` it, which returns ordinary dicts
+and lists.
+"""
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, NoReturn, Tuple
+
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
+
+
+class FrozenDict(dict):  # type: ignore[type-arg]
+    """A dict that cannot be modified, shared between callers."""
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("Shared labware definitions cannot be modified")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable  # type: ignore[assignment]
+    clear = _immutable
+    pop = _immutable  # type: ignore[assignment]
+    popitem = _immutable
+    setdefault = _immutable  # type: ignore[assignment]
+    update = _immutable  # type: ignore[assignment]
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return thaw(self)  # type: ignore[no-any-return]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):  # type: ignore[type-arg]
+    """A list that cannot be modified, shared between callers."""
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("Shared labware definitions cannot be modified")
+
+    __setitem__ = _immutable  # type: ignore[assignment]
+    __delitem__ = _immutable
+    __iadd__ = _immutable
+    __imul__ = _immutable
+    append = _immutable
+    clear = _immutable
+    extend = _immutable
+    insert = _immutable
+    pop = _immutable
+    remove = _immutable
+    reverse = _immutable
+    sort = _immutable  # type: ignore[assignment]
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return thaw(self)  # type: ignore[no-any-return]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (list, (list(self),))
+
+
+def freeze(obj: Any) -> Any:
+    """Recursively convert parsed JSON into frozen dicts and lists."""
+    if isinstance(obj, dict):
+        return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return FrozenList(freeze(v) for v in obj)
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """Recursively copy frozen dicts and lists into ordinary ones."""
+    if isinstance(obj, dict):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [thaw(v) for v in obj]
+    return obj
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    path: Path
+    mtime_ns: int
+    size: int
+    definition: LabwareDefinition
+
+
+@dataclass(frozen=True)
+class _DirectoryIndex:
+    mtime_ns: int
+    load_names: Tuple[str, ...]
+
+
+class LabwareDefinitionCache:
+    """Labware definitions and the load names available on disk.
+
+    A cached definition is reloaded if its file's modification time or size
+    changes. The load names in a definitions directory are re-scanned if
+    its modification time changes, which it does when a labware's
+    subdirectory is added or removed.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[str, str, int], _CacheEntry] = {}
+        self._versions: Dict[Path, FrozenSet[Tuple[str, int]]] = {}
+        self._indexes: Dict[Path, _DirectoryIndex] = {}
+
+    def get_definition(
+        self, namespace: str, load_name: str, version: int, path: Path
+    ) -> LabwareDefinition:
+        """Get the frozen definition stored at a path.
+
+        :raises FileNotFoundError: if there is no definition at the path
+        """
+        key = (namespace, load_name, version)
+        stat = os.stat(path)
+        entry = self._entries.get(key)
+
+        if (
+            entry is None
+            or entry.path != path
+            or entry.mtime_ns != stat.st_mtime_ns
+            or entry.size != stat.st_size
+        ):
+            with open(path, "rb") as f:
+                definition = freeze(json.loads(f.read().decode("utf-8")))
+            entry = _CacheEntry(path, stat.st_mtime_ns, stat.st_size, definition)
+            self._entries[key] = entry
+
+        return entry.definition
+
+    def has_version(self, definitions_path: Path, load_name: str, version: int) -> bool:
+        """Check whether a read-only definitions directory has a definition.
+
+        The directory is only scanned once, so it should not be one that
+        changes while the process is running.
+        """
+        versions = self._versions.get(definitions_path)
+
+        if versions is None:
+            versions = frozenset(
+                (lw_dir.name, int(f.stem))
+                for lw_dir in _scan_subdirectories(definitions_path)
+                for f in Path(lw_dir.path).glob("*.json")
+                if f.stem.isdigit()
+            )
+            self._versions[definitions_path] = versions
+
+        return (load_name, version) in versions
+
+    def get_load_names(self, definitions_path: Path) -> Tuple[str, ...]:
+        """Get the load names of each labware in a definitions directory."""
+        mtime_ns = os.stat(definitions_path).st_mtime_ns
+        index = self._indexes.get(definitions_path)
+
+        if index is None or index.mtime_ns != mtime_ns:
+            load_names = tuple(
+                lw_dir.name for lw_dir in _scan_subdirectories(definitions_path)
+            )
+            index = _DirectoryIndex(mtime_ns, load_names)
+            self._indexes[definitions_path] = index
+
+        return index.load_names
+
+    def clear(self) -> None:
+        """Forget all cached definitions and directory indexes."""
+        self._entries.clear()
+        self._versions.clear()
+        self._indexes.clear()
+
+
+def _scan_subdirectories(path: Path) -> List["os.DirEntry[str]"]:
+    with os.scandir(path) as entries:
+        return [entry for entry in entries if entry.is_dir()]
+
+
+_cache = LabwareDefinitionCache()
+
+
+def get_definition_cache() -> LabwareDefinitionCache:
+    """Get the process-wide labware definition cache."""
+    return _cache
@@ -1,6 +1,7 @@
 """Tests for opentrons.commands.publisher."""
 from __future__ import annotations
 
+import logging
 import pytest
 from decoy import Decoy, matchers
 from typing import Any, Dict, AsyncIterator, cast
@@ -12,8 +13,19 @@ from opentrons.commands.publisher import CommandPublisher, publish, publish_cont
 
 @pytest.fixture
 def broker(decoy: Decoy) -> Broker:
-    """Return a mocked out Broker."""
-    return decoy.mock(cls=Broker)
+    """Return a mocked out Broker, with a subscriber to command messages."""
+    broker = decoy.mock(cls=Broker)
+    decoy.when(broker.has_subscribers("command")).then_return(True)
+    return broker
+
+
+@pytest.fixture
+def unsubscribed_broker(decoy: Decoy) -> Broker:
+    """Return a mocked out Broker with nothing subscribed, or logged at INFO."""
+    broker = decoy.mock(cls=Broker)
+    decoy.when(broker.has_subscribers("command")).then_return(False)
+    decoy.when(broker.logger.isEnabledFor(logging.INFO)).then_return(False)
+    return broker
 
 
 @pytest.fixture
@@ -227,6 +239,88 @@ def test_publish_decorator_remaps_instrument(decoy: Decoy, broker: Broker) -> No
     )
 
 
+def test_publish_decorator_with_kwargs(decoy: Decoy, broker: Broker) -> None:
+    """It should map keyword, keyword-only, and default arguments."""
+    _act = decoy.mock()
+
+    def _get_command_payload(foo: str, bar: int, baz: int) -> CommandDict:
+        return cast(
+            CommandDict,
+            {"name": "some_command", "payload": {"foo": foo, "bar": bar, "baz": baz}},
+        )
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)
+        def act(self, foo: str, bar: int = 42, *, baz: int = 0) -> None:
+            _act()
+
+    subject = _Subject(broker=broker)
+    subject.act(bar=43, foo="hello", baz=7)
+
+    decoy.verify(
+        broker.publish(
+            topic="command",
+            message={
+                "$": "before",
+                "name": "some_command",
+                "payload": {"foo": "hello", "bar": 43, "baz": 7},
+                "error": None,
+            },
+        ),
+        _act(),
+    )
+
+
+def test_publish_decorator_with_bad_args(decoy: Decoy, broker: Broker) -> None:
+    """It should raise a TypeError for a call that doesn't match, before publishing."""
+    _act = decoy.mock()
+
+    def _get_command_payload(foo: str) -> CommandDict:
+        return cast(CommandDict, {"name": "some_command", "payload": {"foo": foo}})
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)
+        def act(self, foo: str, bar: int) -> None:
+            _act()
+
+    subject = _Subject(broker=broker)
+
+    with pytest.raises(TypeError):
+        subject.act("hello")  # type: ignore[call-arg]
+
+    with pytest.raises(TypeError):
+        subject.act("hello", 42, foo="hello")  # type: ignore[misc]
+
+    decoy.verify(broker.publish(topic="command", message=matchers.Anything()), times=0)
+    decoy.verify(_act(), times=0)
+
+
+def test_publish_decorator_unsubscribed(
+    decoy: Decoy,
+    unsubscribed_broker: Broker,
+) -> None:
+    """It should not build or publish messages if nothing would receive them."""
+    _act = decoy.mock()
+    _get_command_payload = decoy.mock()
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)
+        def act(self, foo: str) -> int:
+            _act()
+            return 42
+
+    subject = _Subject(broker=unsubscribed_broker)
+
+    assert subject.act("hello") == 42
+
+    decoy.verify(_act(), times=1)
+    decoy.verify(_get_command_payload(foo="hello"), times=0)
+    decoy.verify(
+        unsubscribed_broker.publish(topic="command", message=matchers.Anything()),
+        times=0,
+    )
+
+
 def test_publish_context(decoy: Decoy, broker: Broker) -> None:
     _act = decoy.mock()
 
@@ -326,3 +420,25 @@ def test_publish_context_with_error_no_engine(
         broker.publish(topic="command", message=matchers.DictMatching({"$": "after"})),
         times=0,
     )
+
+
+def test_publish_context_unsubscribed(
+    decoy: Decoy,
+    unsubscribed_broker: Broker,
+) -> None:
+    """It should not publish messages if nothing would receive them."""
+    _act = decoy.mock()
+
+    command = cast(
+        CommandDict,
+        {"name": "some_command", "payload": {"foo": "hello", "bar": 42}},
+    )
+
+    with publish_context(broker=unsubscribed_broker, command=command):
+        _act()
+
+    decoy.verify(_act(), times=1)
+    decoy.verify(
+        unsubscribed_broker.publish(topic="command", message=matchers.Anything()),
+        times=0,
+    )
@@ -1,130 +1,157 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
+from typing import AsyncIterator, List
 
 import pytest
-from mock import MagicMock, PropertyMock, call
-from serial import Serial  # type: ignore[import]
+from serial import SerialTimeoutException  # type: ignore[import]
 from opentrons.drivers.asyncio.communication import AsyncSerial
 
 
-@pytest.fixture
-def mock_timeout_prop() -> PropertyMock:
-    return PropertyMock()
+class DeviceServer:
+    """A TCP server standing in for a device, reached with a socket:// url."""
 
+    def __init__(self) -> None:
+        self.writers: List[asyncio.StreamWriter] = []
+        self.received = bytearray()
+        self._server: asyncio.AbstractServer
 
-@pytest.fixture
-def mock_write_timeout_prop() -> PropertyMock:
-    return PropertyMock()
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._on_connect, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"socket://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        for writer in self.writers:
+            writer.close()
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def send(self, data: bytes) -> None:
+        for writer in self.writers:
+            writer.write(data)
+            await writer.drain()
+
+    async def _on_connect(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.writers.append(writer)
+        while True:
+            data = await reader.read(100)
+            if not data:
+                break
+            self.received += data
 
 
 @pytest.fixture
-def mock_serial(
-    mock_timeout_prop: PropertyMock, mock_write_timeout_prop: PropertyMock
-) -> MagicMock:
-    """Mock Serial"""
-    m = MagicMock(spec=Serial)
-    type(m).timeout = mock_timeout_prop
-    type(m).write_timeout = mock_write_timeout_prop
-    return m
+async def device() -> AsyncIterator[DeviceServer]:
+    """A device to connect to."""
+    server = DeviceServer()
+    yield server
+    await server.stop()
 
 
 @pytest.fixture
 async def subject(
-    loop: asyncio.AbstractEventLoop, mock_serial: MagicMock
-) -> AsyncSerial:
-    """The test subject."""
-    return AsyncSerial(
-        serial=mock_serial,
-        executor=ThreadPoolExecutor(),
-        loop=loop,
-        reset_buffer_before_write=False,
+    loop: asyncio.AbstractEventLoop, device: DeviceServer
+) -> AsyncIterator[AsyncSerial]:
+    """The test subject, connected to the device."""
+    url = await device.start()
+    serial = await AsyncSerial.create(port=url, baud_rate=115200, timeout=1)
+    # Let the device accept the connection.
+    while not device.writers:
+        await asyncio.sleep(0.001)
+    yield serial
+    await serial.close()
+
+
+async def test_read_until(subject: AsyncSerial, device: DeviceServer) -> None:
+    """It should read up to and including the match, keeping the rest."""
+    await device.send(b"first ok\r\nsec")
+    assert await subject.read_until(b"ok\r\n") == b"first ok\r\n"
+
+    await device.send(b"ond o")
+    read = asyncio.ensure_future(subject.read_until(b"ok\r\n"))
+    await asyncio.sleep(0.01)
+    assert not read.done()
+
+    await device.send(b"k\r\n")
+    assert await read == b"second ok\r\n"
+
+
+async def test_read_until_timeout(subject: AsyncSerial, device: DeviceServer) -> None:
+    """It should return what was read if the match doesn't arrive in time."""
+    await device.send(b"partial")
+    assert await subject.read_until(b"ok\r\n", timeout=0.05) == b"partial"
+    assert await subject.read_until(b"ok\r\n", timeout=0.05) == b""
+
+
+async def test_write(subject: AsyncSerial, device: DeviceServer) -> None:
+    """It should write all the data to the port."""
+    data = b"G28.2 X\r\n" * 1000
+    await subject.write(data)
+
+    while len(device.received) < len(data):
+        await asyncio.sleep(0.001)
+    assert device.received == data
+
+
+async def test_write_timeout(loop: asyncio.AbstractEventLoop) -> None:
+    """It should raise if the port won't accept the data in time."""
+    subject = await AsyncSerial.create(port="loop://", baud_rate=115200)
+    subject._serial.write = lambda data: 0
+
+    with pytest.raises(SerialTimeoutException):
+        await subject.write(b"M105\r\n", timeout=0.05)
+
+
+async def test_reset_buffer_before_write(
+    loop: asyncio.AbstractEventLoop, device: DeviceServer
+) -> None:
+    """It should discard unread data before writing, if configured to."""
+    url = await device.start()
+    subject = await AsyncSerial.create(
+        port=url, baud_rate=115200, timeout=1, reset_buffer_before_write=True
     )
+    while not device.writers:
+        await asyncio.sleep(0.001)
+
+    await device.send(b"stale ok\r\n")
+    await asyncio.sleep(0.01)
+    await subject.write(b"M105\r\n")
+    await device.send(b"fresh ok\r\n")
+
+    assert await subject.read_until(b"ok\r\n") == b"fresh ok\r\n"
+    await subject.close()
+
+
+async def test_close_and_reopen(subject: AsyncSerial, device: DeviceServer) -> None:
+    """It should stop reading when closed and resume when reopened."""
+    await subject.close()
+    assert await subject.is_open() is False
+
+    await subject.open()
+    assert await subject.is_open() is True
+    while len(device.writers) < 2:
+        await asyncio.sleep(0.001)
+
+    await device.send(b"ok\r\n")
+    assert await subject.read_until(b"ok\r\n") == b"ok\r\n"
+
+
+async def test_disconnect(subject: AsyncSerial, device: DeviceServer) -> None:
+    """It should raise on read if the device goes away."""
+    await device.stop()
+
+    with pytest.raises(Exception, match="disconnected"):
+        await subject.read_until(b"ok\r\n")
+
 
+async def test_poll_port_without_fileno(loop: asyncio.AbstractEventLoop) -> None:
+    """It should poll ports that the event loop can't watch."""
+    subject = await AsyncSerial.create(port="loop://", baud_rate=115200, timeout=1)
+    # loop:// simulates the time a write takes at the baud rate, so it can't
+    # be written to without blocking.
+    subject._serial.write_timeout = None
 
-@pytest.mark.parametrize(
-    argnames=["default", "override"],
-    argvalues=[
-        [None, 5],
-        [5, 6],
-    ],
-)
-async def test_write_timeout_override(
-    subject: AsyncSerial,
-    mock_write_timeout_prop: PropertyMock,
-    default: Optional[int],
-    override: Optional[int],
-):
-    """It should override the timeout and return to default after the call."""
-    mock_write_timeout_prop.return_value = default
-    await subject.write(b"", override)
-
-    # Three calls: read, override, reset default.
-    assert mock_write_timeout_prop.call_args_list == [
-        call(),
-        call(override),
-        call(default),
-    ]
-
-
-@pytest.mark.parametrize(
-    argnames=["default", "override"],
-    argvalues=[
-        [None, 5],
-        [5, 6],
-    ],
-)
-async def test_read_timeout_override(
-    subject: AsyncSerial,
-    mock_timeout_prop: PropertyMock,
-    default: Optional[int],
-    override: Optional[int],
-):
-    """It should override the timeout and return to default after the call."""
-    mock_timeout_prop.return_value = default
-    await subject.read_until(b"", override)
-
-    # Three calls: read, override, reset default.
-    assert mock_timeout_prop.call_args_list == [call(), call(override), call(default)]
-
-
-@pytest.mark.parametrize(
-    argnames=["default", "override"],
-    argvalues=[
-        [5, 5],
-        [5, None],
-        [None, None],
-    ],
-)
-async def test_write_timeout_dont_override(
-    subject: AsyncSerial,
-    mock_write_timeout_prop: PropertyMock,
-    default: Optional[int],
-    override: Optional[int],
-):
-    """It should not override the timeout if not necessary."""
-    mock_write_timeout_prop.return_value = default
-    await subject.write(b"", override)
-
-    mock_write_timeout_prop.assert_called_once()
-
-
-@pytest.mark.parametrize(
-    argnames=["default", "override"],
-    argvalues=[
-        [5, 5],
-        [5, None],
-        [None, None],
-    ],
-)
-async def test_read_timeout_dont_override(
-    subject: AsyncSerial,
-    mock_timeout_prop: PropertyMock,
-    default: Optional[int],
-    override: Optional[int],
-):
-    """It should not override the timeout if not necessary."""
-    mock_timeout_prop.return_value = default
-    await subject.read_until(b"", override)
-
-    mock_timeout_prop.assert_called_once()
+    await subject.write(b"M105\r\n")
+    assert await subject.read_until(b"\r\n") == b"M105\r\n"
+    await subject.close()
@@ -1,3 +1,4 @@
+import asyncio
 from copy import deepcopy
 from typing import Dict
 
@@ -219,6 +220,91 @@ async def test_clear_limit_switch(
     ]
 
 
+async def test_streamed_move_alarm(
+    mock_connection: AsyncMock, sim_gpio: SimulatingGPIOCharDev
+):
+    """It should home after an alarm from a streamed move in flight."""
+    from opentrons.config import robot_configs
+
+    smoothie = driver_3_0.SmoothieDriver(
+        connection=mock_connection,
+        config=robot_configs.load(),
+        gpio_chardev=sim_gpio,
+        streaming_moves=True,
+    )
+    cmd_list = []
+
+    async def write_mock(command, retries, timeout):
+        cmd_list.append(command.build())
+        if constants.GCODE.WAIT in command and len(cmd_list) == 2:
+            # the streamed move hits a limit switch while in flight
+            raise AlarmResponse(port="", response="ALARM: Hard limit +X")
+        elif constants.GCODE.CURRENT_POSITION in command:
+            return "ok M114.2 X:10 Y:20 Z:30 A:40 B:50 C:60"
+        elif constants.GCODE.HOMING_STATUS in command:
+            return "X:1 Y:1 Z:1 A:1 B:1 C:1"
+        else:
+            return "ok"
+
+    mock_connection.send_command.side_effect = write_mock
+
+    await smoothie.move({"X": 100})
+    assert smoothie._moves_in_flight == 1
+
+    with pytest.raises(SmoothieError):
+        await smoothie.update_position()
+
+    assert smoothie._moves_in_flight == 0
+    assert [c.strip() for c in cmd_list[:6]] == [
+        # streamed move, without an M400
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X100",
+        # wait for the move before reading the position, and fail
+        "M400",
+        # recover from failure
+        "M999",
+        "M400",
+        "G28.6",
+        "M400",
+    ]
+    # home the failed axis
+    assert any(c.strip().endswith("G28.2 X") for c in cmd_list[6:])
+
+
+async def test_pause_waits_for_streamed_moves(
+    mock_connection: AsyncMock, sim_gpio: SimulatingGPIOCharDev
+):
+    """It should send a single M400 for streamed moves before pausing."""
+    from opentrons.config import robot_configs
+
+    smoothie = driver_3_0.SmoothieDriver(
+        connection=mock_connection,
+        config=robot_configs.load(),
+        gpio_chardev=sim_gpio,
+        streaming_moves=True,
+    )
+    cmd_list = []
+
+    async def write_mock(command, retries, timeout):
+        cmd_list.append(command.build())
+        return "ok"
+
+    mock_connection.send_command.side_effect = write_mock
+
+    await smoothie.move({"X": 100})
+    smoothie.run_flag.clear()
+    move = asyncio.get_event_loop().create_task(smoothie.move({"X": 200}))
+    await asyncio.sleep(0)
+
+    assert smoothie._moves_in_flight == 0
+    assert [c.strip() for c in cmd_list] == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X100",
+        "M400",
+    ]
+
+    smoothie.run_flag.set()
+    await move
+
+
 async def test_unstick_axes(
     smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
 ):
@@ -0,0 +1,74 @@
+import asyncio
+from typing import AsyncIterator, List
+
+import pytest
+
+from opentrons.hardware_control.emulation import fleet
+from opentrons.hardware_control.emulation.module_server import ModuleStatusClient
+from opentrons.hardware_control.emulation.module_server.helpers import wait_emulators
+from opentrons.hardware_control.emulation.settings import Settings
+from opentrons.hardware_control.emulation.types import ModuleType
+
+
+def test_robot_settings() -> None:
+    """Each robot's ports are offset and its serial numbers are its own."""
+    base = Settings()
+    subject = fleet.robot_settings(base, 2)
+    assert subject.smoothie.port == base.smoothie.port + 200
+    assert subject.module_server.port == base.module_server.port + 200
+    assert subject.magdeck_proxy.emulator_port == base.magdeck_proxy.emulator_port + 200
+    assert subject.magdeck_proxy.driver_port == base.magdeck_proxy.driver_port + 200
+    assert subject.tempdeck.serial_number == f"{base.tempdeck.serial_number}_2"
+    assert subject.smoothie.left == base.smoothie.left
+    # The base settings are unchanged.
+    assert base == Settings()
+
+
+def test_fleet_settings_distinct_ports() -> None:
+    """No two robots share a port."""
+    settings = fleet.fleet_settings(Settings(), 50)
+    ports = [port for s in settings for port in fleet._ports(s)]
+    assert len(ports) == len(set(ports))
+
+
+@pytest.mark.parametrize(argnames="count,stride", argvalues=[(2, 1), (1000, 100)])
+def test_fleet_settings_rejects_bad_ports(count: int, stride: int) -> None:
+    """Overlapping or out of range ports are rejected."""
+    with pytest.raises(ValueError):
+        fleet.fleet_settings(Settings(), count, stride)
+
+
+def test_robot_environment() -> None:
+    """The environment points a robot server at the robot's emulators."""
+    settings = fleet.robot_settings(Settings(), 1)
+    assert fleet.robot_environment(settings) == {
+        "OT_SMOOTHIE_EMULATOR_URI": "socket://localhost:10096",
+        "OT_EMULATOR_module_server": '{"host": "localhost", "port": 9089}',
+    }
+
+
+@pytest.fixture
+async def robots(loop: asyncio.AbstractEventLoop) -> AsyncIterator[List[Settings]]:
+    """Run a fleet of two robots, on ports clear of the other emulator tests."""
+    settings = [fleet.robot_settings(Settings(), i) for i in (300, 301)]
+    task = loop.create_task(fleet.Fleet(settings, [ModuleType.Magnetic.value]).run())
+    yield settings
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def test_fleet_runs_robots(robots: List[Settings]) -> None:
+    """Every robot's Smoothie and modules are reachable on its own ports."""
+    for settings in robots:
+        client = await ModuleStatusClient.connect(
+            host="localhost", port=settings.module_server.port, retries=20
+        )
+        await wait_emulators(client=client, modules=[ModuleType.Magnetic], timeout=5)
+        client.close()
+
+        reader, writer = await asyncio.open_connection(
+            "localhost", settings.smoothie.port
+        )
+        writer.write(b"M115\r\n\r\n")
+        assert b"ok" in await asyncio.wait_for(reader.readuntil(b"ok\r\n"), 5)
+        writer.close()
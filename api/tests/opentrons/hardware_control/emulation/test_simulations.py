@@ -0,0 +1,73 @@
+import pytest
+from opentrons.hardware_control.clock import Clock
+from opentrons.hardware_control.emulation.simulations import (
+    Temperature,
+    TemperatureWithHold,
+)
+
+
+@pytest.fixture
+def clock() -> Clock:
+    """A clock that only moves when advanced."""
+    return Clock(speed=1e-9, jump=True)
+
+
+def test_temperature_ticks() -> None:
+    """It should move by a fixed amount each tick without a clock."""
+    subject = Temperature(per_tick=2, current=20)
+    subject.set_target(25)
+
+    subject.tick()
+    assert subject.current == 22
+    subject.tick()
+    assert subject.current == 24
+    subject.tick()
+    assert subject.current == 25
+
+
+def test_temperature_clock(clock: Clock) -> None:
+    """It should move continuously with the clock."""
+    subject = Temperature(per_tick=2, current=20, clock=clock)
+    clock.advance(10)
+    subject.set_target(30)
+
+    clock.advance(1.5)
+    assert subject.current == pytest.approx(23)
+    clock.advance(10)
+    assert subject.current == 30
+
+    subject.set_target(10)
+    clock.advance(2.5)
+    subject.tick()
+    assert subject.current == pytest.approx(25)
+
+
+def test_hold_ticks() -> None:
+    """It should count down the hold once per tick at the target."""
+    subject = TemperatureWithHold(per_tick=2, current=20)
+    subject.set_target(23)
+    subject.set_hold(5)
+
+    subject.tick()
+    assert subject.time_remaining == 5
+    subject.tick()
+    assert subject.time_remaining == 4
+    subject.tick()
+    assert subject.time_remaining == 3
+
+
+def test_hold_clock(clock: Clock) -> None:
+    """It should count down the hold by the clock time spent at the target."""
+    subject = TemperatureWithHold(per_tick=2, current=20, clock=clock)
+    subject.set_target(30)
+    subject.set_hold(60)
+
+    clock.advance(5)
+    assert subject.current == 30
+    assert subject.time_remaining == pytest.approx(60)
+
+    clock.advance(20)
+    assert subject.time_remaining == pytest.approx(40)
+
+    clock.advance(3600)
+    assert subject.time_remaining == 0
@@ -441,3 +441,79 @@ async def test_do_relative_splits_during_home_for(
         "G90 M52 M54 M92 B1.0 C1.0 G4 P0.01 G0 F24000",
         "M400",
     ]
+
+
+@pytest.fixture
+async def streaming_subject(
+    emulation_app: Iterator[None], emulator_settings: Settings
+) -> SmoothieDriver:
+    """Smoothie driver that streams moves, connected to emulator."""
+    d = await SmoothieDriver.build(
+        port=f"socket://127.0.0.1:{emulator_settings.smoothie.port}",
+        config=build_config({}),
+        streaming_moves=True,
+    )
+    yield d
+    await d.disconnect()
+
+
+async def test_streaming_moves(streaming_subject: SmoothieDriver):
+    await streaming_subject.home()
+    spy = MagicMock(wraps=streaming_subject._connection.send_data)
+    streaming_subject._connection.send_data = spy
+
+    await streaming_subject.move({"X": 10, "Y": 10})
+    await streaming_subject.move({"X": 20})
+    await streaming_subject.move({"Z": 100})
+    await streaming_subject.update_position()
+    expected = [
+        # the first move sets currents, but doesn't wait
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 X10 Y10",
+        # currents are unchanged, so the move is sent alone
+        "G0 X20",
+        # a current change waits for moves in flight
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 Z100",
+        # reading the position waits for moves in flight
+        "M400",
+        "M114.2",
+        "M400",
+    ]
+    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    assert command_log == expected
+    assert streaming_subject.position["X"] == 20
+    assert streaming_subject.position["Y"] == 10
+    assert streaming_subject.position["Z"] == 100
+
+
+async def test_streaming_plunger_moves_wait(streaming_subject: SmoothieDriver):
+    await streaming_subject.home()
+    await streaming_subject.move({"X": 10})
+    spy = MagicMock(wraps=streaming_subject._connection.send_data)
+    streaming_subject._connection.send_data = spy
+
+    await streaming_subject.move({"B": 2})
+    expected = [
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 B2",
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M400",
+    ]
+    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    assert command_log == expected
+
+
+async def test_streaming_max_moves_in_flight(streaming_subject: SmoothieDriver):
+    await streaming_subject.home()
+    await streaming_subject.move({"X": 1})
+    streaming_subject._max_moves_in_flight = 2
+    spy = MagicMock(wraps=streaming_subject._connection.send_data)
+    streaming_subject._connection.send_data = spy
+
+    await streaming_subject.move({"X": 2})
+    await streaming_subject.move({"X": 3})
+    await streaming_subject.move({"X": 4})
+    expected = ["G0 X2", "M400", "G0 X3", "G0 X4"]
+    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    assert command_log == expected
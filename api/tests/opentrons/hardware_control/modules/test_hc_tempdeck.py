@@ -1,6 +1,8 @@
+import asyncio
 import pytest
 from mock import AsyncMock
 from opentrons.drivers.temp_deck import AbstractTempDeckDriver
+from opentrons.drivers.types import Temperature
 from opentrons.hardware_control import modules, ExecutionManager
 
 
@@ -109,3 +111,24 @@ async def test_poll_error(loop, usb_port) -> None:
     )
     with pytest.raises(ValueError, match="hello!"):
         await magdeck.wait_next_poll()
+
+
+async def test_poll_faster_while_ramping(loop, usb_port) -> None:
+    """It should poll at the active interval until the target is reached."""
+    mock_driver = AsyncMock(spec=AbstractTempDeckDriver)
+    mock_driver.get_temperature.return_value = Temperature(current=25, target=50)
+
+    tempdeck = modules.TempDeck(
+        port="",
+        usb_port=usb_port,
+        execution_manager=AsyncMock(spec=ExecutionManager),
+        driver=mock_driver,
+        device_info={},
+        loop=loop,
+        polling_frequency=60,
+    )
+    await tempdeck.wait_next_poll()
+    await asyncio.wait_for(tempdeck.wait_next_poll(), timeout=1)
+
+    assert tempdeck.poll_stats.poll_count == 2
+    await tempdeck.cleanup()
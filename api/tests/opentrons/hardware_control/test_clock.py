@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+from opentrons.hardware_control.clock import Clock
+
+
+def test_speed() -> None:
+    """It should scale durations to real time by its speed."""
+    subject = Clock(speed=60)
+    assert subject.real_seconds(120) == 2
+
+
+def test_invalid_speed() -> None:
+    """It should only run forwards."""
+    with pytest.raises(ValueError):
+        Clock(speed=0)
+
+
+async def test_sleep(loop: asyncio.AbstractEventLoop) -> None:
+    """It should sleep for less real time when it runs faster."""
+    subject = Clock(speed=1000)
+    start = subject.time()
+
+    real_start = loop.time()
+    await subject.sleep(50)
+    real_duration = loop.time() - real_start
+
+    assert subject.time() - start >= 50
+    assert real_duration < 1
+
+
+async def test_sleep_jump(loop: asyncio.AbstractEventLoop) -> None:
+    """It should jump ahead rather than sleep, in jump mode."""
+    subject = Clock(jump=True)
+    start = subject.time()
+
+    real_start = loop.time()
+    await subject.sleep(3600)
+    real_duration = loop.time() - real_start
+
+    assert subject.time() - start == pytest.approx(3600, abs=1)
+    assert real_duration < 1
+
+
+def test_advance() -> None:
+    """It should only jump forwards."""
+    subject = Clock()
+    start = subject.time()
+
+    subject.advance(10)
+    subject.advance(-5)
+
+    assert subject.time() - start == pytest.approx(10, abs=1)
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from mock import AsyncMock, MagicMock
 from opentrons.hardware_control.poller import Poller, Listener, Reader, WaitableListener
@@ -49,3 +50,60 @@ async def test_await_poll_error() -> None:
     with pytest.raises(exc.__class__):
         await listener.wait_next_poll()
     await p.stop_and_wait()
+
+
+async def test_request_poll() -> None:
+    """It should poll right away when a poll is requested."""
+    reader = AsyncMock(spec=Reader)
+    reader.read.return_value = 23
+    listener = WaitableListener[int]()
+
+    p: Poller[int] = Poller(interval_seconds=60, reader=reader, listener=listener)
+    await listener.wait_next_poll()
+    p.request_poll()
+    await asyncio.wait_for(listener.wait_next_poll(), timeout=1)
+    await p.stop_and_wait()
+
+    assert reader.read.call_count == 2
+
+
+async def test_adaptive_interval() -> None:
+    """It should poll fast while active, then back off."""
+    reader = AsyncMock(spec=Reader)
+    reader.read.side_effect = [True, True, False, False, False, False]
+    listener = WaitableListener[bool]()
+
+    p: Poller[bool] = Poller(
+        interval_seconds=0.08,
+        active_interval_seconds=0.01,
+        is_active=lambda active: active,
+        reader=reader,
+        listener=listener,
+    )
+
+    intervals = []
+    for _ in range(6):
+        await listener.wait_next_poll()
+        intervals.append(p.interval)
+    await p.stop_and_wait()
+
+    assert intervals == [0.01, 0.01, 0.02, 0.04, 0.08, 0.08]
+
+
+async def test_stats() -> None:
+    """It should count polls and errors, and time them."""
+    reader = AsyncMock(spec=Reader)
+    reader.read.side_effect = [1, AssertionError(), 2, 3]
+    listener = MagicMock(spec=Listener)
+
+    p: Poller[int] = Poller(interval_seconds=0.01, reader=reader, listener=listener)
+    while p.stats.poll_count + p.stats.error_count < 4:
+        await asyncio.sleep(0.01)
+    await p.stop_and_wait()
+
+    stats = p.stats
+    assert stats.poll_count == 3
+    assert stats.error_count == 1
+    assert stats.mean_read_duration is not None
+    assert stats.max_poll_period is not None
+    assert stats.max_poll_period >= 0.01
@@ -0,0 +1,53 @@
+"""Tests for deck obstacle indexing."""
+from typing import List, Optional, Tuple
+
+import pytest
+
+from opentrons.motion_planning import Obstacle, ObstacleIndex
+
+
+subject = ObstacleIndex(
+    [
+        Obstacle(min_x=0, min_y=0, max_x=10, max_y=10, top_z=5),
+        Obstacle(min_x=20, min_y=0, max_x=30, max_y=10, top_z=50),
+        Obstacle(min_x=0, min_y=20, max_x=10, max_y=30, top_z=20),
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        # a single point inside an obstacle
+        ([(5, 5)], 5),
+        # a path between obstacles
+        ([(15, -10), (15, 40)], None),
+        # a path over the short and the tall obstacles
+        ([(5, 5), (25, 5)], 50),
+        # a path that only crosses the corner of an obstacle
+        ([(15, 15), (5, 25.1)], 20),
+        # a diagonal path that passes by an obstacle's corner
+        ([(11, 19), (14, 22)], None),
+        # a path that turns to avoid an obstacle
+        ([(5, 5), (15, 5), (15, 25), (5, 25)], 20),
+    ],
+)
+def test_get_highest_z(
+    path: List[Tuple[float, float]], expected: Optional[float]
+) -> None:
+    """It should get the tallest obstacle the path passes over."""
+    assert subject.get_highest_z(path) == expected
+
+
+def test_get_highest_z_with_clearance() -> None:
+    """It should keep the given distance away from obstacles."""
+    path = [(15, -10), (15, 40)]
+
+    assert subject.get_highest_z(path, xy_clearance=(4, 0)) is None
+    assert subject.get_highest_z(path, xy_clearance=(5, 0)) == 50
+    assert subject.get_highest_z([(5, 15), (5, 15)], xy_clearance=(0, 5)) == 20
+
+
+def test_empty_index() -> None:
+    """It should find nothing in an empty index."""
+    assert ObstacleIndex([]).get_highest_z([(0, 0), (100, 100)]) is None
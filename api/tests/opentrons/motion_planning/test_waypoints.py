@@ -9,6 +9,8 @@ from opentrons.motion_planning import (
     MoveType,
     DestinationOutOfBoundsError,
     ArcOutOfBoundsError,
+    Obstacle,
+    ObstacleIndex,
 )
 
 
@@ -238,3 +240,42 @@ def test_get_waypoints_direct_moves_ignore_clearance_requirements() -> None:
     )
 
     assert result == [Waypoint(Point(1, 1, 5.5))]
+
+
+def test_get_waypoints_clears_obstacles_along_path() -> None:
+    """It should raise the travel height to clear obstacles along the path."""
+    obstacles = ObstacleIndex(
+        [
+            Obstacle(min_x=0, min_y=0, max_x=10, max_y=10, top_z=50),
+            Obstacle(min_x=20, min_y=0, max_x=30, max_y=10, top_z=20),
+            Obstacle(min_x=0, min_y=50, max_x=30, max_y=60, top_z=90),
+        ]
+    )
+    result = get_waypoints(
+        origin=Point(25, 5, 10),
+        dest=Point(5, 5, 10),
+        min_travel_z=5,
+        max_travel_z=100,
+        obstacles=obstacles,
+    )
+
+    assert result == [
+        Waypoint(Point(25, 5, 60)),
+        Waypoint(Point(5, 5, 60)),
+        Waypoint(Point(5, 5, 10)),
+    ]
+
+
+def test_get_waypoints_obstacles_out_of_bounds() -> None:
+    """It should raise if an obstacle along the path is too tall to clear."""
+    obstacles = ObstacleIndex(
+        [Obstacle(min_x=0, min_y=0, max_x=10, max_y=10, top_z=100)]
+    )
+
+    with pytest.raises(ArcOutOfBoundsError):
+        get_waypoints(
+            origin=Point(5, 5, 10),
+            dest=Point(50, 5, 10),
+            max_travel_z=100,
+            obstacles=obstacles,
+        )
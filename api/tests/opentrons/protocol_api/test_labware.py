@@ -733,3 +733,19 @@ def test_labware_hash_func_diff_implementation_same_version(minimal_labware_def)
     l2 = labware.Labware(implementation=impl2, api_level=APIVersion(2, 3))
 
     assert len({l1, l2}) == 2
+
+
+def test_set_tip_length_of_shared_definition():
+    """Setting a tip length should only change the labware it is set on."""
+    definition = labware.get_labware_definition("opentrons_96_tiprack_300ul")
+    tip_length = definition["parameters"]["tipLength"]
+    deck = Deck()
+    impl1 = LabwareImplementation(definition, deck.position_for(1))
+    impl2 = LabwareImplementation(definition, deck.position_for(2))
+
+    impl1.set_tip_length(tip_length + 1.0)
+
+    assert impl1.get_tip_length() == tip_length + 1.0
+    assert impl1.get_definition()["parameters"]["tipLength"] == tip_length + 1.0
+    assert impl2.get_tip_length() == tip_length
+    assert definition["parameters"]["tipLength"] == tip_length
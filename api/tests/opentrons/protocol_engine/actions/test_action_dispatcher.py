@@ -1,10 +1,16 @@
 """Tests for the protocol engine's ActionDispatcher."""
+from contextlib import contextmanager
+from typing import Iterator, List, Union
+
+import pytest
 from decoy import Decoy
 
 from opentrons.protocol_engine.actions import (
+    Action,
     ActionDispatcher,
     ActionHandler,
     PlayAction,
+    PauseAction,
 )
 
 
@@ -38,3 +44,55 @@ def test_add_handler(decoy: Decoy) -> None:
         handler_2.handle_action(action),
         sink.handle_action(action),
     )
+
+
+def test_dispatch_many(decoy: Decoy) -> None:
+    """It should send several actions through the pipeline inside a sink batch."""
+    play_action = PlayAction()
+    pause_action = PauseAction()
+    events: List[Union[str, Action]] = []
+
+    @contextmanager
+    def _batch() -> Iterator[None]:
+        events.append("enter")
+        yield
+        events.append("exit")
+
+    sink = decoy.mock(cls=ActionHandler)
+
+    decoy.when(sink.batch()).then_return(_batch())
+    decoy.when(sink.handle_action(play_action)).then_do(events.append)
+    decoy.when(sink.handle_action(pause_action)).then_do(events.append)
+
+    subject = ActionDispatcher(sink=sink)
+    subject.dispatch_many([play_action, pause_action])
+
+    assert events == ["enter", play_action, pause_action, "exit"]
+
+
+def test_dispatch_many_error(decoy: Decoy) -> None:
+    """It should dispatch the rest of a batch after an action fails."""
+    play_action = PlayAction()
+    pause_action = PauseAction()
+    events: List[Union[str, Action]] = []
+
+    @contextmanager
+    def _batch() -> Iterator[None]:
+        events.append("enter")
+        yield
+        events.append("exit")
+
+    handler = decoy.mock(cls=ActionHandler)
+    sink = decoy.mock(cls=ActionHandler)
+
+    decoy.when(sink.batch()).then_return(_batch())
+    decoy.when(handler.handle_action(play_action)).then_raise(RuntimeError("oh no"))
+    decoy.when(sink.handle_action(pause_action)).then_do(events.append)
+
+    subject = ActionDispatcher(sink=sink)
+    subject.add_handler(handler)
+
+    with pytest.raises(RuntimeError, match="oh no"):
+        subject.dispatch_many([play_action, pause_action])
+
+    assert events == ["enter", pause_action, "exit"]
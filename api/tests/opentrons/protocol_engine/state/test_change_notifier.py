@@ -54,3 +54,36 @@ async def test_multiple_subscribers(count: int) -> None:
     await asyncio.gather(task_1, task_2, task_3)
 
     assert results == [1, 2, 3]
+
+
+async def test_topic_subscribers() -> None:
+    """It should only wake topic subscribers for changes to their topics."""
+    subject = ChangeNotifier()
+    foo_result = asyncio.create_task(subject.wait(topics=["foo"]))
+    bar_result = asyncio.create_task(subject.wait(topics=["bar", "baz"]))
+    any_result = asyncio.create_task(subject.wait())
+
+    await asyncio.sleep(0)
+    subject.notify(topics=["baz"])
+    await asyncio.sleep(0)
+
+    assert foo_result.done() is False
+    assert bar_result.done() is True
+    assert any_result.done() is True
+
+    subject.notify()
+    await foo_result
+
+
+def test_topic_versions() -> None:
+    """It should count notifications per topic."""
+    subject = ChangeNotifier()
+
+    subject.notify(topics=["foo"])
+    subject.notify(topics=["foo", "bar"])
+    subject.notify()
+
+    assert subject.get_version() == 3
+    assert subject.get_version("foo") == 2
+    assert subject.get_version("bar") == 1
+    assert subject.get_version("baz") == 0
@@ -0,0 +1,152 @@
+"""Tests for the persistent command log."""
+import pytest
+
+from opentrons.protocol_engine.commands import CommandStatus
+from opentrons.protocol_engine.state.command_log import CommandLog, PersistentVector
+
+from .command_fixtures import (
+    create_pending_command,
+    create_running_command,
+    create_completed_command,
+    create_failed_command,
+)
+
+
+@pytest.mark.parametrize("count", [0, 1, 32, 33, 1056, 1057, 40000])
+def test_vector_append_and_get(count: int) -> None:
+    """It should append values and read them back in order."""
+    subject: PersistentVector[int] = PersistentVector()
+
+    for i in range(count):
+        subject = subject.append(i)
+
+    assert len(subject) == count
+    assert list(subject) == list(range(count))
+    assert [subject[i] for i in range(count)] == list(range(count))
+
+
+def test_vector_set_is_persistent() -> None:
+    """It should replace values without changing previous versions."""
+    original: PersistentVector[int] = PersistentVector()
+
+    for i in range(2000):
+        original = original.append(i)
+
+    result = original.set(5, -5).set(1500, -1500).set(1999, -1999)
+
+    assert result[5] == -5
+    assert result[1500] == -1500
+    assert result[1999] == -1999
+    assert list(original) == list(range(2000))
+
+    with pytest.raises(IndexError):
+        original.set(2000, 0)
+
+    with pytest.raises(IndexError):
+        original[2000]
+
+
+def test_command_log_set() -> None:
+    """It should add and replace commands, keeping insertion order."""
+    command_a = create_pending_command(command_id="command-id-1")
+    command_b = create_pending_command(command_id="command-id-2")
+    command_c = create_running_command(command_id="command-id-1")
+
+    subject = CommandLog().set(command_a).set(command_b).set(command_c)
+
+    assert len(subject) == 2
+    assert subject["command-id-1"] == command_c
+    assert subject["command-id-2"] == command_b
+    assert list(subject) == ["command-id-1", "command-id-2"]
+    assert list(subject.values()) == [command_c, command_b]
+    assert subject.get_index("command-id-2") == 1
+    assert subject.get_index("not-a-command") is None
+
+
+def test_command_log_get_range() -> None:
+    """It should get a range of commands by position."""
+    commands = [
+        create_pending_command(command_id=f"command-id-{i}") for i in range(100)
+    ]
+    subject = CommandLog(commands)
+
+    assert subject.get_range(30, 70) == commands[30:70]
+    assert subject.get_range(90, 200) == commands[90:]
+    assert subject.get_range(200, 300) == []
+
+
+def test_command_log_versions_are_immutable() -> None:
+    """It should leave previous versions of the log untouched."""
+    command_a = create_pending_command(command_id="command-id-1")
+    command_b = create_pending_command(command_id="command-id-2")
+    command_c = create_completed_command(command_id="command-id-1")
+
+    version_1 = CommandLog().set(command_a)
+    version_2 = version_1.set(command_b)
+    version_3 = version_2.set(command_c)
+
+    assert dict(version_1) == {"command-id-1": command_a}
+    assert dict(version_2) == {"command-id-1": command_a, "command-id-2": command_b}
+    assert dict(version_3) == {"command-id-1": command_c, "command-id-2": command_b}
+    assert "command-id-2" not in version_1
+
+    with pytest.raises(KeyError):
+        version_1["command-id-2"]
+
+
+def test_command_log_branch_from_old_version() -> None:
+    """It should not let a branch from an old version corrupt newer versions."""
+    command_a = create_pending_command(command_id="command-id-1")
+    command_b = create_pending_command(command_id="command-id-2")
+    command_c = create_pending_command(command_id="command-id-3")
+
+    version_1 = CommandLog().set(command_a)
+    version_2 = version_1.set(command_b)
+    branch = version_1.set(command_c)
+
+    assert list(version_2) == ["command-id-1", "command-id-2"]
+    assert list(branch) == ["command-id-1", "command-id-3"]
+    assert "command-id-3" not in version_2
+    assert "command-id-2" not in branch
+
+
+def test_command_log_status_indexes() -> None:
+    """It should keep status counts and queue positions up to date."""
+    subject = CommandLog(
+        [
+            create_pending_command(command_id="command-id-1"),
+            create_pending_command(command_id="command-id-2"),
+            create_pending_command(command_id="command-id-3"),
+        ]
+    )
+
+    assert subject.get_status_count(CommandStatus.QUEUED) == 3
+    assert subject.get_next_queued_index() == 0
+    assert subject.get_first_incomplete_index() == 0
+    assert subject.get_first_failed_index() is None
+
+    subject = subject.set(create_running_command(command_id="command-id-1"))
+
+    assert subject.get_status_count(CommandStatus.QUEUED) == 2
+    assert subject.get_status_count(CommandStatus.RUNNING) == 1
+    assert subject.get_next_queued_index() == 1
+    assert subject.get_first_incomplete_index() == 0
+
+    subject = subject.set(create_completed_command(command_id="command-id-1"))
+    subject = subject.set(create_failed_command(command_id="command-id-3"))
+
+    assert subject.get_status_count(CommandStatus.SUCCEEDED) == 1
+    assert subject.get_status_count(CommandStatus.FAILED) == 1
+    assert subject.get_next_queued_index() == 1
+    assert subject.get_first_incomplete_index() == 1
+    assert subject.get_first_failed_index() == 2
+
+    subject = subject.set(create_completed_command(command_id="command-id-2"))
+
+    assert subject.get_next_queued_index() is None
+    assert subject.get_first_incomplete_index() is None
+
+    subject = subject.set(create_pending_command(command_id="command-id-4"))
+
+    assert subject.get_next_queued_index() == 3
+    assert subject.get_by_index(3).id == "command-id-4"
@@ -1,6 +1,5 @@
 """Tests for the command lifecycle state."""
 import pytest
-from collections import OrderedDict
 from datetime import datetime
 from typing import NamedTuple, Type, cast
 
@@ -9,6 +8,7 @@ from opentrons.protocols.models import LabwareDefinition
 from opentrons.protocol_engine import commands, errors
 from opentrons.protocol_engine.types import DeckSlotLocation, PipetteName, WellLocation
 from opentrons.protocol_engine.state.commands import CommandState, CommandStore
+from opentrons.protocol_engine.state.command_log import CommandLog
 
 from opentrons.protocol_engine.actions import (
     QueueCommandAction,
@@ -35,7 +35,7 @@ def test_initial_state() -> None:
     assert subject.state == CommandState(
         is_running=True,
         stop_requested=False,
-        commands_by_id=OrderedDict(),
+        commands_by_id=CommandLog(),
         errors_by_id={},
     )
 
@@ -165,7 +165,7 @@ def test_command_store_queues_commands(
     subject = CommandStore()
     subject.handle_action(action)
 
-    assert subject.state.commands_by_id == OrderedDict({"command-id": expected_command})
+    assert dict(subject.state.commands_by_id) == {"command-id": expected_command}
 
 
 def test_command_store_preserves_handle_order() -> None:
@@ -179,20 +179,16 @@ def test_command_store_preserves_handle_order() -> None:
     subject.handle_action(UpdateCommandAction(command=command_a))
     subject.handle_action(UpdateCommandAction(command=command_b))
 
-    assert subject.state.commands_by_id == OrderedDict(
-        [
-            ("command-id-1", command_a),
-            ("command-id-2", command_b),
-        ]
-    )
+    assert list(subject.state.commands_by_id.items()) == [
+        ("command-id-1", command_a),
+        ("command-id-2", command_b),
+    ]
 
     subject.handle_action(UpdateCommandAction(command=command_c))
-    assert subject.state.commands_by_id == OrderedDict(
-        [
-            ("command-id-1", command_c),
-            ("command-id-2", command_b),
-        ]
-    )
+    assert list(subject.state.commands_by_id.items()) == [
+        ("command-id-1", command_c),
+        ("command-id-2", command_b),
+    ]
 
 
 def test_command_store_handles_pause_action() -> None:
@@ -203,7 +199,7 @@ def test_command_store_handles_pause_action() -> None:
     assert subject.state == CommandState(
         is_running=False,
         stop_requested=False,
-        commands_by_id=OrderedDict(),
+        commands_by_id=CommandLog(),
         errors_by_id={},
     )
 
@@ -217,7 +213,7 @@ def test_command_store_handles_play_action() -> None:
     assert subject.state == CommandState(
         is_running=True,
         stop_requested=False,
-        commands_by_id=OrderedDict(),
+        commands_by_id=CommandLog(),
         errors_by_id={},
     )
 
@@ -232,7 +228,7 @@ def test_command_store_handles_stop_action() -> None:
     assert subject.state == CommandState(
         is_running=False,
         stop_requested=True,
-        commands_by_id=OrderedDict(),
+        commands_by_id=CommandLog(),
         errors_by_id={},
     )
 
@@ -246,7 +242,7 @@ def test_command_store_cannot_restart_after_stop() -> None:
     assert subject.state == CommandState(
         is_running=False,
         stop_requested=True,
-        commands_by_id=OrderedDict(),
+        commands_by_id=CommandLog(),
         errors_by_id={},
     )
 
@@ -265,7 +261,7 @@ def test_command_store_ignores_known_stop_error() -> None:
     assert subject.state == CommandState(
         is_running=False,
         stop_requested=True,
-        commands_by_id=OrderedDict(),
+        commands_by_id=CommandLog(),
         errors_by_id={},
     )
 
@@ -284,7 +280,7 @@ def test_command_store_saves_unknown_stop_error() -> None:
     assert subject.state == CommandState(
         is_running=False,
         stop_requested=True,
-        commands_by_id=OrderedDict(),
+        commands_by_id=CommandLog(),
         errors_by_id={
             "error-id": errors.ErrorOccurrence(
                 id="error-id",
@@ -319,7 +315,7 @@ def test_command_store_handles_command_failed() -> None:
     assert subject.state == CommandState(
         is_running=True,
         stop_requested=False,
-        commands_by_id=OrderedDict([("command-id", expected_failed_command)]),
+        commands_by_id=CommandLog([expected_failed_command]),
         errors_by_id={
             "error-id": errors.ErrorOccurrence(
                 id="error-id",
@@ -1,12 +1,16 @@
 """Labware state store tests."""
 import pytest
-from collections import OrderedDict
 from contextlib import nullcontext as does_not_raise
 from datetime import datetime
 from typing import List, Mapping, NamedTuple, Optional, Sequence, Tuple, Type, Union
 
 from opentrons.protocol_engine import EngineStatus, commands as cmd, errors
-from opentrons.protocol_engine.state.commands import CommandState, CommandView
+from opentrons.protocol_engine.state.commands import (
+    CommandState,
+    CommandView,
+    CommandSlice,
+)
+from opentrons.protocol_engine.state.command_log import CommandLog
 from opentrons.protocol_engine.actions import PlayAction, PauseAction
 
 from .command_fixtures import (
@@ -27,7 +31,7 @@ def get_command_view(
     state = CommandState(
         is_running=is_running,
         stop_requested=stop_requested,
-        commands_by_id=OrderedDict(commands_by_id),
+        commands_by_id=CommandLog(command for _, command in commands_by_id),
         errors_by_id=errors_by_id or {},
     )
 
@@ -68,19 +72,56 @@ def test_get_all() -> None:
     assert subject.get_all() == [command_1, command_2, command_3]
 
 
+def test_get_slice() -> None:
+    """It should get a page of commands, starting from a cursor."""
+    command_1 = create_completed_command(command_id="command-id-1")
+    command_2 = create_running_command(command_id="command-id-2")
+    command_3 = create_pending_command(command_id="command-id-3")
+
+    subject = get_command_view(
+        commands_by_id=[
+            ("command-id-1", command_1),
+            ("command-id-2", command_2),
+            ("command-id-3", command_3),
+        ]
+    )
+
+    assert subject.get_slice(cursor=1, length=1) == CommandSlice(
+        commands=[command_2],
+        cursor=1,
+        total_length=3,
+    )
+    assert subject.get_slice(cursor=1) == CommandSlice(
+        commands=[command_2, command_3],
+        cursor=1,
+        total_length=3,
+    )
+    assert subject.get_slice(cursor=2, length=10) == CommandSlice(
+        commands=[command_3],
+        cursor=2,
+        total_length=3,
+    )
+    assert subject.get_slice(cursor=5) == CommandSlice(
+        commands=[],
+        cursor=5,
+        total_length=3,
+    )
+
+
 def test_get_next_queued_returns_first_pending() -> None:
     """It should return the first command that's pending."""
-    pending_command = create_pending_command()
-    running_command = create_running_command()
-    completed_command = create_completed_command()
+    running_command = create_running_command(command_id="command-id-1")
+    completed_command = create_completed_command(command_id="command-id-2")
+    pending_command_1 = create_pending_command(command_id="command-id-3")
+    pending_command_2 = create_pending_command(command_id="command-id-4")
 
     subject = get_command_view(
         is_running=True,
         commands_by_id=[
             ("command-id-1", running_command),
             ("command-id-2", completed_command),
-            ("command-id-3", pending_command),
-            ("command-id-4", pending_command),
+            ("command-id-3", pending_command_1),
+            ("command-id-4", pending_command_2),
         ],
     )
 
@@ -174,6 +174,49 @@ def test_get_all_labware_highest_z(
 
     assert all_z == max(plate_z, reservoir_z)
 
+    # the result is reused until the labware state changes
+    decoy.when(labware_view.get_all()).then_return([])
+    assert subject.get_all_labware_highest_z() == all_z
+
+
+def test_get_obstacles(
+    decoy: Decoy,
+    well_plate_def: LabwareDefinition,
+    labware_view: LabwareView,
+    subject: GeometryView,
+) -> None:
+    """It should index the bounding box of each labware."""
+    plate = LoadedLabware(
+        id="plate-id",
+        loadName="plate-load-name",
+        definitionUri="plate-definition-uri",
+        location=DeckSlotLocation(slotName=DeckSlotName.SLOT_3),
+        offsetId=None,
+    )
+
+    decoy.when(labware_view.get_all()).then_return([plate])
+    decoy.when(labware_view.get("plate-id")).then_return(plate)
+    decoy.when(labware_view.get_definition("plate-id")).then_return(well_plate_def)
+    decoy.when(labware_view.get_labware_offset_vector("plate-id")).then_return(
+        LabwareOffsetVector(x=0, y=0, z=0)
+    )
+    decoy.when(labware_view.get_slot_position(DeckSlotName.SLOT_3)).then_return(
+        Point(100, 200, 0)
+    )
+
+    dims = well_plate_def.dimensions
+    corner = well_plate_def.cornerOffsetFromSlot
+    min_x = 100 + corner.x
+    min_y = 200 + corner.y
+    top_z = corner.z + dims.zDimension
+
+    result = subject.get_obstacles()
+
+    assert result.get_highest_z([(min_x, min_y)]) == top_z
+    assert result.get_highest_z([(min_x + dims.xDimension + 1, min_y)]) is None
+    assert result.get_highest_z([(min_x, min_y + dims.yDimension + 1)]) is None
+    assert subject.get_obstacles() is result
+
 
 def test_get_labware_position(
     decoy: Decoy,
@@ -1,5 +1,6 @@
 """Labware state store tests."""
 import pytest
+from dataclasses import replace
 from datetime import datetime
 from typing import Dict, Optional, cast
 
@@ -242,6 +243,25 @@ def test_get_well_rows(falcon_tuberack_def: LabwareDefinition) -> None:
     assert result == expected_rows
 
 
+def test_get_well_rows_recomputed_on_state_change(
+    falcon_tuberack_def: LabwareDefinition, well_plate_def: LabwareDefinition
+) -> None:
+    """It should reuse derived values until the labware state is replaced."""
+    subject = get_labware_view(
+        labware_by_id={"tube-rack-id": tube_rack},
+        definitions_by_uri={"some-tube-rack-uri": falcon_tuberack_def},
+    )
+
+    result = subject.get_well_rows(labware_id="tube-rack-id")
+    assert subject.get_well_rows(labware_id="tube-rack-id") is result
+
+    subject._state = replace(
+        subject.state, definitions_by_uri={"some-tube-rack-uri": well_plate_def}
+    )
+
+    assert list(subject.get_well_rows(labware_id="tube-rack-id")) == list("ABCDEFGH")
+
+
 def test_get_tip_length_raises_with_non_tip_rack(
     well_plate_def: LabwareDefinition,
 ) -> None:
@@ -528,3 +548,24 @@ def test_find_applicable_labware_offset() -> None:
         )
         is None
     )
+
+    # Matches an offset added after the previous lookups.
+    offset_3 = LabwareOffset(
+        id="id-3",
+        createdAt=datetime(year=2023, month=3, day=3),
+        definitionUri="definition-uri",
+        location=DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+        vector=LabwareOffsetVector(x=3, y=3, z=3),
+    )
+    subject._state = replace(
+        subject.state,
+        labware_offsets_by_id={"id-1": offset_1, "id-2": offset_2, "id-3": offset_3},
+    )
+
+    assert (
+        subject.find_applicable_labware_offset(
+            definition_uri="definition-uri",
+            location=DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+        )
+        == offset_3
+    )
@@ -6,7 +6,7 @@ from typing import Optional
 
 from opentrons.types import Point, MountType
 from opentrons.hardware_control.types import CriticalPoint
-from opentrons.motion_planning import MoveType, get_waypoints
+from opentrons.motion_planning import MoveType, Obstacle, ObstacleIndex, get_waypoints
 
 from opentrons.protocol_engine import errors
 from opentrons.protocol_engine.types import (
@@ -285,8 +285,18 @@ def test_get_movement_waypoints(
     elif spec.all_labware_z is not None:
         min_travel_z = spec.all_labware_z
 
-        decoy.when(geometry_view.get_all_labware_highest_z()).then_return(
-            spec.all_labware_z
+        # a labware underneath the whole path
+        decoy.when(geometry_view.get_obstacles()).then_return(
+            ObstacleIndex(
+                [Obstacle(min_x=0, min_y=0, max_x=10, max_y=10, top_z=min_travel_z)]
+            )
+        )
+        decoy.when(pipette_view.get(spec.pipette_id)).then_return(
+            LoadedPipette(
+                id=spec.pipette_id,
+                pipetteName=PipetteName.P300_SINGLE,
+                mount=MountType.LEFT,
+            )
         )
 
     else:
@@ -334,6 +344,13 @@ def test_get_movement_waypoints_raises(
 ) -> None:
     """It should raise FailedToPlanMoveError if get_waypoints raises."""
     decoy.when(pipette_view.get_current_well()).then_return(None)
+    decoy.when(pipette_view.get("pipette-id")).then_return(
+        LoadedPipette(
+            id="pipette-id",
+            pipetteName=PipetteName.P300_SINGLE,
+            mount=MountType.LEFT,
+        )
+    )
     decoy.when(geometry_view.get_well_position("labware-id", "A1", None)).then_return(
         Point(4, 5, 6)
     )
@@ -349,3 +366,56 @@ def test_get_movement_waypoints_raises(
             # this max_travel_z is too low and will induce failure
             max_travel_z=1,
         )
+
+
+@pytest.mark.parametrize(
+    ("pipette_name", "expected_travel_z"),
+    [
+        # the tall labware is 40 mm behind the path
+        (PipetteName.P300_SINGLE, 30),
+        # but within reach of a multi-channel's nozzles
+        (PipetteName.P300_MULTI_GEN2, 110),
+    ],
+)
+def test_get_movement_waypoints_clears_labware_along_path(
+    decoy: Decoy,
+    labware_view: LabwareView,
+    pipette_view: PipetteView,
+    geometry_view: GeometryView,
+    subject: MotionView,
+    pipette_name: PipetteName,
+    expected_travel_z: float,
+) -> None:
+    """A general arc should only rise above the labware that it passes over."""
+    decoy.when(pipette_view.get_current_well()).then_return(None)
+    decoy.when(pipette_view.get("pipette-id")).then_return(
+        LoadedPipette(id="pipette-id", pipetteName=pipette_name, mount=MountType.LEFT)
+    )
+    decoy.when(geometry_view.get_well_position("labware-id", "A1", None)).then_return(
+        Point(200, 10, 5)
+    )
+    decoy.when(geometry_view.get_obstacles()).then_return(
+        ObstacleIndex(
+            [
+                Obstacle(min_x=0, min_y=0, max_x=100, max_y=80, top_z=20),
+                Obstacle(min_x=150, min_y=0, max_x=250, max_y=80, top_z=15),
+                Obstacle(min_x=50, min_y=50, max_x=150, max_y=130, top_z=100),
+            ]
+        )
+    )
+
+    result = subject.get_movement_waypoints(
+        pipette_id="pipette-id",
+        labware_id="labware-id",
+        well_name="A1",
+        well_location=None,
+        origin=Point(10, 10, 5),
+        origin_cp=None,
+        max_travel_z=200,
+    )
+
+    assert [wp.position for wp in result] == [
+        Point(10, 10, expected_travel_z),
+        Point(200, 10, expected_travel_z),
+        Point(200, 10, 5),
+    ]
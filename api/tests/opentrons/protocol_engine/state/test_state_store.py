@@ -1,11 +1,23 @@
 """Tests for the top-level StateStore."""
 import pytest
-from decoy import Decoy
+from datetime import datetime
+from decoy import Decoy, matchers
 from typing import Callable, Optional
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
-from opentrons.protocol_engine.state import StateStore, State
-from opentrons.protocol_engine.actions import PlayAction
+from opentrons.protocol_engine.state import (
+    StateStore,
+    State,
+    StateTopic,
+    CommandTopic,
+)
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import (
+    PlayAction,
+    PauseAction,
+    QueueCommandAction,
+    UpdateCommandAction,
+)
 from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
 
 
@@ -49,9 +61,52 @@ def test_notify_on_state_change(
     subject: StateStore,
 ) -> None:
     """It should notify state changes when actions are handled."""
-    decoy.verify(change_notifier.notify(), times=0)
+    decoy.verify(change_notifier.notify(topics={StateTopic.COMMANDS}), times=0)
     subject.handle_action(PlayAction())
-    decoy.verify(change_notifier.notify(), times=1)
+    decoy.verify(change_notifier.notify(topics={StateTopic.COMMANDS}), times=1)
+
+
+def test_get_version(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should get state versions from the change notifier."""
+    decoy.when(change_notifier.get_version(None)).then_return(1)
+    decoy.when(change_notifier.get_version(StateTopic.LABWARE)).then_return(2)
+
+    assert subject.get_version() == 1
+    assert subject.get_version(StateTopic.LABWARE) == 2
+
+
+def test_batch_notifies_once(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should apply batched actions immediately but notify once at the end."""
+    with subject.batch():
+        subject.handle_action(
+            QueueCommandAction(
+                command_id="command-id",
+                created_at=datetime(year=2021, month=1, day=1),
+                request=commands.HomeCreate(params=commands.HomeParams()),
+            )
+        )
+
+        with subject.batch():
+            subject.handle_action(PlayAction())
+
+        assert subject.commands.get("command-id").id == "command-id"
+        assert subject.state.commands is subject.commands.state
+        decoy.verify(change_notifier.notify(topics=matchers.Anything()), times=0)
+
+    decoy.verify(
+        change_notifier.notify(
+            topics={StateTopic.COMMANDS, CommandTopic("command-id")}
+        ),
+        times=1,
+    )
 
 
 async def test_wait_for_state(
@@ -71,7 +126,7 @@ async def test_wait_for_state(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=2)
+    decoy.verify(await change_notifier.wait(topics=None), times=2)
 
 
 async def test_wait_for_state_short_circuit(
@@ -105,3 +160,53 @@ async def test_wait_for_raises(decoy: Decoy, subject: StateStore) -> None:
 
     with pytest.raises(ValueError, match="oh no"):
         await subject.wait_for(check_condition)
+
+
+async def test_wait_for_view_selector_topics(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should only wait for changes to the state behind a view selector."""
+    subject.handle_action(PauseAction())
+
+    decoy.when(await change_notifier.wait(topics={StateTopic.COMMANDS})).then_do(
+        lambda topics: subject.handle_action(PlayAction())
+    )
+
+    await subject.wait_for(subject.commands.get_is_running)
+
+    decoy.verify(await change_notifier.wait(topics=None), times=0)
+
+
+async def test_wait_for_command_complete_topics(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should wait for a single command's changes or any command failure."""
+    subject.handle_action(
+        QueueCommandAction(
+            command_id="command-id",
+            created_at=datetime(year=2021, month=1, day=1),
+            request=commands.HomeCreate(params=commands.HomeParams()),
+        )
+    )
+    completed_command = subject.commands.get("command-id").copy(
+        update={"status": commands.CommandStatus.SUCCEEDED}
+    )
+    expected_topics = {CommandTopic("command-id"), StateTopic.COMMAND_FAILURES}
+
+    decoy.when(await change_notifier.wait(topics=expected_topics)).then_do(
+        lambda topics: subject.handle_action(
+            UpdateCommandAction(command=completed_command)
+        )
+    )
+
+    await subject.wait_for(subject.commands.get_is_complete, command_id="command-id")
+
+    decoy.verify(
+        change_notifier.notify(
+            topics={StateTopic.COMMANDS, CommandTopic("command-id")}
+        ),
+    )
@@ -39,9 +39,13 @@ def test_configure(
     )
 
     subject.dispatch(action)
+    subject.dispatch_many([action])
 
     assert subject.state == state_view
-    decoy.verify(action_dispatcher.dispatch(action))
+    decoy.verify(
+        action_dispatcher.dispatch(action),
+        action_dispatcher.dispatch_many([action]),
+    )
 
 
 def test_setup_teardown(
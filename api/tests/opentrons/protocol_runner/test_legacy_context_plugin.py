@@ -1,4 +1,6 @@
 """Tests for the ProtocolRunner's LegacyContextPlugin."""
+import asyncio
+import logging
 import pytest
 from anyio import to_thread
 from decoy import Decoy, matchers
@@ -178,8 +180,12 @@ async def test_main_broker_messages(
 
     await to_thread.run_sync(handler, legacy_command)
 
+    await asyncio.sleep(0)
+
     decoy.verify(
-        action_dispatcher.dispatch(pe_actions.UpdateCommandAction(engine_command))
+        action_dispatcher.dispatch_many(
+            [pe_actions.UpdateCommandAction(engine_command)]
+        )
     )
 
 
@@ -222,8 +228,12 @@ async def test_labware_load_broker_messages(
 
     await to_thread.run_sync(handler, labware_load_info)
 
+    await asyncio.sleep(0)
+
     decoy.verify(
-        action_dispatcher.dispatch(pe_actions.UpdateCommandAction(engine_command))
+        action_dispatcher.dispatch_many(
+            [pe_actions.UpdateCommandAction(engine_command)]
+        )
     )
 
 
@@ -265,8 +275,12 @@ async def test_instrument_load_broker_messages(
 
     await to_thread.run_sync(handler, instrument_load_info)
 
+    await asyncio.sleep(0)
+
     decoy.verify(
-        action_dispatcher.dispatch(pe_actions.UpdateCommandAction(engine_command))
+        action_dispatcher.dispatch_many(
+            [pe_actions.UpdateCommandAction(engine_command)]
+        )
     )
 
 
@@ -305,6 +319,230 @@ async def test_module_load_broker_messages(
 
     await to_thread.run_sync(handler, module_load_info)
 
+    await asyncio.sleep(0)
+
+    decoy.verify(
+        action_dispatcher.dispatch_many(
+            [pe_actions.UpdateCommandAction(engine_command)]
+        )
+    )
+
+
+async def test_broker_messages_batched(
+    decoy: Decoy,
+    legacy_context: LegacyProtocolContext,
+    legacy_command_mapper: LegacyCommandMapper,
+    action_dispatcher: pe_actions.ActionDispatcher,
+    subject: LegacyContextPlugin,
+) -> None:
+    """It should dispatch messages that arrive together in a single batch."""
+    subject.setup()
+
+    handler_captor = matchers.Captor()
     decoy.verify(
-        action_dispatcher.dispatch(pe_actions.UpdateCommandAction(engine_command))
+        legacy_context.broker.subscribe(topic="command", handler=handler_captor)
+    )
+
+    handler: Callable[[LegacyCommand], None] = handler_captor.value
+
+    legacy_command_1: PauseMessage = {
+        "$": "before",
+        "name": "command.PAUSE",
+        "payload": {"userMessage": "hello", "text": "hello"},
+        "error": None,
+    }
+    legacy_command_2: PauseMessage = {
+        "$": "after",
+        "name": "command.PAUSE",
+        "payload": {"userMessage": "hello", "text": "hello"},
+        "error": None,
+    }
+    engine_command = pe_commands.Custom(
+        id="command-id",
+        status=pe_commands.CommandStatus.RUNNING,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.CustomParams(message="hello"),  # type: ignore[call-arg]
+    )
+    action_1 = pe_actions.UpdateCommandAction(engine_command)
+    action_2 = pe_actions.UpdateCommandAction(
+        engine_command.copy(update={"status": pe_commands.CommandStatus.SUCCEEDED})
+    )
+
+    decoy.when(legacy_command_mapper.map_command(command=legacy_command_1)).then_return(
+        action_1
+    )
+    decoy.when(legacy_command_mapper.map_command(command=legacy_command_2)).then_return(
+        action_2
     )
+
+    # send both messages before the event loop gets a chance to flush
+    handler(legacy_command_1)
+    handler(legacy_command_2)
+    await asyncio.sleep(0)
+
+    decoy.verify(action_dispatcher.dispatch_many([action_1, action_2]), times=1)
+    decoy.verify(action_dispatcher.dispatch_many([action_1]), times=0)
+
+
+async def test_flush_on_teardown(
+    decoy: Decoy,
+    legacy_context: LegacyProtocolContext,
+    legacy_command_mapper: LegacyCommandMapper,
+    action_dispatcher: pe_actions.ActionDispatcher,
+    subject: LegacyContextPlugin,
+) -> None:
+    """It should dispatch any pending messages when torn down."""
+    unsubscribe: Callable[[], None] = decoy.mock()
+
+    decoy.when(
+        legacy_context.broker.subscribe(topic="command", handler=matchers.Anything())
+    ).then_return(unsubscribe)
+    decoy.when(
+        legacy_context.labware_load_broker.subscribe(callback=matchers.Anything())
+    ).then_return(unsubscribe)
+    decoy.when(
+        legacy_context.instrument_load_broker.subscribe(callback=matchers.Anything())
+    ).then_return(unsubscribe)
+    decoy.when(
+        legacy_context.module_load_broker.subscribe(callback=matchers.Anything())
+    ).then_return(unsubscribe)
+
+    subject.setup()
+
+    handler_captor = matchers.Captor()
+    decoy.verify(
+        legacy_context.broker.subscribe(topic="command", handler=handler_captor)
+    )
+
+    handler: Callable[[LegacyCommand], None] = handler_captor.value
+
+    legacy_command: PauseMessage = {
+        "$": "before",
+        "name": "command.PAUSE",
+        "payload": {"userMessage": "hello", "text": "hello"},
+        "error": None,
+    }
+    engine_command = pe_commands.Custom(
+        id="command-id",
+        status=pe_commands.CommandStatus.RUNNING,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.CustomParams(message="hello"),  # type: ignore[call-arg]
+    )
+    action = pe_actions.UpdateCommandAction(engine_command)
+
+    decoy.when(legacy_command_mapper.map_command(command=legacy_command)).then_return(
+        action
+    )
+
+    handler(legacy_command)
+    subject.teardown()
+
+    decoy.verify(action_dispatcher.dispatch_many([action]), times=1)
+
+
+async def test_flush(
+    decoy: Decoy,
+    legacy_context: LegacyProtocolContext,
+    legacy_command_mapper: LegacyCommandMapper,
+    action_dispatcher: pe_actions.ActionDispatcher,
+    subject: LegacyContextPlugin,
+) -> None:
+    """It should dispatch pending messages when flushed, not on a StopAction."""
+    subject.setup()
+
+    handler_captor = matchers.Captor()
+    decoy.verify(
+        legacy_context.broker.subscribe(topic="command", handler=handler_captor)
+    )
+
+    handler: Callable[[LegacyCommand], None] = handler_captor.value
+
+    legacy_command: PauseMessage = {
+        "$": "before",
+        "name": "command.PAUSE",
+        "payload": {"userMessage": "hello", "text": "hello"},
+        "error": None,
+    }
+    engine_command = pe_commands.Custom(
+        id="command-id",
+        status=pe_commands.CommandStatus.RUNNING,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.CustomParams(message="hello"),  # type: ignore[call-arg]
+    )
+    action = pe_actions.UpdateCommandAction(engine_command)
+
+    decoy.when(legacy_command_mapper.map_command(command=legacy_command)).then_return(
+        action
+    )
+
+    handler(legacy_command)
+    subject.handle_action(pe_actions.StopAction())
+
+    decoy.verify(action_dispatcher.dispatch_many([action]), times=0)
+
+    subject.flush()
+
+    decoy.verify(action_dispatcher.dispatch_many([action]), times=1)
+
+
+async def test_dispatch_error(
+    decoy: Decoy,
+    legacy_context: LegacyProtocolContext,
+    legacy_command_mapper: LegacyCommandMapper,
+    action_dispatcher: pe_actions.ActionDispatcher,
+    subject: LegacyContextPlugin,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """It should log an error dispatching messages from teardown."""
+    unsubscribe: Callable[[], None] = decoy.mock()
+
+    decoy.when(
+        legacy_context.broker.subscribe(topic="command", handler=matchers.Anything())
+    ).then_return(unsubscribe)
+    decoy.when(
+        legacy_context.labware_load_broker.subscribe(callback=matchers.Anything())
+    ).then_return(unsubscribe)
+    decoy.when(
+        legacy_context.instrument_load_broker.subscribe(callback=matchers.Anything())
+    ).then_return(unsubscribe)
+    decoy.when(
+        legacy_context.module_load_broker.subscribe(callback=matchers.Anything())
+    ).then_return(unsubscribe)
+
+    subject.setup()
+
+    handler_captor = matchers.Captor()
+    decoy.verify(
+        legacy_context.broker.subscribe(topic="command", handler=handler_captor)
+    )
+
+    handler: Callable[[LegacyCommand], None] = handler_captor.value
+
+    legacy_command: PauseMessage = {
+        "$": "before",
+        "name": "command.PAUSE",
+        "payload": {"userMessage": "hello", "text": "hello"},
+        "error": None,
+    }
+    engine_command = pe_commands.Custom(
+        id="command-id",
+        status=pe_commands.CommandStatus.RUNNING,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.CustomParams(message="hello"),  # type: ignore[call-arg]
+    )
+    action = pe_actions.UpdateCommandAction(engine_command)
+
+    decoy.when(legacy_command_mapper.map_command(command=legacy_command)).then_return(
+        action
+    )
+    decoy.when(action_dispatcher.dispatch_many([action])).then_raise(
+        RuntimeError("oh no")
+    )
+
+    handler(legacy_command)
+    await asyncio.sleep(0)
+
+    with caplog.at_level(logging.ERROR):
+        subject.teardown()
+
+    assert "oh no" in caplog.text
@@ -217,7 +217,7 @@ def test_load_json(
             )
         ),
         task_queue.set_run_func(func=protocol_engine.wait_until_complete),
-        task_queue.set_cleanup_func(func=protocol_engine.stop),
+        task_queue.set_cleanup_func(func=subject._stop_engine),
     )
 
 
@@ -254,7 +254,7 @@ def test_load_python(
             protocol=python_protocol,
             context=protocol_context,
         ),
-        task_queue.set_cleanup_func(func=protocol_engine.stop),
+        task_queue.set_cleanup_func(func=subject._stop_engine),
     )
 
 
@@ -303,7 +303,7 @@ def test_load_legacy_python(
             protocol=legacy_protocol,
             context=legacy_context,
         ),
-        task_queue.set_cleanup_func(func=protocol_engine.stop),
+        task_queue.set_cleanup_func(func=subject._stop_engine),
     )
 
 
@@ -349,5 +349,66 @@ def test_load_legacy_json(
             protocol=legacy_protocol,
             context=legacy_context,
         ),
-        task_queue.set_cleanup_func(func=protocol_engine.stop),
+        task_queue.set_cleanup_func(func=subject._stop_engine),
     )
+
+
+@pytest.fixture
+def legacy_context_plugin(
+    decoy: Decoy,
+    monkeypatch: pytest.MonkeyPatch,
+    legacy_file_reader: LegacyFileReader,
+    legacy_context_creator: LegacyContextCreator,
+    protocol_engine: ProtocolEngine,
+    subject: ProtocolRunner,
+) -> LegacyContextPlugin:
+    """Load a legacy protocol, and get its plugin with a mocked out flush."""
+    legacy_protocol_source = ProtocolSource(
+        files=[],
+        pre_analysis=PythonPreAnalysis(metadata={}, api_version=APIVersion(2, 11)),
+    )
+    legacy_protocol = decoy.mock(cls=LegacyPythonProtocol)
+
+    decoy.when(legacy_file_reader.read(legacy_protocol_source)).then_return(
+        legacy_protocol
+    )
+    decoy.when(legacy_context_creator.create(legacy_protocol.api_level)).then_return(
+        decoy.mock(cls=LegacyProtocolContext)
+    )
+
+    subject.load(legacy_protocol_source)
+
+    plugin_captor = matchers.Captor()
+    decoy.verify(protocol_engine.add_plugin(plugin_captor))
+    plugin: LegacyContextPlugin = plugin_captor.value
+    monkeypatch.setattr(plugin, "flush", decoy.mock(func=plugin.flush))
+
+    return plugin
+
+
+async def test_stop_flushes_legacy_commands(
+    decoy: Decoy,
+    protocol_engine: ProtocolEngine,
+    legacy_context_plugin: LegacyContextPlugin,
+    subject: ProtocolRunner,
+) -> None:
+    """It should dispatch a legacy protocol's commands before halting."""
+    await subject.stop()
+
+    decoy.verify(legacy_context_plugin.flush(), await protocol_engine.halt())
+
+
+async def test_cleanup_flushes_legacy_commands(
+    decoy: Decoy,
+    task_queue: TaskQueue,
+    protocol_engine: ProtocolEngine,
+    legacy_context_plugin: LegacyContextPlugin,
+) -> None:
+    """It should dispatch a legacy protocol's commands before stopping."""
+    cleanup_captor = matchers.Captor()
+    decoy.verify(task_queue.set_cleanup_func(func=cleanup_captor))
+    error = RuntimeError("oh no")
+
+    await cleanup_captor.value(error=error)
+
+    decoy.verify(legacy_context_plugin.flush(), await protocol_engine.stop(error=error))
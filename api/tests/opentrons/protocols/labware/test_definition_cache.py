@@ -0,0 +1,112 @@
+import copy
+import json
+import os
+import pickle
+
+import pytest
+
+from opentrons.protocols.labware.definition import get_labware_definition
+from opentrons.protocols.labware.definition_cache import (
+    FrozenDict,
+    FrozenList,
+    LabwareDefinitionCache,
+    freeze,
+)
+
+
+@pytest.fixture
+def cache():
+    return LabwareDefinitionCache()
+
+
+@pytest.fixture
+def definitions_dir(tmp_path):
+    lw_dir = tmp_path / "my_labware"
+    lw_dir.mkdir()
+    (lw_dir / "1.json").write_text(json.dumps({"version": 1, "wells": ["A1"]}))
+    return tmp_path
+
+
+def test_get_definition_cached(cache, definitions_dir):
+    path = definitions_dir / "my_labware" / "1.json"
+    first = cache.get_definition("custom_beta", "my_labware", 1, path)
+    second = cache.get_definition("custom_beta", "my_labware", 1, path)
+
+    assert first == {"version": 1, "wells": ["A1"]}
+    assert first is second
+
+
+def test_get_definition_reloads_changed_file(cache, definitions_dir):
+    path = definitions_dir / "my_labware" / "1.json"
+    first = cache.get_definition("custom_beta", "my_labware", 1, path)
+
+    path.write_text(json.dumps({"version": 1, "wells": ["A1", "B1"]}))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = cache.get_definition("custom_beta", "my_labware", 1, path)
+
+    assert second is not first
+    assert second["wells"] == ["A1", "B1"]
+
+
+def test_get_definition_missing(cache, definitions_dir):
+    with pytest.raises(FileNotFoundError):
+        cache.get_definition(
+            "custom_beta", "other", 1, definitions_dir / "other" / "1.json"
+        )
+
+
+def test_has_version(cache, definitions_dir):
+    assert cache.has_version(definitions_dir, "my_labware", 1)
+    assert not cache.has_version(definitions_dir, "my_labware", 2)
+    assert not cache.has_version(definitions_dir, "other", 1)
+
+
+def test_get_load_names_rescans_changed_directory(cache, definitions_dir):
+    assert cache.get_load_names(definitions_dir) == ("my_labware",)
+
+    (definitions_dir / "other").mkdir()
+    stat = os.stat(definitions_dir)
+    os.utime(definitions_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert sorted(cache.get_load_names(definitions_dir)) == ["my_labware", "other"]
+
+
+def test_frozen_definition_cannot_be_modified():
+    frozen = freeze({"wells": {"A1": {"depth": 1}}, "ordering": [["A1"]]})
+
+    assert isinstance(frozen, FrozenDict)
+    assert isinstance(frozen["ordering"], FrozenList)
+    with pytest.raises(TypeError):
+        frozen["wells"]["A1"]["depth"] = 2
+    with pytest.raises(TypeError):
+        frozen["ordering"].append(["B1"])
+    with pytest.raises(TypeError):
+        frozen.update({})
+
+
+def test_frozen_definition_copies_are_mutable():
+    frozen = freeze({"wells": {"A1": {"depth": 1}}, "ordering": [["A1"]]})
+
+    thawed = copy.deepcopy(frozen)
+    thawed["wells"]["A1"]["depth"] = 2
+    thawed["ordering"].append(["B1"])
+    assert type(thawed) is dict
+    assert type(thawed["ordering"]) is list
+    assert frozen["wells"]["A1"]["depth"] == 1
+
+    shallow = copy.copy(frozen)
+    shallow["ordering"] = []
+    assert frozen["ordering"] == [["A1"]]
+
+    unpickled = pickle.loads(pickle.dumps(frozen))
+    assert type(unpickled) is dict
+    assert unpickled == frozen
+
+
+def test_standard_definitions_are_shared():
+    first = get_labware_definition("corning_96_wellplate_360ul_flat")
+    second = get_labware_definition("corning_96_wellplate_360ul_flat")
+
+    assert first is second
+    assert isinstance(first, FrozenDict)
@@ -0,0 +1,80 @@
+"""Benchmark BinarySerializable encoding and decoding of CAN payloads.
+
+Serializes and builds AddLinearMove payloads, like a move group upload does,
+and compares against packing with a format string worked out on every call,
+which is how payloads used to be serialized.
+
+Usage:
+    python benchmarks/binary_serializable.py --payloads 100000
+"""
+import argparse
+import struct
+import time
+from dataclasses import astuple
+from typing import Callable, List
+
+from opentrons_hardware.drivers.can_bus.messages.payloads import (
+    AddLinearMoveRequestPayload,
+)
+from opentrons_hardware.utils import (
+    Int32Field,
+    UInt8Field,
+    UInt32Field,
+    serialize_batch,
+)
+
+
+def uncompiled_serialize(payload: AddLinearMoveRequestPayload) -> bytes:
+    """Serialize by working out the format on every call."""
+    string = payload._get_format_string()
+    struct.calcsize(string)
+    return struct.pack(string, *(x.value for x in astuple(payload)))
+
+
+def time_it(name: str, count: int, func: Callable[[], object]) -> None:
+    """Time a function and print the result."""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {elapsed:.3f} s ({elapsed / count * 1e6:.2f} us/payload)")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--payloads",
+        type=int,
+        default=100000,
+        help="Number of payloads to encode and decode",
+    )
+    args = parser.parse_args()
+    count: int = args.payloads
+
+    payloads: List[AddLinearMoveRequestPayload] = [
+        AddLinearMoveRequestPayload(
+            group_id=UInt8Field(i % 3),
+            seq_id=UInt8Field(i % 256),
+            duration=UInt32Field(i),
+            acceleration=Int32Field(-i),
+            velocity=Int32Field(i * 2),
+        )
+        for i in range(count)
+    ]
+    data = [p.serialize() for p in payloads]
+
+    print(f"binary_serializable: {count} payloads")
+    time_it(
+        "uncompiled serialize",
+        count,
+        lambda: [uncompiled_serialize(p) for p in payloads],
+    )
+    time_it("serialize", count, lambda: [p.serialize() for p in payloads])
+    time_it("serialize_batch", count, lambda: serialize_batch(payloads))
+    time_it(
+        "build", count, lambda: [AddLinearMoveRequestPayload.build(d) for d in data]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Benchmark running move groups back-to-back over a virtual CAN bus.
+
+Runs MoveGroupRunner against simulated nodes on a python-can virtual bus.
+The nodes take the planned duration of each group to execute it, then
+report its moves completed. Any time beyond the groups' planned durations
+is time the gantry spends idle, waiting on the host between groups.
+
+Usage:
+    python benchmarks/move_group_pipeline.py --groups 20 --duration 0.05
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict
+
+from opentrons_hardware.drivers.can_bus import (
+    ArbitrationId,
+    ArbitrationIdParts,
+    CanDriver,
+    CanMessage,
+    MessageId,
+    NodeId,
+)
+from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
+from opentrons_hardware.drivers.can_bus.messages.payloads import (
+    AddLinearMoveRequestPayload,
+    ExecuteMoveGroupRequestPayload,
+    MoveCompletedPayload,
+)
+from opentrons_hardware.hardware_control.constants import interrupts_per_sec
+from opentrons_hardware.hardware_control.motion import (
+    MoveGroups,
+    MoveGroupSingleAxisStep,
+)
+from opentrons_hardware.hardware_control.move_group_runner import MoveGroupRunner
+from opentrons_hardware.utils import UInt8Field, UInt32Field
+
+NODES = [NodeId.gantry_x, NodeId.gantry_y, NodeId.head]
+
+
+async def simulate_nodes(driver: CanDriver) -> None:
+    """Execute uploaded move groups, like the nodes' firmware would.
+
+    Each sequence of a group is reported complete as soon as it ends.
+    """
+    # group id -> seq id -> node id -> duration
+    groups: Dict[int, Dict[int, Dict[int, float]]] = {}
+
+    async for message in driver:
+        parts = message.arbitration_id.parts
+        if parts.message_id == MessageId.add_move_request:
+            move = AddLinearMoveRequestPayload.build(message.data)
+            sequences = groups.setdefault(move.group_id.value, {})
+            sequences.setdefault(move.seq_id.value, {})[parts.node_id] = (
+                move.duration.value / interrupts_per_sec
+            )
+        elif parts.message_id == MessageId.execute_move_group_request:
+            group_id = ExecuteMoveGroupRequestPayload.build(message.data).group_id.value
+            loop = asyncio.get_event_loop()
+            deadline = loop.time()
+            for seq_id, nodes in sorted(groups.pop(group_id).items()):
+                deadline += max(nodes.values())
+                await asyncio.sleep(deadline - loop.time())
+                for node_id in nodes:
+                    await driver.send(create_move_completed(group_id, node_id, seq_id))
+
+
+def create_move_completed(group_id: int, node_id: int, seq_id: int) -> CanMessage:
+    """Create a move completed message from a node."""
+    payload = MoveCompletedPayload(
+        group_id=UInt8Field(group_id),
+        seq_id=UInt8Field(seq_id),
+        current_position=UInt32Field(0),
+        ack_id=UInt8Field(0),
+        node_id=UInt8Field(node_id),
+    )
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=MessageId.move_completed,
+                node_id=NodeId.host,
+                function_code=0,
+            )
+        ),
+        data=payload.serialize(),
+    )
+
+
+def create_move_groups(count: int, steps: int, duration: float) -> MoveGroups:
+    """Create move groups that each take `duration` seconds."""
+    return [
+        [
+            {
+                node: MoveGroupSingleAxisStep(
+                    distance_mm=1,
+                    velocity_mm_sec=steps / duration,
+                    duration_sec=duration / steps,
+                )
+                for node in NODES
+            }
+            for _ in range(steps)
+        ]
+        for _ in range(count)
+    ]
+
+
+async def run_groups(move_groups: MoveGroups, upload_window: int) -> float:
+    """Run move groups, returning the elapsed time."""
+    host_driver = await CanDriver.build(
+        interface="virtual", channel="benchmark", bitrate=0
+    )
+    node_driver = await CanDriver.build(
+        interface="virtual", channel="benchmark", bitrate=0
+    )
+    messenger = CanMessenger(driver=host_driver)
+    messenger.start()
+    nodes = asyncio.get_event_loop().create_task(simulate_nodes(node_driver))
+
+    try:
+        runner = MoveGroupRunner(move_groups=move_groups, upload_window=upload_window)
+        start = time.perf_counter()
+        await runner.run(can_messenger=messenger)
+        return time.perf_counter() - start
+    finally:
+        nodes.cancel()
+        await messenger.stop()
+        host_driver.shutdown()
+        node_driver.shutdown()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--groups", type=int, default=20, help="Number of move groups to run"
+    )
+    parser.add_argument(
+        "--steps", type=int, default=8, help="Number of sequences in each group"
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=0.05,
+        help="Planned duration of each group, in seconds",
+    )
+    args = parser.parse_args()
+    count: int = args.groups
+    move_groups = create_move_groups(count, args.steps, args.duration)
+    planned = count * args.duration
+
+    print(
+        f"move_group_pipeline: {count} groups of {args.steps} sequences "
+        f"on {len(NODES)} nodes, {planned:.3f} s planned"
+    )
+
+    for upload_window in (1, 2):
+        elapsed = asyncio.run(run_groups(move_groups, upload_window))
+        idle_ms = (elapsed - planned) / count * 1e3
+        print(
+            f"upload window {upload_window}: {elapsed:.3f} s, "
+            f"{idle_ms:.2f} ms idle per group"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """Can messenger class."""
 import asyncio
-from typing import List, Optional
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 import logging
 
 from opentrons_hardware.drivers.can_bus import (
@@ -17,7 +18,7 @@ from opentrons_hardware.drivers.can_bus.messages.messages import (
     MessageDefinition,
     get_definition,
 )
-from opentrons_hardware.utils import BinarySerializableException
+from opentrons_hardware.utils import BinarySerializableException, serialize_batch
 
 log = logging.getLogger(__name__)
 
@@ -31,12 +32,103 @@ class MessageListener(ABC):
         ...
 
 
+class OverflowPolicy(str, Enum):
+    """What to do when a listener's message queue is full.
+
+    Attributes:
+        drop_oldest: Discard the oldest queued message to make room.
+        drop_newest: Discard the message that just arrived.
+    """
+
+    drop_oldest = "drop_oldest"
+    drop_newest = "drop_newest"
+
+
+class _Subscription:
+    """A listener, the messages it wants, and how to deliver them."""
+
+    def __init__(
+        self,
+        listener: MessageListener,
+        message_ids: Optional[Iterable[MessageId]],
+        node_ids: Optional[Iterable[NodeId]],
+        queue_size: Optional[int],
+        overflow_policy: OverflowPolicy,
+    ) -> None:
+        self.listener = listener
+        self._message_ids = None if message_ids is None else frozenset(message_ids)
+        self._node_ids = None if node_ids is None else frozenset(node_ids)
+        self._overflow_policy = overflow_policy
+        self._queue: Optional[asyncio.Queue[MessageDefinition]] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+        if queue_size is not None:
+            self._queue = asyncio.Queue(maxsize=queue_size)
+            self.start()
+
+    def matches(self, message_id: int, node_id: int) -> bool:
+        """Check whether the listener wants messages with these ids."""
+        return (self._message_ids is None or message_id in self._message_ids) and (
+            self._node_ids is None or node_id in self._node_ids
+        )
+
+    def deliver(self, message: MessageDefinition) -> None:
+        """Deliver a message, or queue it for delivery, without blocking."""
+        if self._queue is None:
+            _notify(self.listener, message)
+            return
+
+        if self._queue.full():
+            if self._overflow_policy == OverflowPolicy.drop_newest:
+                log.warning(f"Listener {self.listener} queue full, dropping {message}")
+                return
+
+            dropped = self._queue.get_nowait()
+            log.warning(f"Listener {self.listener} queue full, dropping {dropped}")
+
+        self._queue.put_nowait(message)
+
+    def start(self) -> None:
+        """Start delivering queued messages, if not already."""
+        if self._queue is not None and self._task is None:
+            self._task = asyncio.get_event_loop().create_task(self._deliver_task())
+
+    def close(self) -> None:
+        """Stop delivering queued messages."""
+        if self._task:
+            self._task.cancel()
+
+    async def stop(self) -> None:
+        """Stop delivering queued messages, and wait for delivery to end."""
+        task = self._task
+        self._task = None
+        if task:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _deliver_task(self) -> None:
+        """Deliver queued messages to the listener, in order."""
+        assert self._queue is not None
+        while True:
+            message = await self._queue.get()
+            _notify(self.listener, message)
+
+
+def _notify(listener: MessageListener, message: MessageDefinition) -> None:
+    """Call a listener, so that its failure does not stop message intake."""
+    try:
+        listener.on_message(message)
+    except Exception:
+        log.exception(f"Listener {listener} failed to handle {message}")
+
+
 class CanMessenger:
     """High level can messaging class wrapping a CanDriver.
 
     The background task can be controlled with start/stop methods.
 
-    To receive message notifications add a listener using add_listener
+    To receive message notifications add a listener using add_listener.
+    Incoming frames are only decoded if some listener wants them.
     """
 
     def __init__(self, driver: CanDriver) -> None:
@@ -46,18 +138,39 @@ class CanMessenger:
             driver: The can bus driver to use.
         """
         self._drive = driver
-        self._listeners: List[MessageListener] = []
+        self._subscriptions: List[_Subscription] = []
+        self._dispatch_table: Dict[Tuple[int, int], Tuple[_Subscription, ...]] = {}
         self._task: Optional[asyncio.Task[None]] = None
 
     async def send(self, node_id: NodeId, message: MessageDefinition) -> None:
         """Send a message."""
+        await self._send_data(node_id, message, message.payload.serialize())
+
+    async def send_batch(
+        self, messages: Sequence[Tuple[NodeId, MessageDefinition]]
+    ) -> None:
+        """Send many messages, in order.
+
+        All the payloads are serialized together before the first message
+        is sent.
+
+        Args:
+            messages: Pairs of destination node and message to send.
+        """
+        payloads = serialize_batch([message.payload for _, message in messages])
+        for (node_id, message), data in zip(messages, payloads):
+            await self._send_data(node_id, message, data)
+
+    async def _send_data(
+        self, node_id: NodeId, message: MessageDefinition, data: bytes
+    ) -> None:
+        """Send a message's serialized payload."""
         # TODO (amit, 2021-11-05): Use function code when it is better defined.
         arbitration_id = ArbitrationId(
             parts=ArbitrationIdParts(
                 message_id=message.message_id, node_id=node_id, function_code=0
             )
         )
-        data = message.payload.serialize()
         log.debug(
             f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
             f"payload: {message.payload}"
@@ -67,47 +180,122 @@ class CanMessenger:
         )
 
     def start(self) -> None:
-        """Start the reader task."""
+        """Start the reader task, and the queued listeners' delivery tasks."""
         if self._task:
             log.warning("task already running.")
             return
+        for subscription in self._subscriptions:
+            subscription.start()
         self._task = asyncio.get_event_loop().create_task(self._read_task())
 
     async def stop(self) -> None:
-        """Stop the reader task."""
+        """Stop the reader task, and the queued listeners' delivery tasks.
+
+        Messages still queued for a listener are delivered if the messenger
+        is started again.
+        """
         if self._task:
             self._task.cancel()
             try:
                 await self._task
             except asyncio.CancelledError:
                 log.info("Task cancelled.")
+            self._task = None
         else:
             log.warning("task not running.")
+        await asyncio.gather(
+            *(subscription.stop() for subscription in self._subscriptions)
+        )
 
-    def add_listener(self, listener: MessageListener) -> None:
-        """Add a message listener."""
-        self._listeners.append(listener)
+    def add_listener(
+        self,
+        listener: MessageListener,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_ids: Optional[Iterable[NodeId]] = None,
+        queue_size: Optional[int] = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.drop_oldest,
+    ) -> None:
+        """Add a message listener.
+
+        Args:
+            listener: The listener to notify of incoming messages.
+            message_ids: Only notify of messages with these ids. Defaults
+                to all messages.
+            node_ids: Only notify of messages whose arbitration id has one
+                of these node ids. Defaults to all nodes.
+            queue_size: If set, messages are queued, up to this many, and
+                delivered from a separate task, so a slow listener cannot
+                hold up reading from the bus. Otherwise the listener is
+                called directly from the read task.
+            overflow_policy: Which message to drop when the queue is full.
+        """
+        self._subscriptions.append(
+            _Subscription(
+                listener=listener,
+                message_ids=message_ids,
+                node_ids=node_ids,
+                queue_size=queue_size,
+                overflow_policy=overflow_policy,
+            )
+        )
+        self._dispatch_table.clear()
 
     def remove_listener(self, listener: MessageListener) -> None:
-        """Remove a message listener."""
-        self._listeners.remove(listener)
+        """Remove a message listener.
+
+        Any messages still queued for the listener are discarded.
+        """
+        for subscription in self._subscriptions:
+            if subscription.listener is listener:
+                subscription.close()
+                self._subscriptions.remove(subscription)
+                self._dispatch_table.clear()
+                return
+
+        raise ValueError(f"Listener {listener} was not added.")
+
+    def _get_subscriptions(
+        self, message_id: int, node_id: int
+    ) -> Tuple[_Subscription, ...]:
+        """Get the subscriptions that want messages with these ids."""
+        key = (message_id, node_id)
+        subscriptions = self._dispatch_table.get(key)
+
+        if subscriptions is None:
+            subscriptions = tuple(
+                s for s in self._subscriptions if s.matches(message_id, node_id)
+            )
+            self._dispatch_table[key] = subscriptions
+
+        return subscriptions
 
     async def _read_task(self) -> None:
         """Read task."""
         async for message in self._drive:
-            message_definition = get_definition(
-                MessageId(message.arbitration_id.parts.message_id)
-            )
-            if message_definition:
-                try:
-                    build = message_definition.payload_type.build(message.data)
-                    log.debug(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
-                        f"payload: {build}"
-                    )
-                    for listener in self._listeners:
-                        listener.on_message(message_definition(payload=build))  # type: ignore[arg-type]  # noqa: E501
-                except BinarySerializableException:
-                    log.exception(f"Failed to build from {message}")
-            else:
-                log.error(f"Message {message} is not recognized.")
+            self._handle_message(message)
+
+    def _handle_message(self, message: CanMessage) -> None:
+        """Decode an incoming message and deliver it to its listeners."""
+        parts = message.arbitration_id.parts
+        subscriptions = self._get_subscriptions(parts.message_id, parts.node_id)
+        if not subscriptions:
+            return
+
+        message_definition = get_definition(MessageId(parts.message_id))
+        if not message_definition:
+            log.error(f"Message {message} is not recognized.")
+            return
+
+        try:
+            build = message_definition.payload_type.build(message.data)
+        except BinarySerializableException:
+            log.exception(f"Failed to build from {message}")
+            return
+
+        log.debug(
+            f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
+            f"payload: {build}"
+        )
+        definition = message_definition(payload=build)  # type: ignore[arg-type]
+        for subscription in subscriptions:
+            subscription.deliver(definition)
@@ -4,3 +4,6 @@ from typing_extensions import Final
 
 interrupts_per_sec: Final = 170000
 """The number of motor interrupts per second."""
+
+default_upload_window: Final = 2
+"""How many move groups may be uploaded ahead of the one completing."""
@@ -1,17 +1,24 @@
 """A collection of motions that define a single move."""
-from typing import List, Dict
+import math
+from typing import List, Dict, Iterable, Optional, Tuple
 from dataclasses import dataclass
 
 from opentrons_hardware.drivers.can_bus import NodeId
+from opentrons_hardware.hardware_control.constants import interrupts_per_sec
 
 
 @dataclass(frozen=True)
 class MoveGroupSingleAxisStep:
-    """A single move in a move group."""
+    """A single move in a move group.
+
+    The axis starts the step at `velocity_mm_sec` and changes speed at a
+    constant `acceleration_mm_sec_sq` for `duration_sec`.
+    """
 
     distance_mm: float
     velocity_mm_sec: float
     duration_sec: float
+    acceleration_mm_sec_sq: float = 0
 
 
 MoveGroupStep = Dict[
@@ -24,67 +31,335 @@ MoveGroup = List[MoveGroupStep]
 MoveGroups = List[MoveGroup]
 
 
+@dataclass(frozen=True)
+class AxisConstraints:
+    """The motion limits of a single axis.
+
+    Attributes:
+        max_velocity_mm_sec: The fastest the axis may move.
+        max_acceleration_mm_sec_sq: The fastest the axis may change speed.
+        max_velocity_discontinuity_mm_sec: The largest instantaneous change
+            in speed the axis can follow, for instance when starting from
+            rest or at a corner between two blended segments.
+    """
+
+    max_velocity_mm_sec: float
+    max_acceleration_mm_sec_sq: float
+    max_velocity_discontinuity_mm_sec: float
+
+
+AxisConstraintsMap = Dict[NodeId, AxisConstraints]
+
+_UNCONSTRAINED = AxisConstraints(
+    max_velocity_mm_sec=math.inf,
+    max_acceleration_mm_sec_sq=math.inf,
+    max_velocity_discontinuity_mm_sec=math.inf,
+)
+
+_MIN_STEP_DURATION_SEC = 1 / interrupts_per_sec
+"""Steps shorter than a motor interrupt can't be run, so are merged into others."""
+
+_MAX_STEP_RATE = (2 ** 31 - 1) / interrupts_per_sec
+"""The fastest velocity or acceleration of an axis that fits in a step message."""
+
+
+_Phase = Tuple[float, float, float, float]
+"""A segment's distance, start velocity, duration, and acceleration in a phase."""
+
+
+@dataclass(frozen=True)
+class _Segment:
+    """A straight-line segment of a coordinated move."""
+
+    length_mm: float
+    unit_vector: Dict[NodeId, float]
+    max_velocity_mm_sec: float
+    max_acceleration_mm_sec_sq: float
+
+
 def create(
-    origin: Dict[NodeId, float], target: Dict[NodeId, float], speed: float
+    origin: Dict[NodeId, float],
+    target: Dict[NodeId, float],
+    speed: float,
+    constraints: Optional[AxisConstraintsMap] = None,
 ) -> MoveGroups:
     """Create a move.
 
+    All axes move together in a straight line, and arrive at the same time.
+
     Args:
         origin: Start position.
         target: Target position.
-        speed: the speed
+        speed: The speed along the line between origin and target.
+        constraints: Per-axis motion limits. Axes without constraints may
+            change speed instantly.
 
     Returns:
         A Move
     """
-    # Raise KeyError if axis is missing from origin
-    deltas = {ax: target[ax] - origin[ax] for ax in target.keys()}
-
-    move_groups = []
-
-    # First move head
-    dza = deltas.get(NodeId.head, 0)
-    if dza:
-        move_groups.append(
-            [
-                {
-                    NodeId.head: MoveGroupSingleAxisStep(
-                        distance_mm=dza,
-                        velocity_mm_sec=speed if dza > 0 else -speed,
-                        duration_sec=abs(dza) / speed,
-                    )
-                }
-            ]
+    return create_path(origin, [target], speed, constraints)
+
+
+def create_path(
+    origin: Dict[NodeId, float],
+    targets: Iterable[Dict[NodeId, float]],
+    speed: float,
+    constraints: Optional[AxisConstraintsMap] = None,
+) -> MoveGroups:
+    """Create a coordinated move through a series of straight-line segments.
+
+    Each segment gets a trapezoidal velocity profile: it accelerates, cruises,
+    then decelerates, within the limits of every axis that moves. Consecutive
+    segments are blended, so the move only slows down at a corner as much as
+    the axes' velocity discontinuity limits require, instead of stopping.
+
+    The whole path is returned as a single move group, so it can be loaded
+    and executed at once. Every sequence in the group includes each moving
+    axis, so the axes start and stop each step together.
+
+    Args:
+        origin: Start position.
+        targets: Positions to move through, in order. Axes missing from a
+            target stay where they are.
+        speed: The maximum speed along the path.
+        constraints: Per-axis motion limits. Axes without constraints may
+            change speed instantly.
+
+    Returns:
+        A list with a single move group, or an empty list if nothing moves.
+
+    Raises:
+        KeyError: a target has an axis missing from the origin.
+        ValueError: the speed is not positive.
+    """
+    if speed <= 0:
+        raise ValueError(f"Move speed must be positive, got {speed}")
+
+    segments = _create_segments(origin, targets, speed, constraints or {})
+
+    if not segments:
+        return []
+
+    junction_velocities = _plan_junction_velocities(segments, constraints or {})
+    move_group: MoveGroup = []
+
+    for segment, entry_velocity, exit_velocity in zip(
+        segments, junction_velocities, junction_velocities[1:]
+    ):
+        move_group.extend(_create_steps(segment, entry_velocity, exit_velocity))
+
+    return [move_group]
+
+
+def _create_segments(
+    origin: Dict[NodeId, float],
+    targets: Iterable[Dict[NodeId, float]],
+    speed: float,
+    constraints: AxisConstraintsMap,
+) -> List[_Segment]:
+    """Split a path into non-empty segments, with their velocity limits."""
+    segments = []
+    position = dict(origin)
+
+    for target in targets:
+        # Raise KeyError if axis is missing from origin
+        deltas = {ax: target[ax] - position[ax] for ax in target.keys()}
+        position.update(target)
+        length = math.sqrt(sum(d * d for d in deltas.values()))
+
+        if length == 0:
+            continue
+
+        unit_vector = {ax: d / length for ax, d in deltas.items() if d}
+        max_velocity = speed
+        max_acceleration = math.inf
+
+        for ax, component in unit_vector.items():
+            axis_constraints = constraints.get(ax, _UNCONSTRAINED)
+            scale = abs(component)
+            max_velocity = min(
+                max_velocity,
+                min(axis_constraints.max_velocity_mm_sec, _MAX_STEP_RATE) / scale,
+            )
+
+            # an unconstrained axis changes speed instantly, without an
+            # acceleration step, so it has no message field to overflow
+            if not math.isinf(axis_constraints.max_acceleration_mm_sec_sq):
+                max_acceleration = min(
+                    max_acceleration,
+                    min(axis_constraints.max_acceleration_mm_sec_sq, _MAX_STEP_RATE)
+                    / scale,
+                )
+
+        segments.append(
+            _Segment(
+                length_mm=length,
+                unit_vector=unit_vector,
+                max_velocity_mm_sec=max_velocity,
+                max_acceleration_mm_sec_sq=max_acceleration,
+            )
+        )
+
+    return segments
+
+
+def _get_max_junction_velocity(
+    before: Dict[NodeId, float],
+    after: Dict[NodeId, float],
+    constraints: AxisConstraintsMap,
+) -> float:
+    """Get the fastest path speed that can be kept from one direction to another.
+
+    At a junction, each axis' velocity jumps by the path speed times the
+    change in that axis' component of the direction. An empty direction
+    represents the gantry at rest, at either end of the path.
+    """
+    max_velocity = math.inf
+
+    for ax in before.keys() | after.keys():
+        change = abs(after.get(ax, 0) - before.get(ax, 0))
+
+        if change > 0:
+            axis_constraints = constraints.get(ax, _UNCONSTRAINED)
+            max_velocity = min(
+                max_velocity,
+                axis_constraints.max_velocity_discontinuity_mm_sec / change,
+            )
+
+    return max_velocity
+
+
+def _plan_junction_velocities(
+    segments: List[_Segment], constraints: AxisConstraintsMap
+) -> List[float]:
+    """Get the path speed at the start and end of every segment.
+
+    Returns:
+        A list with one more velocity than there are segments, where
+        segment `i` starts at velocity `i` and ends at velocity `i + 1`.
+    """
+    at_rest: Dict[NodeId, float] = {}
+    directions = [at_rest, *(s.unit_vector for s in segments), at_rest]
+    speed_limits = [math.inf, *(s.max_velocity_mm_sec for s in segments), math.inf]
+    velocities = [
+        min(
+            speed_limits[i],
+            speed_limits[i + 1],
+            _get_max_junction_velocity(directions[i], directions[i + 1], constraints),
         )
+        for i in range(len(segments) + 1)
+    ]
 
-    # Move x
-    dx = deltas.get(NodeId.gantry_x, 0)
-    if dx:
-        move_groups.append(
-            [
-                {
-                    NodeId.gantry_x: MoveGroupSingleAxisStep(
-                        distance_mm=dx,
-                        velocity_mm_sec=speed if dx > 0 else -speed,
-                        duration_sec=abs(dx) / speed,
-                    )
-                }
-            ]
+    # make sure every segment can decelerate to its exit velocity...
+    for i in reversed(range(len(segments))):
+        velocities[i] = min(
+            velocities[i], _get_reachable_velocity(segments[i], velocities[i + 1])
         )
 
-    # Move y
-    dy = deltas.get(NodeId.gantry_y, 0)
-    if dy:
-        move_groups.append(
-            [
-                {
-                    NodeId.gantry_y: MoveGroupSingleAxisStep(
-                        distance_mm=dy,
-                        velocity_mm_sec=speed if dy > 0 else -speed,
-                        duration_sec=abs(dx) / speed,
-                    )
-                }
-            ]
+    # ...and accelerate to its exit velocity
+    for i in range(len(segments)):
+        velocities[i + 1] = min(
+            velocities[i + 1], _get_reachable_velocity(segments[i], velocities[i])
         )
 
-    return move_groups
+    return velocities
+
+
+def _get_reachable_velocity(segment: _Segment, start_velocity: float) -> float:
+    """Get the fastest velocity reachable over a segment from a start velocity."""
+    return math.sqrt(
+        start_velocity ** 2 + 2 * segment.max_acceleration_mm_sec_sq * segment.length_mm
+    )
+
+
+def _create_steps(
+    segment: _Segment, entry_velocity: float, exit_velocity: float
+) -> List[MoveGroupStep]:
+    """Create the accelerate, cruise, and decelerate steps of a segment."""
+    acceleration = segment.max_acceleration_mm_sec_sq
+    peak_velocity = min(
+        segment.max_velocity_mm_sec,
+        math.sqrt(
+            (
+                2 * acceleration * segment.length_mm
+                + entry_velocity ** 2
+                + exit_velocity ** 2
+            )
+            / 2
+        ),
+    )
+
+    if math.isinf(acceleration):
+        accel_distance = 0.0
+        decel_distance = 0.0
+    else:
+        accel_distance = (peak_velocity ** 2 - entry_velocity ** 2) / (2 * acceleration)
+        decel_distance = (peak_velocity ** 2 - exit_velocity ** 2) / (2 * acceleration)
+
+    cruise_distance = max(0.0, segment.length_mm - accel_distance - decel_distance)
+    phases: List[_Phase] = []
+
+    if accel_distance > 0:
+        phases.append(
+            (
+                accel_distance,
+                entry_velocity,
+                (peak_velocity - entry_velocity) / acceleration,
+                acceleration,
+            )
+        )
+
+    if cruise_distance > 0:
+        phases.append(
+            (cruise_distance, peak_velocity, cruise_distance / peak_velocity, 0)
+        )
+
+    if decel_distance > 0:
+        phases.append(
+            (
+                decel_distance,
+                peak_velocity,
+                (peak_velocity - exit_velocity) / acceleration,
+                -acceleration,
+            )
+        )
+
+    return [
+        {
+            ax: MoveGroupSingleAxisStep(
+                distance_mm=distance * component,
+                velocity_mm_sec=velocity * component,
+                duration_sec=duration,
+                acceleration_mm_sec_sq=phase_acceleration * component,
+            )
+            for ax, component in segment.unit_vector.items()
+        }
+        for distance, velocity, duration, phase_acceleration in _merge_short_phases(
+            phases
+        )
+    ]
+
+
+def _merge_short_phases(phases: List[_Phase]) -> List[_Phase]:
+    """Merge phases too short to run into the phase before or after them.
+
+    Such slivers are left by floating point error, like the cruise phase of
+    a triangular profile. Dropping them would leave the segment short of its
+    end, so a merged phase keeps its start velocity, and gets the
+    acceleration that covers both phases' distance in their total duration.
+    """
+    merged: List[_Phase] = []
+
+    for phase in phases:
+        if merged and (
+            phase[2] < _MIN_STEP_DURATION_SEC or merged[-1][2] < _MIN_STEP_DURATION_SEC
+        ):
+            distance, velocity, duration, _ = merged[-1]
+            distance += phase[0]
+            duration += phase[2]
+            acceleration = 2 * (distance - velocity * duration) / duration ** 2
+            merged[-1] = (distance, velocity, duration, acceleration)
+        else:
+            merged.append(phase)
+
+    return merged
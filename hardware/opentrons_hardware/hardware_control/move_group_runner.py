@@ -1,7 +1,9 @@
 """Class that schedules motion on can bus."""
 import asyncio
 import logging
-from opentrons_hardware.drivers.can_bus import NodeId
+from typing import Dict, List, Optional, Set, Tuple
+
+from opentrons_hardware.drivers.can_bus import MessageId, NodeId
 from opentrons_hardware.drivers.can_bus.can_messenger import (
     CanMessenger,
     MessageListener,
@@ -12,14 +14,18 @@ from opentrons_hardware.drivers.can_bus.messages.message_definitions import (
     AddLinearMoveRequest,
     MoveCompleted,
     ExecuteMoveGroupRequest,
+    StopRequest,
 )
 from opentrons_hardware.drivers.can_bus.messages.payloads import (
     AddLinearMoveRequestPayload,
     ExecuteMoveGroupRequestPayload,
     EmptyPayload,
 )
-from opentrons_hardware.hardware_control.constants import interrupts_per_sec
-from opentrons_hardware.hardware_control.motion import MoveGroups
+from opentrons_hardware.hardware_control.constants import (
+    interrupts_per_sec,
+    default_upload_window,
+)
+from opentrons_hardware.hardware_control.motion import MoveGroup, MoveGroups
 from opentrons_hardware.utils import UInt8Field, UInt32Field, Int32Field
 
 
@@ -27,25 +33,58 @@ log = logging.getLogger(__name__)
 
 
 class MoveGroupRunner:
-    """A move command scheduler."""
-
-    def __init__(self, move_groups: MoveGroups) -> None:
+    """A move command scheduler.
+
+    Move groups are uploaded and executed as a pipeline: while one group
+    is executing, the groups after it are uploaded, so the next group can
+    be executed as soon as the one before it completes.
+    """
+
+    def __init__(
+        self,
+        move_groups: MoveGroups,
+        upload_window: int = default_upload_window,
+        timeout_margin_sec: Optional[float] = None,
+    ) -> None:
         """Constructor.
 
         Args:
             move_groups: The move groups to run.
+            upload_window: The most groups that may be uploaded but not yet
+                completed at once, including the executing group. A window
+                of 1 waits for each group to complete before uploading the
+                next one.
+            timeout_margin_sec: If set, fail if a group has not completed
+                this long after its planned duration.
         """
+        if upload_window < 1:
+            raise ValueError(f"Upload window must be at least 1, got {upload_window}")
+
         self._move_groups = move_groups
+        self._upload_window = upload_window
+        self._timeout_margin_sec = timeout_margin_sec
 
     async def run(self, can_messenger: CanMessenger) -> None:
         """Run the move group.
 
+        If a group does not complete in time, or the run is cancelled,
+        all nodes are told to stop.
+
         Args:
             can_messenger: a can messenger
+
+        Raises:
+            asyncio.TimeoutError: A group did not complete in time.
         """
         await self._clear_groups(can_messenger)
-        await self._send_groups(can_messenger)
-        await self._move(can_messenger)
+        try:
+            await self._move(can_messenger)
+        except BaseException:
+            log.warning("Move groups did not complete, stopping.")
+            await can_messenger.send(
+                node_id=NodeId.broadcast, message=StopRequest(payload=EmptyPayload())
+            )
+            raise
 
     async def _clear_groups(self, can_messenger: CanMessenger) -> None:
         """Send commands to clear the message groups."""
@@ -55,36 +94,76 @@ class MoveGroupRunner:
         )
 
     async def _send_groups(self, can_messenger: CanMessenger) -> None:
-        """Send commands to set up the message groups."""
-        for group_i, group in enumerate(self._move_groups):
-            for seq_i, sequence in enumerate(group):
-                for node, step in sequence.items():
-                    await can_messenger.send(
-                        node_id=node,
-                        message=AddLinearMoveRequest(
-                            payload=AddLinearMoveRequestPayload(
-                                group_id=UInt8Field(group_i),
-                                seq_id=UInt8Field(seq_i),
-                                duration=UInt32Field(
-                                    int(step.duration_sec * interrupts_per_sec)
-                                ),
-                                acceleration=Int32Field(0),
-                                velocity=Int32Field(
-                                    int(interrupts_per_sec * step.velocity_mm_sec)
-                                ),
-                            )
+        """Send commands to set up all the message groups."""
+        for group_i in range(len(self._move_groups)):
+            await self._send_group(can_messenger, group_i)
+
+    async def _send_group(self, can_messenger: CanMessenger, group_i: int) -> None:
+        """Send commands to set up a message group."""
+        messages: List[Tuple[NodeId, MessageDefinition]] = [
+            (
+                node,
+                AddLinearMoveRequest(
+                    payload=AddLinearMoveRequestPayload(
+                        group_id=UInt8Field(group_i),
+                        seq_id=UInt8Field(seq_i),
+                        duration=UInt32Field(
+                            int(step.duration_sec * interrupts_per_sec)
+                        ),
+                        acceleration=Int32Field(
+                            int(interrupts_per_sec * step.acceleration_mm_sec_sq)
+                        ),
+                        velocity=Int32Field(
+                            int(interrupts_per_sec * step.velocity_mm_sec)
                         ),
                     )
+                ),
+            )
+            for seq_i, sequence in enumerate(self._move_groups[group_i])
+            for node, step in sequence.items()
+        ]
+        await can_messenger.send_batch(messages)
 
     async def _move(self, can_messenger: CanMessenger) -> None:
-        """Run all the move groups."""
+        """Upload and run all the move groups."""
         scheduler = MoveScheduler(self._move_groups)
+        uploaded = 0
+
         try:
-            can_messenger.add_listener(scheduler)
-            await scheduler.run(can_messenger)
+            can_messenger.add_listener(
+                scheduler, message_ids=[MessageId.move_completed]
+            )
+            for group_id, move_group in enumerate(self._move_groups):
+                if uploaded == group_id:
+                    await self._send_group(can_messenger, group_id)
+                    uploaded += 1
+
+                await scheduler.execute(can_messenger, group_id)
+
+                # upload the groups to come while this one is executing
+                while (
+                    uploaded < len(self._move_groups)
+                    and uploaded - group_id < self._upload_window
+                ):
+                    await self._send_group(can_messenger, uploaded)
+                    uploaded += 1
+
+                await scheduler.wait(group_id, self._get_timeout(move_group))
         finally:
             can_messenger.remove_listener(scheduler)
 
+    def _get_timeout(self, move_group: MoveGroup) -> Optional[float]:
+        """Get how long to wait for a move group to complete."""
+        if self._timeout_margin_sec is None:
+            return None
+
+        node_durations: Dict[NodeId, float] = {}
+        for sequence in move_group:
+            for node, step in sequence.items():
+                node_durations[node] = node_durations.get(node, 0) + step.duration_sec
+
+        return max(node_durations.values(), default=0) + self._timeout_margin_sec
+
 
 class MoveScheduler(MessageListener):
     """A message listener that manages the sending of execute move group messages."""
@@ -92,14 +171,14 @@ class MoveScheduler(MessageListener):
     def __init__(self, move_groups: MoveGroups) -> None:
         """Constructor."""
         # For each move group create a set identifying the node and seq id.
-        self._moves = []
+        self._moves: List[Set[Tuple[int, int]]] = []
         for move_group in move_groups:
             move_set = set()
             for seq_id, move in enumerate(move_group):
                 move_set.update(set((k.value, seq_id) for k in move.keys()))
             self._moves.append(move_set)
 
-        self._event = asyncio.Event()
+        self._events = [asyncio.Event() for _ in self._moves]
 
     def on_message(self, message: MessageDefinition) -> None:
         """Incoming message handler."""
@@ -110,26 +189,43 @@ class MoveScheduler(MessageListener):
             self._moves[group_id].remove((node_id, seq_id))
             if not self._moves[group_id]:
                 log.info(f"Move group {group_id} has completed.")
-                self._event.set()
+                self._events[group_id].set()
 
     async def run(self, can_messenger: CanMessenger) -> None:
         """Start each move group after the prior has completed."""
         for group_id in range(len(self._moves)):
-            self._event.clear()
+            await self.execute(can_messenger, group_id)
+            await self.wait(group_id)
 
-            log.info(f"Executing move group {group_id}.")
+    async def execute(self, can_messenger: CanMessenger, group_id: int) -> None:
+        """Start a move group."""
+        log.info(f"Executing move group {group_id}.")
 
-            await can_messenger.send(
-                node_id=NodeId.broadcast,
-                message=ExecuteMoveGroupRequest(
-                    payload=ExecuteMoveGroupRequestPayload(
-                        group_id=UInt8Field(group_id),
-                        # TODO (al, 2021-11-8): The triggers should be populated
-                        #  with actual values.
-                        start_trigger=UInt8Field(0),
-                        cancel_trigger=UInt8Field(0),
-                    )
-                ),
-            )
+        await can_messenger.send(
+            node_id=NodeId.broadcast,
+            message=ExecuteMoveGroupRequest(
+                payload=ExecuteMoveGroupRequestPayload(
+                    group_id=UInt8Field(group_id),
+                    # TODO (al, 2021-11-8): The triggers should be populated
+                    #  with actual values.
+                    start_trigger=UInt8Field(0),
+                    cancel_trigger=UInt8Field(0),
+                )
+            ),
+        )
 
-            await self._event.wait()
+    async def wait(self, group_id: int, timeout: Optional[float] = None) -> None:
+        """Wait for a move group to complete.
+
+        Args:
+            group_id: The move group to wait for.
+            timeout: If set, the longest to wait, in seconds.
+
+        Raises:
+            asyncio.TimeoutError: The group did not complete in time.
+        """
+        try:
+            await asyncio.wait_for(self._events[group_id].wait(), timeout)
+        except asyncio.TimeoutError:
+            log.error(f"Move group {group_id} did not complete in {timeout} s.")
+            raise
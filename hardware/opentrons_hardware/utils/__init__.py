@@ -14,6 +14,8 @@ from .binary_serializable import (
     BinaryFieldBase,
     BinarySerializableException,
     InvalidFieldException,
+    SerializationException,
+    serialize_batch,
 )
 
 __all__ = [
@@ -30,4 +32,6 @@ __all__ = [
     "BinaryFieldBase",
     "BinarySerializableException",
     "InvalidFieldException",
+    "SerializationException",
+    "serialize_batch",
 ]
@@ -2,8 +2,21 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
-from typing import TypeVar, Generic
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    TypeVar,
+    Generic,
+    List,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 
 class BinarySerializableException(BaseException):
@@ -26,6 +39,9 @@ class SerializationException(BinarySerializableException):
 
 T = TypeVar("T")
 
+ReadableBuffer = Union[bytes, bytearray, memoryview]
+WritableBuffer = Union[bytearray, memoryview]
+
 
 class BinaryFieldBase(Generic[T]):
     """Binary serializable field."""
@@ -130,15 +146,32 @@ class BinarySerializable:
         Returns:
             Byte buffer
         """
-        string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
         try:
-            return struct.pack(string, *vals)
+            return self._get_struct().pack(*self._get_values())
         except struct.error as e:
             raise SerializationException(str(e))
 
+    def serialize_into(self, buffer: WritableBuffer, offset: int = 0) -> int:
+        """Serialize into an existing writable buffer, without copying.
+
+        Args:
+            buffer: The buffer to write into.
+            offset: Position in the buffer to start writing at.
+
+        Returns:
+            The number of bytes written.
+        """
+        compiled = self._get_struct()
+        try:
+            compiled.pack_into(buffer, offset, *self._get_values())
+        except struct.error as e:
+            raise SerializationException(str(e))
+        return compiled.size
+
     @classmethod
-    def build(cls, data: bytes) -> BinarySerializable:
+    def build(
+        cls: Type[BinarySerializableT], data: ReadableBuffer
+    ) -> BinarySerializableT:
         """Create a BinarySerializable from a byte buffer.
 
         The byte buffer must be at least enough bytes to satisfy all fields.
@@ -149,22 +182,80 @@ class BinarySerializable:
             from a stream of bytes.
 
         Args:
-            data: Byte buffer
+            data: Byte buffer, or a memoryview of one.
+
+        Returns:
+            cls
+        """
+        return cls.build_from(data)
+
+    @classmethod
+    def build_from(
+        cls: Type[BinarySerializableT], data: ReadableBuffer, offset: int = 0
+    ) -> BinarySerializableT:
+        """Create a BinarySerializable from a position in a byte buffer.
+
+        Args:
+            data: Byte buffer, or a memoryview of one.
+            offset: Position in the buffer the serializable starts at.
 
         Returns:
             cls
         """
         try:
-            format_string = cls._get_format_string()
-            size = cls.get_size()
             # ignore bytes beyond the size of message.
-            b = struct.unpack(format_string, data[:size])
-            args = {v.name: v.type.build(b[i]) for i, v in enumerate(fields(cls))}
-            # Mypy is not liking constructing the derived types.
-            return cls(**args)  # type: ignore[call-arg]
+            values = cls._get_struct().unpack_from(data, offset)
         except struct.error as e:
             raise InvalidFieldException(str(e))
 
+        args = [
+            field_type.build(value)
+            for (_, field_type), value in zip(cls._get_fields(), values)
+        ]
+        return cls(*args)
+
+    def _get_values(self) -> Sequence[Any]:
+        """Get the raw value of each field, in order."""
+        return self._get_values_getter()(self)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_values_getter(cls) -> Callable[[Any], Sequence[Any]]:
+        """Get a function that reads the raw value of each field of an instance.
+
+        Returns:
+            a function returning a sequence of values
+        """
+        names = [f"{name}.value" for name, _ in cls._get_fields()]
+        if len(names) == 0:
+            return lambda _: ()
+        elif len(names) == 1:
+            getter = attrgetter(names[0])
+            return lambda instance: (getter(instance),)
+        return attrgetter(*names)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_fields(cls) -> Tuple[Tuple[str, Type[BinaryFieldBase[Any]]], ...]:
+        """Get the name and type of each field of this class.
+
+        Returns:
+            a tuple of name and type pairs
+        """
+        return tuple((v.name, v.type) for v in fields(cls))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_struct(cls) -> struct.Struct:
+        """Get the compiled `struct` for this class.
+
+        It is compiled on first use, then reused by every instance.
+
+        Returns:
+            a Struct
+        """
+        return struct.Struct(cls._get_format_string())
+
     @classmethod
     def _get_format_string(cls) -> str:
         """Get the `struct` format string for this class.
@@ -185,7 +276,41 @@ class BinarySerializable:
     @classmethod
     def get_size(cls) -> int:
         """Get the size of the serializable in bytes."""
-        return struct.calcsize(cls._get_format_string())
+        return cls._get_struct().size
+
+
+BinarySerializableT = TypeVar("BinarySerializableT", bound=BinarySerializable)
+
+
+def serialize_batch(serializables: Sequence[BinarySerializable]) -> List[bytes]:
+    """Serialize many serializables at once.
+
+    Each class' compiled struct and field getter is looked up once for the
+    whole batch, rather than once per serializable.
+
+    Args:
+        serializables: The serializables to serialize.
+
+    Returns:
+        The bytes of each serializable, in order.
+    """
+    codecs: Dict[
+        Type[BinarySerializable], Tuple[struct.Struct, Callable[[Any], Sequence[Any]]]
+    ] = {}
+    result = []
+
+    try:
+        for s in serializables:
+            cls = type(s)
+            codec = codecs.get(cls)
+            if codec is None:
+                codec = codecs[cls] = (cls._get_struct(), cls._get_values_getter())
+            compiled, get_values = codec
+            result.append(compiled.pack(*get_values(s)))
+    except struct.error as e:
+        raise SerializationException(str(e))
+
+    return result
 
 
 class LittleEndianMixIn:
@@ -2,9 +2,10 @@
 from __future__ import annotations
 import asyncio
 from asyncio import Queue
+from typing import List, Tuple
 
 import pytest
-from mock import AsyncMock, Mock
+from mock import AsyncMock, Mock, call
 
 from opentrons_hardware.drivers.can_bus import (
     NodeId,
@@ -16,6 +17,7 @@ from opentrons_hardware.drivers.can_bus import (
 from opentrons_hardware.drivers.can_bus.can_messenger import (
     CanMessenger,
     MessageListener,
+    OverflowPolicy,
 )
 from opentrons_hardware.drivers.can_bus.messages import MessageDefinition
 from opentrons_hardware.drivers.can_bus.messages.message_definitions import (
@@ -90,6 +92,39 @@ async def test_send(
     )
 
 
+async def test_send_batch(subject: CanMessenger, mock_driver: AsyncMock) -> None:
+    """It should send each message of a batch, in order."""
+    messages: List[Tuple[NodeId, MessageDefinition]] = [
+        (NodeId.head, HeartbeatRequest(payload=EmptyPayload())),
+        (
+            NodeId.gantry_x,
+            GetMoveGroupRequest(
+                payload=MoveGroupRequestPayload(group_id=UInt8Field(3))
+            ),
+        ),
+        (
+            NodeId.gantry_y,
+            GetMoveGroupRequest(
+                payload=MoveGroupRequestPayload(group_id=UInt8Field(4))
+            ),
+        ),
+    ]
+    await subject.send_batch(messages)
+    assert mock_driver.send.call_args_list == [
+        call(
+            message=CanMessage(
+                arbitration_id=ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=message.message_id, node_id=node_id, function_code=0
+                    )
+                ),
+                data=message.payload.serialize(),
+            )
+        )
+        for node_id, message in messages
+    ]
+
+
 async def test_listen_messages(
     subject: CanMessenger, incoming_messages: Queue[CanMessage]
 ) -> None:
@@ -127,3 +162,191 @@ async def test_listen_messages(
     listener.on_message.assert_called_once_with(
         GetMoveGroupRequest(payload=MoveGroupRequestPayload(group_id=UInt8Field(1)))
     )
+
+
+def create_move_group_request(node_id: int, group_id: int) -> CanMessage:
+    """Create an incoming get move group request."""
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=MessageId.get_move_group_request,
+                node_id=node_id,
+                function_code=0,
+            )
+        ),
+        data=bytes([group_id]),
+    )
+
+
+def create_heartbeat_request(node_id: int) -> CanMessage:
+    """Create an incoming heartbeat request."""
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=MessageId.heartbeat_request,
+                node_id=node_id,
+                function_code=0,
+            )
+        ),
+        data=b"",
+    )
+
+
+async def test_listen_filtered_messages(subject: CanMessenger) -> None:
+    """It should only call listeners with the messages they subscribed to."""
+    all_listener = Mock(spec=MessageListener)
+    message_listener = Mock(spec=MessageListener)
+    node_listener = Mock(spec=MessageListener)
+    subject.add_listener(all_listener)
+    subject.add_listener(
+        message_listener, message_ids=[MessageId.get_move_group_request]
+    )
+    subject.add_listener(node_listener, node_ids=[NodeId.gantry_x])
+
+    subject._handle_message(create_move_group_request(NodeId.head, 1))
+    subject._handle_message(create_heartbeat_request(NodeId.gantry_x))
+    subject._handle_message(create_move_group_request(NodeId.gantry_x, 2))
+
+    heartbeat = HeartbeatRequest(payload=EmptyPayload())
+    move_group_1 = GetMoveGroupRequest(
+        payload=MoveGroupRequestPayload(group_id=UInt8Field(1))
+    )
+    move_group_2 = GetMoveGroupRequest(
+        payload=MoveGroupRequestPayload(group_id=UInt8Field(2))
+    )
+    assert all_listener.on_message.call_args_list == [
+        call(move_group_1),
+        call(heartbeat),
+        call(move_group_2),
+    ]
+    assert message_listener.on_message.call_args_list == [
+        call(move_group_1),
+        call(move_group_2),
+    ]
+    assert node_listener.on_message.call_args_list == [
+        call(heartbeat),
+        call(move_group_2),
+    ]
+
+
+async def test_remove_filtered_listener(subject: CanMessenger) -> None:
+    """It should stop calling a listener once it is removed."""
+    listener = Mock(spec=MessageListener)
+    subject.add_listener(listener, message_ids=[MessageId.heartbeat_request])
+    subject._handle_message(create_heartbeat_request(NodeId.head))
+    subject.remove_listener(listener)
+    subject._handle_message(create_heartbeat_request(NodeId.head))
+
+    listener.on_message.assert_called_once()
+
+    with pytest.raises(ValueError):
+        subject.remove_listener(listener)
+
+
+async def test_unwanted_messages_not_built(subject: CanMessenger) -> None:
+    """It should not decode a message no listener wants."""
+    listener = Mock(spec=MessageListener)
+    subject.add_listener(listener, message_ids=[MessageId.heartbeat_request])
+
+    # Too short to build, but never built
+    subject._handle_message(
+        CanMessage(
+            arbitration_id=ArbitrationId(
+                parts=ArbitrationIdParts(
+                    message_id=MessageId.move_completed,
+                    node_id=NodeId.head,
+                    function_code=0,
+                )
+            ),
+            data=b"",
+        )
+    )
+
+    listener.on_message.assert_not_called()
+
+
+async def test_listener_error(subject: CanMessenger) -> None:
+    """It should keep delivering messages after a listener raises an error."""
+    failing_listener = Mock(spec=MessageListener)
+    failing_listener.on_message.side_effect = RuntimeError("oh no")
+    listener = Mock(spec=MessageListener)
+    subject.add_listener(failing_listener)
+    subject.add_listener(listener)
+
+    subject._handle_message(create_heartbeat_request(NodeId.head))
+    subject._handle_message(create_heartbeat_request(NodeId.head))
+
+    assert failing_listener.on_message.call_count == 2
+    assert listener.on_message.call_count == 2
+
+
+async def test_queued_listener(subject: CanMessenger) -> None:
+    """It should deliver queued messages in order, from another task."""
+    listener = Mock(spec=MessageListener)
+    subject.add_listener(listener, queue_size=10)
+
+    subject._handle_message(create_move_group_request(NodeId.head, 1))
+    subject._handle_message(create_move_group_request(NodeId.head, 2))
+    listener.on_message.assert_not_called()
+
+    await asyncio.sleep(0)
+    assert listener.on_message.call_args_list == [
+        call(
+            GetMoveGroupRequest(
+                payload=MoveGroupRequestPayload(group_id=UInt8Field(group_id))
+            )
+        )
+        for group_id in (1, 2)
+    ]
+    subject.remove_listener(listener)
+
+
+@pytest.mark.parametrize(
+    argnames=["overflow_policy", "expected_group_ids"],
+    argvalues=[
+        [OverflowPolicy.drop_oldest, [2, 3]],
+        [OverflowPolicy.drop_newest, [1, 2]],
+    ],
+)
+async def test_queued_listener_overflow(
+    subject: CanMessenger,
+    overflow_policy: OverflowPolicy,
+    expected_group_ids: List[int],
+) -> None:
+    """It should drop messages that do not fit in a listener's queue."""
+    listener = Mock(spec=MessageListener)
+    subject.add_listener(listener, queue_size=2, overflow_policy=overflow_policy)
+
+    for group_id in (1, 2, 3):
+        subject._handle_message(create_move_group_request(NodeId.head, group_id))
+
+    await asyncio.sleep(0)
+    assert listener.on_message.call_args_list == [
+        call(
+            GetMoveGroupRequest(
+                payload=MoveGroupRequestPayload(group_id=UInt8Field(group_id))
+            )
+        )
+        for group_id in expected_group_ids
+    ]
+    subject.remove_listener(listener)
+
+
+async def test_stop_queued_listener(subject: CanMessenger) -> None:
+    """It should stop delivering queued messages when stopped, until restarted."""
+    listener = Mock(spec=MessageListener)
+    subject.add_listener(listener, queue_size=10)
+    subject.start()
+    await subject.stop()
+
+    subject._handle_message(create_move_group_request(NodeId.head, 1))
+    await asyncio.sleep(0)
+    listener.on_message.assert_not_called()
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    subject.start()
+    await asyncio.sleep(0)
+    listener.on_message.assert_called_once_with(
+        GetMoveGroupRequest(payload=MoveGroupRequestPayload(group_id=UInt8Field(1)))
+    )
+    await subject.stop()
@@ -1,6 +1,39 @@
 """Tests for motion methods."""
+import math
+from typing import Dict
+
+import pytest
+
 from opentrons_hardware.drivers.can_bus import NodeId
-from opentrons_hardware.hardware_control.motion import create, MoveGroupSingleAxisStep
+from opentrons_hardware.hardware_control.constants import interrupts_per_sec
+from opentrons_hardware.hardware_control.motion import (
+    create,
+    create_path,
+    AxisConstraints,
+    MoveGroup,
+    MoveGroupSingleAxisStep,
+)
+
+
+def assert_steps_equal(
+    actual: MoveGroupSingleAxisStep, expected: MoveGroupSingleAxisStep
+) -> None:
+    """Check that two steps are equal, to within floating point error."""
+    assert actual.distance_mm == pytest.approx(expected.distance_mm)
+    assert actual.velocity_mm_sec == pytest.approx(expected.velocity_mm_sec)
+    assert actual.duration_sec == pytest.approx(expected.duration_sec)
+    assert actual.acceleration_mm_sec_sq == pytest.approx(
+        expected.acceleration_mm_sec_sq
+    )
+
+
+def get_distances(move_group: MoveGroup) -> Dict[NodeId, float]:
+    """Get the total distance moved by each axis in a move group."""
+    distances: Dict[NodeId, float] = {}
+    for sequence in move_group:
+        for node, step in sequence.items():
+            distances[node] = distances.get(node, 0) + step.distance_mm
+    return distances
 
 
 def test_create_just_head() -> None:
@@ -25,63 +58,314 @@ def test_create_just_head() -> None:
 
 
 def test_create_just_x_y() -> None:
-    """It should create a move in just x and y."""
-    expected = [
-        [
-            {
-                NodeId.gantry_x: MoveGroupSingleAxisStep(
-                    distance_mm=2, velocity_mm_sec=0.25, duration_sec=8
-                ),
-            }
-        ],
-        [
-            {
-                NodeId.gantry_y: MoveGroupSingleAxisStep(
-                    distance_mm=2, velocity_mm_sec=0.25, duration_sec=8
-                ),
-            }
-        ],
-    ]
-    assert (
-        create(
-            origin={NodeId.gantry_x: 0, NodeId.gantry_y: 0},
-            target={NodeId.gantry_x: 2, NodeId.gantry_y: 2},
-            speed=0.25,
-        )
-        == expected
+    """It should create a coordinated move in just x and y."""
+    result = create(
+        origin={NodeId.gantry_x: 0, NodeId.gantry_y: 0},
+        target={NodeId.gantry_x: 2, NodeId.gantry_y: 2},
+        speed=0.25,
+    )
+    expected_step = MoveGroupSingleAxisStep(
+        distance_mm=2,
+        velocity_mm_sec=0.25 / math.sqrt(2),
+        duration_sec=2 * math.sqrt(2) / 0.25,
     )
 
+    assert len(result) == 1
+    assert len(result[0]) == 1
+    assert result[0][0].keys() == {NodeId.gantry_x, NodeId.gantry_y}
+    assert_steps_equal(result[0][0][NodeId.gantry_x], expected_step)
+    assert_steps_equal(result[0][0][NodeId.gantry_y], expected_step)
+
 
 def test_create_all() -> None:
-    """It should create a move in all axes."""
-    expected = [
-        [
-            {
-                NodeId.head: MoveGroupSingleAxisStep(
-                    distance_mm=4, velocity_mm_sec=0.05, duration_sec=80
-                ),
-            }
-        ],
-        [
-            {
-                NodeId.gantry_x: MoveGroupSingleAxisStep(
-                    distance_mm=2, velocity_mm_sec=0.05, duration_sec=40
-                ),
-            }
-        ],
-        [
-            {
-                NodeId.gantry_y: MoveGroupSingleAxisStep(
-                    distance_mm=2, velocity_mm_sec=0.05, duration_sec=40
-                ),
-            }
+    """It should create a coordinated move in all axes."""
+    result = create(
+        origin={NodeId.head: 0, NodeId.gantry_x: 0, NodeId.gantry_y: 0},
+        target={NodeId.head: 4, NodeId.gantry_x: 2, NodeId.gantry_y: -2},
+        speed=0.05,
+    )
+    # the move is 2 * sqrt(6) mm long
+    duration = 2 * math.sqrt(6) / 0.05
+
+    assert len(result) == 1
+    assert len(result[0]) == 1
+    assert_steps_equal(
+        result[0][0][NodeId.head],
+        MoveGroupSingleAxisStep(
+            distance_mm=4, velocity_mm_sec=4 / duration, duration_sec=duration
+        ),
+    )
+    assert_steps_equal(
+        result[0][0][NodeId.gantry_x],
+        MoveGroupSingleAxisStep(
+            distance_mm=2, velocity_mm_sec=2 / duration, duration_sec=duration
+        ),
+    )
+    assert_steps_equal(
+        result[0][0][NodeId.gantry_y],
+        MoveGroupSingleAxisStep(
+            distance_mm=-2, velocity_mm_sec=-2 / duration, duration_sec=duration
+        ),
+    )
+
+
+def test_create_no_move() -> None:
+    """It should create no move groups if nothing moves."""
+    assert create(origin={NodeId.head: 2}, target={NodeId.head: 2}, speed=1) == []
+
+
+def test_create_invalid_speed() -> None:
+    """It should reject a speed that is not positive."""
+    with pytest.raises(ValueError):
+        create(origin={NodeId.head: 0}, target={NodeId.head: 2}, speed=0)
+
+
+def test_create_trapezoid() -> None:
+    """It should accelerate, cruise, and decelerate within the axis limits."""
+    result = create(
+        origin={NodeId.gantry_x: 0},
+        target={NodeId.gantry_x: 100},
+        speed=50,
+        constraints={
+            NodeId.gantry_x: AxisConstraints(
+                max_velocity_mm_sec=200,
+                max_acceleration_mm_sec_sq=100,
+                max_velocity_discontinuity_mm_sec=10,
+            )
+        },
+    )
+
+    # 10 -> 50 mm/s at 100 mm/s^2 takes 0.4 s and 12 mm, each way
+    assert len(result) == 1
+    assert [set(s) for s in result[0]] == [{NodeId.gantry_x}] * 3
+    assert_steps_equal(
+        result[0][0][NodeId.gantry_x],
+        MoveGroupSingleAxisStep(
+            distance_mm=12,
+            velocity_mm_sec=10,
+            duration_sec=0.4,
+            acceleration_mm_sec_sq=100,
+        ),
+    )
+    assert_steps_equal(
+        result[0][1][NodeId.gantry_x],
+        MoveGroupSingleAxisStep(distance_mm=76, velocity_mm_sec=50, duration_sec=1.52),
+    )
+    assert_steps_equal(
+        result[0][2][NodeId.gantry_x],
+        MoveGroupSingleAxisStep(
+            distance_mm=12,
+            velocity_mm_sec=50,
+            duration_sec=0.4,
+            acceleration_mm_sec_sq=-100,
+        ),
+    )
+
+
+def test_create_triangle() -> None:
+    """It should start decelerating before reaching speed on a short move."""
+    result = create(
+        origin={NodeId.head: 10},
+        target={NodeId.head: 9},
+        speed=50,
+        constraints={
+            NodeId.head: AxisConstraints(
+                max_velocity_mm_sec=50,
+                max_acceleration_mm_sec_sq=100,
+                max_velocity_discontinuity_mm_sec=0,
+            )
+        },
+    )
+
+    # 0 -> 10 mm/s at 100 mm/s^2 takes 0.1 s and 0.5 mm
+    assert len(result[0]) == 2
+    assert_steps_equal(
+        result[0][0][NodeId.head],
+        MoveGroupSingleAxisStep(
+            distance_mm=-0.5,
+            velocity_mm_sec=0,
+            duration_sec=0.1,
+            acceleration_mm_sec_sq=-100,
+        ),
+    )
+    assert_steps_equal(
+        result[0][1][NodeId.head],
+        MoveGroupSingleAxisStep(
+            distance_mm=-0.5,
+            velocity_mm_sec=-10,
+            duration_sec=0.1,
+            acceleration_mm_sec_sq=100,
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    argnames=["length", "acceleration"],
+    # the accelerate and decelerate distances of these don't quite add up to
+    # the length, in floating point
+    argvalues=[(0.7, 333), (2.3, 100), (3.7, 100), (10.1, 13)],
+)
+def test_create_triangle_without_cruise(length: float, acceleration: float) -> None:
+    """It should not leave a sliver of a cruise step in a triangular profile."""
+    result = create(
+        origin={NodeId.head: 0},
+        target={NodeId.head: length},
+        speed=1000,
+        constraints={
+            NodeId.head: AxisConstraints(
+                max_velocity_mm_sec=1000,
+                max_acceleration_mm_sec_sq=acceleration,
+                max_velocity_discontinuity_mm_sec=0,
+            )
+        },
+    )
+
+    assert len(result[0]) == 2
+    assert [s[NodeId.head].acceleration_mm_sec_sq for s in result[0]] == pytest.approx(
+        [acceleration, -acceleration]
+    )
+    assert get_distances(result[0])[NodeId.head] == pytest.approx(length)
+
+
+def test_create_limits_step_rates() -> None:
+    """It should keep velocities and accelerations within a step message."""
+    max_rate = (2 ** 31 - 1) / interrupts_per_sec
+    result = create(
+        origin={NodeId.head: 0},
+        target={NodeId.head: 1000},
+        speed=1e6,
+        constraints={
+            NodeId.head: AxisConstraints(
+                max_velocity_mm_sec=1e6,
+                max_acceleration_mm_sec_sq=1e6,
+                max_velocity_discontinuity_mm_sec=0,
+            )
+        },
+    )
+
+    for sequence in result[0]:
+        step = sequence[NodeId.head]
+        assert abs(step.acceleration_mm_sec_sq) <= max_rate
+        assert abs(step.velocity_mm_sec) <= max_rate
+
+
+def test_create_limited_by_slowest_axis() -> None:
+    """It should scale the path's speed and acceleration to each axis' limits."""
+    result = create(
+        origin={NodeId.gantry_x: 0, NodeId.gantry_y: 0},
+        target={NodeId.gantry_x: 30, NodeId.gantry_y: 40},
+        speed=1000,
+        constraints={
+            NodeId.gantry_x: AxisConstraints(
+                max_velocity_mm_sec=1000,
+                max_acceleration_mm_sec_sq=1000,
+                max_velocity_discontinuity_mm_sec=0,
+            ),
+            NodeId.gantry_y: AxisConstraints(
+                max_velocity_mm_sec=20,
+                max_acceleration_mm_sec_sq=40,
+                max_velocity_discontinuity_mm_sec=0,
+            ),
+        },
+    )
+
+    for sequence in result[0]:
+        step_x = sequence[NodeId.gantry_x]
+        step_y = sequence[NodeId.gantry_y]
+        assert step_x.duration_sec == step_y.duration_sec
+        assert abs(step_y.velocity_mm_sec) <= 20
+        assert abs(step_y.acceleration_mm_sec_sq) in (0, pytest.approx(40))
+        assert step_x.distance_mm == pytest.approx(step_y.distance_mm * 3 / 4)
+
+    assert result[0][1][NodeId.gantry_y].velocity_mm_sec == pytest.approx(20)
+    assert get_distances(result[0]) == pytest.approx(
+        {NodeId.gantry_x: 30, NodeId.gantry_y: 40}
+    )
+
+
+def test_create_path_blends_segments() -> None:
+    """It should keep moving through a junction in one move group."""
+    constraints = AxisConstraints(
+        max_velocity_mm_sec=100,
+        max_acceleration_mm_sec_sq=100,
+        max_velocity_discontinuity_mm_sec=10,
+    )
+    result = create_path(
+        origin={NodeId.gantry_x: 0, NodeId.gantry_y: 0},
+        targets=[
+            {NodeId.gantry_x: 100, NodeId.gantry_y: 0},
+            {NodeId.gantry_x: 100, NodeId.gantry_y: 100},
         ],
-    ]
+        speed=50,
+        constraints={NodeId.gantry_x: constraints, NodeId.gantry_y: constraints},
+    )
+
+    assert len(result) == 1
+    assert get_distances(result[0]) == pytest.approx(
+        {NodeId.gantry_x: 100, NodeId.gantry_y: 100}
+    )
+
+    # the corner needs x to slow to 10 mm/s, then y to start from 10 mm/s
+    last_x_step = result[0][2][NodeId.gantry_x]
+    first_y_step = result[0][3][NodeId.gantry_y]
     assert (
-        create(
-            origin={NodeId.head: 0, NodeId.gantry_x: 0, NodeId.gantry_y: 0},
-            target={NodeId.head: 4, NodeId.gantry_x: 2, NodeId.gantry_y: 2},
-            speed=0.05,
-        )
-        == expected
+        last_x_step.velocity_mm_sec
+        + last_x_step.acceleration_mm_sec_sq * last_x_step.duration_sec
+    ) == pytest.approx(10)
+    assert first_y_step.velocity_mm_sec == pytest.approx(10)
+
+
+def test_create_path_straight_segments() -> None:
+    """It should not slow down between segments in the same direction."""
+    result = create_path(
+        origin={NodeId.head: 0},
+        targets=[{NodeId.head: 50}, {NodeId.head: 50}, {NodeId.head: 100}],
+        speed=10,
+        constraints={
+            NodeId.head: AxisConstraints(
+                max_velocity_mm_sec=10,
+                max_acceleration_mm_sec_sq=10,
+                max_velocity_discontinuity_mm_sec=0,
+            )
+        },
+    )
+
+    # accelerate and cruise, cruise and decelerate
+    assert [s[NodeId.head].acceleration_mm_sec_sq for s in result[0]] == [
+        10,
+        0,
+        0,
+        -10,
+    ]
+    assert get_distances(result[0]) == pytest.approx({NodeId.head: 100})
+
+
+def test_create_path_merges_short_phases() -> None:
+    """It should keep the distance of phases too short to run."""
+    constraints = AxisConstraints(
+        max_velocity_mm_sec=100,
+        max_acceleration_mm_sec_sq=100,
+        max_velocity_discontinuity_mm_sec=0,
+    )
+    # each segment takes 100 mm to accelerate to 100 mm/s and back, plus a
+    # cruise shorter than a motor interrupt
+    length = 100 + 100 * 0.5 / interrupts_per_sec
+    targets = [
+        {NodeId.gantry_x: length * math.ceil(i / 2), NodeId.gantry_y: length * (i // 2)}
+        for i in range(1, 11)
+    ]
+    result = create_path(
+        origin={NodeId.gantry_x: 0, NodeId.gantry_y: 0},
+        targets=targets,
+        speed=100,
+        constraints={NodeId.gantry_x: constraints, NodeId.gantry_y: constraints},
+    )
+
+    assert get_distances(result[0]) == pytest.approx(
+        {NodeId.gantry_x: 5 * length, NodeId.gantry_y: 5 * length}, abs=1e-9
+    )
+    assert all(
+        step.duration_sec >= 1 / interrupts_per_sec
+        for sequence in result[0]
+        for step in sequence.values()
     )
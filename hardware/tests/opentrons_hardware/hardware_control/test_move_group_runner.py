@@ -1,4 +1,7 @@
 """Tests for the move scheduler."""
+import asyncio
+from typing import Any, List, Optional, Sequence, Tuple
+
 import pytest
 from mock import AsyncMock, call, MagicMock
 
@@ -88,6 +91,16 @@ def move_group_multiple() -> MoveGroups:
     ]
 
 
+def assert_sent_in_batch(
+    mock_can_messenger: AsyncMock, node_id: NodeId, message: MessageDefinition
+) -> None:
+    """Check that a message was sent in a batch of setup commands."""
+    assert any(
+        (node_id, message) in c[0][0]
+        for c in mock_can_messenger.send_batch.call_args_list
+    )
+
+
 async def test_single_group_clear(
     mock_can_messenger: AsyncMock, move_group_single: MoveGroups
 ) -> None:
@@ -118,7 +131,8 @@ async def test_single_send_setup_commands(
     """It should send all the move group set up commands."""
     subject = MoveGroupRunner(move_groups=move_group_single)
     await subject._send_groups(can_messenger=mock_can_messenger)
-    mock_can_messenger.send.assert_any_call(
+    assert_sent_in_batch(
+        mock_can_messenger,
         node_id=NodeId.head,
         message=AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
@@ -150,7 +164,8 @@ async def test_multi_send_setup_commands(
     await subject._send_groups(can_messenger=mock_can_messenger)
 
     # Group 0
-    mock_can_messenger.send.assert_any_call(
+    assert_sent_in_batch(
+        mock_can_messenger,
         node_id=NodeId.head,
         message=AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
@@ -174,7 +189,8 @@ async def test_multi_send_setup_commands(
     )
 
     # Group 1
-    mock_can_messenger.send.assert_any_call(
+    assert_sent_in_batch(
+        mock_can_messenger,
         node_id=NodeId.gantry_x,
         message=AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
@@ -197,7 +213,8 @@ async def test_multi_send_setup_commands(
         ),
     )
 
-    mock_can_messenger.send.assert_any_call(
+    assert_sent_in_batch(
+        mock_can_messenger,
         node_id=NodeId.gantry_y,
         message=AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
@@ -221,7 +238,8 @@ async def test_multi_send_setup_commands(
     )
 
     # Group 2
-    mock_can_messenger.send.assert_any_call(
+    assert_sent_in_batch(
+        mock_can_messenger,
         node_id=NodeId.pipette,
         message=AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
@@ -244,7 +262,8 @@ async def test_multi_send_setup_commands(
         ),
     )
 
-    mock_can_messenger.send.assert_any_call(
+    assert_sent_in_batch(
+        mock_can_messenger,
         node_id=NodeId.pipette,
         message=AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
@@ -268,6 +287,33 @@ async def test_multi_send_setup_commands(
     )
 
 
+async def test_send_setup_commands_with_acceleration(
+    mock_can_messenger: AsyncMock,
+) -> None:
+    """It should send the acceleration of each step."""
+    step = MoveGroupSingleAxisStep(
+        distance_mm=1, velocity_mm_sec=0, duration_sec=0.5, acceleration_mm_sec_sq=-8
+    )
+    subject = MoveGroupRunner(move_groups=[[{NodeId.gantry_x: step}]])
+    await subject._send_groups(can_messenger=mock_can_messenger)
+    mock_can_messenger.send_batch.assert_called_once_with(
+        [
+            (
+                NodeId.gantry_x,
+                AddLinearMoveRequest(
+                    payload=AddLinearMoveRequestPayload(
+                        group_id=UInt8Field(0),
+                        seq_id=UInt8Field(0),
+                        velocity=Int32Field(0),
+                        acceleration=Int32Field(int(-8 * interrupts_per_sec)),
+                        duration=UInt32Field(int(0.5 * interrupts_per_sec)),
+                    )
+                ),
+            )
+        ]
+    )
+
+
 async def test_move() -> None:
     """It should register to listen for messages."""
     subject = MoveGroupRunner(move_groups=[])
@@ -376,3 +422,176 @@ async def test_multi_group_move(
             ),
         ]
     )
+
+
+class MockPipelineNodes:
+    """Side effects for a CanMessenger mock that records the pipeline.
+
+    Moves complete on the next iteration of the event loop after their
+    group is executed, and uploads take one iteration of the event loop.
+    """
+
+    def __init__(self, move_groups: MoveGroups, complete: bool = True) -> None:
+        """Constructor."""
+        self._move_groups = move_groups
+        self._complete = complete
+        self._listener: Optional[MessageListener] = None
+        self.events: List[Tuple[str, int]] = []
+
+    def add_listener(self, listener: MessageListener, **kwargs: Any) -> None:
+        """Mock add_listener function."""
+        self._listener = listener
+
+    async def send(self, node_id: NodeId, message: MessageDefinition) -> None:
+        """Mock send function."""
+        if isinstance(message, md.ExecuteMoveGroupRequest):
+            group_id = message.payload.group_id.value
+            self.events.append(("execute", group_id))
+            if self._complete:
+                asyncio.get_event_loop().call_soon(self._complete_group, group_id)
+        elif isinstance(message, md.StopRequest):
+            self.events.append(("stop", 0))
+
+    async def send_batch(
+        self, messages: Sequence[Tuple[NodeId, MessageDefinition]]
+    ) -> None:
+        """Mock send_batch function."""
+        message = messages[0][1]
+        assert isinstance(message, md.AddLinearMoveRequest)
+        self.events.append(("upload", message.payload.group_id.value))
+        await asyncio.sleep(0)
+
+    def _complete_group(self, group_id: int) -> None:
+        """Send a move completed for every move in a group."""
+        assert self._listener is not None
+        self.events.append(("complete", group_id))
+        for seq_id, moves in enumerate(self._move_groups[group_id]):
+            for node in moves.keys():
+                self._listener.on_message(
+                    md.MoveCompleted(
+                        payload=MoveCompletedPayload(
+                            group_id=UInt8Field(group_id),
+                            seq_id=UInt8Field(seq_id),
+                            current_position=UInt32Field(0),
+                            node_id=UInt8Field(node.value),
+                            ack_id=UInt8Field(0),
+                        )
+                    )
+                )
+
+
+def create_mock_pipeline_nodes(
+    mock_can_messenger: AsyncMock, move_groups: MoveGroups, complete: bool = True
+) -> MockPipelineNodes:
+    """Make a CanMessenger mock behave like nodes running move groups."""
+    nodes = MockPipelineNodes(move_groups, complete)
+    mock_can_messenger.add_listener = MagicMock(side_effect=nodes.add_listener)
+    mock_can_messenger.remove_listener = MagicMock()
+    mock_can_messenger.send.side_effect = nodes.send
+    mock_can_messenger.send_batch.side_effect = nodes.send_batch
+    return nodes
+
+
+async def test_run_pipelined(
+    mock_can_messenger: AsyncMock, move_group_multiple: MoveGroups
+) -> None:
+    """It should upload the next group while the current one executes."""
+    nodes = create_mock_pipeline_nodes(mock_can_messenger, move_group_multiple)
+    subject = MoveGroupRunner(move_groups=move_group_multiple, upload_window=2)
+    await subject.run(can_messenger=mock_can_messenger)
+
+    assert nodes.events == [
+        ("upload", 0),
+        ("execute", 0),
+        ("upload", 1),
+        ("complete", 0),
+        ("execute", 1),
+        ("upload", 2),
+        ("complete", 1),
+        ("execute", 2),
+        ("complete", 2),
+    ]
+
+
+async def test_run_unpipelined(
+    mock_can_messenger: AsyncMock, move_group_multiple: MoveGroups
+) -> None:
+    """It should upload each group after the prior completes with a window of 1."""
+    nodes = create_mock_pipeline_nodes(mock_can_messenger, move_group_multiple)
+    subject = MoveGroupRunner(move_groups=move_group_multiple, upload_window=1)
+    await subject.run(can_messenger=mock_can_messenger)
+
+    assert nodes.events == [
+        ("upload", 0),
+        ("execute", 0),
+        ("complete", 0),
+        ("upload", 1),
+        ("execute", 1),
+        ("complete", 1),
+        ("upload", 2),
+        ("execute", 2),
+        ("complete", 2),
+    ]
+
+
+async def test_run_upload_window_ahead(
+    mock_can_messenger: AsyncMock, move_group_multiple: MoveGroups
+) -> None:
+    """It should upload as many groups ahead as the window allows."""
+    nodes = create_mock_pipeline_nodes(mock_can_messenger, move_group_multiple)
+    subject = MoveGroupRunner(move_groups=move_group_multiple, upload_window=3)
+    await subject.run(can_messenger=mock_can_messenger)
+
+    assert [e for e in nodes.events if e[0] == "upload"] == [
+        ("upload", 0),
+        ("upload", 1),
+        ("upload", 2),
+    ]
+    assert nodes.events.index(("upload", 2)) < nodes.events.index(("execute", 1))
+
+
+def test_invalid_upload_window(move_group_multiple: MoveGroups) -> None:
+    """It should reject an upload window smaller than one group."""
+    with pytest.raises(ValueError):
+        MoveGroupRunner(move_groups=move_group_multiple, upload_window=0)
+
+
+async def test_run_timeout(mock_can_messenger: AsyncMock) -> None:
+    """It should stop all nodes if a group does not complete in time."""
+    move_groups: MoveGroups = [
+        [
+            {
+                NodeId.head: MoveGroupSingleAxisStep(
+                    distance_mm=1, velocity_mm_sec=1, duration_sec=0.01
+                )
+            }
+        ]
+    ]
+    nodes = create_mock_pipeline_nodes(mock_can_messenger, move_groups, False)
+    subject = MoveGroupRunner(move_groups=move_groups, timeout_margin_sec=0.01)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await subject.run(can_messenger=mock_can_messenger)
+
+    assert nodes.events == [("upload", 0), ("execute", 0), ("stop", 0)]
+    mock_can_messenger.remove_listener.assert_called_once()
+
+
+async def test_run_cancelled(
+    mock_can_messenger: AsyncMock, move_group_single: MoveGroups
+) -> None:
+    """It should stop all nodes if the run is cancelled."""
+    nodes = create_mock_pipeline_nodes(mock_can_messenger, move_group_single, False)
+    subject = MoveGroupRunner(move_groups=move_group_single)
+    task = asyncio.get_event_loop().create_task(
+        subject.run(can_messenger=mock_can_messenger)
+    )
+
+    while ("execute", 0) not in nodes.events:
+        await asyncio.sleep(0)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert nodes.events[-1] == ("stop", 0)
@@ -101,6 +101,42 @@ def test_serdes(subject: TestClass) -> None:
     assert new == subject
 
 
+def test_serialize_into(subject: TestClass) -> None:
+    """It should serialize into a buffer at an offset."""
+    buffer = bytearray(b"\xff" * 34)
+    assert subject.serialize_into(memoryview(buffer), 2) == 30
+    assert buffer == b"\xff\xff" + subject.serialize() + b"\xff\xff"
+
+
+def test_serialize_into_too_small(subject: TestClass) -> None:
+    """It should raise an error if the buffer is too small."""
+    with pytest.raises(utils.SerializationException):
+        subject.serialize_into(bytearray(29))
+
+
+def test_build_from_memoryview(subject: TestClass) -> None:
+    """It should deserialize from a position in a memoryview."""
+    data = memoryview(b"12" + subject.serialize())
+    assert TestClass.build_from(data, 2) == subject
+
+
+def test_serialize_batch(subject: TestClass) -> None:
+    """It should serialize many serializables of different types."""
+    other = LittleEndianTestClass(
+        ul=utils.UInt32Field(0x05000000), l=utils.Int32Field(0x06000000)
+    )
+    result = utils.serialize_batch([subject, other, subject])
+    assert result == [subject.serialize(), other.serialize(), subject.serialize()]
+
+
+def test_serialize_batch_error() -> None:
+    """It should raise an error if a value does not fit its field."""
+    with pytest.raises(utils.SerializationException):
+        utils.serialize_batch(
+            [LittleEndianTestClass(ul=utils.UInt32Field(-1), l=utils.Int32Field(0))]
+        )
+
+
 @dataclass
 class LittleEndianTestClass(utils.LittleEndianBinarySerializable):
     """Little endian test class."""
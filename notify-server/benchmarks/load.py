@@ -0,0 +1,156 @@
+"""Benchmark the notify-server under a load of published events.
+
+Runs the server and a publisher in their own processes on local TCP
+sockets. The publisher sends events at a fixed rate on a noisy topic and a
+state topic, and this process subscribes to both. Reports how many events of
+each topic got through, and how long they took from publish to receipt.
+
+Usage:
+    python benchmarks/load.py --rate 5000 --duration 5
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from notify_server.models.event import Event
+from notify_server.models.payload_type import UserData
+from notify_server.network.connection import create_push, create_subscriber
+from notify_server.server import run
+from notify_server.settings import ServerBindAddress, Settings
+
+NOISY_TOPIC = "noisy"
+STATE_TOPIC = "state"
+# Publish one state event for every this many events.
+STATE_EVERY = 10
+# How often to send a batch of events to keep up the rate.
+BATCH_INTERVAL = 0.01
+# Stand-in for the send time in the serialized event.
+SENT_PLACEHOLDER = "__sent__"
+
+
+def _settings(port: int, rate_limit: Optional[float]) -> Settings:
+    return Settings(
+        publisher_address=ServerBindAddress(scheme="tcp", host="127.0.0.1", port=port),
+        subscriber_address=ServerBindAddress(
+            scheme="tcp", host="127.0.0.1", port=port + 1
+        ),
+        state_topics=[STATE_TOPIC],
+        topic_rate_limits={STATE_TOPIC: rate_limit} if rate_limit is not None else {},
+    )
+
+
+def _run_server(settings: Settings) -> None:
+    asyncio.run(run(settings))
+
+
+def _run_publisher(
+    settings: Settings, rate: float, duration: float, counts: "multiprocessing.Queue"
+) -> None:
+    counts.put(asyncio.run(_publish(settings, rate, duration)))
+
+
+async def _publish(settings: Settings, rate: float, duration: float) -> Dict[str, int]:
+    """Publish events at a rate, and return how many were sent by topic."""
+    connection = create_push(settings.publisher_address.connection_string())
+    # Serialize once, and fill in the send time of each event by hand, so
+    # the publisher can keep up with the rate.
+    template = Event(
+        createdOn=datetime.now(),
+        publisher="benchmark",
+        data=UserData(data={"sent": SENT_PLACEHOLDER}),
+    ).json()
+    sent = {NOISY_TOPIC: 0, STATE_TOPIC: 0}
+    total = 0
+    start = time.time()
+
+    while time.time() - start < duration:
+        target = int((time.time() - start) * rate)
+        for index in range(total, target):
+            topic = STATE_TOPIC if index % STATE_EVERY == 0 else NOISY_TOPIC
+            data = template.replace(f'"{SENT_PLACEHOLDER}"', repr(time.time()))
+            connection.send_multipart([topic.encode(), data.encode()])
+            sent[topic] += 1
+        total = max(total, target)
+        await asyncio.sleep(BATCH_INTERVAL)
+
+    # Let the last events go out before closing.
+    await asyncio.sleep(0.5)
+    connection.close()
+    return sent
+
+
+async def _receive(settings: Settings, latencies: Dict[str, List[float]]) -> None:
+    """Record the latency of every event received."""
+    connection = create_subscriber(
+        settings.subscriber_address.connection_string(), [NOISY_TOPIC, STATE_TOPIC]
+    )
+    try:
+        while True:
+            topic, data = await connection.recv_multipart()
+            sent = json.loads(data)["data"]["data"]["sent"]
+            latencies[topic.decode()].append(time.time() - sent)
+    finally:
+        connection.close()
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+async def main() -> None:
+    """Run the server, load it with events, and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rate", type=float, default=5000, help="events per second")
+    parser.add_argument("--duration", type=float, default=5, help="seconds to run")
+    parser.add_argument("--port", type=int, default=15555, help="first TCP port")
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="optional events per second limit on the state topic",
+    )
+    args = parser.parse_args()
+    settings = _settings(args.port, args.rate_limit)
+
+    server = multiprocessing.Process(target=_run_server, args=(settings,))
+    server.start()
+    latencies: Dict[str, List[float]] = {NOISY_TOPIC: [], STATE_TOPIC: []}
+    receiver = asyncio.create_task(_receive(settings, latencies))
+    # Let the server start and the subscriber connect.
+    await asyncio.sleep(1)
+
+    counts: "multiprocessing.Queue" = multiprocessing.Queue()
+    pub = multiprocessing.Process(
+        target=_run_publisher, args=(settings, args.rate, args.duration, counts)
+    )
+    pub.start()
+    while pub.is_alive():
+        await asyncio.sleep(0.1)
+    sent = counts.get()
+    # Let the last events arrive.
+    await asyncio.sleep(1)
+
+    receiver.cancel()
+    await asyncio.gather(receiver, return_exceptions=True)
+    server.terminate()
+    server.join()
+
+    print(f"{args.rate:.0f} events/s for {args.duration:.0f} s:")
+    for topic in (NOISY_TOPIC, STATE_TOPIC):
+        received = latencies[topic]
+        line = f"  {topic:<6} sent: {sent[topic]:7d}   received: {len(received):7d}"
+        if received:
+            line += (
+                f"   latency p50: {_percentile(received, 50) * 1e3:7.2f} ms"
+                f"   p99: {_percentile(received, 99) * 1e3:7.2f} ms"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,224 @@
+"""A compact binary encoding of JSON-like values.
+
+This is the subset of MessagePack (https://msgpack.org) needed to encode
+events: nil, booleans, integers, floats, strings, binary, arrays and maps.
+Output is readable by any MessagePack implementation.
+"""
+from __future__ import annotations
+
+import struct
+from typing import Any, Callable, Optional, Tuple
+
+
+class PackingError(ValueError):
+    """Exception raised on a value that can't be packed or unpacked."""
+
+    pass
+
+
+Default = Callable[[Any], Any]
+"""Convert a value that can't be packed to one that can."""
+
+_UINT_FORMATS = ((0xFF, 0xCC, ">B"), (0xFFFF, 0xCD, ">H"), (0xFFFFFFFF, 0xCE, ">I"))
+_INT_FORMATS = (
+    (0x7F, 0xD0, ">b"),
+    (0x7FFF, 0xD1, ">h"),
+    (0x7FFFFFFF, 0xD2, ">i"),
+    (0x7FFFFFFFFFFFFFFF, 0xD3, ">q"),
+)
+
+
+def pack(value: Any, default: Optional[Default] = None) -> bytes:
+    """
+    Encode a value.
+
+    :param value: The value to encode.
+    :param default: Called with values of any other type to convert them.
+    :raises: PackingError
+    """
+    out = bytearray()
+    _pack(value, out, default, depth=0)
+    return bytes(out)
+
+
+def unpack(data: bytes) -> Any:
+    """
+    Decode a value.
+
+    :raises: PackingError
+    """
+    try:
+        value, offset = _unpack(memoryview(data), 0)
+    except (IndexError, struct.error, UnicodeDecodeError, RecursionError) as e:
+        raise PackingError("Truncated or malformed data") from e
+    if offset != len(data):
+        raise PackingError(f"{len(data) - offset} bytes of extra data")
+    return value
+
+
+_MAX_DEPTH = 100
+
+
+def _pack(value: Any, out: bytearray, default: Optional[Default], depth: int) -> None:
+    if depth > _MAX_DEPTH:
+        raise PackingError("Value is nested too deeply")
+
+    if value is None:
+        out.append(0xC0)
+    elif value is True:
+        out.append(0xC3)
+    elif value is False:
+        out.append(0xC2)
+    elif isinstance(value, int):
+        _pack_int(value, out)
+    elif isinstance(value, float):
+        out.append(0xCB)
+        out += struct.pack(">d", value)
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        _pack_header(len(encoded), out, fix=(0xA0, 31), sized=(0xD9, 0xDA, 0xDB))
+        out += encoded
+    elif isinstance(value, (bytes, bytearray)):
+        _pack_header(len(value), out, fix=None, sized=(0xC4, 0xC5, 0xC6))
+        out += value
+    elif isinstance(value, (list, tuple)):
+        _pack_header(len(value), out, fix=(0x90, 15), sized=(None, 0xDC, 0xDD))
+        for item in value:
+            _pack(item, out, default, depth + 1)
+    elif isinstance(value, dict):
+        _pack_header(len(value), out, fix=(0x80, 15), sized=(None, 0xDE, 0xDF))
+        for key, item in value.items():
+            _pack(key, out, default, depth + 1)
+            _pack(item, out, default, depth + 1)
+    elif default is not None:
+        try:
+            converted = default(value)
+        except TypeError as e:
+            raise PackingError(f"Can't pack {type(value).__name__}") from e
+        _pack(converted, out, default, depth + 1)
+    else:
+        raise PackingError(f"Can't pack {type(value).__name__}")
+
+
+def _pack_int(value: int, out: bytearray) -> None:
+    if -32 <= value <= 0x7F:
+        out += struct.pack(">b" if value < 0 else ">B", value)
+        return
+
+    formats = _UINT_FORMATS + ((0xFFFFFFFFFFFFFFFF, 0xCF, ">Q"),)
+    if value < 0:
+        formats = _INT_FORMATS
+    for limit, marker, fmt in formats:
+        if -limit - 1 <= value <= limit:
+            out.append(marker)
+            out += struct.pack(fmt, value)
+            return
+    raise PackingError(f"Integer {value} is out of range")
+
+
+def _pack_header(
+    length: int,
+    out: bytearray,
+    fix: Optional[Tuple[int, int]],
+    sized: Tuple[Optional[int], int, int],
+) -> None:
+    """Write the marker and length of a string, binary, array or map."""
+    if fix is not None and length <= fix[1]:
+        out.append(fix[0] | length)
+        return
+
+    for (limit, _, fmt), marker in zip(_UINT_FORMATS, sized):
+        if marker is not None and length <= limit:
+            out.append(marker)
+            out += struct.pack(fmt, length)
+            return
+    raise PackingError(f"Length {length} is too long")
+
+
+_FIXED_SIZES = {
+    0xCC: ">B",
+    0xCD: ">H",
+    0xCE: ">I",
+    0xCF: ">Q",
+    0xD0: ">b",
+    0xD1: ">h",
+    0xD2: ">i",
+    0xD3: ">q",
+    0xCA: ">f",
+    0xCB: ">d",
+}
+_STR_LENGTHS = {0xD9: ">B", 0xDA: ">H", 0xDB: ">I"}
+_BIN_LENGTHS = {0xC4: ">B", 0xC5: ">H", 0xC6: ">I"}
+_ARRAY_LENGTHS = {0xDC: ">H", 0xDD: ">I"}
+_MAP_LENGTHS = {0xDE: ">H", 0xDF: ">I"}
+_CONSTANTS = {0xC0: None, 0xC2: False, 0xC3: True}
+
+
+def _unpack(data: memoryview, offset: int) -> Tuple[Any, int]:
+    marker = data[offset]
+    offset += 1
+
+    if marker <= 0x7F:
+        return marker, offset
+    if marker >= 0xE0:
+        return marker - 0x100, offset
+    if 0xA0 <= marker <= 0xBF:
+        return _unpack_str(data, offset, marker & 0x1F)
+    if 0x90 <= marker <= 0x9F:
+        return _unpack_array(data, offset, marker & 0x0F)
+    if 0x80 <= marker <= 0x8F:
+        return _unpack_map(data, offset, marker & 0x0F)
+    if marker in _CONSTANTS:
+        return _CONSTANTS[marker], offset
+    if marker in _FIXED_SIZES:
+        return _read(data, offset, _FIXED_SIZES[marker])
+    if marker in _STR_LENGTHS:
+        length, offset = _read(data, offset, _STR_LENGTHS[marker])
+        return _unpack_str(data, offset, length)
+    if marker in _BIN_LENGTHS:
+        length, offset = _read(data, offset, _BIN_LENGTHS[marker])
+        return bytes(_slice(data, offset, length)), offset + length
+    if marker in _ARRAY_LENGTHS:
+        length, offset = _read(data, offset, _ARRAY_LENGTHS[marker])
+        return _unpack_array(data, offset, length)
+    if marker in _MAP_LENGTHS:
+        length, offset = _read(data, offset, _MAP_LENGTHS[marker])
+        return _unpack_map(data, offset, length)
+
+    raise PackingError(f"Unsupported type marker 0x{marker:02x}")
+
+
+def _read(data: memoryview, offset: int, fmt: str) -> Tuple[Any, int]:
+    (value,) = struct.unpack_from(fmt, data, offset)
+    return value, offset + struct.calcsize(fmt)
+
+
+def _slice(data: memoryview, offset: int, length: int) -> memoryview:
+    end = offset + length
+    if end > len(data):
+        raise IndexError("Data is truncated")
+    return data[offset:end]
+
+
+def _unpack_str(data: memoryview, offset: int, length: int) -> Tuple[str, int]:
+    return str(_slice(data, offset, length), "utf-8"), offset + length
+
+
+def _unpack_array(data: memoryview, offset: int, length: int) -> Tuple[Any, int]:
+    result = []
+    for _ in range(length):
+        item, offset = _unpack(data, offset)
+        result.append(item)
+    return result, offset
+
+
+def _unpack_map(data: memoryview, offset: int, length: int) -> Tuple[Any, int]:
+    result = {}
+    for _ in range(length):
+        key, offset = _unpack(data, offset)
+        value, offset = _unpack(data, offset)
+        try:
+            result[key] = value
+        except TypeError as e:
+            raise PackingError(f"Unhashable map key {key!r}") from e
+    return result, offset
@@ -12,21 +12,23 @@ from notify_server.network.connection import create_push, Connection
 log = logging.getLogger(__name__)
 
 
-def create(host_address: str) -> Publisher:
+def create(host_address: str, binary: bool = False) -> Publisher:
     """
     Construct a publisher.
 
     :param host_address: uri to connect to.
+    :param binary: Whether to send events in the compact binary format.
     """
-    return Publisher(connection=create_push(host_address))
+    return Publisher(connection=create_push(host_address), binary=binary)
 
 
 class Publisher:
     """Publisher class."""
 
-    def __init__(self, connection: Connection) -> None:
+    def __init__(self, connection: Connection, binary: bool = False) -> None:
         """Construct a Publisher."""
         self._connection = connection
+        self._binary = binary
 
     async def send(self, topic: str, event: Event) -> None:
         """Publish an event to a topic."""
@@ -34,7 +36,7 @@ class Publisher:
 
     def send_nowait(self, topic: str, event: Event) -> Future[Any]:
         """Publish an event to a topic without waiting for completion."""
-        frames = to_frames(topic=topic, event=event)
+        frames = to_frames(topic=topic, event=event, binary=self._binary)
         return self._connection.send_multipart(frames)
 
     def close(self) -> None:
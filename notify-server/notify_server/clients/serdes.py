@@ -4,9 +4,17 @@ from __future__ import annotations
 from typing import List
 
 from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
 
+from notify_server.clients.packing import pack, unpack
 from notify_server.models.event import Event
 
+BINARY_FORMAT_VERSION = 1
+"""The first byte of an event frame in the binary format.
+
+JSON event frames always start with "{", so the two formats can be told apart.
+"""
+
 
 class MalformedFrames(Exception):
     """Exception raised on badly formed frames."""
@@ -20,25 +28,28 @@ class FrameEncodingError(Exception):
     pass
 
 
-def to_frames(topic: str, event: Event) -> List[bytes]:
+def to_frames(topic: str, event: Event, binary: bool = False) -> List[bytes]:
     """
     Create zmq frames from members.
 
+    :param topic: The event's topic.
+    :param event: The event.
+    :param binary: Whether to encode the event in the compact binary format,
+        rather than as json.
     :raises: FrameEncodingError
     """
     try:
-        event_json = event.json()
+        if binary:
+            event_frame = bytes((BINARY_FORMAT_VERSION,)) + pack(
+                event.dict(), default=pydantic_encoder
+            )
+        else:
+            event_frame = bytes(event.json(), "utf-8")
     except (ValueError, TypeError) as e:
-        # Could not serialize event to json.
+        # Could not serialize event.
         raise FrameEncodingError() from e
 
-    return [
-        bytes(v, "utf-8")
-        for v in (
-            topic,
-            event_json,
-        )
-    ]
+    return [bytes(topic, "utf-8"), event_frame]
 
 
 class TopicEvent(BaseModel):
@@ -52,14 +63,18 @@ def from_frames(frames: List[bytes]) -> TopicEvent:
     """
     Create an object from a zmq frame.
 
-    The frame must have two entries: a topic, a json serialized Event
-    object.
+    The frame must have two entries: a topic, and an Event object serialized
+    as json or in the binary format.
 
     :raises: MalformedFrame
     """
     try:
-        return TopicEvent(
-            topic=frames[0].decode("utf-8"), event=Event.parse_raw((frames[1]))
-        )
+        topic = frames[0].decode("utf-8")
+        event_frame = frames[1]
+        if event_frame[:1] == bytes((BINARY_FORMAT_VERSION,)):
+            event = Event.parse_obj(unpack(event_frame[1:]))
+        else:
+            event = Event.parse_raw(event_frame)
+        return TopicEvent(topic=topic, event=event)
     except (ValueError, IndexError, AttributeError) as e:
         raise MalformedFrames() from e
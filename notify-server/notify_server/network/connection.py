@@ -36,9 +36,17 @@ def create_push(address: str) -> Connection:
 
 
 def create_publisher(address: str) -> Connection:
-    """Create a PUB client connection."""
+    """
+    Create a publisher server connection.
+
+    This is an XPUB socket, so subscriptions can be read from it as messages
+    of one frame: a 1 byte followed by the topic for a subscribe, or a 0
+    byte for an unsubscribe. Every subscription is reported, not only the
+    first to each topic.
+    """
     ctx = Context.instance()
-    sock = ctx.socket(zmq.PUB)
+    sock = ctx.socket(zmq.XPUB)
+    sock.setsockopt(zmq.XPUB_VERBOSE, 1)
 
     log.info("Publisher binding to %s", address)
     sock.bind(address)
@@ -0,0 +1,218 @@
+"""A bounded queue of events waiting to be published."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Iterable, List, Mapping, Optional
+from typing import Counter as CounterType
+
+log = logging.getLogger(__name__)
+
+Frames = List[bytes]
+"""A multipart message: a topic frame, then the event."""
+
+
+@dataclass(frozen=True)
+class EventQueueStats:
+    """Counts of events the queue didn't publish as received, by topic."""
+
+    dropped: Dict[str, int] = field(default_factory=dict)
+    """Events dropped because the queue was full."""
+
+    conflated: Dict[str, int] = field(default_factory=dict)
+    """State events replaced by a later event before being published."""
+
+    rate_limited: Dict[str, int] = field(default_factory=dict)
+    """Events dropped because their topic was over its rate limit."""
+
+
+class _Entry:
+    """A queued event, whose frames may be replaced if it's a state."""
+
+    def __init__(self, topic: bytes, frames: Frames) -> None:
+        self.topic = topic
+        self.frames = frames
+
+
+class _RateLimit:
+    """A token bucket allowing a number of events per second."""
+
+    def __init__(self, rate: float, now: float) -> None:
+        self._rate = rate
+        self._capacity = max(1.0, rate)
+        self._tokens = self._capacity
+        self._last_refill = now
+
+    def try_acquire(self, now: float) -> bool:
+        """Take a token if there is one."""
+        self._refill(now)
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def available_at(self, now: float) -> float:
+        """Get when the next token will be available."""
+        self._refill(now)
+        return now + max(0.0, 1 - self._tokens) / self._rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._last_refill = now
+
+
+class EventQueue:
+    """A bounded queue of events waiting to be published.
+
+    When the queue is full, the oldest event is dropped to make room.
+
+    Events on state topics, like door state, only matter as the latest
+    value. A new state event replaces its topic's event that is still in the
+    queue, rather than being queued behind it. The latest published event on
+    each state topic is also cached, to send to new subscribers. Caching only
+    published events means the cached value is never newer than an event
+    still waiting in the queue, so replaying it can't reorder a topic's states.
+
+    Topics can be rate limited. Events over a topic's limit are dropped, or
+    for state topics, held back and replaced until the limit allows them.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        state_topics: Iterable[str] = (),
+        rate_limits: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Construct an EventQueue.
+
+        :param max_size: The most events to hold before dropping the oldest.
+        :param state_topics: Topics whose events are states.
+        :param rate_limits: Most events per second to publish, by topic.
+        :param clock: Source of monotonic time in seconds.
+        """
+        self._max_size = max_size
+        self._state_topics = {t.encode() for t in state_topics}
+        self._clock = clock
+        self._rate_limits = {
+            t.encode(): _RateLimit(rate, clock())
+            for t, rate in (rate_limits or {}).items()
+        }
+        self._entries: Deque[_Entry] = deque()
+        self._queued_states: Dict[bytes, _Entry] = {}
+        self._held_states: Dict[bytes, Frames] = {}
+        self._last_values: Dict[bytes, Frames] = {}
+        self._not_empty = asyncio.Event()
+        self._dropped: CounterType[str] = Counter()
+        self._conflated: CounterType[str] = Counter()
+        self._rate_limited: CounterType[str] = Counter()
+
+    def __len__(self) -> int:
+        """Get the number of events waiting to be published."""
+        return len(self._entries)
+
+    @property
+    def stats(self) -> EventQueueStats:
+        """Get counts of events that weren't published as received."""
+        return EventQueueStats(
+            dropped=dict(self._dropped),
+            conflated=dict(self._conflated),
+            rate_limited=dict(self._rate_limited),
+        )
+
+    def put(self, frames: Frames) -> None:
+        """Add an event to the queue, without waiting."""
+        topic = frames[0]
+        is_state = topic in self._state_topics
+        rate_limit = self._rate_limits.get(topic)
+
+        if rate_limit is not None and (
+            topic in self._held_states or not rate_limit.try_acquire(self._clock())
+        ):
+            if not is_state:
+                self._rate_limited[topic.decode()] += 1
+            else:
+                if topic in self._held_states:
+                    self._conflated[topic.decode()] += 1
+                self._held_states[topic] = frames
+            return
+
+        self._enqueue(topic, frames, is_state)
+
+    async def get(self) -> Frames:
+        """Wait for the next event to publish."""
+        while True:
+            self._release_held_states()
+
+            if self._entries:
+                entry = self._entries.popleft()
+                if self._queued_states.get(entry.topic) is entry:
+                    del self._queued_states[entry.topic]
+                if entry.topic in self._state_topics:
+                    self._last_values[entry.topic] = entry.frames
+                return entry.frames
+
+            self._not_empty.clear()
+            try:
+                await asyncio.wait_for(
+                    self._not_empty.wait(), self._time_until_held_release()
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    def get_last_values(self, topic_prefix: bytes = b"") -> List[Frames]:
+        """Get the latest published event of each state topic matching a subscription.
+
+        :param topic_prefix: A subscription, which matches topics by prefix.
+        """
+        return [
+            frames
+            for topic, frames in self._last_values.items()
+            if topic.startswith(topic_prefix)
+        ]
+
+    def _enqueue(self, topic: bytes, frames: Frames, is_state: bool) -> None:
+        queued_state = self._queued_states.get(topic) if is_state else None
+
+        if queued_state is not None:
+            queued_state.frames = frames
+            self._conflated[topic.decode()] += 1
+            return
+
+        if len(self._entries) >= self._max_size:
+            dropped = self._entries.popleft()
+            if self._queued_states.get(dropped.topic) is dropped:
+                del self._queued_states[dropped.topic]
+            self._dropped[dropped.topic.decode()] += 1
+
+        entry = _Entry(topic, frames)
+        self._entries.append(entry)
+        if is_state:
+            self._queued_states[topic] = entry
+        self._not_empty.set()
+
+    def _release_held_states(self) -> None:
+        """Queue held back state events whose rate limits now allow them."""
+        if not self._held_states:
+            return
+
+        now = self._clock()
+        for topic, frames in list(self._held_states.items()):
+            if self._rate_limits[topic].try_acquire(now):
+                del self._held_states[topic]
+                self._enqueue(topic, frames, is_state=True)
+
+    def _time_until_held_release(self) -> Optional[float]:
+        """Get how long until a held back state event can be released."""
+        if not self._held_states:
+            return None
+
+        now = self._clock()
+        return min(
+            self._rate_limits[topic].available_at(now) - now
+            for topic in self._held_states
+        )
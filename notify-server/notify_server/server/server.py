@@ -2,15 +2,19 @@
 
 import logging
 import asyncio
-from asyncio import Queue
+from typing import Optional
 
 from notify_server.network.connection import create_publisher, create_pull, Connection
+from notify_server.server.event_queue import EventQueue, EventQueueStats
 from notify_server.settings import Settings
 
 log = logging.getLogger(__name__)
 
+SUBSCRIBE = b"\x01"
+"""The first byte of an XPUB subscribe message."""
 
-async def _publisher_server_task(connection: Connection, queue: Queue) -> None:
+
+async def _publisher_server_task(connection: Connection, queue: EventQueue) -> None:
     """
     Run a task that reads multipart messages: topic, data.
 
@@ -25,14 +29,14 @@ async def _publisher_server_task(connection: Connection, queue: Queue) -> None:
         while True:
             m = await connection.recv_multipart()
             log.debug("Event: %s", m)
-            await queue.put(m)
+            queue.put(m)
     except asyncio.CancelledError:
         log.exception("Done")
     finally:
         connection.close()
 
 
-async def _subscriber_server_task(connection: Connection, queue: Queue) -> None:
+async def _subscriber_server_task(connection: Connection, queue: EventQueue) -> None:
     """
     Run a task that publishes messages to subscribers.
 
@@ -51,18 +55,68 @@ async def _subscriber_server_task(connection: Connection, queue: Queue) -> None:
         connection.close()
 
 
+async def _subscription_task(connection: Connection, queue: EventQueue) -> None:
+    """
+    Run a task that sends the latest state events to new subscribers.
+
+    Subscribers get the last value of the state topics they subscribe to as
+    soon as they connect, rather than waiting for the state to change.
+
+    An XPUB socket can't address a single subscriber, so the last value is
+    broadcast to every subscriber of a matching topic, not just the new one.
+    The value replayed is the last one published, which existing subscribers
+    already have, so they must treat a repeated state event as a no-op.
+
+    :param connection: The subscriber server's network connection.
+    :param queue: The queue of multipart messages, with the last values.
+    :return: None
+    """
+    while True:
+        (subscription, *_) = await connection.recv_multipart()
+        if subscription[:1] == SUBSCRIBE:
+            for frames in queue.get_last_values(subscription[1:]):
+                log.debug("Publishing last value: %s", frames)
+                await connection.send_multipart(frames)
+
+
+async def _stats_log_task(queue: EventQueue, interval_seconds: float) -> None:
+    """
+    Run a task that logs the queue's counts of unpublished events.
+
+    :param queue: The queue of multipart messages.
+    :param interval_seconds: How often to check the counts.
+    :return: None
+    """
+    last_stats: Optional[EventQueueStats] = None
+    while True:
+        await asyncio.sleep(interval_seconds)
+        stats = queue.stats
+        if stats != last_stats and stats != EventQueueStats():
+            log.warning("Events not published as received: %s", stats)
+        last_stats = stats
+
+
 async def run(settings: Settings) -> None:
     """Run the server tasks. Will not return."""
-    queue: Queue = Queue()
-
-    subtask = asyncio.create_task(
-        _subscriber_server_task(
-            create_publisher(settings.subscriber_address.connection_string()), queue
-        )
+    queue = EventQueue(
+        max_size=settings.max_queue_size,
+        state_topics=settings.state_topics,
+        rate_limits=settings.topic_rate_limits,
     )
+    publisher = create_publisher(settings.subscriber_address.connection_string())
+
+    subtask = asyncio.create_task(_subscriber_server_task(publisher, queue))
+    subscriptiontask = asyncio.create_task(_subscription_task(publisher, queue))
     pubtask = asyncio.create_task(
         _publisher_server_task(
             create_pull(settings.publisher_address.connection_string()), queue
         )
     )
-    await asyncio.gather(subtask, pubtask)
+    statstask = asyncio.create_task(
+        _stats_log_task(queue, settings.stats_log_interval_seconds)
+    )
+    try:
+        await asyncio.gather(subtask, subscriptiontask, pubtask, statstask)
+    finally:
+        for task in (subtask, subscriptiontask, pubtask, statstask):
+            task.cancel()
@@ -1,8 +1,12 @@
 """Settings class."""
 
+from typing import Dict, List
+
 from typing_extensions import Literal
 from pydantic import BaseSettings, BaseModel, Field
 
+from notify_server.models.topics import RobotEventTopics
+
 
 class ServerBindAddress(BaseModel):
     """A bind address for server zmq socket."""
@@ -27,6 +31,33 @@ class Settings(BaseSettings):
     publisher_address: ServerBindAddress = ServerBindAddress(scheme="ipc")
     subscriber_address: ServerBindAddress = ServerBindAddress(scheme="tcp")
 
+    max_queue_size: int = Field(
+        1000,
+        description="The most events to hold waiting to be published. When "
+        "full, the oldest event is dropped.",
+    )
+    state_topics: List[str] = Field(
+        # Hardware events are currently all door state.
+        [RobotEventTopics.HARDWARE_EVENTS.value],
+        description="Topics whose events are states, so only the latest one "
+        "matters. Waiting events on these topics are replaced by newer ones, "
+        "and the latest is sent to new subscribers.",
+    )
+    topic_rate_limits: Dict[str, float] = Field(
+        {},
+        description="Most events per second to publish on each topic.",
+    )
+    binary_frames: bool = Field(
+        False,
+        description="Whether publishers should send events in the compact "
+        "binary format rather than json. Subscribers read either format.",
+    )
+    stats_log_interval_seconds: float = Field(
+        60,
+        description="How often to log counts of dropped and conflated events, "
+        "if they've changed.",
+    )
+
     production: bool = Field(
         True,
         description="Whether this the application is running in a "
@@ -1,5 +1,5 @@
 """Pub sub integration tests."""
-from asyncio import Task, sleep
+from asyncio import Task, sleep, wait_for
 from typing import AsyncGenerator, Tuple
 
 import pytest
@@ -77,3 +77,27 @@ async def test_two_pub_two_sub_two_topics(
     e = await subscriber_all_topics.next_event()
     assert e.topic == "topic2"
     assert e.event == event
+
+
+async def test_last_value_on_subscribe(
+    server_fixture: Task,
+    settings: Settings,
+    two_publishers: Tuple[publisher.Publisher, publisher.Publisher],
+    event: Event,
+) -> None:
+    """Test that a new subscriber gets the last event of a state topic."""
+    await sleep(0.1)
+
+    topic = settings.state_topics[0]
+    pub1, _ = two_publishers
+    await pub1.send(topic, event)
+    # Let the server receive the event before subscribing.
+    await sleep(0.1)
+
+    sub = subscriber.create(settings.subscriber_address.connection_string(), [topic])
+    try:
+        e = await wait_for(sub.next_event(), timeout=1)
+        assert e.topic == topic
+        assert e.event == event
+    finally:
+        sub.close()
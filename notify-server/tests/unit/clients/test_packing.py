@@ -0,0 +1,68 @@
+"""Unit tests for the packing module."""
+from typing import Any
+
+import pytest
+from notify_server.clients.packing import PackingError, pack, unpack
+
+
+@pytest.mark.parametrize(
+    argnames=["value", "expected"],
+    argvalues=[
+        [None, b"\xc0"],
+        [True, b"\xc3"],
+        [False, b"\xc2"],
+        [1, b"\x01"],
+        [-1, b"\xff"],
+        [200, b"\xcc\xc8"],
+        [-200, b"\xd1\xff\x38"],
+        [1.5, b"\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00"],
+        ["abc", b"\xa3abc"],
+        [b"abc", b"\xc4\x03abc"],
+        [[1, 2], b"\x92\x01\x02"],
+        [{"a": 1}, b"\x81\xa1a\x01"],
+    ],
+)
+def test_pack(value: Any, expected: bytes) -> None:
+    """Test that values are packed as MessagePack."""
+    assert pack(value) == expected
+    assert unpack(expected) == value
+
+
+@pytest.mark.parametrize(
+    argnames=["value"],
+    argvalues=[
+        [2 ** 64 - 1],
+        [-(2 ** 63)],
+        ["a" * 40],
+        ["a" * 300],
+        [b"a" * 70000],
+        [list(range(20))],
+        [{str(i): i for i in range(20)}],
+        [{"nested": [{"a": None}, [1.25, "b", True]], 3: -40000}],
+    ],
+)
+def test_round_trip(value: Any) -> None:
+    """Test that unpacking a packed value returns it."""
+    assert unpack(pack(value)) == value
+
+
+def test_pack_default() -> None:
+    """Test that a default converts values of other types."""
+    assert unpack(pack({"a": {1, 2}}, default=sorted)) == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize(argnames=["value"], argvalues=[[{1, 2}], [2 ** 64]])
+def test_pack_fail(value: Any) -> None:
+    """Test that an exception is raised on values that can't be packed."""
+    with pytest.raises(PackingError):
+        pack(value)
+
+
+@pytest.mark.parametrize(
+    argnames=["data"],
+    argvalues=[[b""], [b"\xa3ab"], [b"\x92\x01"], [b"\x01\x02"], [b"\xc1"]],
+)
+def test_unpack_fail(data: bytes) -> None:
+    """Test that an exception is raised on malformed data."""
+    with pytest.raises(PackingError):
+        unpack(data)
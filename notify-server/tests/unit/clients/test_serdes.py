@@ -9,6 +9,8 @@ from notify_server.clients.serdes import (
     from_frames,
 )
 from notify_server.models.event import Event
+from notify_server.models.hardware_event import DoorStatePayload
+from opentrons.hardware_control.types import DoorState
 
 
 def test_to_frames(event: Event) -> None:
@@ -19,8 +21,23 @@ def test_to_frames(event: Event) -> None:
     ]
 
 
+def test_to_frames_binary(event: Event) -> None:
+    """Test that to_frames method can encode the event in the binary format."""
+    frames = to_frames(topic="topic", event=event, binary=True)
+    assert frames[0] == b"topic"
+    assert frames[1][0] == 1
+    assert len(frames[1]) < len(event.json())
+
+
 @pytest.mark.parametrize(
-    argnames=["frames"], argvalues=[[[]], [[b"a", b"{"]], [[b"a", b"{}"]]]
+    argnames=["frames"],
+    argvalues=[
+        [[]],
+        [[b"a", b"{"]],
+        [[b"a", b"{}"]],
+        [[b"a", b"\x01"]],
+        [[b"a", b"\x02"]],
+    ],
 )
 def test_entry_from_frames_fail(frames: List[bytes]) -> None:
     """Test that an exception is raised on bad message."""
@@ -32,3 +49,12 @@ def test_entry_from_frames(event: Event) -> None:
     """Test that an object is created from_frames."""
     entry = from_frames([b"topic", event.json().encode("utf-8")])
     assert entry == TopicEvent(topic="topic", event=event)
+
+
+@pytest.mark.parametrize(argnames=["binary"], argvalues=[[True], [False]])
+def test_entry_round_trip(event: Event, binary: bool) -> None:
+    """Test that from_frames reads events in either format."""
+    door_event = event.copy(update={"data": DoorStatePayload(state=DoorState.OPEN)})
+    for e in (event, door_event):
+        entry = from_frames(to_frames(topic="topic", event=e, binary=binary))
+        assert entry == TopicEvent(topic="topic", event=e)
@@ -0,0 +1,157 @@
+"""Event queue unit tests."""
+import asyncio
+from typing import List
+
+import pytest
+
+from notify_server.server.event_queue import EventQueue, EventQueueStats, Frames
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the time."""
+        return self.now
+
+
+def frames(topic: str, data: str) -> Frames:
+    """Create a message."""
+    return [topic.encode(), data.encode()]
+
+
+async def drain(subject: EventQueue) -> List[Frames]:
+    """Get every message that's waiting."""
+    result = []
+    while len(subject):
+        result.append(await subject.get())
+    return result
+
+
+async def test_order() -> None:
+    """It should publish events in the order they were received."""
+    subject = EventQueue(max_size=10)
+    subject.put(frames("a", "1"))
+    subject.put(frames("b", "2"))
+    subject.put(frames("a", "3"))
+
+    assert await drain(subject) == [
+        frames("a", "1"),
+        frames("b", "2"),
+        frames("a", "3"),
+    ]
+
+
+async def test_get_waits() -> None:
+    """It should wait for an event to be received."""
+    subject = EventQueue(max_size=10)
+    get = asyncio.ensure_future(subject.get())
+    await asyncio.sleep(0)
+    assert not get.done()
+
+    subject.put(frames("a", "1"))
+    assert await get == frames("a", "1")
+
+
+async def test_drop_oldest() -> None:
+    """It should drop the oldest event when full."""
+    subject = EventQueue(max_size=2)
+    subject.put(frames("a", "1"))
+    subject.put(frames("b", "2"))
+    subject.put(frames("a", "3"))
+
+    assert await drain(subject) == [frames("b", "2"), frames("a", "3")]
+    assert subject.stats == EventQueueStats(dropped={"a": 1})
+
+
+async def test_conflate_states() -> None:
+    """It should replace a waiting state event with a newer one."""
+    subject = EventQueue(max_size=10, state_topics=["door"])
+    subject.put(frames("door", "open"))
+    subject.put(frames("a", "1"))
+    subject.put(frames("door", "closed"))
+
+    assert await drain(subject) == [frames("door", "closed"), frames("a", "1")]
+    assert subject.stats == EventQueueStats(conflated={"door": 1})
+
+    subject.put(frames("door", "open"))
+    assert await drain(subject) == [frames("door", "open")]
+
+
+async def test_last_values() -> None:
+    """It should keep the latest event of each state topic."""
+    subject = EventQueue(max_size=10, state_topics=["door", "module"])
+    subject.put(frames("door", "open"))
+    subject.put(frames("door", "closed"))
+    subject.put(frames("module", "hot"))
+    subject.put(frames("other", "1"))
+    await drain(subject)
+
+    assert subject.get_last_values() == [
+        frames("door", "closed"),
+        frames("module", "hot"),
+    ]
+    assert subject.get_last_values(b"mod") == [frames("module", "hot")]
+    assert subject.get_last_values(b"other") == []
+
+
+async def test_last_values_published() -> None:
+    """It should only cache state events once they are published."""
+    subject = EventQueue(max_size=10, state_topics=["door"])
+    subject.put(frames("door", "open"))
+    assert await subject.get() == frames("door", "open")
+
+    subject.put(frames("door", "closed"))
+    assert subject.get_last_values() == [frames("door", "open")]
+
+    await drain(subject)
+    assert subject.get_last_values() == [frames("door", "closed")]
+
+
+async def test_rate_limit() -> None:
+    """It should drop events over a topic's rate limit."""
+    clock = FakeClock()
+    subject = EventQueue(max_size=10, rate_limits={"a": 2}, clock=clock)
+    for i in range(4):
+        subject.put(frames("a", str(i)))
+        subject.put(frames("b", str(i)))
+
+    assert [f for f in await drain(subject) if f[0] == b"a"] == [
+        frames("a", "0"),
+        frames("a", "1"),
+    ]
+    assert subject.stats == EventQueueStats(rate_limited={"a": 2})
+
+    clock.now = 0.5
+    subject.put(frames("a", "4"))
+    subject.put(frames("a", "5"))
+    assert await drain(subject) == [frames("a", "4")]
+
+
+async def test_rate_limit_state() -> None:
+    """It should hold back the latest state event until the limit allows it."""
+    clock = FakeClock()
+    subject = EventQueue(
+        max_size=10, state_topics=["door"], rate_limits={"door": 10}, clock=clock
+    )
+    for _ in range(10):
+        subject.put(frames("door", "open"))
+        assert await drain(subject) == [frames("door", "open")]
+
+    subject.put(frames("door", "closed"))
+    subject.put(frames("door", "open again"))
+    assert await drain(subject) == []
+
+    get = asyncio.ensure_future(subject.get())
+    await asyncio.sleep(0)
+    assert not get.done()
+
+    clock.now = 0.1
+    assert await asyncio.wait_for(get, timeout=1) == frames("door", "open again")
+    assert subject.stats == EventQueueStats(conflated={"door": 1})
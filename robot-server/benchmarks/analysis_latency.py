@@ -0,0 +1,210 @@
+"""Benchmark how protocol analysis affects the latency of other requests.
+
+Serves a trivial request on a local TCP socket from the same event loop that
+runs protocol analyses, the way the robot server does, and keeps several
+clients requesting it while a large generated protocol is analyzed. Reports
+request latency with no analysis, with analysis in the server's process, and
+with analysis in the worker pool, then how long it takes to analyze the same
+protocol again once its result is cached.
+
+Usage:
+    python benchmarks/analysis_latency.py --transfers 200 --clients 4
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from opentrons.protocol_runner import (
+    ProtocolRunData,
+    ProtocolSource,
+    PythonPreAnalysis,
+    create_simulating_runner,
+)
+from opentrons.protocols.api_support.types import APIVersion
+
+from robot_server.persistence import open_database
+from robot_server.protocols.analysis_cache import AnalysisCache
+from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_worker import AnalysisWorkerPool
+from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
+from robot_server.protocols.protocol_store import ProtocolResource
+
+PROTOCOL_TEMPLATE = """\
+metadata = {{"apiLevel": "2.11"}}
+
+
+def run(protocol):
+    plate = protocol.load_labware("corning_96_wellplate_360ul_flat", 1)
+    tipracks = [
+        protocol.load_labware("opentrons_96_tiprack_300ul", slot)
+        for slot in (2, 3, 4, 5, 6)
+    ]
+    p300 = protocol.load_instrument("p300_single", "right", tip_racks=tipracks)
+
+    for i in range({transfers}):
+        p300.pick_up_tip()
+        p300.aspirate(100, plate.wells()[i % 96])
+        p300.dispense(100, plate.wells()[(i + 1) % 96])
+        p300.return_tip()
+"""
+# How long each client waits between requests.
+REQUEST_INTERVAL = 0.01
+
+
+class _InProcessWorkerPool(AnalysisWorkerPool):
+    """Analyze protocols in this process, as the server used to."""
+
+    def __init__(self) -> None:
+        pass
+
+    async def analyze(self, protocol_source: ProtocolSource) -> ProtocolRunData:
+        protocol_runner = await create_simulating_runner()
+        return await protocol_runner.run(protocol_source)
+
+    def close(self) -> None:
+        pass
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    while await reader.readline():
+        writer.write(b"ok\n")
+        await writer.drain()
+    writer.close()
+
+
+async def _client(port: int, done: asyncio.Event, latencies: List[float]) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    while not done.is_set():
+        start = time.perf_counter()
+        writer.write(b"ping\n")
+        await reader.readline()
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(REQUEST_INTERVAL)
+    writer.close()
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+async def _measure(
+    name: str,
+    port: int,
+    clients: int,
+    analyzer: Optional[ProtocolAnalyzer],
+    protocols: List[ProtocolResource],
+    idle_time: float,
+) -> None:
+    """Request from several clients while analyzing protocols, and report."""
+    done = asyncio.Event()
+    latencies: List[float] = []
+    tasks = [
+        asyncio.ensure_future(_client(port, done, latencies)) for _ in range(clients)
+    ]
+
+    start = time.perf_counter()
+    if analyzer is None:
+        await asyncio.sleep(idle_time)
+    else:
+        await asyncio.gather(
+            *(
+                analyzer.analyze(protocol_resource=p, analysis_id=f"{name}-{i}")
+                for i, p in enumerate(protocols)
+            )
+        )
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    await asyncio.gather(*tasks)
+    line = f"  {name:<12} {elapsed * 1e3:9.1f} ms   requests: {len(latencies):6d}"
+    if latencies:
+        line += (
+            f"   p50: {_percentile(latencies, 50) * 1e3:7.2f} ms"
+            f"   p99: {_percentile(latencies, 99) * 1e3:7.2f} ms"
+            f"   max: {max(latencies) * 1e3:8.2f} ms"
+        )
+    print(line)
+
+
+def _protocol(directory: Path, index: int, transfers: int) -> ProtocolResource:
+    path = directory / f"protocol-{index}" / "protocol.py"
+    path.parent.mkdir()
+    # Make each protocol distinct so none shares another's analysis.
+    path.write_text(PROTOCOL_TEMPLATE.format(transfers=transfers) + f"\n# {index}\n")
+    return ProtocolResource(
+        protocol_id=f"protocol-{index}",
+        created_at=datetime.now(),
+        files=[path],
+        pre_analysis=PythonPreAnalysis(metadata={}, api_version=APIVersion(2, 11)),
+    )
+
+
+async def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--transfers", type=int, default=200, help="transfers in each protocol"
+    )
+    parser.add_argument(
+        "--protocols", type=int, default=2, help="protocols analyzed at once"
+    )
+    parser.add_argument("--clients", type=int, default=4, help="concurrent clients")
+    parser.add_argument("--workers", type=int, default=1, help="analysis workers")
+    parser.add_argument("--port", type=int, default=15600, help="local TCP port")
+    args = parser.parse_args()
+
+    server = await asyncio.start_server(_handle, "127.0.0.1", args.port)
+    worker_pool = AnalysisWorkerPool(max_workers=args.workers)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        protocols = [
+            _protocol(directory, i, args.transfers) for i in range(args.protocols)
+        ]
+
+        def _analyzer(pool: AnalysisWorkerPool, name: str) -> ProtocolAnalyzer:
+            return ProtocolAnalyzer(
+                worker_pool=pool,
+                analysis_cache=AnalysisCache(
+                    robot_version="benchmark", custom_labware_dir=directory
+                ),
+                analysis_store=AnalysisStore(
+                    connection=open_database(directory / f"{name}.db")
+                ),
+            )
+
+        # Start the workers ahead of time, as a running server will have.
+        warm_up = _protocol(directory, args.protocols, 1)
+        await asyncio.gather(
+            *(worker_pool.analyze(warm_up) for _ in range(args.workers))
+        )
+
+        print(
+            f"{args.protocols} protocols of {args.transfers} transfers,"
+            f" {args.clients} clients:"
+        )
+        await _measure("idle", args.port, args.clients, None, [], 1)
+        await _measure(
+            "in-process",
+            args.port,
+            args.clients,
+            _analyzer(_InProcessWorkerPool(), "in-process"),
+            protocols,
+            0,
+        )
+        pooled = _analyzer(worker_pool, "worker-pool")
+        await _measure("worker pool", args.port, args.clients, pooled, protocols, 0)
+        await _measure("cached", args.port, args.clients, pooled, protocols, 0)
+
+    worker_pool.close()
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
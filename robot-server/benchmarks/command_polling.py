@@ -0,0 +1,112 @@
+"""Benchmark what it costs to poll a long run's command list.
+
+Builds the command state of a run with thousands of commands, partway
+through, and measures the server-side work of one poll of
+GET /runs/{runId}/commands: building and serializing every command summary,
+as a client without a cursor gets, versus only the commands from the first
+incomplete one onward, versus a single page from there, versus checking an
+unchanged ETag.
+
+Usage:
+    python benchmarks/command_polling.py --commands 5000
+"""
+import argparse
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from fastapi import Response
+
+from opentrons.protocol_engine import commands as pe_commands
+from opentrons.protocol_engine.state.command_log import CommandLog
+from opentrons.protocol_engine.state.commands import CommandState, CommandView
+
+from robot_server.runs.run_models import RunCommandSummary, get_command_summary
+from robot_server.service.etag import get_not_modified_response
+from robot_server.service.json_api import MultiResponseMeta, PaginatedResponseModel
+
+
+def _make_command(index: int, status: pe_commands.CommandStatus) -> pe_commands.Command:
+    return pe_commands.Pause(
+        id=f"command-{index}",
+        status=status,
+        createdAt=datetime.now(),
+        params=pe_commands.PauseParams(message=f"step {index}"),
+    )
+
+
+def _make_view(count: int) -> CommandView:
+    # A run halfway through: completed commands, one running, the rest queued.
+    running_index = count // 2
+    commands = [
+        _make_command(
+            i,
+            pe_commands.CommandStatus.SUCCEEDED
+            if i < running_index
+            else pe_commands.CommandStatus.RUNNING
+            if i == running_index
+            else pe_commands.CommandStatus.QUEUED,
+        )
+        for i in range(count)
+    ]
+
+    return CommandView(
+        CommandState(
+            is_running=True,
+            stop_requested=False,
+            commands_by_id=CommandLog(commands),
+            errors_by_id={},
+        )
+    )
+
+
+def _poll(view: CommandView, cursor: int, length: Optional[int] = None) -> int:
+    command_slice = view.get_slice(cursor=cursor, length=length)
+    response = PaginatedResponseModel[RunCommandSummary, None](
+        data=[get_command_summary(c) for c in command_slice.commands],
+        links=None,
+        meta=MultiResponseMeta(cursor=cursor, totalLength=command_slice.total_length),
+    )
+    return len(response.json())
+
+
+def _poll_unchanged(etag: str) -> int:
+    not_modified = get_not_modified_response(Response(), etag, etag)
+    assert not_modified is not None
+    return len(not_modified.body)
+
+
+def _time(label: str, poll: Callable[[], int], repeat: int) -> None:
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        size = poll()
+
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<24} {elapsed * 1000:9.3f} ms {size:>10} bytes")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--commands", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    view = _make_view(args.commands)
+    first_incomplete = args.commands // 2
+    etag = '"run-id-1-1-1234"'
+
+    print(f"One poll of a run with {args.commands} commands:")
+    _time("every command", lambda: _poll(view, 0), args.repeat)
+    _time("from first incomplete", lambda: _poll(view, first_incomplete), args.repeat)
+    _time(
+        "page of 20 from there",
+        lambda: _poll(view, first_incomplete, 20),
+        args.repeat,
+    )
+    _time("unchanged ETag", lambda: _poll_unchanged(etag), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Benchmark what it costs to follow a run through its event stream.
+
+Runs thousands of commands through a ProtocolEngine, with each command
+queued, started and completed, the way a protocol run changes them. Reports
+how much the run's event log adds to each command, with nobody following the
+run and with clients following it, and how much data a following client
+receives per command, compared to polling the whole command list.
+
+Usage:
+    python benchmarks/run_events.py --commands 5000 --clients 4
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from opentrons.hardware_control import API as HardwareAPI
+from opentrons.protocol_engine import (
+    AbstractPlugin,
+    ProtocolEngine,
+    actions as pe_actions,
+    commands as pe_commands,
+    create_protocol_engine,
+)
+
+from robot_server.runs.event_log import RunEventLog
+from robot_server.runs.run_models import get_command_summary
+
+
+class _Executor(AbstractPlugin):
+    """Dispatches command updates, standing in for the engine's queue worker."""
+
+    def handle_action(self, action: pe_actions.Action) -> None:
+        pass
+
+    def execute(self, command: pe_commands.Command) -> None:
+        running = command.copy(
+            update={
+                "status": pe_commands.CommandStatus.RUNNING,
+                "startedAt": datetime.now(),
+            }
+        )
+        self.dispatch(pe_actions.UpdateCommandAction(command=running))
+        self.dispatch(
+            pe_actions.UpdateCommandAction(
+                command=running.copy(
+                    update={
+                        "status": pe_commands.CommandStatus.SUCCEEDED,
+                        "completedAt": datetime.now(),
+                        "result": pe_commands.PauseResult(),
+                    }
+                )
+            )
+        )
+
+
+async def _follow(event_log: RunEventLog) -> int:
+    size = 0
+
+    async for event in event_log.stream(cursor=0):
+        size += len(event)
+
+    return size
+
+
+async def _run(
+    hardware_api: HardwareAPI,
+    commands: int,
+    clients: int,
+    event_log: Optional[RunEventLog],
+) -> float:
+    engine: ProtocolEngine = await create_protocol_engine(hardware_api=hardware_api)
+    executor = _Executor()
+    engine.add_plugin(executor)
+    followers: List["asyncio.Task[int]"] = []
+
+    if event_log is not None:
+        engine.add_plugin(event_log)
+        followers = [asyncio.create_task(_follow(event_log)) for _ in range(clients)]
+
+    start = time.perf_counter()
+
+    for i in range(commands):
+        command = engine.add_command(
+            pe_commands.PauseCreate(params=pe_commands.PauseParams(message=f"{i}"))
+        )
+        executor.execute(command)
+        # give followers a chance to read, as they would while hardware moves
+        await asyncio.sleep(0)
+
+    if event_log is not None:
+        event_log.close()
+        await asyncio.gather(*followers)
+
+    elapsed = time.perf_counter() - start
+    await engine.stop()
+
+    return elapsed / commands
+
+
+async def _main(commands: int, clients: int) -> None:
+    hardware_api = await HardwareAPI.build_hardware_simulator()
+
+    baseline = await _run(hardware_api, commands, 0, None)
+    unread = await _run(hardware_api, commands, 0, RunEventLog())
+    followed_log = RunEventLog()
+    followed = await _run(hardware_api, commands, clients, followed_log)
+    streamed = sum(len(e) for e in await followed_log.get_events(cursor=0))
+
+    engine = await create_protocol_engine(hardware_api=hardware_api)
+    command = engine.add_command(
+        pe_commands.PauseCreate(params=pe_commands.PauseParams(message="0"))
+    )
+    summary_size = len(get_command_summary(command).json())
+
+    print(f"Running {commands} commands, per command:")
+    print(f"  without an event log:      {baseline * 1e6:8.1f} us")
+    print(f"  event log, not followed:   {unread * 1e6:8.1f} us")
+    print(f"  event log, {clients} followers:    {followed * 1e6:8.1f} us")
+    print("Data a client receives to keep up with each command change:")
+    print(f"  event stream: {streamed / commands:8.0f} bytes")
+    print(
+        "  polling every command:"
+        f" {summary_size * commands:8.0f} bytes per poll, by the end of the run"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--commands", type=int, default=5000)
+    parser.add_argument("--clients", type=int, default=4)
+    args = parser.parse_args()
+
+    asyncio.run(_main(args.commands, args.clients))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Benchmark how the run history scales with the number of stored runs.
+
+Stores many finished runs, each with a final state and a full command log,
+in a temporary database the way the server does once a run stops being
+current. Reports the server's resident memory as runs are added, and how long
+it takes to read every run back the way GET /runs does, and with every run's
+command summaries.
+
+Usage:
+    python benchmarks/run_history.py --runs 500 --commands 100
+"""
+import argparse
+import asyncio
+import resource
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from opentrons.protocol_engine import EngineStatus, commands as pe_commands
+
+from robot_server.persistence import open_database
+from robot_server.runs.run_models import RunCommandSummary
+from robot_server.runs.run_store import RunResource, RunState, RunStore
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _make_commands(run_index: int, count: int) -> List[pe_commands.Command]:
+    return [
+        pe_commands.Pause(
+            id=f"command-{run_index}-{i}",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime.now(),
+            startedAt=datetime.now(),
+            completedAt=datetime.now(),
+            params=pe_commands.PauseParams(message=f"step {i}"),
+            result=pe_commands.PauseResult(),
+        )
+        for i in range(count)
+    ]
+
+
+async def _add_runs(subject: RunStore, first: int, runs: int, commands: int) -> None:
+    for run_index in range(first, first + runs):
+        run_id = f"run-{run_index}"
+        run_commands = _make_commands(run_index, commands)
+        subject.upsert(
+            RunResource(
+                run_id=run_id,
+                protocol_id=None,
+                created_at=datetime.now(),
+                actions=[],
+                is_current=True,
+            )
+        )
+        await subject.insert_state(
+            run_id=run_id,
+            state=RunState(
+                status=EngineStatus.SUCCEEDED,
+                commands=[
+                    RunCommandSummary.construct(
+                        id=c.id,
+                        commandType=c.commandType,
+                        status=c.status,
+                    )
+                    for c in run_commands
+                ],
+                errors=[],
+                labware=[],
+                pipettes=[],
+            ),
+            commands=run_commands,
+        )
+
+
+def _get_all_states(subject: RunStore, include_commands: bool) -> int:
+    count = 0
+
+    for run in subject.get_all():
+        state = subject.get_state(run.run_id, include_commands=include_commands)
+        count += len(state.commands)
+
+    return count
+
+
+async def _main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        connection = open_database(Path(directory) / "robot_server.db")
+        subject = RunStore(connection=connection)
+
+        print(f"Storing {args.runs} runs of {args.commands} commands each")
+        start_rss = _max_rss_mb()
+        batch = args.runs // 5
+
+        for first in range(0, args.runs, batch):
+            await _add_runs(
+                subject, first, min(batch, args.runs - first), args.commands
+            )
+            print(
+                f"  {min(first + batch, args.runs)} runs:"
+                f" max RSS {_max_rss_mb():.1f} MB"
+                f" (+{_max_rss_mb() - start_rss:.1f} MB)"
+            )
+
+        middle = args.runs // 2
+        start = time.perf_counter()
+        subject.get(f"run-{middle}")
+        subject.get_state(f"run-{middle}")
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        subject.get_command(f"run-{middle}", f"command-{middle}-{args.commands - 1}")
+        command = time.perf_counter() - start
+
+        start = time.perf_counter()
+        runs = len(subject.get_all())
+        listed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _get_all_states(subject, include_commands=False)
+        summaries = time.perf_counter() - start
+
+        start = time.perf_counter()
+        commands = _get_all_states(subject, include_commands=True)
+        elapsed = time.perf_counter() - start
+
+        print(f"GET /runs/{{id}} data: {single * 1000:.2f} ms")
+        print(f"GET /runs/{{id}}/commands/{{id}} data: {command * 1000:.2f} ms")
+        print(f"List of {runs} runs: {listed * 1000:.1f} ms")
+        print(f"GET /runs data for {runs} runs: {summaries * 1000:.1f} ms")
+        print(
+            f"Every run's state with its {commands} command summaries:"
+            f" {elapsed * 1000:.1f} ms"
+        )
+
+        connection.close()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=500)
+    parser.add_argument("--commands", type=int, default=100)
+    args = parser.parse_args()
+
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,9 @@ from .hardware import initialize_hardware, cleanup_hardware
 from .service import initialize_logging
 from .service.dependencies import get_protocol_manager
 from .service.legacy.rpc import cleanup_rpc_server
+from .service.notifications.dependencies import cleanup_event_fanout
+from .protocols.dependencies import cleanup_protocol_analyzer
+from .persistence import initialize_sql_connection, cleanup_sql_connection
 
 log = logging.getLogger(__name__)
 
@@ -47,6 +50,7 @@ async def on_startup() -> None:
     """Handle app startup."""
     initialize_logging()
     initialize_hardware(app.state)
+    initialize_sql_connection(app.state)
 
 
 @app.on_event("shutdown")
@@ -58,6 +62,9 @@ async def on_shutdown() -> None:
     shutdown_results = await asyncio.gather(
         cleanup_rpc_server(app.state),
         cleanup_hardware(app.state),
+        cleanup_event_fanout(app.state),
+        cleanup_protocol_analyzer(app.state),
+        cleanup_sql_connection(app.state),
         return_exceptions=True,
     )
 
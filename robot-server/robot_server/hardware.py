@@ -184,7 +184,8 @@ def _initialize_event_watchers(app_state: AppState, hardware_api: HardwareAPI) -
     """Initialize notification publishing for hardware events."""
     notify_server_settings = NotifyServerSettings()
     hw_event_publisher = publisher.create(
-        notify_server_settings.publisher_address.connection_string()
+        notify_server_settings.publisher_address.connection_string(),
+        binary=notify_server_settings.binary_frames,
     )
 
     def _publish_hardware_event(hw_event: Union[str, HardwareEvent]) -> None:
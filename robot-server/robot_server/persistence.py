@@ -0,0 +1,122 @@
+"""Durable storage of protocols, analyses and runs in a SQLite database."""
+import logging
+import sqlite3
+from pathlib import Path
+
+from fastapi import Depends
+
+from opentrons.config import infer_config_base_dir
+
+from .app_state import AppState, AppStateValue, get_app_state
+from .settings import get_settings
+
+log = logging.getLogger(__name__)
+
+_DATABASE_FILE = "robot_server.db"
+
+# Every statement is idempotent, so the schema can be created on each start.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS protocol (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    files TEXT NOT NULL,
+    pre_analysis TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS protocol_created_at ON protocol (created_at);
+
+CREATE TABLE IF NOT EXISTS analysis (
+    id TEXT PRIMARY KEY,
+    protocol_id TEXT NOT NULL,
+    analysis TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS analysis_protocol_id ON analysis (protocol_id);
+
+CREATE TABLE IF NOT EXISTS run (
+    id TEXT PRIMARY KEY,
+    protocol_id TEXT,
+    created_at TEXT NOT NULL,
+    is_current INTEGER NOT NULL,
+    actions TEXT NOT NULL,
+    state TEXT
+);
+CREATE INDEX IF NOT EXISTS run_protocol_id ON run (protocol_id);
+CREATE INDEX IF NOT EXISTS run_created_at ON run (created_at);
+
+CREATE TABLE IF NOT EXISTS run_command (
+    run_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    command_id TEXT NOT NULL,
+    command TEXT NOT NULL,
+    PRIMARY KEY (run_id, idx)
+);
+CREATE INDEX IF NOT EXISTS run_command_id ON run_command (run_id, command_id);
+"""
+
+_sql_connection = AppStateValue[sqlite3.Connection]("sql_connection")
+
+
+def get_persistence_directory() -> Path:
+    """Get the directory that the server keeps its durable data in."""
+    directory = get_settings().persistence_directory
+
+    if directory is None:
+        return infer_config_base_dir() / "robot_server"
+
+    return Path(directory)
+
+
+def open_database(path: Path) -> sqlite3.Connection:
+    """Open the database at a path, creating it and its tables if needed.
+
+    The connection may only be used by the thread that opened it.
+
+    Arguments:
+        path: The database file. Its directory must exist.
+    """
+    connection = sqlite3.connect(str(path))
+    # Write-ahead logging makes each commit cheaper, which matters on the
+    # robot's SD card.
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+def get_database_path(connection: sqlite3.Connection) -> Path:
+    """Get the file of a connection's database, to open another connection to it."""
+    _, _, path = connection.execute("PRAGMA database_list").fetchone()
+    return Path(path)
+
+
+def initialize_sql_connection(app_state: AppState) -> sqlite3.Connection:
+    """Open the server's database, if not already open.
+
+    Called on the event loop's thread at startup, so requests, which are
+    handled on that thread too, can use the connection.
+    """
+    connection = _sql_connection.get_from(app_state)
+
+    if connection is None:
+        directory = get_persistence_directory()
+        directory.mkdir(parents=True, exist_ok=True)
+        log.info(f"Storing protocols and runs in {directory}")
+        connection = open_database(directory / _DATABASE_FILE)
+        _sql_connection.set_on(app_state, connection)
+
+    return connection
+
+
+async def get_sql_connection(
+    app_state: AppState = Depends(get_app_state),
+) -> sqlite3.Connection:
+    """Get the singleton connection to the server's database."""
+    return initialize_sql_connection(app_state)
+
+
+async def cleanup_sql_connection(app_state: AppState) -> None:
+    """Close the connection to the database, if one was opened."""
+    connection = _sql_connection.get_from(app_state)
+    _sql_connection.set_on(app_state, None)
+
+    if connection is not None:
+        connection.close()
@@ -0,0 +1,85 @@
+"""Cache of protocol analysis results."""
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, Tuple
+
+from opentrons.config import feature_flags
+from opentrons.protocol_runner import ProtocolRunData
+
+DEFAULT_MAX_ENTRIES = 20
+
+
+class AnalysisCache:
+    """Keep the results of recent protocol analyses.
+
+    A result is keyed by everything that determines it: the contents of the
+    protocol's files, the robot software version, the custom labware on the
+    robot, and whether analysis runs the fast simulation. A protocol uploaded
+    again with the same key reuses the earlier result rather than being
+    simulated from scratch.
+    """
+
+    def __init__(
+        self,
+        robot_version: str,
+        custom_labware_dir: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the AnalysisCache.
+
+        Arguments:
+            robot_version: The version of the software that runs analyses.
+            custom_labware_dir: Where custom labware definitions that protocols
+                may load are kept.
+            max_entries: The most results to keep. The least recently used
+                result is dropped to make room for a new one.
+        """
+        self._robot_version = robot_version
+        self._custom_labware_dir = custom_labware_dir
+        self._max_entries = max_entries
+        self._results: "OrderedDict[str, ProtocolRunData]" = OrderedDict()
+
+    def get_key(self, files: Sequence[Path]) -> str:
+        """Get the cache key of a protocol made of the given files.
+
+        This reads the files and the custom labware, so it blocks on disk.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(f"version:{self._robot_version}\0".encode())
+        fast = not feature_flags.disable_fast_protocol_upload()
+        hasher.update(f"fast-simulation:{fast}\0".encode())
+        _hash_files(hasher, "file", ((f.name, f) for f in files))
+
+        if self._custom_labware_dir.is_dir():
+            labware = sorted(
+                (str(p.relative_to(self._custom_labware_dir)), p)
+                for p in self._custom_labware_dir.rglob("*.json")
+                if p.is_file()
+            )
+            _hash_files(hasher, "labware", labware)
+
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[ProtocolRunData]:
+        """Get a cached analysis result, if there is one."""
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+        return result
+
+    def put(self, key: str, result: ProtocolRunData) -> None:
+        """Cache an analysis result."""
+        self._results[key] = result
+        self._results.move_to_end(key)
+        while len(self._results) > self._max_entries:
+            self._results.popitem(last=False)
+
+
+def _hash_files(
+    hasher: "hashlib._Hash", kind: str, files: Iterable[Tuple[str, Path]]
+) -> None:
+    for name, path in sorted(files, key=lambda entry: entry[0]):
+        contents = path.read_bytes()
+        hasher.update(f"{kind}:{name}:{len(contents)}\0".encode())
+        hasher.update(contents)
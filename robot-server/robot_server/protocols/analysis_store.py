@@ -1,5 +1,6 @@
 """Protocol analysis storage."""
-from typing import Dict, List, Set
+import sqlite3
+from typing import Dict, List
 
 from opentrons.protocol_engine import (
     Command,
@@ -17,20 +18,28 @@ from .analysis_models import (
 
 
 class AnalysisStore:
-    """Storage interface for protocol analyses."""
+    """Storage interface for protocol analyses.
 
-    def __init__(self) -> None:
-        """Initialize the AnalysisStore's internal state."""
-        self._analysis_ids_by_protocol: Dict[str, Set[str]] = {}
-        self._analyses_by_id: Dict[str, ProtocolAnalysis] = {}
+    Completed analyses are kept in the database. Pending analyses are only
+    kept in memory, since an analysis cut short by a restart never completes.
+
+    Completed analyses are also kept in memory once stored or read, so each
+    one is validated at most once, rather than on every request for it.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """Initialize the AnalysisStore's internal state.
+
+        Arguments:
+            connection: Connection to the database to keep analyses in.
+        """
+        self._connection = connection
+        self._pending_protocol_ids: Dict[str, str] = {}
+        self._completed: Dict[str, CompletedAnalysis] = {}
 
     def add_pending(self, protocol_id: str, analysis_id: str) -> List[ProtocolAnalysis]:
         """Add a pending analysis to the store."""
-        self._analyses_by_id[analysis_id] = PendingAnalysis(id=analysis_id)
-
-        ids_for_protocol = self._analysis_ids_by_protocol.get(protocol_id, set())
-        ids_for_protocol.add(analysis_id)
-        self._analysis_ids_by_protocol[protocol_id] = ids_for_protocol
+        self._pending_protocol_ids[analysis_id] = protocol_id
 
         return self.get_by_protocol(protocol_id)
 
@@ -42,13 +51,24 @@ class AnalysisStore:
         pipettes: List[LoadedPipette],
         errors: List[ErrorOccurrence],
     ) -> None:
-        """Update analysis results in the store."""
+        """Update analysis results in the store.
+
+        Nothing is stored if the analysis is not pending, as when its
+        protocol was removed during the analysis.
+        """
+        protocol_id = self._pending_protocol_ids.pop(analysis_id, None)
+
+        if protocol_id is None:
+            return
+
         if len(errors) > 0:
             result = AnalysisResult.NOT_OK
         else:
             result = AnalysisResult.OK
 
-        self._analyses_by_id[analysis_id] = CompletedAnalysis(
+        # The results are already validated models. Validating thousands of
+        # commands again would hold up the event loop for as long as a second.
+        analysis = CompletedAnalysis.construct(
             id=analysis_id,
             result=result,
             commands=commands,
@@ -57,8 +77,58 @@ class AnalysisStore:
             errors=errors,
         )
 
+        with self._connection:
+            self._connection.execute(
+                "INSERT INTO analysis (id, protocol_id, analysis) VALUES (?, ?, ?)",
+                (analysis_id, protocol_id, analysis.json()),
+            )
+
+        self._completed[analysis_id] = analysis
+
     def get_by_protocol(self, protocol_id: str) -> List[ProtocolAnalysis]:
         """Get an analysis for a given protocol ID from the store."""
-        ids_for_protocol = self._analysis_ids_by_protocol.get(protocol_id, set())
+        rows = self._connection.execute(
+            "SELECT id FROM analysis WHERE protocol_id = ? ORDER BY rowid",
+            (protocol_id,),
+        )
+        analyses: List[ProtocolAnalysis] = [
+            self._get_completed(analysis_id) for (analysis_id,) in rows.fetchall()
+        ]
+        analyses.extend(
+            PendingAnalysis(id=analysis_id)
+            for analysis_id, pending_protocol_id in self._pending_protocol_ids.items()
+            if pending_protocol_id == protocol_id
+        )
+
+        return analyses
+
+    def remove_by_protocol(self, protocol_id: str) -> None:
+        """Remove all analyses of a given protocol ID from the store."""
+        self._pending_protocol_ids = {
+            analysis_id: pending_protocol_id
+            for analysis_id, pending_protocol_id in self._pending_protocol_ids.items()
+            if pending_protocol_id != protocol_id
+        }
+
+        rows = self._connection.execute(
+            "SELECT id FROM analysis WHERE protocol_id = ?", (protocol_id,)
+        )
+        for (analysis_id,) in rows.fetchall():
+            self._completed.pop(analysis_id, None)
+
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM analysis WHERE protocol_id = ?", (protocol_id,)
+            )
+
+    def _get_completed(self, analysis_id: str) -> CompletedAnalysis:
+        analysis = self._completed.get(analysis_id)
+
+        if analysis is None:
+            (raw,) = self._connection.execute(
+                "SELECT analysis FROM analysis WHERE id = ?", (analysis_id,)
+            ).fetchone()
+            analysis = CompletedAnalysis.parse_raw(raw)
+            self._completed[analysis_id] = analysis
 
-        return [self._analyses_by_id[analysis_id] for analysis_id in ids_for_protocol]
+        return analysis
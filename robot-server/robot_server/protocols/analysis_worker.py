@@ -0,0 +1,81 @@
+"""Analyze protocols in worker processes."""
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from opentrons.protocol_runner import (
+    ProtocolRunData,
+    ProtocolSource,
+    create_simulating_runner,
+)
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 1
+
+
+class AnalysisWorkerError(RuntimeError):
+    """Error raised when a worker process dies before finishing an analysis."""
+
+    pass
+
+
+class AnalysisWorkerPool:
+    """A pool of processes that analyze protocols.
+
+    Analysis simulates the whole protocol, which can keep a CPU busy for a long
+    time. Running it in the server's own process would starve the event loop,
+    and slow down every other request until the analysis finished.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        """Initialize the pool. Worker processes are started as they're needed.
+
+        Arguments:
+            max_workers: The most analyses to run at once.
+        """
+        self._max_workers = max_workers
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # Fork isn't safe in a process that has threads, like the server's, so
+        # spawn fresh interpreters instead.
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    async def analyze(self, protocol_source: ProtocolSource) -> ProtocolRunData:
+        """Analyze a protocol in a worker process.
+
+        Raises:
+            AnalysisWorkerError: The worker process died during the analysis.
+        """
+        executor = self._executor
+        loop = asyncio.get_running_loop()
+
+        try:
+            return await loop.run_in_executor(
+                executor, analyze_protocol, protocol_source
+            )
+        except BrokenProcessPool as e:
+            log.warning("Protocol analysis worker died; restarting worker pool.")
+            if executor is self._executor:
+                self._executor = self._create_executor()
+            raise AnalysisWorkerError("Protocol analysis worker died.") from e
+
+    def close(self) -> None:
+        """Stop the worker processes, abandoning any analyses in progress."""
+        self._executor.shutdown(wait=False)
+
+
+def analyze_protocol(protocol_source: ProtocolSource) -> ProtocolRunData:
+    """Analyze a protocol. Runs in a worker process."""
+    return asyncio.run(_analyze(protocol_source))
+
+
+async def _analyze(protocol_source: ProtocolSource) -> ProtocolRunData:
+    protocol_runner = await create_simulating_runner()
+    return await protocol_runner.run(protocol_source)
@@ -1,54 +1,88 @@
 """Protocol router dependency wire-up."""
 import logging
-from pathlib import Path
-from tempfile import gettempdir
+import sqlite3
 from fastapi import Depends
 
-from opentrons.protocol_runner import create_simulating_runner
+from opentrons import __version__
+from opentrons.config import get_opentrons_path
 
 from robot_server.app_state import AppState, AppStateValue, get_app_state
+from robot_server.persistence import get_persistence_directory, get_sql_connection
+from robot_server.settings import get_settings
 from .protocol_store import ProtocolStore
 from .protocol_analyzer import ProtocolAnalyzer
 from .analysis_store import AnalysisStore
+from .analysis_cache import AnalysisCache
+from .analysis_worker import AnalysisWorkerPool
 
 log = logging.getLogger(__name__)
 
-_PROTOCOL_STORE_DIRECTORY = Path(gettempdir()) / "opentrons-protocols"
-
 _protocol_store = AppStateValue[ProtocolStore]("protocol_store")
 _analysis_store = AppStateValue[AnalysisStore]("analysis_store")
+_protocol_analyzer = AppStateValue[ProtocolAnalyzer]("protocol_analyzer")
 
 
-def get_protocol_store(app_state: AppState = Depends(get_app_state)) -> ProtocolStore:
+async def get_protocol_store(
+    app_state: AppState = Depends(get_app_state),
+    sql_connection: sqlite3.Connection = Depends(get_sql_connection),
+) -> ProtocolStore:
     """Get a singleton ProtocolStore to keep track of created protocols."""
     protocol_store = _protocol_store.get_from(app_state)
 
     if protocol_store is None:
-        log.info(f"Storing protocols in {_PROTOCOL_STORE_DIRECTORY}")
-        protocol_store = ProtocolStore(directory=_PROTOCOL_STORE_DIRECTORY)
+        directory = get_persistence_directory() / "protocols"
+        log.info(f"Storing protocols in {directory}")
+        protocol_store = ProtocolStore(directory=directory, connection=sql_connection)
         _protocol_store.set_on(app_state, protocol_store)
 
     return protocol_store
 
 
-def get_analysis_store(app_state: AppState = Depends(get_app_state)) -> AnalysisStore:
+async def get_analysis_store(
+    app_state: AppState = Depends(get_app_state),
+    sql_connection: sqlite3.Connection = Depends(get_sql_connection),
+) -> AnalysisStore:
     """Get a singleton AnalysisStore to keep track of created analyses."""
     analysis_store = _analysis_store.get_from(app_state)
 
     if analysis_store is None:
-        analysis_store = AnalysisStore()
+        analysis_store = AnalysisStore(connection=sql_connection)
         _analysis_store.set_on(app_state, analysis_store)
 
     return analysis_store
 
 
 async def get_protocol_analyzer(
+    app_state: AppState = Depends(get_app_state),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
 ) -> ProtocolAnalyzer:
-    """Construct a ProtocolAnalyzer for a single request."""
-    protocol_runner = await create_simulating_runner()
-
-    return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
-        analysis_store=analysis_store,
-    )
+    """Get a singleton ProtocolAnalyzer to analyze protocols in worker processes."""
+    protocol_analyzer = _protocol_analyzer.get_from(app_state)
+
+    if protocol_analyzer is None:
+        settings = get_settings()
+        protocol_analyzer = ProtocolAnalyzer(
+            worker_pool=AnalysisWorkerPool(
+                max_workers=settings.protocol_analysis_max_workers
+            ),
+            analysis_cache=AnalysisCache(
+                robot_version=__version__,
+                custom_labware_dir=get_opentrons_path(
+                    "labware_user_definitions_dir_v2"
+                ),
+                max_entries=settings.protocol_analysis_cache_size,
+            ),
+            analysis_store=analysis_store,
+        )
+        _protocol_analyzer.set_on(app_state, protocol_analyzer)
+
+    return protocol_analyzer
+
+
+async def cleanup_protocol_analyzer(app_state: AppState) -> None:
+    """Stop the ProtocolAnalyzer's worker processes and remove the singleton."""
+    protocol_analyzer = _protocol_analyzer.get_from(app_state)
+    _protocol_analyzer.set_on(app_state, None)
+
+    if protocol_analyzer is not None:
+        protocol_analyzer.close()
@@ -1,8 +1,19 @@
 """Protocol analysis module."""
-from opentrons.protocol_runner import ProtocolRunner
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Dict
+from uuid import uuid4
+
+from opentrons.protocol_engine import ErrorOccurrence
+from opentrons.protocol_runner import ProtocolRunData, ProtocolSource
 
 from .protocol_store import ProtocolResource
 from .analysis_store import AnalysisStore
+from .analysis_cache import AnalysisCache
+from .analysis_worker import AnalysisWorkerPool, AnalysisWorkerError
+
+log = logging.getLogger(__name__)
 
 
 class ProtocolAnalyzer:
@@ -10,21 +21,112 @@ class ProtocolAnalyzer:
 
     def __init__(
         self,
-        protocol_runner: ProtocolRunner,
+        worker_pool: AnalysisWorkerPool,
+        analysis_cache: AnalysisCache,
         analysis_store: AnalysisStore,
     ) -> None:
         """Initialize the analyzer and its dependencies."""
-        self._protocol_runner = protocol_runner
+        self._worker_pool = worker_pool
+        self._analysis_cache = analysis_cache
         self._analysis_store = analysis_store
+        self._in_progress: Dict[str, "asyncio.Future[ProtocolRunData]"] = {}
+
+    async def get_cache_key(self, protocol_resource: ProtocolResource) -> str:
+        """Get the key of a given protocol's analysis in the cache.
+
+        Computing the key reads the protocol's files and the custom labware,
+        so it's done on a worker thread rather than the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._analysis_cache.get_key, protocol_resource.files
+        )
+
+    def analyze_from_cache(self, cache_key: str, analysis_id: str) -> bool:
+        """Store the cached analysis of a protocol, if there is one.
+
+        Arguments:
+            cache_key: The protocol's key, from `get_cache_key`.
+            analysis_id: The ID of the analysis to store.
+
+        Returns:
+            Whether the analysis was cached and has been stored.
+        """
+        result = self._analysis_cache.get(cache_key)
+
+        if result is None:
+            return False
+
+        self._store(analysis_id, result)
+        return True
 
     async def analyze(
         self,
         protocol_resource: ProtocolResource,
         analysis_id: str,
+        cache_key: str,
     ) -> None:
-        """Analyze a given protocol, storing the analysis when complete."""
-        result = await self._protocol_runner.run(protocol_resource)
+        """Analyze a given protocol, storing the analysis when complete.
+
+        Arguments:
+            protocol_resource: The protocol to analyze.
+            analysis_id: The ID of the analysis to store.
+            cache_key: The protocol's key, from `get_cache_key`.
+        """
+        result = self._analysis_cache.get(cache_key)
+
+        if result is None:
+            try:
+                result = await self._analyze_once(cache_key, protocol_resource)
+            except AnalysisWorkerError as e:
+                result = ProtocolRunData(
+                    commands=[],
+                    labware=[],
+                    pipettes=[],
+                    errors=[
+                        ErrorOccurrence(
+                            id=str(uuid4()),
+                            errorType=type(e).__name__,
+                            createdAt=datetime.now(tz=timezone.utc),
+                            detail=str(e),
+                        )
+                    ],
+                )
+
+        self._store(analysis_id, result)
+
+    async def _analyze_once(
+        self,
+        key: str,
+        protocol_resource: ProtocolResource,
+    ) -> ProtocolRunData:
+        # Identical protocols uploaded while one is being analyzed share that
+        # analysis rather than each starting their own.
+        future = self._in_progress.get(key)
+
+        if future is None:
+            # Send the worker only what it needs to run the protocol.
+            protocol_source = ProtocolSource(
+                files=protocol_resource.files,
+                pre_analysis=protocol_resource.pre_analysis,
+            )
+            future = asyncio.ensure_future(self._worker_pool.analyze(protocol_source))
+            self._in_progress[key] = future
+
+            def _done(f: "asyncio.Future[ProtocolRunData]") -> None:
+                del self._in_progress[key]
+                if not f.cancelled() and f.exception() is None:
+                    self._analysis_cache.put(key, f.result())
+
+            future.add_done_callback(_done)
+
+        return await asyncio.shield(future)
+
+    def close(self) -> None:
+        """Stop the analysis worker processes."""
+        self._worker_pool.close()
 
+    def _store(self, analysis_id: str, result: ProtocolRunData) -> None:
         self._analysis_store.update(
             analysis_id=analysis_id,
             commands=result.commands,
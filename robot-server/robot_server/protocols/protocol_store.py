@@ -1,11 +1,14 @@
 """Methods for saving and retrieving protocol files."""
+import json
+import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
 from fastapi import UploadFile
 from logging import getLogger
 from pathlib import Path
-from typing import Dict, List, Sequence, Union
+from typing import Any, Dict, List, Sequence, Union
 
+from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocol_runner import ProtocolSource
 from opentrons.protocol_runner.pre_analysis import JsonPreAnalysis, PythonPreAnalysis
 
@@ -40,17 +43,15 @@ class ProtocolFileInvalidError(ValueError):
 class ProtocolStore:
     """Methods for storing and retrieving protocol files."""
 
-    def __init__(self, directory: Path) -> None:
+    def __init__(self, directory: Path, connection: sqlite3.Connection) -> None:
         """Initialize the ProtocolStore.
 
         Arguments:
             directory: Directory in which to place created files.
-
-            pre_analyzer: Called to extract basic info from protocols when they are
-            `create()`ed.
+            connection: Connection to the database to keep protocols in.
         """
         self._directory = directory
-        self._protocols_by_id: Dict[str, ProtocolResource] = {}
+        self._connection = connection
 
     async def create(
         self,
@@ -90,27 +91,49 @@ class ProtocolStore:
             files=saved_files,
         )
 
-        self._protocols_by_id[protocol_id] = entry
+        with self._connection:
+            self._connection.execute(
+                "INSERT INTO protocol (id, created_at, files, pre_analysis)"
+                " VALUES (?, ?, ?, ?)",
+                (
+                    protocol_id,
+                    created_at.isoformat(),
+                    json.dumps([f.name for f in saved_files]),
+                    json.dumps(_pre_analysis_to_dict(pre_analysis), default=str),
+                ),
+            )
 
         return entry
 
     def get(self, protocol_id: str) -> ProtocolResource:
         """Get a single protocol by ID."""
-        try:
-            return self._protocols_by_id[protocol_id]
-        except KeyError as e:
-            raise ProtocolNotFoundError(protocol_id) from e
+        row = self._connection.execute(
+            "SELECT id, created_at, files, pre_analysis FROM protocol WHERE id = ?",
+            (protocol_id,),
+        ).fetchone()
+
+        if row is None:
+            raise ProtocolNotFoundError(protocol_id)
+
+        return self._to_resource(row)
 
     def get_all(self) -> List[ProtocolResource]:
-        """Get all protocols currently saved in this store."""
-        return list(self._protocols_by_id.values())
+        """Get all protocols currently saved in this store, oldest first."""
+        rows = self._connection.execute(
+            "SELECT id, created_at, files, pre_analysis FROM protocol"
+            " ORDER BY created_at, rowid"
+        )
+
+        return [self._to_resource(row) for row in rows]
 
     def remove(self, protocol_id: str) -> ProtocolResource:
         """Remove a protocol from the store."""
-        try:
-            entry = self._protocols_by_id.pop(protocol_id)
-        except KeyError as e:
-            raise ProtocolNotFoundError(protocol_id) from e
+        entry = self.get(protocol_id)
+
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM protocol WHERE id = ?", (protocol_id,)
+            )
 
         try:
             for file_path in entry.files:
@@ -126,3 +149,45 @@ class ProtocolStore:
 
     def _get_protocol_dir(self, protocol_id: str) -> Path:
         return self._directory / protocol_id
+
+    def _to_resource(self, row: Any) -> ProtocolResource:
+        protocol_id, created_at, files, pre_analysis = row
+        protocol_dir = self._get_protocol_dir(protocol_id)
+
+        return ProtocolResource(
+            protocol_id=protocol_id,
+            created_at=datetime.fromisoformat(created_at),
+            files=[protocol_dir / name for name in json.loads(files)],
+            pre_analysis=_pre_analysis_from_dict(json.loads(pre_analysis)),
+        )
+
+
+def _pre_analysis_to_dict(
+    pre_analysis: Union[JsonPreAnalysis, PythonPreAnalysis]
+) -> Dict[str, Any]:
+    if isinstance(pre_analysis, JsonPreAnalysis):
+        return {
+            "protocolType": "json",
+            "schemaVersion": pre_analysis.schema_version,
+            "metadata": pre_analysis.metadata,
+        }
+
+    return {
+        "protocolType": "python",
+        "apiVersion": str(pre_analysis.api_version),
+        "metadata": pre_analysis.metadata,
+    }
+
+
+def _pre_analysis_from_dict(
+    data: Dict[str, Any]
+) -> Union[JsonPreAnalysis, PythonPreAnalysis]:
+    if data["protocolType"] == "json":
+        return JsonPreAnalysis(
+            schema_version=data["schemaVersion"], metadata=data["metadata"]
+        )
+
+    return PythonPreAnalysis(
+        api_version=APIVersion.from_string(data["apiVersion"]),
+        metadata=data["metadata"],
+    )
@@ -75,8 +75,8 @@ async def create_protocol(
     Arguments:
         files: List of uploaded files, from form-data.
         response_builder: Interface to construct response models.
-        protocol_store: In-memory database of protocol resources.
-        analysis_store: In-memory database of protocol analyses.
+        protocol_store: Database of protocol resources.
+        analysis_store: Database of protocol analyses.
         pre_analyzer: Protocol pre-analysis interface.
         protocol_analyzer: Protocol analysis interface.
         task_runner: Background task runner.
@@ -126,15 +126,26 @@ async def create_protocol(
     except ProtocolFileInvalidError as e:
         raise ProtocolFileInvalid(detail=str(e)).as_error(status.HTTP_400_BAD_REQUEST)
 
-    task_runner.run(
-        protocol_analyzer.analyze,
-        protocol_resource=protocol_resource,
-        analysis_id=analysis_id,
-    )
     analyses = analysis_store.add_pending(
         protocol_id=protocol_id,
         analysis_id=analysis_id,
     )
+
+    # A protocol that's been analyzed before doesn't need to wait for analysis.
+    cache_key = await protocol_analyzer.get_cache_key(protocol_resource)
+
+    if protocol_analyzer.analyze_from_cache(
+        cache_key=cache_key,
+        analysis_id=analysis_id,
+    ):
+        analyses = analysis_store.get_by_protocol(protocol_id=protocol_id)
+    else:
+        task_runner.run(
+            protocol_analyzer.analyze,
+            protocol_resource=protocol_resource,
+            analysis_id=analysis_id,
+            cache_key=cache_key,
+        )
     data = response_builder.build(resource=protocol_resource, analyses=analyses)
 
     # todo(mm, 2021-09-14): Do we need to close the UploadFiles in our `files` arg?
@@ -157,8 +168,8 @@ async def get_protocols(
 
     Arguments:
         response_builder: Interface to construct response models.
-        protocol_store: In-memory database of protocol resources.
-        analysis_store: In-memory database of protocol analyses.
+        protocol_store: Database of protocol resources.
+        analysis_store: Database of protocol analyses.
     """
     protocol_resources = protocol_store.get_all()
     data = [
@@ -192,8 +203,8 @@ async def get_protocol_by_id(
     Arguments:
         protocolId: Protocol identifier to fetch, pulled from URL.
         response_builder: Interface to construct response models.
-        protocol_store: In-memory database of protocol resources.
-        analysis_store: In-memory database of protocol analyses.
+        protocol_store: Database of protocol resources.
+        analysis_store: Database of protocol analyses.
     """
     try:
         resource = protocol_store.get(protocol_id=protocolId)
@@ -219,12 +230,14 @@ async def get_protocol_by_id(
 async def delete_protocol_by_id(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_store: AnalysisStore = Depends(get_analysis_store),
 ) -> EmptyResponseModel[None]:
     """Delete an uploaded protocol by ID.
 
     Arguments:
         protocolId: Protocol identifier to delete, pulled from URL.
-        protocol_store: In-memory database of protocol resources.
+        protocol_store: Database of protocol resources.
+        analysis_store: Database of protocol analyses.
     """
     try:
         protocol_store.remove(protocol_id=protocolId)
@@ -232,4 +245,6 @@ async def delete_protocol_by_id(
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
+    analysis_store.remove_by_protocol(protocol_id=protocolId)
+
     return EmptyResponseModel(links=None)
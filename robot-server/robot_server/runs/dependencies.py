@@ -1,10 +1,13 @@
 """Run router dependency-injection wire-up."""
+import sqlite3
+
 from fastapi import Depends
 
 from opentrons.hardware_control import API as HardwareAPI
 
 from robot_server.app_state import AppState, AppStateValue, get_app_state
 from robot_server.hardware import get_hardware
+from robot_server.persistence import get_sql_connection
 
 from .engine_store import EngineStore
 from .run_store import RunStore
@@ -14,26 +17,30 @@ _run_store = AppStateValue[RunStore]("run_store")
 _engine_store = AppStateValue[EngineStore]("engine_store")
 
 
-def get_run_store(app_state: AppState = Depends(get_app_state)) -> RunStore:
+async def get_run_store(
+    app_state: AppState = Depends(get_app_state),
+    sql_connection: sqlite3.Connection = Depends(get_sql_connection),
+) -> RunStore:
     """Get a singleton RunStore to keep track of created runs."""
     run_store = _run_store.get_from(app_state)
 
     if run_store is None:
-        run_store = RunStore()
+        run_store = RunStore(connection=sql_connection)
         _run_store.set_on(app_state, run_store)
 
     return run_store
 
 
-def get_engine_store(
+async def get_engine_store(
     app_state: AppState = Depends(get_app_state),
     hardware_api: HardwareAPI = Depends(get_hardware),
+    run_store: RunStore = Depends(get_run_store),
 ) -> EngineStore:
     """Get a singleton EngineStore to keep track of created engines / runners."""
     engine_store = _engine_store.get_from(app_state)
 
     if engine_store is None:
-        engine_store = EngineStore(hardware_api=hardware_api)
+        engine_store = EngineStore(hardware_api=hardware_api, run_store=run_store)
         _engine_store.set_on(app_state, engine_store)
 
     return engine_store
@@ -1,10 +1,18 @@
 """In-memory storage of ProtocolEngine instances."""
-from typing import Dict, NamedTuple, Optional
+from typing import NamedTuple, Optional
 
 from opentrons.hardware_control import API as HardwareAPI
-from opentrons.protocol_engine import ProtocolEngine, StateView, create_protocol_engine
+from opentrons.protocol_engine import (
+    ProtocolEngine,
+    StateView,
+    create_protocol_engine,
+)
 from opentrons.protocol_runner import ProtocolRunner
 
+from .event_log import RunEventLog
+from .run_models import get_command_summary
+from .run_store import RunStore, RunState
+
 
 class EngineMissingError(RuntimeError):
     """An error raised if the engine somehow hasn't been initialized.
@@ -24,24 +32,42 @@ class EngineConflictError(RuntimeError):
 class RunnerEnginePair(NamedTuple):
     """A stored ProtocolRunner/ProtocolEngine pair."""
 
+    run_id: str
     runner: ProtocolRunner
     engine: ProtocolEngine
+    event_log: RunEventLog
+
+
+def get_run_state(state_view: StateView) -> RunState:
+    """Summarize the state of a run's ProtocolEngine."""
+    return RunState(
+        status=state_view.commands.get_status(),
+        commands=[get_command_summary(c) for c in state_view.commands.get_all()],
+        errors=state_view.commands.get_all_errors(),
+        pipettes=state_view.pipettes.get_all(),
+        labware=state_view.labware.get_all(),
+    )
 
 
 # TODO(mc, 2021-05-28): evaluate multi-engine logic, which this does not support
 class EngineStore:
-    """Factory and in-memory storage for ProtocolEngine."""
+    """Factory and in-memory storage for ProtocolEngine.
+
+    Only the current run's engine is kept. When a run stops being current,
+    its final state is moved to the RunStore and its engine is dropped.
+    """
 
-    def __init__(self, hardware_api: HardwareAPI) -> None:
+    def __init__(self, hardware_api: HardwareAPI, run_store: RunStore) -> None:
         """Initialize an engine storage interface.
 
         Arguments:
             hardware_api: Hardware control API instance used for ProtocolEngine
                 construction.
+            run_store: Run storage to keep the final state of each run in.
         """
         self._hardware_api = hardware_api
+        self._run_store = run_store
         self._runner_engine_pair: Optional[RunnerEnginePair] = None
-        self._engines_by_run_id: Dict[str, ProtocolEngine] = {}
 
     @property
     def engine(self) -> ProtocolEngine:
@@ -82,13 +108,21 @@ class EngineStore:
         """
         engine = await create_protocol_engine(hardware_api=self._hardware_api)
         runner = ProtocolRunner(protocol_engine=engine, hardware_api=self._hardware_api)
+        event_log = RunEventLog()
+        engine.add_plugin(event_log)
 
         if self._runner_engine_pair is not None:
             if not self.engine.state_view.commands.get_is_stopped():
                 raise EngineConflictError("Current run is not stopped.")
 
-        self._runner_engine_pair = RunnerEnginePair(runner=runner, engine=engine)
-        self._engines_by_run_id[run_id] = engine
+            await self._archive(self._runner_engine_pair)
+
+        self._runner_engine_pair = RunnerEnginePair(
+            run_id=run_id,
+            runner=runner,
+            engine=engine,
+            event_log=event_log,
+        )
 
         return engine.state_view
 
@@ -99,14 +133,34 @@ class EngineStore:
             run_id: The run resource to retrieve engine state from.
 
         Raises:
-            EngineMissingError: No engine found for the given run ID.
+            EngineMissingError: The run is not the current run, so its engine
+                is gone. Its final state is in the RunStore.
         """
-        try:
-            return self._engines_by_run_id[run_id].state_view
-        except KeyError:
+        pair = self._runner_engine_pair
+
+        if pair is None or pair.run_id != run_id:
             raise EngineMissingError(f"No engine state found for run {run_id}")
 
-    def clear(self) -> None:
+        return pair.engine.state_view
+
+    def get_event_log(self, run_id: str) -> RunEventLog:
+        """Get the log of a run's command and status changes.
+
+        Args:
+            run_id: The run resource to retrieve the event log of.
+
+        Raises:
+            EngineMissingError: The run is not the current run, so its engine
+                is gone, along with its event log.
+        """
+        pair = self._runner_engine_pair
+
+        if pair is None or pair.run_id != run_id:
+            raise EngineMissingError(f"No engine state found for run {run_id}")
+
+        return pair.event_log
+
+    async def clear(self) -> None:
         """Remove the persisted ProtocolEngine, if present, no-op otherwise.
 
         Raises:
@@ -117,4 +171,17 @@ class EngineStore:
             if not self.engine.state_view.commands.get_is_stopped():
                 raise EngineConflictError("Current run is not stopped.")
 
+            await self._archive(self._runner_engine_pair)
+
         self._runner_engine_pair = None
+
+    async def _archive(self, pair: RunnerEnginePair) -> None:
+        # The run's engine is kept until its state is stored, so the run can
+        # be read in the meantime.
+        state_view = pair.engine.state_view
+        await self._run_store.insert_state(
+            run_id=pair.run_id,
+            state=get_run_state(state_view),
+            commands=state_view.commands.get_all(),
+        )
+        pair.event_log.close()
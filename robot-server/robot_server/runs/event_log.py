@@ -0,0 +1,123 @@
+"""A log of a run's command and status changes, for streaming to clients."""
+from typing import AsyncIterator, Dict, List, Optional
+
+from opentrons.protocol_engine import (
+    AbstractPlugin,
+    EngineStatus,
+    actions as pe_actions,
+)
+from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
+
+from .event_models import CommandUpdated, Resync, StatusUpdated
+from .run_models import get_command_summary
+
+
+class RunEventLog(AbstractPlugin):
+    """ProtocolEngine plugin that logs a run's changes as small events.
+
+    While handling an action, the plugin only notes which command the action
+    is about. Events are built from the engine's state, and serialized, the
+    next time a client reads the log, so the log costs almost nothing while
+    nobody is reading it. A command that changed several times between two
+    reads gets a single event with its latest summary.
+
+    Events are kept, in order, for as long as the run is current, so a client
+    can resume the stream from the last event it received.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the log with no events."""
+        self._events: List[str] = []
+        # dict, rather than set, to keep commands in the order they changed
+        self._changed_command_ids: Dict[str, None] = {}
+        self._status: Optional[EngineStatus] = None
+        self._change_notifier = ChangeNotifier()
+        self._closed = False
+
+    def setup(self) -> None:
+        """Log the run's initial status."""
+        self._flush()
+
+    def handle_action(self, action: pe_actions.Action) -> None:
+        """Note the command an action changes and wake waiting readers."""
+        if isinstance(action, pe_actions.QueueCommandAction):
+            self._changed_command_ids[action.command_id] = None
+        elif isinstance(action, pe_actions.UpdateCommandAction):
+            self._changed_command_ids[action.command.id] = None
+        elif isinstance(action, pe_actions.FailCommandAction):
+            self._changed_command_ids[action.command_id] = None
+
+        # Any action may change the run's status. By the time a woken reader
+        # runs, the StateStore has handled this action and the rest of its batch.
+        self._change_notifier.notify()
+
+    def close(self) -> None:
+        """Stop logging, ending every stream of the log.
+
+        Streams still get the events of any changes they haven't read yet.
+        """
+        self._closed = True
+        self._change_notifier.notify()
+
+    async def get_events(self, cursor: int) -> List[str]:
+        """Get serialized events, waiting for new ones if necessary.
+
+        Arguments:
+            cursor: Position of the first event to get.
+
+        Returns:
+            Every event from the cursor on. Only empty if the log is closed.
+        """
+        while True:
+            self._flush()
+
+            if cursor < len(self._events) or self._closed:
+                return self._events[cursor:]
+
+            await self._change_notifier.wait()
+
+    async def stream(self, cursor: int) -> AsyncIterator[str]:
+        """Stream serialized events until the log is closed.
+
+        Arguments:
+            cursor: Position of the first event to stream. If the log does
+                not reach this position, a resync event is sent, followed
+                by every event from the start of the log.
+        """
+        self._flush()
+
+        if cursor > len(self._events):
+            yield Resync().json()
+            cursor = 0
+
+        while True:
+            events = await self.get_events(cursor)
+
+            if len(events) == 0:
+                return
+
+            for event in events:
+                yield event
+
+            cursor += len(events)
+
+    def _flush(self) -> None:
+        changed_command_ids = self._changed_command_ids
+        self._changed_command_ids = {}
+
+        for command_id in changed_command_ids:
+            command = self.state.commands.get(command_id)
+            self._events.append(
+                CommandUpdated(
+                    cursor=len(self._events),
+                    command=get_command_summary(command),
+                ).json()
+            )
+
+        status = self.state.commands.get_status()
+
+        if status != self._status:
+            self._status = status
+            self._events.append(
+                StatusUpdated(cursor=len(self._events), status=status).json()
+            )
@@ -0,0 +1,54 @@
+"""Models for the events streamed from a run as it changes."""
+from pydantic import BaseModel, Field
+from typing_extensions import Literal
+
+from opentrons.protocol_engine import EngineStatus
+
+from .run_models import RunCommandSummary
+
+
+class CommandUpdated(BaseModel):
+    """A command was added to the run or changed status."""
+
+    eventType: Literal["commandUpdated"] = "commandUpdated"
+    cursor: int = Field(
+        ...,
+        description=(
+            "Position of this event in the run's event stream."
+            " To resume the stream after this event, reconnect with a cursor"
+            " one greater."
+        ),
+    )
+    command: RunCommandSummary = Field(
+        ...,
+        description=(
+            "The command's summary, as of when the event was sent."
+            " A command that is new to the client should be appended"
+            " to the run's command list."
+        ),
+    )
+
+
+class StatusUpdated(BaseModel):
+    """The run's status changed."""
+
+    eventType: Literal["statusUpdated"] = "statusUpdated"
+    cursor: int = Field(
+        ...,
+        description=(
+            "Position of this event in the run's event stream."
+            " To resume the stream after this event, reconnect with a cursor"
+            " one greater."
+        ),
+    )
+    status: EngineStatus = Field(..., description="The run's new status.")
+
+
+class Resync(BaseModel):
+    """The requested cursor is not part of the run's event stream.
+
+    Any state the client built from earlier events should be discarded.
+    The stream continues from the run's first event.
+    """
+
+    eventType: Literal["resync"] = "resync"
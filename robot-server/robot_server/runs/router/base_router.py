@@ -2,7 +2,7 @@
 
 Contains routes dealing primarily with `Run` models.
 """
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from datetime import datetime
 from pydantic import BaseModel, Field
 from typing import Optional, Union
@@ -10,6 +10,11 @@ from typing_extensions import Literal
 
 from robot_server.errors import ErrorDetails, ErrorResponse
 from robot_server.service.dependencies import get_current_time, get_unique_id
+from robot_server.service.etag import (
+    NOT_MODIFIED_RESPONSE,
+    get_if_none_match,
+    get_not_modified_response,
+)
 from robot_server.service.task_runner import TaskRunner
 from robot_server.service.json_api import (
     RequestModel,
@@ -26,10 +31,15 @@ from robot_server.protocols import (
     get_protocol_store,
 )
 
-from ..run_store import RunStore, RunResource, RunNotFoundError
+from ..run_store import RunStore, RunResource, RunState, RunNotFoundError
 from ..run_view import RunView
-from ..run_models import Run, RunCreate, RunUpdate, RunCommandSummary
-from ..engine_store import EngineStore, EngineConflictError
+from ..run_models import Run, RunSummary, RunCreate, RunUpdate, RunCommandSummary
+from ..engine_store import (
+    EngineStore,
+    EngineConflictError,
+    EngineMissingError,
+    get_run_state,
+)
 from ..dependencies import get_run_store, get_engine_store
 
 base_router = APIRouter()
@@ -76,6 +86,81 @@ class AllRunsLinks(BaseModel):
     )
 
 
+def _get_state(
+    run_id: str,
+    engine_store: EngineStore,
+    run_store: RunStore,
+    include_commands: bool = True,
+) -> RunState:
+    """Get the state of a run from its engine or, if it's done, from storage."""
+    try:
+        engine_state = engine_store.get_state(run_id)
+    except EngineMissingError:
+        return run_store.get_state(run_id, include_commands=include_commands)
+
+    return get_run_state(engine_state)
+
+
+def get_run_etag(run: RunResource, engine_store: EngineStore) -> str:
+    """Get an entity tag that changes whenever a run's response data may change.
+
+    Computing the tag is cheap, so polling clients can be told that nothing
+    changed without building the run's command summaries.
+    """
+    try:
+        version = str(engine_store.get_state(run.run_id).get_version())
+    except EngineMissingError:
+        # A run's stored state never changes once its engine is gone.
+        version = "stored"
+
+    return f'"{run.run_id}-{int(run.is_current)}-{len(run.actions)}-{version}"'
+
+
+async def get_run_resource(
+    runId: str,
+    run_store: RunStore = Depends(get_run_store),
+) -> RunResource:
+    """Get a run's stored resource by its ID, without building its response data.
+
+    Args:
+        runId: Run ID pulled from URL.
+        run_store: Run storage interface.
+    """
+    try:
+        return run_store.get(run_id=runId)
+    except RunNotFoundError as e:
+        raise RunNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
+
+
+def _build_run_summary(run: RunResource, state: RunState) -> RunSummary:
+    return RunSummary(
+        id=run.run_id,
+        protocolId=run.protocol_id,
+        createdAt=run.created_at,
+        current=run.is_current,
+        actions=run.actions,
+        errors=state.errors,
+        pipettes=state.pipettes,
+        labware=state.labware,
+        status=state.status,
+    )
+
+
+def _build_run(run: RunResource, state: RunState) -> Run:
+    return Run(
+        id=run.run_id,
+        protocolId=run.protocol_id,
+        createdAt=run.created_at,
+        current=run.is_current,
+        actions=run.actions,
+        commands=state.commands,
+        errors=state.errors,
+        pipettes=state.pipettes,
+        labware=state.labware,
+        status=state.status,
+    )
+
+
 @base_router.post(
     path="/runs",
     summary="Create a run",
@@ -160,14 +245,17 @@ async def create_run(
 @base_router.get(
     path="/runs",
     summary="Get all runs",
-    description="Get a list of all active and inactive runs.",
+    description=(
+        "Get a list of all active and inactive runs, without their commands."
+        " Use `GET /runs/{runId}/commands` to get a run's commands."
+    ),
     status_code=status.HTTP_200_OK,
-    response_model=MultiResponseModel[Run, AllRunsLinks],
+    response_model=MultiResponseModel[RunSummary, AllRunsLinks],
 )
 async def get_runs(
     run_store: RunStore = Depends(get_run_store),
     engine_store: EngineStore = Depends(get_engine_store),
-) -> MultiResponseModel[Run, AllRunsLinks]:
+) -> MultiResponseModel[RunSummary, AllRunsLinks]:
     """Get all runs.
 
     Args:
@@ -178,30 +266,8 @@ async def get_runs(
     links = AllRunsLinks()
 
     for run in run_store.get_all():
-        run_id = run.run_id
-        engine_state = engine_store.get_state(run_id)
-        run_data = Run(
-            id=run_id,
-            protocolId=run.protocol_id,
-            createdAt=run.created_at,
-            current=run.is_current,
-            actions=run.actions,
-            commands=[
-                RunCommandSummary(
-                    id=c.id,
-                    commandType=c.commandType,
-                    status=c.status,
-                    errorId=c.errorId,
-                )
-                for c in engine_state.commands.get_all()
-            ],
-            errors=engine_state.commands.get_all_errors(),
-            pipettes=engine_state.pipettes.get_all(),
-            labware=engine_state.labware.get_all(),
-            status=engine_state.commands.get_status(),
-        )
-
-        data.append(run_data)
+        state = _get_state(run.run_id, engine_store, run_store, include_commands=False)
+        data.append(_build_run_summary(run, state))
 
         if run.is_current:
             links.current = ResourceLink(href=f"/runs/{run.run_id}")
@@ -215,17 +281,24 @@ async def get_runs(
     description="Get a specific run by its unique identifier.",
     status_code=status.HTTP_200_OK,
     response_model=ResponseModel[Run, None],
-    responses={status.HTTP_404_NOT_FOUND: {"model": ErrorResponse[RunNotFound]}},
+    responses={
+        status.HTTP_304_NOT_MODIFIED: NOT_MODIFIED_RESPONSE,
+        status.HTTP_404_NOT_FOUND: {"model": ErrorResponse[RunNotFound]},
+    },
 )
 async def get_run(
     runId: str,
+    response: Response,
+    if_none_match: Optional[str] = Depends(get_if_none_match),
     run_store: RunStore = Depends(get_run_store),
     engine_store: EngineStore = Depends(get_engine_store),
-) -> ResponseModel[Run, None]:
+) -> Union[ResponseModel[Run, None], Response]:
     """Get a run by its ID.
 
     Args:
         runId: Run ID pulled from URL.
+        response: Response to set the run's ETag header on.
+        if_none_match: The ETag of the client's copy of the run, if any.
         run_store: Run storage interface.
         engine_store: ProtocolEngine storage and control.
     """
@@ -234,29 +307,18 @@ async def get_run(
     except RunNotFoundError as e:
         raise RunNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
-    engine_state = engine_store.get_state(run.run_id)
-
-    data = Run(
-        id=run.run_id,
-        protocolId=run.protocol_id,
-        createdAt=run.created_at,
-        current=run.is_current,
-        actions=run.actions,
-        commands=[
-            RunCommandSummary(
-                id=c.id,
-                commandType=c.commandType,
-                status=c.status,
-                errorId=c.errorId,
-            )
-            for c in engine_state.commands.get_all()
-        ],
-        errors=engine_state.commands.get_all_errors(),
-        pipettes=engine_state.pipettes.get_all(),
-        labware=engine_state.labware.get_all(),
-        status=engine_state.commands.get_status(),
+    not_modified = get_not_modified_response(
+        response=response,
+        etag=get_run_etag(run, engine_store),
+        if_none_match=if_none_match,
     )
 
+    if not_modified is not None:
+        return not_modified
+
+    state = _get_state(run.run_id, engine_store, run_store)
+    data = _build_run(run, state)
+
     return ResponseModel(data=data, links=None)
 
 
@@ -281,7 +343,7 @@ async def remove_run(
         engine_store: ProtocolEngine storage and control.
     """
     try:
-        engine_store.clear()
+        await engine_store.clear()
     except EngineConflictError:
         raise RunNotIdle().as_error(status.HTTP_409_CONFLICT)
 
@@ -337,33 +399,13 @@ async def update_run(
         run = run_view.with_update(run=run, update=update)
 
         try:
-            engine_store.clear()
+            await engine_store.clear()
         except EngineConflictError:
             raise RunNotIdle().as_error(status.HTTP_409_CONFLICT)
 
         run_store.upsert(run)
 
-    engine_state = engine_store.get_state(run.run_id)
-
-    data = Run(
-        id=run.run_id,
-        protocolId=run.protocol_id,
-        createdAt=run.created_at,
-        current=run.is_current,
-        actions=run.actions,
-        commands=[
-            RunCommandSummary(
-                id=c.id,
-                commandType=c.commandType,
-                status=c.status,
-                errorId=c.errorId,
-            )
-            for c in engine_state.commands.get_all()
-        ],
-        errors=engine_state.commands.get_all_errors(),
-        pipettes=engine_state.pipettes.get_all(),
-        labware=engine_state.labware.get_all(),
-        status=engine_state.commands.get_status(),
-    )
+    state = _get_state(run.run_id, engine_store, run_store)
+    data = _build_run(run, state)
 
     return ResponseModel(data=data, links=None)
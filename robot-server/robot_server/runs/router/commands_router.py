@@ -1,21 +1,28 @@
 """Router for /runs commands endpoints."""
-from fastapi import APIRouter, Depends, status
-from typing import Union
+from fastapi import APIRouter, Depends, Query, Response, status
+from typing import List, Optional, Union
 from typing_extensions import Literal
 
 from opentrons.protocol_engine import commands as pe_commands, errors as pe_errors
 
 from robot_server.errors import ErrorDetails, ErrorResponse
+from robot_server.service.etag import (
+    NOT_MODIFIED_RESPONSE,
+    get_if_none_match,
+    get_not_modified_response,
+)
 from robot_server.service.json_api import (
     RequestModel,
     ResponseModel,
-    MultiResponseModel,
+    MultiResponseMeta,
+    PaginatedResponseModel,
 )
 
-from ..run_models import Run, RunCommandSummary
-from ..engine_store import EngineStore
-from ..dependencies import get_engine_store
-from .base_router import RunNotFound, RunStopped, get_run
+from ..run_models import RunCommandSummary, get_command_summary
+from ..run_store import RunStore, RunResource
+from ..engine_store import EngineStore, EngineMissingError
+from ..dependencies import get_engine_store, get_run_store
+from .base_router import RunNotFound, RunStopped, get_run_etag, get_run_resource
 
 commands_router = APIRouter()
 
@@ -45,7 +52,7 @@ class CommandNotFound(ErrorDetails):
 async def create_run_command(
     request_body: RequestModel[pe_commands.CommandCreate],
     engine_store: EngineStore = Depends(get_engine_store),
-    run: ResponseModel[Run, None] = Depends(get_run),
+    run: RunResource = Depends(get_run_resource),
 ) -> ResponseModel[pe_commands.Command, None]:
     """Enqueue a protocol command.
 
@@ -54,12 +61,11 @@ async def create_run_command(
             to enqueue.
         engine_store: Used to retrieve the `ProtocolEngine` on which the new
             command will be enqueued.
-        run: Run response model, provided by the route handler for
-            `GET /runs/{runId}`. Present to ensure 404 if run
-            not found.
+        run: Run resource, provided by `get_run_resource`.
+            Present to ensure 404 if run not found.
     """
-    if not run.data.current:
-        raise RunStopped(detail=f"Run {run.data.id} is not the current run").as_error(
+    if not run.is_current:
+        raise RunStopped(detail=f"Run {run.run_id} is not the current run").as_error(
             status.HTTP_400_BAD_REQUEST
         )
 
@@ -74,24 +80,90 @@ async def create_run_command(
         "Get a list of all commands in the run and their statuses. "
         "This endpoint returns command summaries. Use "
         "`GET /runs/{runId}/commands/{commandId}` to get all "
-        "information available for a given command."
+        "information available for a given command.\n\n"
+        "Commands keep their place in the list once added, and a command "
+        "that has succeeded or failed never changes again. To poll for "
+        "updates, pass the index of the first command you have not yet seen "
+        "complete as `cursor`, along with the ETag of your last response "
+        "as `If-None-Match`."
     ),
     status_code=status.HTTP_200_OK,
-    response_model=MultiResponseModel[RunCommandSummary, None],
+    response_model=PaginatedResponseModel[RunCommandSummary, None],
     responses={
+        status.HTTP_304_NOT_MODIFIED: NOT_MODIFIED_RESPONSE,
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse[RunNotFound]},
     },
 )
 async def get_run_commands(
-    run: ResponseModel[Run, None] = Depends(get_run),
-) -> MultiResponseModel[RunCommandSummary, None]:
-    """Get a summary of all commands in a run.
+    response: Response,
+    cursor: int = Query(
+        0,
+        ge=0,
+        description="The index of the first command to return.",
+    ),
+    pageLength: Optional[int] = Query(
+        None,
+        ge=1,
+        description=(
+            "The maximum number of commands to return."
+            " If omitted, every command from `cursor` onward is returned."
+        ),
+    ),
+    if_none_match: Optional[str] = Depends(get_if_none_match),
+    engine_store: EngineStore = Depends(get_engine_store),
+    run_store: RunStore = Depends(get_run_store),
+    run: RunResource = Depends(get_run_resource),
+) -> Union[PaginatedResponseModel[RunCommandSummary, None], Response]:
+    """Get a summary of a page of commands in a run.
 
     Arguments:
-        run: Run response model, provided by the route handler for
-            `GET /runs/{runId}`
+        response: Response to set the page's ETag header on.
+        cursor: Index of the first command to return, from the query string.
+        pageLength: Maximum number of commands to return, from the query string.
+        if_none_match: The ETag of the client's copy of the page, if any.
+        engine_store: Protocol engine and runner storage.
+        run_store: Run storage, which keeps the commands of finished runs.
+        run: Run resource, provided by `get_run_resource`.
+            Present to ensure 404 if run not found.
     """
-    return MultiResponseModel(data=run.data.commands, links=None)
+    not_modified = get_not_modified_response(
+        response=response,
+        etag=_get_commands_etag(get_run_etag(run, engine_store), cursor, pageLength),
+        if_none_match=if_none_match,
+    )
+
+    if not_modified is not None:
+        return not_modified
+
+    commands: List[RunCommandSummary]
+
+    try:
+        engine_state = engine_store.get_state(run.run_id)
+    except EngineMissingError:
+        all_commands = run_store.get_state(run.run_id).commands
+        stop = None if pageLength is None else cursor + pageLength
+        commands = all_commands[cursor:stop]
+        total_length = len(all_commands)
+    else:
+        command_slice = engine_state.commands.get_slice(
+            cursor=cursor,
+            length=pageLength,
+        )
+        commands = [get_command_summary(c) for c in command_slice.commands]
+        total_length = command_slice.total_length
+
+    return PaginatedResponseModel(
+        data=commands,
+        links=None,
+        meta=MultiResponseMeta(cursor=cursor, totalLength=total_length),
+    )
+
+
+def _get_commands_etag(run_etag: str, cursor: int, page_length: Optional[int]) -> str:
+    # Each page of the same run is a different resource, with its own tag.
+    page = "all" if page_length is None else str(page_length)
+    run_tag = run_etag.strip('"')
+    return f'"{run_tag}-{cursor}-{page}"'
 
 
 @commands_router.get(
@@ -115,20 +187,25 @@ async def get_run_commands(
 async def get_run_command(
     commandId: str,
     engine_store: EngineStore = Depends(get_engine_store),
-    run: ResponseModel[Run, None] = Depends(get_run),
+    run_store: RunStore = Depends(get_run_store),
+    run: RunResource = Depends(get_run_resource),
 ) -> ResponseModel[pe_commands.Command, None]:
     """Get a specific command from a run.
 
     Arguments:
         commandId: Command identifier, pulled from route parameter.
         engine_store: Protocol engine and runner storage.
-        run: Run response model, provided by the route handler for
-            `GET /run/{runId}`. Present to ensure 404 if run
-            not found.
+        run_store: Run storage, which keeps the commands of finished runs.
+        run: Run resource, provided by `get_run_resource`.
+            Present to ensure 404 if run not found.
     """
-    engine_state = engine_store.get_state(run.data.id)
     try:
-        command = engine_state.commands.get(commandId)
+        try:
+            engine_state = engine_store.get_state(run.run_id)
+        except EngineMissingError:
+            command = run_store.get_command(run.run_id, commandId)
+        else:
+            command = engine_state.commands.get(commandId)
     except pe_errors.CommandDoesNotExistError as e:
         raise CommandNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
@@ -0,0 +1,50 @@
+"""Router for /runs events endpoints."""
+from fastapi import APIRouter, Depends, Query
+from starlette.websockets import WebSocket
+
+from robot_server.service.notifications import handle_subscriber
+
+from ..engine_store import EngineStore, EngineMissingError
+from ..dependencies import get_engine_store
+
+events_router = APIRouter()
+
+
+@events_router.websocket("/runs/{runId}/events")
+async def stream_run_events(
+    websocket: WebSocket,
+    runId: str,
+    cursor: int = Query(
+        0,
+        ge=0,
+        description=(
+            "Position in the run's event stream to start from."
+            " To resume a dropped stream, use one more than the cursor"
+            " of the last event received."
+        ),
+    ),
+    engine_store: EngineStore = Depends(get_engine_store),
+) -> None:
+    """Stream a run's command and status changes over a websocket.
+
+    Each message is a `commandUpdated` event, with the summary of a command
+    that was added to the run or changed status, or a `statusUpdated` event,
+    with the run's new status. The stream ends, and the connection closes,
+    when the run stops being current. A run that is not current closes the
+    connection right away; its final state is available from `GET /runs/{runId}`.
+
+    Arguments:
+        websocket: The client's websocket connection.
+        runId: Run ID pulled from the URL.
+        cursor: Position of the first event to send.
+        engine_store: Protocol engine and runner storage.
+    """
+    await websocket.accept()
+
+    try:
+        event_log = engine_store.get_event_log(runId)
+    except EngineMissingError:
+        await websocket.close()
+        return
+
+    await handle_subscriber.handle_stream(websocket, event_log.stream(cursor=cursor))
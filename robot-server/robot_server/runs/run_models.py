@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field
 from typing import List, Optional
 
 from opentrons.protocol_engine import (
+    Command,
     CommandStatus,
     CommandType,
     EngineStatus as RunStatus,
@@ -29,8 +30,18 @@ class RunCommandSummary(ResourceModel):
     )
 
 
-class Run(ResourceModel):
-    """Run resource model."""
+def get_command_summary(command: Command) -> RunCommandSummary:
+    """Summarize a command for a run's command list."""
+    return RunCommandSummary(
+        id=command.id,
+        commandType=command.commandType,
+        status=command.status,
+        errorId=command.errorId,
+    )
+
+
+class RunSummary(ResourceModel):
+    """Run resource model, without the run's commands."""
 
     id: str = Field(..., description="Unique run identifier.")
     createdAt: datetime = Field(..., description="When the run was created")
@@ -46,10 +57,6 @@ class Run(ResourceModel):
         ...,
         description="Client-initiated run control actions.",
     )
-    commands: List[RunCommandSummary] = Field(
-        ...,
-        description="Protocol commands queued, running, or executed for the run.",
-    )
     errors: List[ErrorOccurrence] = Field(
         ...,
         description="Any errors that have occurred during the run.",
@@ -75,6 +82,15 @@ class Run(ResourceModel):
     )
 
 
+class Run(RunSummary):
+    """Run resource model."""
+
+    commands: List[RunCommandSummary] = Field(
+        ...,
+        description="Protocol commands queued, running, or executed for the run.",
+    )
+
+
 class RunCreate(BaseModel):
     """Create request data for a new run."""
 
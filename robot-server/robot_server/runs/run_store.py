@@ -1,9 +1,28 @@
-"""Runs' in-memory store."""
-from dataclasses import dataclass, replace
+"""Runs' durable store."""
+import asyncio
+import json
+import sqlite3
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, List, Optional, Sequence
+
+from pydantic import parse_obj_as, parse_raw_as
+from pydantic.json import pydantic_encoder
+
+from opentrons.protocol_engine import (
+    Command,
+    CommandStatus,
+    EngineStatus,
+    ErrorOccurrence,
+    LoadedLabware,
+    LoadedPipette,
+    errors as pe_errors,
+)
+
+from robot_server.persistence import get_database_path, open_database
 
 from .action_models import RunAction
+from .run_models import RunCommandSummary
 
 
 @dataclass(frozen=True)
@@ -21,6 +40,17 @@ class RunResource:
     is_current: bool
 
 
+@dataclass(frozen=True)
+class RunState:
+    """The final state of a run, kept once its ProtocolEngine is gone."""
+
+    status: EngineStatus
+    commands: List[RunCommandSummary]
+    errors: List[ErrorOccurrence]
+    labware: List[LoadedLabware]
+    pipettes: List[LoadedPipette]
+
+
 class RunNotFoundError(ValueError):
     """Error raised when a given Run ID is not found in the store."""
 
@@ -32,9 +62,22 @@ class RunNotFoundError(ValueError):
 class RunStore:
     """Methods for storing and retrieving run resources."""
 
-    def __init__(self) -> None:
-        """Initialize a RunStore and its in-memory storage."""
-        self._runs_by_id: Dict[str, RunResource] = {}
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """Initialize a RunStore.
+
+        Any run left current by an earlier server process has lost its
+        ProtocolEngine, so it is no longer current.
+
+        Arguments:
+            connection: Connection to the database to keep runs in.
+        """
+        self._connection = connection
+        self._database_path = get_database_path(connection)
+
+        with self._connection:
+            self._connection.execute(
+                "UPDATE run SET is_current = 0 WHERE is_current = 1"
+            )
 
     def upsert(self, run: RunResource) -> RunResource:
         """Insert or update a run resource in the store.
@@ -46,12 +89,34 @@ class RunStore:
         Returns:
             The resource that was added to the store.
         """
-        if run.is_current is True:
-            for target_id, target in self._runs_by_id.items():
-                if target.is_current and target_id != run.run_id:
-                    self._runs_by_id[target_id] = replace(target, is_current=False)
+        values = (
+            run.protocol_id,
+            run.created_at.isoformat(),
+            run.is_current,
+            json.dumps(run.actions, default=pydantic_encoder),
+            run.run_id,
+        )
+
+        with self._connection:
+            if run.is_current is True:
+                self._connection.execute(
+                    "UPDATE run SET is_current = 0 WHERE is_current = 1 AND id != ?",
+                    (run.run_id,),
+                )
+
+            # Update the run in place, if it exists, to keep its final state.
+            updated = self._connection.execute(
+                "UPDATE run SET protocol_id = ?, created_at = ?, is_current = ?,"
+                " actions = ? WHERE id = ?",
+                values,
+            )
 
-        self._runs_by_id[run.run_id] = run
+            if updated.rowcount == 0:
+                self._connection.execute(
+                    "INSERT INTO run (protocol_id, created_at, is_current, actions, id)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    values,
+                )
 
         return run
 
@@ -64,18 +129,29 @@ class RunStore:
         Returns:
             The retrieved run entry from the store.
         """
-        try:
-            return self._runs_by_id[run_id]
-        except KeyError as e:
-            raise RunNotFoundError(run_id) from e
+        row = self._connection.execute(
+            "SELECT id, protocol_id, created_at, is_current, actions FROM run"
+            " WHERE id = ?",
+            (run_id,),
+        ).fetchone()
+
+        if row is None:
+            raise RunNotFoundError(run_id)
+
+        return _to_resource(row)
 
     def get_all(self) -> List[RunResource]:
         """Get all known run resources.
 
         Returns:
-            All stored run entries.
+            All stored run entries, oldest first.
         """
-        return list(self._runs_by_id.values())
+        rows = self._connection.execute(
+            "SELECT id, protocol_id, created_at, is_current, actions FROM run"
+            " ORDER BY created_at, rowid"
+        )
+
+        return [_to_resource(row) for row in rows]
 
     def remove(self, run_id: str) -> RunResource:
         """Remove a run by its unique identifier.
@@ -89,7 +165,155 @@ class RunStore:
         Raises:
             RunNotFoundError: The specified run ID was not found.
         """
+        run = self.get(run_id)
+
+        with self._connection:
+            self._connection.execute("DELETE FROM run WHERE id = ?", (run_id,))
+            self._connection.execute(
+                "DELETE FROM run_command WHERE run_id = ?", (run_id,)
+            )
+
+        return run
+
+    async def insert_state(
+        self,
+        run_id: str,
+        state: RunState,
+        commands: Sequence[Command],
+    ) -> None:
+        """Keep the final state and full commands of a run.
+
+        A long run has thousands of commands to serialize and write, so it's
+        done on a worker thread, with its own connection to the database.
+
+        Arguments:
+            run_id: The run's unique identifier. Nothing is stored if the run
+                is not in the store.
+            state: The run's final state.
+            commands: Every command of the run, in order.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._insert_state, run_id, state, commands)
+
+    def _insert_state(
+        self,
+        run_id: str,
+        state: RunState,
+        commands: Sequence[Command],
+    ) -> None:
+        state_json = json.dumps(
+            {
+                "status": state.status,
+                "commands": state.commands,
+                "errors": state.errors,
+                "labware": state.labware,
+                "pipettes": state.pipettes,
+            },
+            default=pydantic_encoder,
+        )
+
+        connection = open_database(self._database_path)
+
         try:
-            return self._runs_by_id.pop(run_id)
-        except KeyError as e:
-            raise RunNotFoundError(run_id) from e
+            with connection:
+                updated = connection.execute(
+                    "UPDATE run SET state = ? WHERE id = ?", (state_json, run_id)
+                )
+
+                if updated.rowcount == 0:
+                    return
+
+                connection.execute(
+                    "DELETE FROM run_command WHERE run_id = ?", (run_id,)
+                )
+                connection.executemany(
+                    "INSERT INTO run_command (run_id, idx, command_id, command)"
+                    " VALUES (?, ?, ?, ?)",
+                    (
+                        (run_id, index, command.id, command.json())
+                        for index, command in enumerate(commands)
+                    ),
+                )
+        finally:
+            connection.close()
+
+    def get_state(self, run_id: str, include_commands: bool = True) -> RunState:
+        """Get the final state of a run.
+
+        A run that never had its final state stored, because the server
+        stopped while it was current, is stopped with no commands.
+
+        Arguments:
+            run_id: The run's unique identifier.
+            include_commands: Whether to get the run's command summaries.
+                If not, the state's command list is empty.
+
+        Raises:
+            RunNotFoundError: The specified run ID was not found.
+        """
+        row = self._connection.execute(
+            "SELECT state FROM run WHERE id = ?", (run_id,)
+        ).fetchone()
+
+        if row is None:
+            raise RunNotFoundError(run_id)
+
+        if row[0] is None:
+            return RunState(
+                status=EngineStatus.STOPPED,
+                commands=[],
+                errors=[],
+                labware=[],
+                pipettes=[],
+            )
+
+        state = json.loads(row[0])
+        # Command summaries were validated before they were stored, and a long
+        # run has thousands of them, so they are not validated again.
+        commands = [
+            RunCommandSummary.construct(
+                id=c["id"],
+                commandType=c["commandType"],
+                status=CommandStatus(c["status"]),
+                errorId=c.get("errorId"),
+            )
+            for c in (state["commands"] if include_commands else [])
+        ]
+
+        return RunState(
+            status=EngineStatus(state["status"]),
+            commands=commands,
+            errors=parse_obj_as(List[ErrorOccurrence], state["errors"]),
+            labware=parse_obj_as(List[LoadedLabware], state["labware"]),
+            pipettes=parse_obj_as(List[LoadedPipette], state["pipettes"]),
+        )
+
+    def get_command(self, run_id: str, command_id: str) -> Command:
+        """Get one of the stored commands of a run.
+
+        Raises:
+            CommandDoesNotExistError: The run has no such stored command.
+        """
+        row = self._connection.execute(
+            "SELECT command FROM run_command WHERE run_id = ? AND command_id = ?",
+            (run_id, command_id),
+        ).fetchone()
+
+        if row is None:
+            raise pe_errors.CommandDoesNotExistError(
+                f"Command {command_id} does not exist"
+            )
+
+        return parse_raw_as(Command, row[0])  # type: ignore[arg-type]
+
+
+def _to_resource(row: Any) -> RunResource:
+    run_id, protocol_id, created_at, is_current, actions = row
+
+    return RunResource(
+        run_id=run_id,
+        protocol_id=protocol_id,
+        created_at=datetime.fromisoformat(created_at),
+        actions=parse_raw_as(List[RunAction], actions),
+        is_current=bool(is_current),
+    )
@@ -0,0 +1,58 @@
+"""Conditional GET support with ETag and If-None-Match headers."""
+from typing import Any, Dict, Optional
+
+from fastapi import Header, Response, status
+
+IF_NONE_MATCH_DESCRIPTION = (
+    "The ETag of a previous response for this resource."
+    " If the resource has not changed since, the server responds with 304."
+)
+
+NOT_MODIFIED_RESPONSE: Dict[str, Any] = {
+    "description": "The resource has not changed since the given ETag.",
+}
+
+
+async def get_if_none_match(
+    if_none_match: Optional[str] = Header(None, description=IF_NONE_MATCH_DESCRIPTION),
+) -> Optional[str]:
+    """Get the request's If-None-Match header, if any."""
+    return if_none_match
+
+
+def get_not_modified_response(
+    response: Response,
+    etag: str,
+    if_none_match: Optional[str],
+) -> Optional[Response]:
+    """Tag a response, and get a 304 response if the client's copy is current.
+
+    Arguments:
+        response: The response that the route's headers are set on.
+        etag: The current entity tag of the requested resource.
+        if_none_match: The request's If-None-Match header, if any.
+
+    Returns:
+        A response to send in place of the resource, if the client's copy
+        of the resource is current.
+    """
+    response.headers["ETag"] = etag
+
+    if if_none_match is None:
+        return None
+
+    client_etags = [_strip_weak(tag.strip()) for tag in if_none_match.split(",")]
+
+    if "*" in client_etags or _strip_weak(etag) in client_etags:
+        # A returned Response skips the route's response, so copy its headers.
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=dict(response.headers),
+        )
+
+    return None
+
+
+def _strip_weak(etag: str) -> str:
+    # If-None-Match uses weak comparison, which ignores the weakness prefix.
+    return etag[2:] if etag.startswith("W/") else etag
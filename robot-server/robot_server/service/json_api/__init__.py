@@ -5,6 +5,8 @@ from .response import (
     ResponseModel,
     EmptyResponseModel,
     MultiResponseModel,
+    MultiResponseMeta,
+    PaginatedResponseModel,
     ResponseDataModel,
 )
 
@@ -15,6 +17,8 @@ __all__ = [
     "ResponseModel",
     "EmptyResponseModel",
     "MultiResponseModel",
+    "MultiResponseMeta",
+    "PaginatedResponseModel",
     "ResponseDataModel",
     "ResourceLink",
     "ResourceLinks",
@@ -48,3 +48,27 @@ class MultiResponseModel(GenericModel, Generic[ResponseDataT, ResponseLinksT]):
 
     data: List[ResponseDataT] = Field(..., description=DESCRIPTION_DATA)
     links: ResponseLinksT = Field(..., description=DESCRIPTION_LINKS)
+
+
+class MultiResponseMeta(BaseModel):
+    """Metadata about a page of a larger list of resources."""
+
+    cursor: int = Field(
+        ...,
+        description="The index of the page's first resource in the full list.",
+    )
+    totalLength: int = Field(
+        ...,
+        description="The number of resources in the full list.",
+    )
+
+
+class PaginatedResponseModel(GenericModel, Generic[ResponseDataT, ResponseLinksT]):
+    """A response that returns a page of a larger list of resources."""
+
+    data: List[ResponseDataT] = Field(..., description=DESCRIPTION_DATA)
+    links: ResponseLinksT = Field(..., description=DESCRIPTION_LINKS)
+    meta: MultiResponseMeta = Field(
+        ...,
+        description="Where the page is in the full list of resources.",
+    )
@@ -0,0 +1,38 @@
+"""Notification dependencies for use with FastAPI's dependency injection."""
+from fastapi import Depends
+
+from notify_server.clients.subscriber import create
+
+from robot_server.app_state import AppState, AppStateValue, get_app_state
+from robot_server.settings import get_settings
+
+from .fanout import EventFanout
+
+_event_fanout = AppStateValue[EventFanout]("notification_event_fanout")
+
+
+async def get_event_fanout(
+    app_state: AppState = Depends(get_app_state),
+) -> EventFanout:
+    """Get the singleton that shares notifications among websocket clients.
+
+    Must be called within FastAPI's dependency injection system via fastapi.Depends.
+    """
+    fanout = _event_fanout.get_from(app_state)
+
+    if fanout is None:
+        # Subscribe to every topic; the fanout filters by each client's topics.
+        subscriber = create(get_settings().notification_server_subscriber_address, [""])
+        fanout = EventFanout(subscriber)
+        _event_fanout.set_on(app_state, fanout)
+
+    return fanout
+
+
+async def cleanup_event_fanout(app_state: AppState) -> None:
+    """Close and remove the notification fanout singleton."""
+    fanout = _event_fanout.get_from(app_state)
+    _event_fanout.set_on(app_state, None)
+
+    if fanout is not None:
+        await fanout.close()
@@ -0,0 +1,131 @@
+"""Share one notify-server subscription among websocket clients."""
+import asyncio
+import logging
+from typing import Dict, Optional, Sequence
+
+from notify_server.clients.serdes import MalformedFrames, TopicEvent
+from notify_server.clients.subscriber import Subscriber
+from notify_server.models.topics import RobotEventTopics
+
+log = logging.getLogger(__name__)
+
+CLIENT_QUEUE_SIZE = 100
+"""The most events to hold for a client that isn't keeping up."""
+
+STATE_TOPICS: Sequence[str] = (RobotEventTopics.HARDWARE_EVENTS.value,)
+"""Topics whose latest event is the current state, as in the notify-server."""
+
+ROUTE_ERROR_RETRY_SEC = 0.5
+"""How long to wait before reading again after an unexpected read error."""
+
+
+class EventFanout:
+    """Route events from one notify-server subscriber to many clients.
+
+    Each event is decoded and serialized to json once, no matter how many
+    clients are connected, and the same text is queued for every client
+    subscribed to its topic.
+
+    The notify-server replays the latest event of each state topic only when
+    the fanout's single subscription is made, so the fanout keeps the latest
+    event of each state topic itself, and queues them for each new client.
+
+    The notify-server broadcasts that replay to all of its subscribers, so a
+    state event identical to the cached one is a replay, and is dropped.
+    """
+
+    def __init__(
+        self,
+        subscriber: Subscriber,
+        client_queue_size: int = CLIENT_QUEUE_SIZE,
+        state_topics: Sequence[str] = STATE_TOPICS,
+    ) -> None:
+        """Initialize an EventFanout.
+
+        Arguments:
+            subscriber: A notify-server subscriber to every topic clients
+                may subscribe to.
+            client_queue_size: The most events to hold for each client. When
+                a client's queue is full, its oldest event is dropped.
+            state_topics: Topics whose latest event is sent to every new
+                client subscribed to them.
+        """
+        self._subscriber = subscriber
+        self._client_queue_size = client_queue_size
+        self._state_topics = set(state_topics)
+        self._states: Dict[str, str] = {}
+        self._clients: Dict["asyncio.Queue[str]", Sequence[str]] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def add_client(self, topics: Sequence[str]) -> "asyncio.Queue[str]":
+        """Add a client, and start reading events if not already.
+
+        Arguments:
+            topics: The topics to send the client. As with notify-server
+                subscriptions, a topic matches any event topic it prefixes.
+
+        Returns:
+            The queue the client's events will be put in, as json text,
+            starting with the latest event of each matching state topic.
+        """
+        queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=self._client_queue_size)
+        self._clients[queue] = list(topics)
+
+        for state_topic, text in self._states.items():
+            if any(state_topic.startswith(topic) for topic in topics):
+                self._put(queue, text)
+
+        if self._task is None:
+            self._task = asyncio.get_event_loop().create_task(self._route_events())
+
+        return queue
+
+    def remove_client(self, queue: "asyncio.Queue[str]") -> None:
+        """Stop sending events to a client."""
+        self._clients.pop(queue, None)
+
+    async def close(self) -> None:
+        """Stop reading events and close the subscriber."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        self._subscriber.close()
+
+    async def _route_events(self) -> None:
+        while True:
+            try:
+                entry = await self._subscriber.next_event()
+            except MalformedFrames:
+                log.exception("Discarding malformed notification.")
+                continue
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                log.exception("Failed to read notification; retrying.")
+                await asyncio.sleep(ROUTE_ERROR_RETRY_SEC)
+                continue
+
+            self._route(entry)
+
+    def _route(self, entry: TopicEvent) -> None:
+        text: Optional[str] = None
+
+        if entry.topic in self._state_topics:
+            text = entry.json()
+            if self._states.get(entry.topic) == text:
+                return
+            self._states[entry.topic] = text
+
+        for queue, topics in self._clients.items():
+            if any(entry.topic.startswith(topic) for topic in topics):
+                if text is None:
+                    text = entry.json()
+                self._put(queue, text)
+
+    @staticmethod
+    def _put(queue: "asyncio.Queue[str]", text: str) -> None:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(text)
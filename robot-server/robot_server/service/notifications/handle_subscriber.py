@@ -1,46 +1,73 @@
 """Websocket subscriber handler functions."""
 import asyncio
 import logging
-from asyncio import CancelledError
-from typing import List
+from typing import AsyncIterator, List
 
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
-from notify_server.clients.serdes import TopicEvent
-from notify_server.clients.subscriber import Subscriber, create
-
-from robot_server.settings import get_settings
+from .fanout import EventFanout
 
 log = logging.getLogger(__name__)
 
 
-async def handle_socket(websocket: WebSocket, topics: List[str]) -> None:
+async def handle_socket(
+    websocket: WebSocket, topics: List[str], fanout: EventFanout
+) -> None:
     """Handle a websocket connection."""
-    subscriber = create(get_settings().notification_server_subscriber_address, topics)
-    await asyncio.gather(
-        receive(websocket, subscriber), route_events(websocket, subscriber)
-    )
+    queue = fanout.add_client(topics)
+    route_task = asyncio.create_task(route_events(websocket, queue))
+    try:
+        await receive(websocket)
+    finally:
+        fanout.remove_client(queue)
+        route_task.cancel()
+        await asyncio.gather(route_task, return_exceptions=True)
+
+
+async def handle_stream(websocket: WebSocket, texts: AsyncIterator[str]) -> None:
+    """Send a stream of json serialized entries to a websocket connection.
+
+    The connection is closed once the stream ends. The stream is dropped
+    if the client disconnects first.
+    """
+    receive_task = asyncio.create_task(receive(websocket))
+    send_task = asyncio.create_task(send_all(websocket, texts))
+    try:
+        done, _ = await asyncio.wait(
+            {receive_task, send_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        receive_task.cancel()
+        send_task.cancel()
+        await asyncio.gather(receive_task, send_task, return_exceptions=True)
+
+    if send_task in done:
+        send_task.result()
+        await websocket.close()
 
 
-async def receive(websocket: WebSocket, subscriber: Subscriber) -> None:
+async def receive(websocket: WebSocket) -> None:
     """Read data from websocket. Will exit on websocket disconnect."""
     try:
         while True:
             await websocket.receive_json()
     except WebSocketDisconnect:
         log.info("Websocket subscriber disconnected.")
-        subscriber.close()
 
 
-async def send(websocket: WebSocket, entry: TopicEvent) -> None:
-    """Send entry to web socket."""
-    await websocket.send_text(entry.json())
+async def send(websocket: WebSocket, text: str) -> None:
+    """Send a json serialized entry to web socket."""
+    await websocket.send_text(text)
 
 
-async def route_events(websocket: WebSocket, subscriber: Subscriber) -> None:
-    """Route events from subscriber to websocket."""
-    try:
-        async for entry in subscriber:
-            await send(websocket, entry)
-    except CancelledError:
-        log.exception("Connection to notify-server closed.")
+async def send_all(websocket: WebSocket, texts: AsyncIterator[str]) -> None:
+    """Send every json serialized entry of a stream to web socket."""
+    async for text in texts:
+        await send(websocket, text)
+
+
+async def route_events(websocket: WebSocket, queue: "asyncio.Queue[str]") -> None:
+    """Route json serialized events from a client's queue to websocket."""
+    while True:
+        text = await queue.get()
+        await send(websocket, text)
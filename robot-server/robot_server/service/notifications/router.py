@@ -1,14 +1,20 @@
 from typing import List
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 from starlette.websockets import WebSocket
 from robot_server.service.notifications import handle_subscriber
+from robot_server.service.notifications.dependencies import get_event_fanout
+from robot_server.service.notifications.fanout import EventFanout
 
 router = APIRouter()
 
 
 @router.websocket("/notifications/subscribe")
-async def handle_subscribe(websocket: WebSocket, topic: List[str] = Query(...)):
+async def handle_subscribe(
+    websocket: WebSocket,
+    topic: List[str] = Query(...),
+    fanout: EventFanout = Depends(get_event_fanout),
+):
     """Accept a websocket connection."""
     await websocket.accept()
-    await handle_subscriber.handle_socket(websocket, topic)
+    await handle_subscriber.handle_socket(websocket, topic, fanout)
@@ -65,6 +65,24 @@ class RobotServerSettings(BaseSettings):
         description="The maximum number of protocols allowed for upload",
     )
 
+    protocol_analysis_max_workers: int = Field(
+        1,
+        description="The number of worker processes that analyze protocols.",
+    )
+
+    protocol_analysis_cache_size: int = Field(
+        20,
+        description="The number of protocol analysis results to keep for reuse"
+        " when the same protocol is uploaded again.",
+    )
+
+    persistence_directory: typing.Optional[str] = Field(
+        None,
+        description="Directory to keep protocols, analyses and runs in across"
+        " restarts. If not set, a robot_server directory is used within the"
+        " robot's data directory.",
+    )
+
     notification_server_subscriber_address: str = Field(
         "tcp://localhost:5555",
         description="The endpoint to subscribe to notification server topics.",
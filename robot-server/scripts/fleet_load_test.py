@@ -0,0 +1,343 @@
+"""Drive a fleet of robot servers and report request latency and throughput.
+
+Every robot runs the same scenario at once: upload a protocol, create a run of
+it, play the run, and poll its commands from several clients until it ends,
+then close the run. The latency of every request is recorded, and percentiles
+and throughput are reported for each endpoint.
+
+With --launch, the emulated robots are started in one process with
+`opentrons.hardware_control.emulation.scripts.run_fleet`, and a robot server is
+started for each of them. Otherwise, pass the URL of each robot server to drive.
+
+Usage:
+    python scripts/fleet_load_test.py --launch 4 --m magdeck \
+        tests/integration/protocols/basic_transfer_standalone.py
+    python scripts/fleet_load_test.py --robot http://robot-a:31950 \
+        --robot http://robot-b:31950 my_protocol.py
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, DefaultDict, Dict, Iterator, List, Sequence, Tuple
+
+import httpx
+
+from opentrons.hardware_control.emulation.fleet import (
+    fleet_settings,
+    robot_environment,
+)
+from opentrons.hardware_control.emulation.settings import Settings
+
+FIRST_SERVER_PORT = 32000
+TERMINAL_STATUSES = {"stopped", "failed", "succeeded"}
+HEADERS = {"Opentrons-Version": "*"}
+
+
+class Recorder:
+    """Record the latency of requests by endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize a Recorder."""
+        self.latencies: DefaultDict[str, List[float]] = defaultdict(list)
+        self.errors: DefaultDict[str, int] = defaultdict(int)
+
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Make a request, recording its latency under the endpoint's name."""
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, path, **kwargs)
+        except httpx.HTTPError:
+            self.errors[endpoint] += 1
+            raise
+        self.latencies[endpoint].append(time.perf_counter() - start)
+        if response.is_error:
+            self.errors[endpoint] += 1
+        return response
+
+    def report(self, elapsed: float) -> str:
+        """Summarize the recorded requests as a table."""
+        lines = [
+            f"{'endpoint':<32} {'count':>7} {'errors':>6} {'req/s':>8} "
+            f"{'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+        ]
+        total = 0
+        for endpoint in sorted(self.latencies):
+            latencies = sorted(self.latencies[endpoint])
+            total += len(latencies)
+            p50, p90, p99 = (percentile(latencies, p) * 1000 for p in (50, 90, 99))
+            lines.append(
+                f"{endpoint:<32} {len(latencies):>7} {self.errors[endpoint]:>6} "
+                f"{len(latencies) / elapsed:>8.1f} {p50:>8.1f} {p90:>8.1f} "
+                f"{p99:>8.1f} {latencies[-1] * 1000:>8.1f}"
+            )
+        lines.append(
+            f"{total} requests in {elapsed:.1f} s: {total / elapsed:.1f} req/s, "
+            f"{sum(self.errors.values())} errors"
+        )
+        return "\n".join(lines)
+
+
+def percentile(ordered: Sequence[float], p: float) -> float:
+    """Get a percentile of sorted values by the nearest-rank method."""
+    rank = max(math.ceil(p / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+async def poll_commands(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    run_id: str,
+    interval: float,
+    done: asyncio.Event,
+) -> None:
+    """Poll a run's commands, like an app watching the run, until it ends."""
+    while not done.is_set():
+        await recorder.request(
+            client, "GET", f"/runs/{run_id}/commands", "GET /runs/{id}/commands"
+        )
+        await asyncio.sleep(interval)
+
+
+async def run_scenario(
+    base_url: str,
+    protocol: Path,
+    recorder: Recorder,
+    iterations: int,
+    pollers: int,
+    interval: float,
+) -> None:
+    """Upload, run and watch a protocol on one robot."""
+    async with httpx.AsyncClient(
+        base_url=base_url, headers=HEADERS, timeout=60
+    ) as client:
+        for _ in range(iterations):
+            with protocol.open("rb") as f:
+                response = await recorder.request(
+                    client,
+                    "POST",
+                    "/protocols",
+                    "POST /protocols",
+                    files={"files": (protocol.name, f)},
+                )
+            response.raise_for_status()
+            protocol_id = response.json()["data"]["id"]
+
+            response = await recorder.request(
+                client,
+                "POST",
+                "/runs",
+                "POST /runs",
+                json={"data": {"protocolId": protocol_id}},
+            )
+            response.raise_for_status()
+            run_id = response.json()["data"]["id"]
+
+            response = await recorder.request(
+                client,
+                "POST",
+                f"/runs/{run_id}/actions",
+                "POST /runs/{id}/actions",
+                json={"data": {"actionType": "play"}},
+            )
+            response.raise_for_status()
+
+            done = asyncio.Event()
+            polling = [
+                asyncio.ensure_future(
+                    poll_commands(client, recorder, run_id, interval, done)
+                )
+                for _ in range(pollers)
+            ]
+            try:
+                while True:
+                    response = await recorder.request(
+                        client, "GET", f"/runs/{run_id}", "GET /runs/{id}"
+                    )
+                    response.raise_for_status()
+                    if response.json()["data"]["status"] in TERMINAL_STATUSES:
+                        break
+                    await asyncio.sleep(interval)
+            finally:
+                done.set()
+                await asyncio.gather(*polling)
+
+            response = await recorder.request(
+                client,
+                "PATCH",
+                f"/runs/{run_id}",
+                "PATCH /runs/{id}",
+                json={"data": {"current": False}},
+            )
+            response.raise_for_status()
+
+
+async def wait_healthy(base_urls: Sequence[str], timeout: float) -> None:
+    """Wait for every robot server to answer its health check."""
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(headers=HEADERS) as client:
+        for base_url in base_urls:
+            while True:
+                try:
+                    response = await client.get(f"{base_url}/health")
+                    if response.status_code == 200:
+                        break
+                except httpx.HTTPError:
+                    pass
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"{base_url} did not start")
+                await asyncio.sleep(0.5)
+
+
+@contextlib.contextmanager
+def launch_fleet(
+    robots: int, modules: Sequence[str], log_dir: str
+) -> Iterator[List[str]]:
+    """Start emulated robots and a robot server for each, yielding their URLs."""
+    processes: List["subprocess.Popen[bytes]"] = []
+    module_args = [arg for m in modules for arg in ("--m", m)]
+    base_urls = []
+
+    def _start(name: str, args: List[str], env: Dict[str, str]) -> None:
+        with open(os.path.join(log_dir, f"{name}.log"), "wb") as log:
+            processes.append(
+                subprocess.Popen(
+                    [sys.executable, "-m", *args],
+                    env={**os.environ, **env},
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                )
+            )
+
+    try:
+        _start(
+            "emulators",
+            [
+                "opentrons.hardware_control.emulation.scripts.run_fleet",
+                str(robots),
+                *module_args,
+            ],
+            {},
+        )
+        for index, settings in enumerate(fleet_settings(Settings(), robots)):
+            port = FIRST_SERVER_PORT + index
+            config_dir = os.path.join(log_dir, f"robot-{index}")
+            os.makedirs(config_dir)
+            env = {
+                **robot_environment(settings),
+                "OT_API_CONFIG_DIR": config_dir,
+                "OT_ROBOT_SERVER_ws_domain_socket": "",
+                "OT_ROBOT_SERVER_DOT_ENV_PATH": os.devnull,
+            }
+            args = ["uvicorn", "robot_server:app", "--port", str(port)]
+            _start(f"robot-server-{index}", args, env)
+            base_urls.append(f"http://localhost:{port}")
+        yield base_urls
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+
+
+async def drive(
+    args: argparse.Namespace, base_urls: Sequence[str]
+) -> Tuple[Recorder, float]:
+    """Run the scenario on every robot at once, returning how long it took."""
+    await wait_healthy(base_urls, args.start_timeout)
+    recorder = Recorder()
+    start = time.monotonic()
+    await asyncio.gather(
+        *(
+            run_scenario(
+                base_url,
+                args.protocol,
+                recorder,
+                args.iterations,
+                args.pollers,
+                args.poll_interval,
+            )
+            for base_url in base_urls
+        )
+    )
+    return recorder, time.monotonic() - start
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("protocol", type=Path, help="the protocol file to run")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
+        "--robot", action="append", help="the URL of a robot server to drive"
+    )
+    target.add_argument(
+        "--launch",
+        type=int,
+        metavar="ROBOTS",
+        help="start this many emulated robots and robot servers",
+    )
+    parser.add_argument(
+        "--m",
+        action="append",
+        default=[],
+        help="which module(s) to emulate on each launched robot",
+    )
+    parser.add_argument("--iterations", type=int, default=3, help="runs per robot")
+    parser.add_argument(
+        "--pollers", type=int, default=2, help="clients polling each run's commands"
+    )
+    parser.add_argument(
+        "--poll-interval", type=float, default=0.1, help="seconds between polls"
+    )
+    parser.add_argument(
+        "--start-timeout",
+        type=float,
+        default=60,
+        help="seconds to wait for robot servers to start",
+    )
+    parser.add_argument("--json", type=Path, help="also write the latencies here")
+    args = parser.parse_args()
+
+    with contextlib.ExitStack() as stack:
+        if args.launch:
+            log_dir = tempfile.mkdtemp(prefix="fleet-load-test-")
+            print(f"Launching {args.launch} robots, logging to {log_dir}")
+            base_urls = stack.enter_context(launch_fleet(args.launch, args.m, log_dir))
+        else:
+            base_urls = args.robot
+
+        recorder, elapsed = asyncio.get_event_loop().run_until_complete(
+            drive(args, base_urls)
+        )
+
+    print(recorder.report(elapsed))
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    "elapsed": elapsed,
+                    "latencies": recorder.latencies,
+                    "errors": recorder.errors,
+                }
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ import os
 import shutil
 import json
 import pathlib
+import sqlite3
 import requests
 import pytest
 
@@ -34,6 +35,7 @@ from opentrons.protocols.geometry.deck import Deck
 
 from robot_server import app
 from robot_server.hardware import get_hardware
+from robot_server.persistence import open_database
 from robot_server.versioning import API_VERSION_HEADER, LATEST_API_VERSION_HEADER_VALUE
 from robot_server.service.protocol.manager import ProtocolManager
 from robot_server.service.session.manager import SessionManager
@@ -67,6 +69,14 @@ def current_time() -> datetime:
     return datetime(year=2021, month=1, day=1, tzinfo=timezone.utc)
 
 
+@pytest.fixture
+def sql_connection(tmp_path: pathlib.Path) -> Iterator[sqlite3.Connection]:
+    """Get a connection to a fresh database."""
+    connection = open_database(tmp_path / "robot_server.db")
+    yield connection
+    connection.close()
+
+
 @pytest.fixture
 def hardware() -> MagicMock:
     return MagicMock(spec=API)
@@ -0,0 +1,125 @@
+"""Tests for the AnalysisCache."""
+import pytest
+from pathlib import Path
+from typing import List
+
+from opentrons.protocol_runner import ProtocolRunData
+
+from robot_server.protocols.analysis_cache import AnalysisCache
+
+
+@pytest.fixture
+def labware_dir(tmp_path: Path) -> Path:
+    """Get a directory of custom labware."""
+    labware_dir = tmp_path / "labware"
+    (labware_dir / "custom").mkdir(parents=True)
+    (labware_dir / "custom" / "1.json").write_text('{"version": 1}')
+    return labware_dir
+
+
+@pytest.fixture
+def protocol_files(tmp_path: Path) -> List[Path]:
+    """Get the files of a protocol."""
+    protocol_dir = tmp_path / "protocol"
+    protocol_dir.mkdir()
+    main = protocol_dir / "main.py"
+    main.write_text("metadata = {'apiLevel': '2.11'}\n")
+    data = protocol_dir / "data.csv"
+    data.write_text("1,2,3\n")
+    return [main, data]
+
+
+@pytest.fixture
+def subject(labware_dir: Path) -> AnalysisCache:
+    """Get an AnalysisCache test subject."""
+    return AnalysisCache(robot_version="1.2.3", custom_labware_dir=labware_dir)
+
+
+def _result() -> ProtocolRunData:
+    return ProtocolRunData(commands=[], errors=[], labware=[], pipettes=[])
+
+
+def test_key_same_protocol(
+    tmp_path: Path, protocol_files: List[Path], subject: AnalysisCache
+) -> None:
+    """The same files have the same key, wherever and in whatever order they are."""
+    copy_dir = tmp_path / "copy"
+    copy_dir.mkdir()
+    copies = []
+    for f in reversed(protocol_files):
+        copy = copy_dir / f.name
+        copy.write_bytes(f.read_bytes())
+        copies.append(copy)
+
+    assert subject.get_key(protocol_files) == subject.get_key(copies)
+
+
+def test_key_changes_with_protocol(
+    protocol_files: List[Path], subject: AnalysisCache
+) -> None:
+    """Changing or renaming any file changes the key."""
+    key = subject.get_key(protocol_files)
+
+    protocol_files[1].write_text("1,2,4\n")
+    changed_key = subject.get_key(protocol_files)
+    assert changed_key != key
+
+    renamed = protocol_files[1].with_name("other.csv")
+    protocol_files[1].rename(renamed)
+    assert subject.get_key([protocol_files[0], renamed]) not in {key, changed_key}
+
+
+def test_key_changes_with_version(
+    labware_dir: Path, protocol_files: List[Path], subject: AnalysisCache
+) -> None:
+    """A different robot version has a different key."""
+    other = AnalysisCache(robot_version="1.2.4", custom_labware_dir=labware_dir)
+    assert other.get_key(protocol_files) != subject.get_key(protocol_files)
+
+
+def test_key_changes_with_labware(
+    labware_dir: Path, protocol_files: List[Path], subject: AnalysisCache
+) -> None:
+    """Adding or changing custom labware changes the key."""
+    key = subject.get_key(protocol_files)
+
+    (labware_dir / "custom" / "1.json").write_text('{"version": 2}')
+    changed_key = subject.get_key(protocol_files)
+    assert changed_key != key
+
+    (labware_dir / "custom" / "2.json").write_text('{"version": 1}')
+    assert subject.get_key(protocol_files) not in {key, changed_key}
+
+
+def test_key_without_labware_dir(tmp_path: Path, protocol_files: List[Path]) -> None:
+    """A robot with no custom labware directory still has keys."""
+    subject = AnalysisCache(
+        robot_version="1.2.3", custom_labware_dir=tmp_path / "missing"
+    )
+    assert subject.get_key(protocol_files) == subject.get_key(protocol_files)
+
+
+def test_get_put(subject: AnalysisCache) -> None:
+    """It should return cached results."""
+    result = _result()
+    assert subject.get("key") is None
+
+    subject.put("key", result)
+    assert subject.get("key") == result
+
+
+def test_least_recently_used_dropped(labware_dir: Path) -> None:
+    """It should drop the least recently used result when full."""
+    subject = AnalysisCache(
+        robot_version="1.2.3", custom_labware_dir=labware_dir, max_entries=2
+    )
+    results = [_result() for _ in range(3)]
+
+    subject.put("a", results[0])
+    subject.put("b", results[1])
+    subject.get("a")
+    subject.put("c", results[2])
+
+    assert subject.get("a") is results[0]
+    assert subject.get("b") is None
+    assert subject.get("c") is results[2]
@@ -1,5 +1,6 @@
 """Tests for the AnalysisStore interface."""
 import pytest
+import sqlite3
 from datetime import datetime
 from typing import List, NamedTuple
 
@@ -18,23 +19,23 @@ from robot_server.protocols.analysis_models import (
 )
 
 
-def test_get_empty() -> None:
+def test_get_empty(sql_connection: sqlite3.Connection) -> None:
     """It should return an empty list if no analysis saved."""
-    subject = AnalysisStore()
+    subject = AnalysisStore(connection=sql_connection)
     result = subject.get_by_protocol("protocol-id")
 
     assert result == []
 
 
-def test_add_pending() -> None:
+def test_add_pending(sql_connection: sqlite3.Connection) -> None:
     """It should add a pending analysis to the store."""
-    subject = AnalysisStore()
+    subject = AnalysisStore(connection=sql_connection)
     result = subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
 
     assert result == [PendingAnalysis(id="analysis-id")]
 
 
-def test_add_analysis_equipment() -> None:
+def test_add_analysis_equipment(sql_connection: sqlite3.Connection) -> None:
     """It should add labware and pipettes to the stored analysis."""
     labware = pe_types.LoadedLabware(
         id="labware-id",
@@ -50,7 +51,7 @@ def test_add_analysis_equipment() -> None:
         mount=MountType.LEFT,
     )
 
-    subject = AnalysisStore()
+    subject = AnalysisStore(connection=sql_connection)
     subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
     subject.update(
         analysis_id="analysis-id",
@@ -116,9 +117,10 @@ def test_add_parses_labware_commands(
     commands: List[pe_commands.Command],
     errors: List[pe_errors.ErrorOccurrence],
     expected_result: AnalysisResult,
+    sql_connection: sqlite3.Connection,
 ) -> None:
     """It should be able to parse the commands list for analysis results."""
-    subject = AnalysisStore()
+    subject = AnalysisStore(connection=sql_connection)
 
     subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
     subject.update(
@@ -131,3 +133,97 @@ def test_add_parses_labware_commands(
     res = subject.get_by_protocol("protocol-id")[0].result  # type: ignore[union-attr]
 
     assert res == expected_result
+
+
+def test_update_not_pending(sql_connection: sqlite3.Connection) -> None:
+    """It should not store the results of an analysis that is not pending."""
+    subject = AnalysisStore(connection=sql_connection)
+    subject.update(
+        analysis_id="analysis-id",
+        commands=[],
+        errors=[],
+        labware=[],
+        pipettes=[],
+    )
+
+    assert subject.get_by_protocol("protocol-id") == []
+
+
+def test_remove_by_protocol(sql_connection: sqlite3.Connection) -> None:
+    """It should remove completed and pending analyses of a protocol."""
+    subject = AnalysisStore(connection=sql_connection)
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-1")
+    subject.update(
+        analysis_id="analysis-1",
+        commands=[],
+        errors=[],
+        labware=[],
+        pipettes=[],
+    )
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-2")
+    subject.add_pending(protocol_id="other-protocol-id", analysis_id="analysis-3")
+
+    subject.remove_by_protocol("protocol-id")
+
+    assert subject.get_by_protocol("protocol-id") == []
+    assert subject.get_by_protocol("other-protocol-id") == [
+        PendingAnalysis(id="analysis-3")
+    ]
+
+
+def test_get_after_reopen(sql_connection: sqlite3.Connection) -> None:
+    """It should keep completed analyses for a new store on the same database."""
+    subject = AnalysisStore(connection=sql_connection)
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+    subject.update(
+        analysis_id="analysis-id",
+        commands=[],
+        errors=[],
+        labware=[],
+        pipettes=[],
+    )
+
+    result = AnalysisStore(connection=sql_connection).get_by_protocol("protocol-id")
+
+    assert result == [
+        CompletedAnalysis(
+            id="analysis-id",
+            result=AnalysisResult.OK,
+            labware=[],
+            pipettes=[],
+            commands=[],
+            errors=[],
+        )
+    ]
+
+
+def test_get_validates_once(
+    monkeypatch: pytest.MonkeyPatch, sql_connection: sqlite3.Connection
+) -> None:
+    """It should only validate each stored analysis once."""
+    subject = AnalysisStore(connection=sql_connection)
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-1")
+    subject.update(
+        analysis_id="analysis-1",
+        commands=[],
+        errors=[],
+        labware=[],
+        pipettes=[],
+    )
+    parse_calls: List[str] = []
+    parse_raw = CompletedAnalysis.parse_raw
+
+    def _parse_raw(raw: str) -> CompletedAnalysis:
+        parse_calls.append(raw)
+        return parse_raw(raw)
+
+    monkeypatch.setattr(CompletedAnalysis, "parse_raw", _parse_raw)
+    subject.get_by_protocol("protocol-id")
+    assert parse_calls == []
+
+    reopened = AnalysisStore(connection=sql_connection)
+    first = reopened.get_by_protocol("protocol-id")
+    second = reopened.get_by_protocol("protocol-id")
+
+    assert len(parse_calls) == 1
+    assert first == second
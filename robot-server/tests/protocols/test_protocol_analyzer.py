@@ -1,7 +1,9 @@
 """Tests for the ProtocolAnalyzer."""
+import asyncio
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 from datetime import datetime
+from pathlib import Path
 
 from opentrons.types import MountType, DeckSlotName
 from opentrons.protocol_engine import (
@@ -9,17 +11,28 @@ from opentrons.protocol_engine import (
     errors as pe_errors,
     types as pe_types,
 )
-from opentrons.protocol_runner import ProtocolRunner, ProtocolRunData, JsonPreAnalysis
+from opentrons.protocol_runner import ProtocolRunData, ProtocolSource, JsonPreAnalysis
 
+from robot_server.protocols.analysis_cache import AnalysisCache
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_worker import (
+    AnalysisWorkerPool,
+    AnalysisWorkerError,
+)
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
 
 
 @pytest.fixture
-def protocol_runner(decoy: Decoy) -> ProtocolRunner:
-    """Get a mocked out ProtocolRunner."""
-    return decoy.mock(cls=ProtocolRunner)
+def worker_pool(decoy: Decoy) -> AnalysisWorkerPool:
+    """Get a mocked out AnalysisWorkerPool."""
+    return decoy.mock(cls=AnalysisWorkerPool)
+
+
+@pytest.fixture
+def analysis_cache(decoy: Decoy) -> AnalysisCache:
+    """Get a mocked out AnalysisCache."""
+    return decoy.mock(cls=AnalysisCache)
 
 
 @pytest.fixture
@@ -30,29 +43,50 @@ def analysis_store(decoy: Decoy) -> AnalysisStore:
 
 @pytest.fixture
 def subject(
-    protocol_runner: ProtocolRunner,
+    worker_pool: AnalysisWorkerPool,
+    analysis_cache: AnalysisCache,
     analysis_store: AnalysisStore,
 ) -> ProtocolAnalyzer:
     """Get a ProtocolAnalyzer test subject."""
     return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
+        worker_pool=worker_pool,
+        analysis_cache=analysis_cache,
         analysis_store=analysis_store,
     )
 
 
+@pytest.fixture
+def protocol_resource() -> ProtocolResource:
+    """Get a protocol to analyze."""
+    return ProtocolResource(
+        protocol_id="protocol-id",
+        pre_analysis=JsonPreAnalysis(schema_version=123, metadata={}),
+        created_at=datetime(year=2021, month=1, day=1),
+        files=[Path("/dev/null/protocol.json")],
+    )
+
+
+async def test_get_cache_key(
+    decoy: Decoy,
+    analysis_cache: AnalysisCache,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should get a protocol's cache key from the analysis cache."""
+    decoy.when(analysis_cache.get_key(protocol_resource.files)).then_return("key")
+
+    assert await subject.get_cache_key(protocol_resource) == "key"
+
+
 async def test_analyze(
     decoy: Decoy,
-    protocol_runner: ProtocolRunner,
+    worker_pool: AnalysisWorkerPool,
+    analysis_cache: AnalysisCache,
     analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
     subject: ProtocolAnalyzer,
 ) -> None:
-    """It should be able to analyize a protocol."""
-    protocol_resource = ProtocolResource(
-        protocol_id="protocol-id",
-        pre_analysis=JsonPreAnalysis(schema_version=123, metadata={}),
-        created_at=datetime(year=2021, month=1, day=1),
-        files=[],
-    )
+    """It should be able to analyize a protocol in a worker, and cache the result."""
 
     analysis_command = pe_commands.Pause(
         id="command-id",
@@ -82,21 +116,28 @@ async def test_analyze(
         mount=MountType.LEFT,
     )
 
-    decoy.when(await protocol_runner.run(protocol_resource)).then_return(
-        ProtocolRunData(
-            commands=[analysis_command],
-            errors=[analysis_error],
-            labware=[analysis_labware],
-            pipettes=[analysis_pipette],
-        )
+    result = ProtocolRunData(
+        commands=[analysis_command],
+        errors=[analysis_error],
+        labware=[analysis_labware],
+        pipettes=[analysis_pipette],
     )
+    protocol_source = ProtocolSource(
+        files=protocol_resource.files,
+        pre_analysis=protocol_resource.pre_analysis,
+    )
+
+    decoy.when(analysis_cache.get("key")).then_return(None)
+    decoy.when(await worker_pool.analyze(protocol_source)).then_return(result)
 
     await subject.analyze(
         protocol_resource=protocol_resource,
         analysis_id="analysis-id",
+        cache_key="key",
     )
 
     decoy.verify(
+        analysis_cache.put("key", result),
         analysis_store.update(
             analysis_id="analysis-id",
             commands=[analysis_command],
@@ -105,3 +146,152 @@ async def test_analyze(
             errors=[analysis_error],
         ),
     )
+
+
+async def test_analyze_cached(
+    decoy: Decoy,
+    worker_pool: AnalysisWorkerPool,
+    analysis_cache: AnalysisCache,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should store a cached result without analyzing the protocol again."""
+    result = ProtocolRunData(commands=[], errors=[], labware=[], pipettes=[])
+
+    decoy.when(analysis_cache.get("key")).then_return(result)
+
+    assert subject.analyze_from_cache(
+        cache_key="key",
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        analysis_store.update(
+            analysis_id="analysis-id",
+            commands=[],
+            labware=[],
+            pipettes=[],
+            errors=[],
+        ),
+    )
+    decoy.verify(await worker_pool.analyze(matchers.Anything()), times=0)
+
+
+def test_analyze_from_cache_miss(
+    decoy: Decoy,
+    analysis_cache: AnalysisCache,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should report a protocol with no cached analysis."""
+    decoy.when(analysis_cache.get("key")).then_return(None)
+
+    assert not subject.analyze_from_cache(
+        cache_key="key",
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        analysis_store.update(
+            analysis_id=matchers.Anything(),
+            commands=matchers.Anything(),
+            labware=matchers.Anything(),
+            pipettes=matchers.Anything(),
+            errors=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+
+async def test_analyze_worker_error(
+    decoy: Decoy,
+    worker_pool: AnalysisWorkerPool,
+    analysis_cache: AnalysisCache,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should store an error, and cache nothing, if the worker dies."""
+    decoy.when(analysis_cache.get("key")).then_return(None)
+    decoy.when(await worker_pool.analyze(matchers.Anything())).then_raise(
+        AnalysisWorkerError("oh no")
+    )
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+        cache_key="key",
+    )
+
+    errors = matchers.Captor()
+    decoy.verify(
+        analysis_store.update(
+            analysis_id="analysis-id",
+            commands=[],
+            labware=[],
+            pipettes=[],
+            errors=errors,
+        ),
+    )
+    assert [(e.errorType, e.detail) for e in errors.value] == [
+        ("AnalysisWorkerError", "oh no")
+    ]
+    decoy.verify(analysis_cache.put("key", matchers.Anything()), times=0)
+
+
+async def test_analyze_shares_analysis_in_progress(
+    decoy: Decoy,
+    analysis_cache: AnalysisCache,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+) -> None:
+    """It should analyze identical protocols uploaded together only once."""
+    result = ProtocolRunData(commands=[], errors=[], labware=[], pipettes=[])
+    sources = []
+    release = asyncio.Event()
+
+    class _FakeWorkerPool(AnalysisWorkerPool):
+        def __init__(self) -> None:
+            pass
+
+        async def analyze(self, protocol_source: ProtocolSource) -> ProtocolRunData:
+            sources.append(protocol_source)
+            await release.wait()
+            return result
+
+    subject = ProtocolAnalyzer(
+        worker_pool=_FakeWorkerPool(),
+        analysis_cache=analysis_cache,
+        analysis_store=analysis_store,
+    )
+
+    decoy.when(analysis_cache.get("key")).then_return(None)
+
+    tasks = [
+        asyncio.ensure_future(
+            subject.analyze(
+                protocol_resource=protocol_resource,
+                analysis_id=analysis_id,
+                cache_key="key",
+            )
+        )
+        for analysis_id in ("analysis-1", "analysis-2")
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert len(sources) == 1
+    decoy.verify(analysis_cache.put("key", result), times=1)
+    for analysis_id in ("analysis-1", "analysis-2"):
+        decoy.verify(
+            analysis_store.update(
+                analysis_id=analysis_id,
+                commands=[],
+                labware=[],
+                pipettes=[],
+                errors=[],
+            ),
+        )
@@ -1,5 +1,6 @@
 """Tests for the ProtocolStore interface."""
 import pytest
+import sqlite3
 from datetime import datetime
 from decoy import matchers
 from pathlib import Path
@@ -53,9 +54,9 @@ def upload_files(
 
 
 @pytest.fixture
-def subject(tmp_path: Path) -> ProtocolStore:
+def subject(tmp_path: Path, sql_connection: sqlite3.Connection) -> ProtocolStore:
     """Get a ProtocolStore test subject."""
-    return ProtocolStore(directory=tmp_path)
+    return ProtocolStore(directory=tmp_path, connection=sql_connection)
 
 
 async def test_create_and_get_json_protocol(
@@ -121,6 +122,32 @@ async def test_create_and_get_python_protocol(
     assert subject.get("protocol-id") == creation_result
 
 
+async def test_get_protocol_after_reopen(
+    tmp_path: Path,
+    upload_files: List[UploadFile],
+    subject: ProtocolStore,
+    sql_connection: sqlite3.Connection,
+) -> None:
+    """It should get a protocol from a new store on the same database."""
+    created_at = datetime.now()
+    pre_analysis = PythonPreAnalysis(
+        api_version=APIVersion(2, 10),
+        metadata={"protocolName": "My Protocol"},
+    )
+
+    creation_result = await subject.create(
+        protocol_id="protocol-id",
+        created_at=created_at,
+        files=upload_files,
+        pre_analysis=pre_analysis,
+    )
+
+    reopened = ProtocolStore(directory=tmp_path, connection=sql_connection)
+
+    assert reopened.get("protocol-id") == creation_result
+    assert reopened.get_all() == [creation_result]
+
+
 async def test_create_protocol_raises_for_missing_filename(
     tmp_path: Path,
     subject: ProtocolStore,
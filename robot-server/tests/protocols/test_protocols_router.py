@@ -19,7 +19,11 @@ from robot_server.protocols.protocol_models import Metadata, Protocol, ProtocolT
 from robot_server.protocols.analysis_store import AnalysisStore
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
 from robot_server.protocols.response_builder import ResponseBuilder
-from robot_server.protocols.analysis_models import PendingAnalysis
+from robot_server.protocols.analysis_models import (
+    AnalysisResult,
+    CompletedAnalysis,
+    PendingAnalysis,
+)
 
 from robot_server.protocols.protocol_store import (
     ProtocolStore,
@@ -223,6 +227,9 @@ async def test_create_protocol(
     decoy.when(
         analysis_store.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
     ).then_return([analysis])
+    decoy.when(await protocol_analyzer.get_cache_key(protocol_resource)).then_return(
+        "key"
+    )
 
     decoy.when(
         response_builder.build(resource=protocol_resource, analyses=[analysis])
@@ -248,10 +255,109 @@ async def test_create_protocol(
             protocol_analyzer.analyze,
             analysis_id="analysis-id",
             protocol_resource=protocol_resource,
+            cache_key="key",
         )
     )
 
 
+async def test_create_protocol_analysis_cached(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+    pre_analyzer: PreAnalyzer,
+    protocol_analyzer: ProtocolAnalyzer,
+    response_builder: ResponseBuilder,
+    task_runner: TaskRunner,
+    current_time: datetime,
+) -> None:
+    """It should respond with a cached analysis rather than analyze again."""
+    protocol_file = UploadFile(filename="foo.json")
+    pre_analysis = JsonPreAnalysis(schema_version=123, metadata={})
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        pre_analysis=pre_analysis,
+        created_at=current_time,
+        files=[],
+    )
+    pending_analysis = PendingAnalysis(id="analysis-id")
+    completed_analysis = CompletedAnalysis(
+        id="analysis-id",
+        result=AnalysisResult.OK,
+        commands=[],
+        labware=[],
+        pipettes=[],
+        errors=[],
+    )
+    protocol = Protocol(
+        id="protocol-id",
+        createdAt=current_time,
+        protocolType=ProtocolType.JSON,
+        metadata=Metadata(),
+        analyses=[completed_analysis],
+        files=[],
+    )
+
+    decoy.when(pre_analyzer.analyze([protocol_file])).then_return(pre_analysis)
+
+    decoy.when(
+        await protocol_store.create(
+            protocol_id="protocol-id",
+            created_at=current_time,
+            files=[protocol_file],
+            pre_analysis=pre_analysis,
+        )
+    ).then_return(protocol_resource)
+
+    decoy.when(
+        analysis_store.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+    ).then_return([pending_analysis])
+    decoy.when(await protocol_analyzer.get_cache_key(protocol_resource)).then_return(
+        "key"
+    )
+
+    decoy.when(
+        protocol_analyzer.analyze_from_cache(
+            cache_key="key",
+            analysis_id="analysis-id",
+        )
+    ).then_return(True)
+
+    decoy.when(analysis_store.get_by_protocol(protocol_id="protocol-id")).then_return(
+        [completed_analysis]
+    )
+
+    decoy.when(
+        response_builder.build(
+            resource=protocol_resource, analyses=[completed_analysis]
+        )
+    ).then_return(protocol)
+
+    result = await create_protocol(
+        files=[protocol_file],
+        response_builder=response_builder,
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+        pre_analyzer=pre_analyzer,
+        protocol_analyzer=protocol_analyzer,
+        task_runner=task_runner,
+        protocol_id="protocol-id",
+        analysis_id="analysis-id",
+        created_at=current_time,
+    )
+
+    assert result.data == protocol
+
+    decoy.verify(
+        task_runner.run(
+            protocol_analyzer.analyze,
+            analysis_id="analysis-id",
+            protocol_resource=protocol_resource,
+            cache_key="key",
+        ),
+        times=0,
+    )
+
+
 async def test_create_protocol_not_pre_analyzable(
     decoy: Decoy,
     pre_analyzer: PreAnalyzer,
@@ -307,11 +413,19 @@ async def test_create_protocol_invalid_file(
 async def test_delete_protocol_by_id(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
 ) -> None:
-    """It should remove a single protocol file."""
-    result = await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+    """It should remove a single protocol file and its analyses."""
+    result = await delete_protocol_by_id(
+        "protocol-id",
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+    )
 
-    decoy.verify(protocol_store.remove(protocol_id="protocol-id"))
+    decoy.verify(
+        protocol_store.remove(protocol_id="protocol-id"),
+        analysis_store.remove_by_protocol(protocol_id="protocol-id"),
+    )
 
     assert result.data is None
 
@@ -319,6 +433,7 @@ async def test_delete_protocol_by_id(
 async def test_delete_protocol_not_found(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
 ) -> None:
     """It should 404 if the protocol to delete is not found."""
     not_found_error = ProtocolNotFoundError("protocol-id")
@@ -328,6 +443,10 @@ async def test_delete_protocol_not_found(
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+        await delete_protocol_by_id(
+            "protocol-id",
+            protocol_store=protocol_store,
+            analysis_store=analysis_store,
+        )
 
     assert exc_info.value.status_code == 404
@@ -2,6 +2,7 @@
 import pytest
 from datetime import datetime
 from decoy import Decoy, matchers
+from fastapi import Response
 
 from opentrons.types import DeckSlotName, MountType
 from opentrons.protocol_engine import (
@@ -22,8 +23,15 @@ from robot_server.protocols import (
     ProtocolNotFoundError,
 )
 
+from robot_server.runs.action_models import RunAction, RunActionType
 from robot_server.runs.run_view import RunView
-from robot_server.runs.run_models import RunCommandSummary, Run, RunCreate, RunUpdate
+from robot_server.runs.run_models import (
+    RunCommandSummary,
+    Run,
+    RunSummary,
+    RunCreate,
+    RunUpdate,
+)
 
 from robot_server.runs.engine_store import (
     EngineStore,
@@ -35,12 +43,15 @@ from robot_server.runs.run_store import (
     RunStore,
     RunNotFoundError,
     RunResource,
+    RunState,
 )
 
 from robot_server.runs.router.base_router import (
     AllRunsLinks,
     create_run,
     get_run,
+    get_run_etag,
+    get_run_resource,
     get_runs,
     remove_run,
     update_run,
@@ -277,10 +288,13 @@ async def test_get_run(
 
     result = await get_run(
         runId="run-id",
+        response=Response(),
+        if_none_match=None,
         run_store=run_store,
         engine_store=engine_store,
     )
 
+    assert isinstance(result, ResponseModel)
     assert result.data == expected_response
 
 
@@ -355,10 +369,70 @@ async def test_get_run_with_errors(
 
     result = await get_run(
         runId="run-id",
+        response=Response(),
+        if_none_match=None,
         run_store=run_store,
         engine_store=engine_store,
     )
 
+    assert isinstance(result, ResponseModel)
+    assert result.data == expected_response
+
+
+async def test_get_finished_run(
+    decoy: Decoy,
+    run_store: RunStore,
+    engine_store: EngineStore,
+) -> None:
+    """It should get the stored state of a run whose engine is gone."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1),
+        actions=[],
+        is_current=False,
+    )
+
+    command_summary = RunCommandSummary(
+        id="command-id",
+        commandType="pause",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+    )
+
+    expected_response = Run(
+        id="run-id",
+        protocolId=None,
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=pe_types.EngineStatus.SUCCEEDED,
+        current=False,
+        actions=[],
+        errors=[],
+        commands=[command_summary],
+        pipettes=[],
+        labware=[],
+    )
+
+    decoy.when(run_store.get(run_id="run-id")).then_return(run)
+    decoy.when(engine_store.get_state("run-id")).then_raise(EngineMissingError())
+    decoy.when(run_store.get_state("run-id", include_commands=True)).then_return(
+        RunState(
+            status=pe_types.EngineStatus.SUCCEEDED,
+            commands=[command_summary],
+            errors=[],
+            labware=[],
+            pipettes=[],
+        )
+    )
+
+    result = await get_run(
+        runId="run-id",
+        response=Response(),
+        if_none_match=None,
+        run_store=run_store,
+        engine_store=engine_store,
+    )
+
+    assert isinstance(result, ResponseModel)
     assert result.data == expected_response
 
 
@@ -369,12 +443,106 @@ async def test_get_run_with_missing_id(decoy: Decoy, run_store: RunStore) -> Non
     decoy.when(run_store.get(run_id="run-id")).then_raise(not_found_error)
 
     with pytest.raises(ApiError) as exc_info:
-        await get_run(runId="run-id", run_store=run_store)
+        await get_run(
+            runId="run-id",
+            response=Response(),
+            if_none_match=None,
+            run_store=run_store,
+        )
 
     assert exc_info.value.status_code == 404
     assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
 
 
+async def test_get_run_not_modified(
+    decoy: Decoy,
+    run_store: RunStore,
+    engine_store: EngineStore,
+) -> None:
+    """It should 304 without building the run if the client's copy is current."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1),
+        actions=[],
+        is_current=True,
+    )
+
+    engine_state = decoy.mock(cls=StateView)
+
+    decoy.when(run_store.get(run_id="run-id")).then_return(run)
+    decoy.when(engine_store.get_state("run-id")).then_return(engine_state)
+    decoy.when(engine_state.get_version()).then_return(42)
+
+    response = Response()
+    result = await get_run(
+        runId="run-id",
+        response=response,
+        if_none_match='"run-id-1-0-42"',
+        run_store=run_store,
+        engine_store=engine_store,
+    )
+
+    assert isinstance(result, Response)
+    assert result.status_code == 304
+    assert result.headers["ETag"] == '"run-id-1-0-42"'
+    decoy.verify(engine_state.commands.get_all(), times=0)
+
+
+def test_get_run_etag(
+    decoy: Decoy,
+    engine_store: EngineStore,
+) -> None:
+    """It should get a run's ETag from its engine's state version, if it has one."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1),
+        actions=[
+            RunAction(
+                id="action-id",
+                actionType=RunActionType.PLAY,
+                createdAt=datetime(year=2022, month=2, day=2),
+            )
+        ],
+        is_current=True,
+    )
+
+    engine_state = decoy.mock(cls=StateView)
+
+    decoy.when(engine_store.get_state("run-id")).then_return(engine_state)
+    decoy.when(engine_state.get_version()).then_return(42)
+
+    assert get_run_etag(run, engine_store) == '"run-id-1-1-42"'
+
+    decoy.when(engine_store.get_state("run-id")).then_raise(EngineMissingError())
+
+    assert get_run_etag(run, engine_store) == '"run-id-1-1-stored"'
+
+
+async def test_get_run_resource(decoy: Decoy, run_store: RunStore) -> None:
+    """It should get a run's resource, or 404 if it does not exist."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1),
+        actions=[],
+        is_current=True,
+    )
+
+    decoy.when(run_store.get(run_id="run-id")).then_return(run)
+    decoy.when(run_store.get(run_id="other-id")).then_raise(
+        RunNotFoundError(run_id="other-id")
+    )
+
+    assert await get_run_resource(runId="run-id", run_store=run_store) == run
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_run_resource(runId="other-id", run_store=run_store)
+
+    assert exc_info.value.status_code == 404
+
+
 async def test_get_runs_empty(decoy: Decoy, run_store: RunStore) -> None:
     """It should return an empty collection response when no runs exist."""
     decoy.when(run_store.get_all()).then_return([])
@@ -390,7 +558,7 @@ async def test_get_runs_not_empty(
     run_store: RunStore,
     engine_store: EngineStore,
 ) -> None:
-    """It should return a collection response when a run exists."""
+    """It should return a collection of run summaries when runs exist."""
     created_at_1 = datetime(year=2021, month=1, day=1)
     created_at_2 = datetime(year=2022, month=2, day=2)
 
@@ -410,27 +578,25 @@ async def test_get_runs_not_empty(
         is_current=True,
     )
 
-    response_1 = Run(
+    response_1 = RunSummary(
         id="unique-id-1",
         protocolId=None,
         createdAt=created_at_1,
         status=pe_types.EngineStatus.SUCCEEDED,
         current=False,
         actions=[],
-        commands=[],
         errors=[],
         pipettes=[],
         labware=[],
     )
 
-    response_2 = Run(
+    response_2 = RunSummary(
         id="unique-id-2",
         protocolId=None,
         createdAt=created_at_2,
         status=pe_types.EngineStatus.IDLE,
         current=True,
         actions=[],
-        commands=[],
         errors=[],
         pipettes=[],
         labware=[],
@@ -438,18 +604,19 @@ async def test_get_runs_not_empty(
 
     decoy.when(run_store.get_all()).then_return([run_1, run_2])
 
-    engine_state_1 = decoy.mock(cls=StateView)
     engine_state_2 = decoy.mock(cls=StateView)
 
-    decoy.when(engine_store.get_state("unique-id-1")).then_return(engine_state_1)
+    decoy.when(engine_store.get_state("unique-id-1")).then_raise(EngineMissingError())
     decoy.when(engine_store.get_state("unique-id-2")).then_return(engine_state_2)
 
-    decoy.when(engine_state_1.commands.get_all()).then_return([])
-    decoy.when(engine_state_1.commands.get_all_errors()).then_return([])
-    decoy.when(engine_state_1.pipettes.get_all()).then_return([])
-    decoy.when(engine_state_1.labware.get_all()).then_return([])
-    decoy.when(engine_state_1.commands.get_status()).then_return(
-        pe_types.EngineStatus.SUCCEEDED
+    decoy.when(run_store.get_state("unique-id-1", include_commands=False)).then_return(
+        RunState(
+            status=pe_types.EngineStatus.SUCCEEDED,
+            commands=[],
+            errors=[],
+            labware=[],
+            pipettes=[],
+        )
     )
 
     decoy.when(engine_state_2.commands.get_all()).then_return([])
@@ -479,7 +646,7 @@ async def test_delete_run_by_id(
     )
 
     decoy.verify(
-        engine_store.clear(),
+        await engine_store.clear(),
         run_store.remove(run_id="run-id"),
     )
 
@@ -513,7 +680,7 @@ async def test_delete_active_run(
     run_store: RunStore,
 ) -> None:
     """It should 409 if the run is not finished."""
-    decoy.when(engine_store.clear()).then_raise(EngineConflictError("oh no"))
+    decoy.when(await engine_store.clear()).then_raise(EngineConflictError("oh no"))
 
     with pytest.raises(ApiError) as exc_info:
         await remove_run(
@@ -605,7 +772,7 @@ async def test_update_run_to_not_current(
 
     assert result == ResponseModel(data=expected_response, links=None)
     decoy.verify(
-        engine_store.clear(),
+        await engine_store.clear(),
         run_store.upsert(updated_resource),
     )
 
@@ -666,7 +833,7 @@ async def test_update_current_to_current_noop(
 
     assert result == ResponseModel(data=expected_response, links=None)
     decoy.verify(run_store.upsert(run_resource), times=0)
-    decoy.verify(engine_store.clear(), times=0)
+    decoy.verify(await engine_store.clear(), times=0)
 
 
 async def test_update_to_current_conflict(
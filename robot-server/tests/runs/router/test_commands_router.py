@@ -3,7 +3,9 @@ import pytest
 
 from datetime import datetime
 from decoy import Decoy
+from fastapi import Response
 
+from opentrons.protocol_engine.state import CommandSlice
 from opentrons.protocol_engine import (
     CommandStatus,
     EngineStatus,
@@ -13,9 +15,14 @@ from opentrons.protocol_engine import (
 )
 
 from robot_server.errors import ApiError
-from robot_server.service.json_api import RequestModel, ResponseModel
-from robot_server.runs.run_models import Run, RunCommandSummary
-from robot_server.runs.engine_store import EngineStore
+from robot_server.service.json_api import (
+    RequestModel,
+    MultiResponseMeta,
+    PaginatedResponseModel,
+)
+from robot_server.runs.run_models import RunCommandSummary
+from robot_server.runs.run_store import RunStore, RunResource, RunState
+from robot_server.runs.engine_store import EngineStore, EngineMissingError
 from robot_server.runs.router.commands_router import (
     create_run_command,
     get_run_command,
@@ -29,17 +36,12 @@ async def test_create_run_command(decoy: Decoy, engine_store: EngineStore) -> No
         params=pe_commands.PauseParams(message="Hello")
     )
 
-    run = Run(
-        id="run-id",
-        protocolId=None,
-        createdAt=datetime(year=2021, month=1, day=1),
-        status=EngineStatus.RUNNING,
-        current=True,
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1),
         actions=[],
-        commands=[],
-        errors=[],
-        pipettes=[],
-        labware=[],
+        is_current=True,
     )
 
     output_command = pe_commands.Pause(
@@ -57,7 +59,7 @@ async def test_create_run_command(decoy: Decoy, engine_store: EngineStore) -> No
     response = await create_run_command(
         request_body=RequestModel(data=command_request),
         engine_store=engine_store,
-        run=ResponseModel(data=run, links=None),
+        run=run,
     )
 
     assert response.data == output_command
@@ -72,67 +74,230 @@ async def test_create_run_command_not_current(
         params=pe_commands.PauseParams(message="Hello")
     )
 
-    run = Run(
-        id="run-id",
-        protocolId=None,
-        createdAt=datetime(year=2021, month=1, day=1),
-        status=EngineStatus.RUNNING,
-        current=False,
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1),
         actions=[],
-        commands=[],
-        errors=[],
-        pipettes=[],
-        labware=[],
+        is_current=False,
     )
 
     with pytest.raises(ApiError) as exc_info:
         await create_run_command(
             request_body=RequestModel(data=command_request),
             engine_store=engine_store,
-            run=ResponseModel(data=run, links=None),
+            run=run,
         )
 
     assert exc_info.value.status_code == 400
     assert exc_info.value.content["errors"][0]["id"] == "RunStopped"
 
 
-async def test_get_run_commands() -> None:
-    """It should return a list of all commands in a run."""
-    command_summary = RunCommandSummary(
+async def test_get_run_commands(
+    decoy: Decoy,
+    engine_store: EngineStore,
+    run_store: RunStore,
+) -> None:
+    """It should return a page of commands in a run."""
+    command = pe_commands.MoveToWell(
         id="command-id",
-        commandType="moveToWell",
         status=CommandStatus.RUNNING,
+        createdAt=datetime(year=2022, month=2, day=2),
+        params=pe_commands.MoveToWellParams(pipetteId="a", labwareId="b", wellName="c"),
     )
 
-    run = Run(
-        id="run-id",
-        protocolId=None,
-        createdAt=datetime(year=2021, month=1, day=1),
-        status=EngineStatus.RUNNING,
-        current=True,
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1),
         actions=[],
-        commands=[command_summary],
-        errors=[],
-        pipettes=[],
-        labware=[],
+        is_current=True,
+    )
+
+    engine_state = decoy.mock(cls=StateView)
+
+    decoy.when(engine_store.get_state("run-id")).then_return(engine_state)
+    decoy.when(engine_state.get_version()).then_return(1)
+    decoy.when(engine_state.commands.get_slice(cursor=1, length=2)).then_return(
+        CommandSlice(commands=[command], cursor=1, total_length=2)
     )
 
-    response = await get_run_commands(run=ResponseModel(data=run, links=None))
+    response = Response()
+    result = await get_run_commands(
+        response=response,
+        cursor=1,
+        pageLength=2,
+        if_none_match=None,
+        engine_store=engine_store,
+        run_store=run_store,
+        run=run,
+    )
 
-    assert response.data == [command_summary]
+    assert isinstance(result, PaginatedResponseModel)
+    assert result.data == [
+        RunCommandSummary(
+            id="command-id",
+            commandType="moveToWell",
+            status=CommandStatus.RUNNING,
+        )
+    ]
+    assert result.meta == MultiResponseMeta(cursor=1, totalLength=2)
+    assert response.headers["ETag"] == '"run-id-1-0-1-1-2"'
 
 
-async def test_get_run_command_by_id(
+async def test_get_finished_run_commands(
     decoy: Decoy,
     engine_store: EngineStore,
+    run_store: RunStore,
 ) -> None:
-    """It should return full details about a command by ID."""
-    command_summary = RunCommandSummary(
-        id="command-id",
-        commandType="moveToWell",
-        status=CommandStatus.RUNNING,
+    """It should return a page of the stored commands of a finished run."""
+    command_summaries = [
+        RunCommandSummary(
+            id=f"command-{i}",
+            commandType="pause",
+            status=CommandStatus.SUCCEEDED,
+        )
+        for i in range(3)
+    ]
+
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1),
+        actions=[],
+        is_current=False,
+    )
+
+    decoy.when(engine_store.get_state("run-id")).then_raise(EngineMissingError())
+    decoy.when(run_store.get_state("run-id")).then_return(
+        RunState(
+            status=EngineStatus.SUCCEEDED,
+            commands=command_summaries,
+            errors=[],
+            labware=[],
+            pipettes=[],
+        )
+    )
+
+    result = await get_run_commands(
+        response=Response(),
+        cursor=1,
+        pageLength=None,
+        if_none_match=None,
+        engine_store=engine_store,
+        run_store=run_store,
+        run=run,
+    )
+
+    assert isinstance(result, PaginatedResponseModel)
+    assert result.data == command_summaries[1:]
+    assert result.meta == MultiResponseMeta(cursor=1, totalLength=3)
+
+
+async def test_get_run_commands_not_modified(
+    decoy: Decoy,
+    engine_store: EngineStore,
+    run_store: RunStore,
+) -> None:
+    """It should respond 304 if the client's copy of the run is current."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1),
+        actions=[],
+        is_current=False,
+    )
+
+    decoy.when(engine_store.get_state("run-id")).then_raise(EngineMissingError())
+
+    result = await get_run_commands(
+        response=Response(),
+        cursor=0,
+        pageLength=None,
+        if_none_match='"run-id-0-0-stored-0-all"',
+        engine_store=engine_store,
+        run_store=run_store,
+        run=run,
+    )
+
+    assert isinstance(result, Response)
+    assert result.status_code == 304
+    decoy.verify(run_store.get_state("run-id"), times=0)
+
+
+async def test_get_run_commands_pages_not_modified(
+    decoy: Decoy,
+    engine_store: EngineStore,
+    run_store: RunStore,
+) -> None:
+    """It should only respond 304 to the page the client's copy is of."""
+    command_summaries = [
+        RunCommandSummary(
+            id=f"command-{i}",
+            commandType="pause",
+            status=CommandStatus.SUCCEEDED,
+        )
+        for i in range(3)
+    ]
+
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1),
+        actions=[],
+        is_current=False,
+    )
+
+    decoy.when(engine_store.get_state("run-id")).then_raise(EngineMissingError())
+    decoy.when(run_store.get_state("run-id")).then_return(
+        RunState(
+            status=EngineStatus.SUCCEEDED,
+            commands=command_summaries,
+            errors=[],
+            labware=[],
+            pipettes=[],
+        )
+    )
+
+    etag = None
+    pages = []
+
+    for cursor in (0, 2):
+        response = Response()
+        result = await get_run_commands(
+            response=response,
+            cursor=cursor,
+            pageLength=2,
+            if_none_match=etag,
+            engine_store=engine_store,
+            run_store=run_store,
+            run=run,
+        )
+        assert isinstance(result, PaginatedResponseModel)
+        pages.append(result.data)
+        etag = response.headers["ETag"]
+
+    assert pages == [command_summaries[:2], command_summaries[2:]]
+
+    result = await get_run_commands(
+        response=Response(),
+        cursor=2,
+        pageLength=2,
+        if_none_match=etag,
+        engine_store=engine_store,
+        run_store=run_store,
+        run=run,
     )
 
+    assert isinstance(result, Response)
+    assert result.status_code == 304
+
+
+async def test_get_run_command_by_id(
+    decoy: Decoy,
+    engine_store: EngineStore,
+) -> None:
+    """It should return full details about a command by ID."""
     command = pe_commands.MoveToWell(
         id="command-id",
         status=CommandStatus.RUNNING,
@@ -140,17 +305,12 @@ async def test_get_run_command_by_id(
         params=pe_commands.MoveToWellParams(pipetteId="a", labwareId="b", wellName="c"),
     )
 
-    run = Run(
-        id="run-id",
-        protocolId=None,
-        createdAt=datetime(year=2021, month=1, day=1),
-        status=EngineStatus.RUNNING,
-        current=True,
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1),
         actions=[],
-        commands=[command_summary],
-        errors=[],
-        pipettes=[],
-        labware=[],
+        is_current=True,
     )
 
     engine_state = decoy.mock(cls=StateView)
@@ -161,7 +321,41 @@ async def test_get_run_command_by_id(
     response = await get_run_command(
         commandId="command-id",
         engine_store=engine_store,
-        run=ResponseModel(data=run, links=None),
+        run=run,
+    )
+
+    assert response.data == command
+
+
+async def test_get_finished_run_command_by_id(
+    decoy: Decoy,
+    engine_store: EngineStore,
+    run_store: RunStore,
+) -> None:
+    """It should get a command of a run whose engine is gone from storage."""
+    command = pe_commands.MoveToWell(
+        id="command-id",
+        status=CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2022, month=2, day=2),
+        params=pe_commands.MoveToWellParams(pipetteId="a", labwareId="b", wellName="c"),
+    )
+
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1),
+        actions=[],
+        is_current=False,
+    )
+
+    decoy.when(engine_store.get_state("run-id")).then_raise(EngineMissingError())
+    decoy.when(run_store.get_command("run-id", "command-id")).then_return(command)
+
+    response = await get_run_command(
+        commandId="command-id",
+        engine_store=engine_store,
+        run_store=run_store,
+        run=run,
     )
 
     assert response.data == command
@@ -174,17 +368,12 @@ async def test_get_run_command_missing_command(
     """It should 404 if you attempt to get a non-existent command."""
     key_error = pe_errors.CommandDoesNotExistError("oh no")
 
-    run = Run(
-        id="run-id",
-        protocolId=None,
-        createdAt=datetime(year=2021, month=1, day=1),
-        status=EngineStatus.RUNNING,
-        current=True,
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1),
         actions=[],
-        commands=[],
-        errors=[],
-        pipettes=[],
-        labware=[],
+        is_current=True,
     )
 
     engine_state = decoy.mock(cls=StateView)
@@ -195,7 +384,7 @@ async def test_get_run_command_missing_command(
         await get_run_command(
             commandId="command-id",
             engine_store=engine_store,
-            run=ResponseModel(data=run, links=None),
+            run=run,
         )
 
     assert exc_info.value.status_code == 404
@@ -0,0 +1,71 @@
+"""Tests for the /runs/{runId}/events websocket."""
+import pytest
+from decoy import Decoy
+from starlette.websockets import WebSocket
+from typing import AsyncIterator
+
+from robot_server.service.notifications import handle_subscriber
+from robot_server.runs.engine_store import EngineStore, EngineMissingError
+from robot_server.runs.event_log import RunEventLog
+from robot_server.runs.router.events_router import stream_run_events
+
+
+@pytest.fixture
+def websocket(decoy: Decoy) -> WebSocket:
+    """Get a mocked out websocket connection."""
+    return decoy.mock(cls=WebSocket)
+
+
+async def test_stream_run_events(
+    decoy: Decoy,
+    monkeypatch: pytest.MonkeyPatch,
+    websocket: WebSocket,
+    engine_store: EngineStore,
+) -> None:
+    """It should stream the current run's event log from the given cursor."""
+
+    async def _events() -> AsyncIterator[str]:
+        yield "event"
+
+    event_log = decoy.mock(cls=RunEventLog)
+    events = _events()
+    handle_stream = decoy.mock(func=handle_subscriber.handle_stream)
+    monkeypatch.setattr(handle_subscriber, "handle_stream", handle_stream)
+
+    decoy.when(engine_store.get_event_log("run-id")).then_return(event_log)
+    decoy.when(event_log.stream(cursor=3)).then_return(events)
+
+    await stream_run_events(
+        websocket=websocket,
+        runId="run-id",
+        cursor=3,
+        engine_store=engine_store,
+    )
+
+    decoy.verify(
+        await websocket.accept(),
+        await handle_stream(websocket, events),
+    )
+
+
+async def test_stream_run_events_not_current(
+    decoy: Decoy,
+    websocket: WebSocket,
+    engine_store: EngineStore,
+) -> None:
+    """It should close the connection if the run is not current."""
+    decoy.when(engine_store.get_event_log("run-id")).then_raise(
+        EngineMissingError("oh no")
+    )
+
+    await stream_run_events(
+        websocket=websocket,
+        runId="run-id",
+        cursor=0,
+        engine_store=engine_store,
+    )
+
+    decoy.verify(
+        await websocket.accept(),
+        await websocket.close(),
+    )
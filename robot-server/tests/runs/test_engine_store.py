@@ -1,25 +1,34 @@
 """Tests for the EngineStore interface."""
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 
 from opentrons.hardware_control import API as HardwareAPI
 from opentrons.protocol_engine import ProtocolEngine
 from opentrons.protocol_runner import ProtocolRunner
 
+from robot_server.runs.run_store import RunStore
 from robot_server.runs.engine_store import (
     EngineStore,
     EngineMissingError,
     EngineConflictError,
+    get_run_state,
 )
+from robot_server.runs.event_log import RunEventLog
 
 
 @pytest.fixture
-def subject(decoy: Decoy) -> EngineStore:
+def run_store(decoy: Decoy) -> RunStore:
+    """Get a mocked out RunStore."""
+    return decoy.mock(cls=RunStore)
+
+
+@pytest.fixture
+def subject(decoy: Decoy, run_store: RunStore) -> EngineStore:
     """Get a EngineStore test subject."""
     # TODO(mc, 2021-06-11): to make these test more effective and valuable, we
     # should pass in some sort of actual, valid HardwareAPI instead of a mock
     hardware_api = decoy.mock(cls=HardwareAPI)
-    return EngineStore(hardware_api=hardware_api)
+    return EngineStore(hardware_api=hardware_api, run_store=run_store)
 
 
 async def test_create_engine(subject: EngineStore) -> None:
@@ -32,14 +41,28 @@ async def test_create_engine(subject: EngineStore) -> None:
     assert result is subject.get_state("run-id")
 
 
-async def test_archives_state_if_engine_already_exists(subject: EngineStore) -> None:
+async def test_archives_state_if_engine_already_exists(
+    decoy: Decoy,
+    run_store: RunStore,
+    subject: EngineStore,
+) -> None:
     """It should not create more than one engine / runner pair."""
     state_1 = await subject.create(run_id="run-id-1")
     await subject.runner.stop()
     state_2 = await subject.create(run_id="run-id-2")
 
     assert state_2 is subject.engine.state_view
-    assert state_1 is subject.get_state("run-id-1")
+
+    with pytest.raises(EngineMissingError):
+        subject.get_state("run-id-1")
+
+    decoy.verify(
+        await run_store.insert_state(
+            run_id="run-id-1",
+            state=get_run_state(state_1),
+            commands=state_1.commands.get_all(),
+        )
+    )
 
 
 async def test_cannot_create_engine_if_active(subject: EngineStore) -> None:
@@ -59,11 +82,50 @@ def test_raise_if_engine_does_not_exist(subject: EngineStore) -> None:
         subject.runner
 
 
-async def test_clear_engine(subject: EngineStore) -> None:
-    """It should clear a stored engine entry."""
+async def test_get_event_log(subject: EngineStore) -> None:
+    """It should keep an event log for the current run."""
+    await subject.create(run_id="run-id")
+
+    result = subject.get_event_log("run-id")
+
+    assert isinstance(result, RunEventLog)
+
+    with pytest.raises(EngineMissingError):
+        subject.get_event_log("other-run-id")
+
+
+async def test_clear_engine_closes_event_log(subject: EngineStore) -> None:
+    """It should end the event log's streams when the run is archived."""
     await subject.create(run_id="run-id")
+    event_log = subject.get_event_log("run-id")
     await subject.runner.stop()
-    subject.clear()
+    await subject.clear()
+
+    events = [event async for event in event_log.stream(cursor=0)]
+
+    assert len(events) > 0
+
+    with pytest.raises(EngineMissingError):
+        subject.get_event_log("run-id")
+
+
+async def test_clear_engine(
+    decoy: Decoy,
+    run_store: RunStore,
+    subject: EngineStore,
+) -> None:
+    """It should clear a stored engine entry, archiving its state."""
+    await subject.create(run_id="run-id")
+    await subject.runner.stop()
+    await subject.clear()
+
+    decoy.verify(
+        await run_store.insert_state(
+            run_id="run-id",
+            state=matchers.Anything(),
+            commands=matchers.Anything(),
+        )
+    )
 
     with pytest.raises(EngineMissingError):
         subject.engine
@@ -74,7 +136,7 @@ async def test_clear_engine(subject: EngineStore) -> None:
 
 async def test_clear_engine_noop(subject: EngineStore) -> None:
     """It should noop if clear called and no stored engine entry."""
-    subject.clear()
+    await subject.clear()
 
 
 async def test_clear_engine_not_stopped(subject: EngineStore) -> None:
@@ -82,4 +144,4 @@ async def test_clear_engine_not_stopped(subject: EngineStore) -> None:
     await subject.create(run_id="run-id")
 
     with pytest.raises(EngineConflictError):
-        subject.clear()
+        await subject.clear()
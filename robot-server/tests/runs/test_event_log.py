@@ -0,0 +1,157 @@
+"""Tests for the RunEventLog ProtocolEngine plugin."""
+import asyncio
+from asyncio import AbstractEventLoop
+from datetime import datetime
+from typing import List
+
+import pytest
+from decoy import Decoy
+
+from opentrons.hardware_control import API as HardwareAPI
+from opentrons.protocol_engine import (
+    EngineStatus,
+    ProtocolEngine,
+    actions as pe_actions,
+    commands as pe_commands,
+    create_protocol_engine,
+)
+
+from robot_server.runs.event_log import RunEventLog
+from robot_server.runs.event_models import CommandUpdated, Resync, StatusUpdated
+from robot_server.runs.run_models import RunCommandSummary
+
+
+@pytest.fixture
+async def engine(decoy: Decoy, loop: AbstractEventLoop) -> ProtocolEngine:
+    """Get a ProtocolEngine with a mocked out HardwareAPI."""
+    return await create_protocol_engine(hardware_api=decoy.mock(cls=HardwareAPI))
+
+
+@pytest.fixture
+def subject(engine: ProtocolEngine) -> RunEventLog:
+    """Get a RunEventLog test subject, plugged into the engine."""
+    event_log = RunEventLog()
+    engine.add_plugin(event_log)
+    return event_log
+
+
+def _add_pause(engine: ProtocolEngine) -> pe_commands.Command:
+    return engine.add_command(
+        pe_commands.PauseCreate(params=pe_commands.PauseParams(message="hello"))
+    )
+
+
+def _command_updated(
+    cursor: int,
+    command: pe_commands.Command,
+    status: pe_commands.CommandStatus,
+) -> str:
+    return CommandUpdated(
+        cursor=cursor,
+        command=RunCommandSummary(
+            id=command.id,
+            commandType=command.commandType,
+            status=status,
+        ),
+    ).json()
+
+
+async def test_initial_status(subject: RunEventLog) -> None:
+    """It should start with the run's status."""
+    result = await subject.get_events(cursor=0)
+
+    assert result == [StatusUpdated(cursor=0, status=EngineStatus.IDLE).json()]
+
+
+async def test_command_events(engine: ProtocolEngine, subject: RunEventLog) -> None:
+    """It should log added commands, in order, from the given cursor."""
+    command_1 = _add_pause(engine)
+    command_2 = _add_pause(engine)
+
+    result = await subject.get_events(cursor=1)
+
+    assert result == [
+        _command_updated(1, command_1, pe_commands.CommandStatus.QUEUED),
+        _command_updated(2, command_2, pe_commands.CommandStatus.QUEUED),
+        StatusUpdated(cursor=3, status=EngineStatus.RUNNING).json(),
+    ]
+
+
+async def test_coalesce_command_changes(
+    engine: ProtocolEngine,
+    subject: RunEventLog,
+) -> None:
+    """It should log one event with the latest summary of a command."""
+    command = _add_pause(engine)
+    subject.dispatch(
+        pe_actions.UpdateCommandAction(
+            command=command.copy(
+                update={
+                    "status": pe_commands.CommandStatus.SUCCEEDED,
+                    "completedAt": datetime.now(),
+                }
+            )
+        )
+    )
+
+    result = await subject.get_events(cursor=1)
+
+    assert result == [
+        _command_updated(1, command, pe_commands.CommandStatus.SUCCEEDED),
+    ]
+
+
+async def test_status_events(engine: ProtocolEngine, subject: RunEventLog) -> None:
+    """It should log changes to the run's status."""
+    await subject.get_events(cursor=0)
+    engine.pause()
+
+    result = await subject.get_events(cursor=1)
+
+    assert result == [StatusUpdated(cursor=1, status=EngineStatus.PAUSED).json()]
+
+
+async def test_wait_for_events(engine: ProtocolEngine, subject: RunEventLog) -> None:
+    """It should wait for new events if there are none past the cursor."""
+    task = asyncio.create_task(subject.get_events(cursor=1))
+    await asyncio.sleep(0)
+
+    assert not task.done()
+
+    command = _add_pause(engine)
+    result = await task
+
+    assert result == [
+        _command_updated(1, command, pe_commands.CommandStatus.QUEUED),
+        StatusUpdated(cursor=2, status=EngineStatus.RUNNING).json(),
+    ]
+
+
+async def test_close_ends_stream(engine: ProtocolEngine, subject: RunEventLog) -> None:
+    """It should end every stream once closed."""
+
+    async def _collect() -> List[str]:
+        return [event async for event in subject.stream(cursor=0)]
+
+    task = asyncio.create_task(_collect())
+    await asyncio.sleep(0)
+    command = _add_pause(engine)
+    subject.close()
+
+    assert await task == [
+        StatusUpdated(cursor=0, status=EngineStatus.IDLE).json(),
+        _command_updated(1, command, pe_commands.CommandStatus.QUEUED),
+        StatusUpdated(cursor=2, status=EngineStatus.RUNNING).json(),
+    ]
+
+
+async def test_stream_resync(subject: RunEventLog) -> None:
+    """It should restart a stream from a cursor past the end of the log."""
+    subject.close()
+
+    result = [event async for event in subject.stream(cursor=5)]
+
+    assert result == [
+        Resync().json(),
+        StatusUpdated(cursor=0, status=EngineStatus.IDLE).json(),
+    ]
@@ -1,11 +1,26 @@
 """Tests for robot_server.runs.run_store."""
 import pytest
+import sqlite3
 from datetime import datetime
 
-from robot_server.runs.run_store import RunStore, RunResource, RunNotFoundError
+from opentrons.protocol_engine import (
+    CommandStatus,
+    EngineStatus,
+    commands as pe_commands,
+    errors as pe_errors,
+)
 
+from robot_server.runs.action_models import RunAction, RunActionType
+from robot_server.runs.run_models import RunCommandSummary
+from robot_server.runs.run_store import (
+    RunStore,
+    RunResource,
+    RunState,
+    RunNotFoundError,
+)
 
-def test_add_run() -> None:
+
+def test_add_run(sql_connection: sqlite3.Connection) -> None:
     """It should be able to add a new run to the store."""
     run = RunResource(
         run_id="run-id",
@@ -15,13 +30,13 @@ def test_add_run() -> None:
         is_current=True,
     )
 
-    subject = RunStore()
+    subject = RunStore(connection=sql_connection)
     result = subject.upsert(run)
 
     assert result == run
 
 
-def test_update_run() -> None:
+def test_update_run(sql_connection: sqlite3.Connection) -> None:
     """It should be able to update a run in the store."""
     run = RunResource(
         run_id="identical-run-id",
@@ -38,7 +53,7 @@ def test_update_run() -> None:
         is_current=True,
     )
 
-    subject = RunStore()
+    subject = RunStore(connection=sql_connection)
     subject.upsert(run)
 
     result = subject.upsert(updated_run)
@@ -46,7 +61,7 @@ def test_update_run() -> None:
     assert result == updated_run
 
 
-def test_get_run() -> None:
+def test_get_run(sql_connection: sqlite3.Connection) -> None:
     """It can get a previously stored run entry."""
     run = RunResource(
         run_id="run-id",
@@ -56,7 +71,7 @@ def test_get_run() -> None:
         is_current=False,
     )
 
-    subject = RunStore()
+    subject = RunStore(connection=sql_connection)
     subject.upsert(run)
 
     result = subject.get(run_id="run-id")
@@ -64,15 +79,15 @@ def test_get_run() -> None:
     assert result == run
 
 
-def test_get_run_missing() -> None:
+def test_get_run_missing(sql_connection: sqlite3.Connection) -> None:
     """It raises if the run does not exist."""
-    subject = RunStore()
+    subject = RunStore(connection=sql_connection)
 
     with pytest.raises(RunNotFoundError, match="run-id"):
         subject.get(run_id="run-id")
 
 
-def test_get_all_runs() -> None:
+def test_get_all_runs(sql_connection: sqlite3.Connection) -> None:
     """It can get all created runs."""
     run_1 = RunResource(
         run_id="run-id-1",
@@ -89,7 +104,7 @@ def test_get_all_runs() -> None:
         is_current=True,
     )
 
-    subject = RunStore()
+    subject = RunStore(connection=sql_connection)
     subject.upsert(run_1)
     subject.upsert(run_2)
 
@@ -98,7 +113,7 @@ def test_get_all_runs() -> None:
     assert result == [run_1, run_2]
 
 
-def test_remove_run() -> None:
+def test_remove_run(sql_connection: sqlite3.Connection) -> None:
     """It can remove and return a previously stored run entry."""
     run = RunResource(
         run_id="run-id",
@@ -108,7 +123,7 @@ def test_remove_run() -> None:
         is_current=True,
     )
 
-    subject = RunStore()
+    subject = RunStore(connection=sql_connection)
     subject.upsert(run)
 
     result = subject.remove(run_id="run-id")
@@ -117,15 +132,15 @@ def test_remove_run() -> None:
     assert subject.get_all() == []
 
 
-def test_remove_run_missing_id() -> None:
+def test_remove_run_missing_id(sql_connection: sqlite3.Connection) -> None:
     """It raises if the run does not exist."""
-    subject = RunStore()
+    subject = RunStore(connection=sql_connection)
 
     with pytest.raises(RunNotFoundError, match="run-id"):
         subject.remove(run_id="run-id")
 
 
-def test_add_run_current_run_deactivates() -> None:
+def test_add_run_current_run_deactivates(sql_connection: sqlite3.Connection) -> None:
     """Adding a current run should mark all others as not current."""
     run_1 = RunResource(
         run_id="run-id-1",
@@ -143,9 +158,141 @@ def test_add_run_current_run_deactivates() -> None:
         is_current=True,
     )
 
-    subject = RunStore()
+    subject = RunStore(connection=sql_connection)
     subject.upsert(run_1)
     subject.upsert(run_2)
 
     assert subject.get("run-id-1").is_current is False
     assert subject.get("run-id-2").is_current is True
+
+
+def test_run_round_trip(sql_connection: sqlite3.Connection) -> None:
+    """It should keep runs' actions and timestamps in the database."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        actions=[
+            RunAction(
+                id="action-id",
+                actionType=RunActionType.PLAY,
+                createdAt=datetime(year=2022, month=2, day=2),
+            )
+        ],
+        is_current=True,
+    )
+
+    RunStore(connection=sql_connection).upsert(run)
+    result = RunStore(connection=sql_connection).get("run-id")
+
+    # A new store, as after a restart, has no current run.
+    assert result == RunResource(
+        run_id="run-id",
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        actions=run.actions,
+        is_current=False,
+    )
+
+
+async def test_insert_state(sql_connection: sqlite3.Connection) -> None:
+    """It should keep the final state and commands of a run."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime.now(),
+        actions=[],
+        is_current=True,
+    )
+    command = pe_commands.Pause(
+        id="command-id",
+        status=CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.PauseParams(message="hello world"),
+    )
+    state = RunState(
+        status=EngineStatus.SUCCEEDED,
+        commands=[
+            RunCommandSummary(
+                id="command-id",
+                commandType="pause",
+                status=CommandStatus.SUCCEEDED,
+            )
+        ],
+        errors=[],
+        labware=[],
+        pipettes=[],
+    )
+
+    subject = RunStore(connection=sql_connection)
+    subject.upsert(run)
+    await subject.insert_state(run_id="run-id", state=state, commands=[command])
+    # Updating the run keeps its state.
+    subject.upsert(run)
+
+    assert subject.get_state("run-id") == state
+    assert subject.get_state("run-id", include_commands=False) == RunState(
+        status=EngineStatus.SUCCEEDED,
+        commands=[],
+        errors=[],
+        labware=[],
+        pipettes=[],
+    )
+    assert subject.get_command("run-id", "command-id") == command
+
+    with pytest.raises(pe_errors.CommandDoesNotExistError):
+        subject.get_command("run-id", "other-command-id")
+
+
+def test_get_state_not_stored(sql_connection: sqlite3.Connection) -> None:
+    """A run without a stored state is stopped with no commands."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime.now(),
+        actions=[],
+        is_current=True,
+    )
+
+    subject = RunStore(connection=sql_connection)
+    subject.upsert(run)
+
+    assert subject.get_state("run-id") == RunState(
+        status=EngineStatus.STOPPED,
+        commands=[],
+        errors=[],
+        labware=[],
+        pipettes=[],
+    )
+
+    with pytest.raises(RunNotFoundError):
+        subject.get_state("other-run-id")
+
+
+async def test_remove_run_removes_commands(sql_connection: sqlite3.Connection) -> None:
+    """Removing a run removes its stored commands."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime.now(),
+        actions=[],
+        is_current=False,
+    )
+    command = pe_commands.Pause(
+        id="command-id",
+        status=CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.PauseParams(message="hello world"),
+    )
+    state = RunState(
+        status=EngineStatus.SUCCEEDED, commands=[], errors=[], labware=[], pipettes=[]
+    )
+
+    subject = RunStore(connection=sql_connection)
+    subject.upsert(run)
+    await subject.insert_state(run_id="run-id", state=state, commands=[command])
+    subject.remove(run_id="run-id")
+    subject.upsert(run)
+
+    with pytest.raises(pe_errors.CommandDoesNotExistError):
+        subject.get_command("run-id", "command-id")
@@ -1,12 +1,34 @@
+import asyncio
 from datetime import datetime
-from typing import AsyncIterator
+from typing import List, Union, cast
 
 import pytest
 from notify_server.clients.serdes import TopicEvent
+from notify_server.clients.subscriber import Subscriber
 from notify_server.models.event import Event
 from notify_server.models.payload_type import UserData
 
 
+class FakeSubscriber:
+    """A subscriber that receives a list of events, then waits forever."""
+
+    def __init__(self, events: List[Union[TopicEvent, Exception]]) -> None:
+        self._events = events
+        self.closed = False
+
+    async def next_event(self) -> TopicEvent:
+        if not self._events:
+            await asyncio.get_event_loop().create_future()
+
+        event = self._events.pop(0)
+        if isinstance(event, Exception):
+            raise event
+        return event
+
+    def close(self) -> None:
+        self.closed = True
+
+
 @pytest.fixture
 def topic_event() -> TopicEvent:
     return TopicEvent(
@@ -20,10 +42,6 @@ def topic_event() -> TopicEvent:
 
 
 @pytest.fixture
-def mock_subscriber(topic_event: TopicEvent) -> AsyncIterator[TopicEvent]:
-    """A mock subscriber."""
-
-    async def _f() -> AsyncIterator[TopicEvent]:
-        yield topic_event
-
-    return _f()
+def mock_subscriber(topic_event: TopicEvent) -> Subscriber:
+    """A mock subscriber that receives one event."""
+    return cast(Subscriber, FakeSubscriber([topic_event]))
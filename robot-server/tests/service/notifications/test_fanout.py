@@ -0,0 +1,125 @@
+import asyncio
+from typing import cast
+
+import pytest
+from mock import patch
+from notify_server.clients.serdes import MalformedFrames, TopicEvent
+from notify_server.clients.subscriber import Subscriber
+
+from robot_server.service.notifications import fanout
+from robot_server.service.notifications.fanout import EventFanout
+
+from .conftest import FakeSubscriber
+
+
+async def test_fanout_by_topic(
+    mock_subscriber: Subscriber, topic_event: TopicEvent
+) -> None:
+    """It should send an event to every client subscribed to its topic."""
+    subject = EventFanout(mock_subscriber)
+    exact = subject.add_client(["some_topic"])
+    prefix = subject.add_client(["other", "some"])
+    other = subject.add_client(["other"])
+
+    assert await asyncio.wait_for(exact.get(), timeout=1) == topic_event.json()
+    assert await asyncio.wait_for(prefix.get(), timeout=1) == topic_event.json()
+    assert other.empty()
+
+    await subject.close()
+
+
+async def test_serialize_once(mock_subscriber: Subscriber) -> None:
+    """It should serialize each event once for all clients."""
+    subject = EventFanout(mock_subscriber)
+
+    with patch.object(TopicEvent, "json", return_value="text") as mock_json:
+        queues = [subject.add_client(["some_topic"]) for _ in range(3)]
+        for queue in queues:
+            assert await asyncio.wait_for(queue.get(), timeout=1) == "text"
+
+    mock_json.assert_called_once()
+    await subject.close()
+
+
+async def test_drop_oldest(topic_event: TopicEvent) -> None:
+    """It should drop the oldest event of a client that isn't keeping up."""
+    newer = topic_event.copy(update={"topic": "some_topic_2"})
+    subscriber = FakeSubscriber([topic_event, newer])
+    subject = EventFanout(cast(Subscriber, subscriber), client_queue_size=1)
+    queue = subject.add_client(["some"])
+
+    while subscriber._events:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert queue.qsize() == 1
+    assert queue.get_nowait() == newer.json()
+    await subject.close()
+
+
+async def test_skip_malformed(topic_event: TopicEvent) -> None:
+    """It should keep routing events after a malformed one."""
+    subscriber = FakeSubscriber([MalformedFrames(), topic_event])
+    subject = EventFanout(cast(Subscriber, subscriber))
+    queue = subject.add_client(["some_topic"])
+
+    assert await asyncio.wait_for(queue.get(), timeout=1) == topic_event.json()
+    await subject.close()
+
+
+async def test_keep_routing_after_error(
+    monkeypatch: pytest.MonkeyPatch, topic_event: TopicEvent
+) -> None:
+    """It should keep routing events after an unexpected read error."""
+    monkeypatch.setattr(fanout, "ROUTE_ERROR_RETRY_SEC", 0)
+    subscriber = FakeSubscriber([RuntimeError("oh no"), topic_event])
+    subject = EventFanout(cast(Subscriber, subscriber))
+    queue = subject.add_client(["some_topic"])
+
+    assert await asyncio.wait_for(queue.get(), timeout=1) == topic_event.json()
+    await subject.close()
+
+
+async def test_send_state_to_new_clients(topic_event: TopicEvent) -> None:
+    """It should send the latest event of each state topic to new clients."""
+    older = topic_event.copy(update={"topic": "state_topic"})
+    newer = older.copy(update={"publisher": "some_other"})
+    subscriber = FakeSubscriber([older, newer, topic_event])
+    subject = EventFanout(cast(Subscriber, subscriber), state_topics=["state_topic"])
+    first = subject.add_client(["some_topic"])
+
+    assert await asyncio.wait_for(first.get(), timeout=1) == topic_event.json()
+
+    state = subject.add_client(["state"])
+    other = subject.add_client(["some_topic"])
+
+    assert state.qsize() == 1
+    assert state.get_nowait() == newer.json()
+    assert other.empty()
+    await subject.close()
+
+
+async def test_drop_replayed_state(topic_event: TopicEvent) -> None:
+    """It should not resend a state event the notify-server replays."""
+    state = topic_event.copy(update={"topic": "state_topic"})
+    subscriber = FakeSubscriber([state, state, topic_event])
+    subject = EventFanout(cast(Subscriber, subscriber), state_topics=["state_topic"])
+    queue = subject.add_client(["s"])
+
+    assert await asyncio.wait_for(queue.get(), timeout=1) == state.json()
+    assert await asyncio.wait_for(queue.get(), timeout=1) == topic_event.json()
+    await subject.close()
+
+
+async def test_remove_client_and_close(mock_subscriber: Subscriber) -> None:
+    """It should stop sending to removed clients, and close the subscriber."""
+    subject = EventFanout(mock_subscriber)
+    queue = subject.add_client(["some_topic"])
+    subject.remove_client(queue)
+
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert queue.empty()
+
+    await subject.close()
+    assert cast(FakeSubscriber, mock_subscriber).closed
@@ -1,11 +1,11 @@
+import asyncio
 from typing import AsyncIterator
 
 import pytest
-from mock import MagicMock, patch, DEFAULT
-from notify_server.clients.serdes import TopicEvent
-from starlette.websockets import WebSocket
+from mock import MagicMock, call, patch
+from starlette.websockets import WebSocket, WebSocketDisconnect
 from robot_server.service.notifications import handle_subscriber
-from robot_server.settings import get_settings
+from robot_server.service.notifications.fanout import EventFanout
 
 
 @pytest.fixture
@@ -14,33 +14,71 @@ def mock_socket() -> MagicMock:
     return MagicMock(spec=WebSocket)
 
 
-async def test_create_subscriber(mock_socket: MagicMock) -> None:
-    """Test that a subscriber is created correctly."""
-    # Why two patch calls? `create` is the name of an arg to `patch.multiple`.
-    with patch.object(handle_subscriber, "create") as mock_create:
-        with patch.multiple(
-            handle_subscriber, route_events=DEFAULT, receive=DEFAULT
-        ) as values:
-            await handle_subscriber.handle_socket(mock_socket, ["a", "b"])
-            mock_create.assert_called_once_with(
-                get_settings().notification_server_subscriber_address, ["a", "b"]
-            )
-            values["route_events"].assert_called_once()
-            values["receive"].assert_called_once()
-
-
-async def test_route_events(
-    mock_socket: MagicMock,
-    mock_subscriber: AsyncIterator[TopicEvent],
-    topic_event: TopicEvent,
-) -> None:
-    """Test that an event is read from subscriber and sent to websocket."""
+async def test_handle_socket(mock_socket: MagicMock) -> None:
+    """Test that a client is added to the fanout until the socket disconnects."""
+    mock_fanout = MagicMock(spec=EventFanout)
+    queue: "asyncio.Queue[str]" = asyncio.Queue()
+    mock_fanout.add_client.return_value = queue
+    mock_socket.receive_json.side_effect = WebSocketDisconnect()
+
+    with patch.object(handle_subscriber, "route_events") as mock_route_events:
+        await handle_subscriber.handle_socket(mock_socket, ["a", "b"], mock_fanout)
+
+    mock_fanout.add_client.assert_called_once_with(["a", "b"])
+    mock_route_events.assert_called_once_with(mock_socket, queue)
+    mock_fanout.remove_client.assert_called_once_with(queue)
+
+
+async def test_handle_stream(mock_socket: MagicMock) -> None:
+    """Test that a stream is sent to websocket, then the socket is closed."""
+    never_disconnect: "asyncio.Future[None]" = asyncio.get_event_loop().create_future()
+
+    async def _receive_json() -> None:
+        await never_disconnect
+
+    async def _texts() -> AsyncIterator[str]:
+        yield "a"
+        yield "b"
+
+    mock_socket.receive_json.side_effect = _receive_json
+
+    await handle_subscriber.handle_stream(mock_socket, _texts())
+
+    mock_socket.send_text.assert_has_calls([call("a"), call("b")])
+    mock_socket.close.assert_called_once()
+
+
+async def test_handle_stream_disconnect(mock_socket: MagicMock) -> None:
+    """Test that a stream is dropped when the socket disconnects."""
+    never_end: "asyncio.Future[None]" = asyncio.get_event_loop().create_future()
+
+    async def _texts() -> AsyncIterator[str]:
+        await never_end
+        yield "a"
+
+    mock_socket.receive_json.side_effect = WebSocketDisconnect()
+
+    await handle_subscriber.handle_stream(mock_socket, _texts())
+
+    mock_socket.send_text.assert_not_called()
+    mock_socket.close.assert_not_called()
+
+
+async def test_route_events(mock_socket: MagicMock) -> None:
+    """Test that an event is read from the client's queue and sent to websocket."""
+    queue: "asyncio.Queue[str]" = asyncio.Queue()
+    queue.put_nowait("text")
+
     with patch.object(handle_subscriber, "send") as mock_send:
-        await handle_subscriber.route_events(mock_socket, mock_subscriber)
-        mock_send.assert_called_once_with(mock_socket, topic_event)
+        task = asyncio.ensure_future(handle_subscriber.route_events(mock_socket, queue))
+        while not queue.empty():
+            await asyncio.sleep(0)
+        task.cancel()
+
+    mock_send.assert_called_once_with(mock_socket, "text")
 
 
-async def test_send_entry(topic_event: TopicEvent, mock_socket: MagicMock) -> None:
-    """Test that entry is sent as json."""
-    await handle_subscriber.send(mock_socket, topic_event)
-    mock_socket.send_text.assert_called_once_with(topic_event.json())
+async def test_send_entry(mock_socket: MagicMock) -> None:
+    """Test that serialized entry is sent as text."""
+    await handle_subscriber.send(mock_socket, "text")
+    mock_socket.send_text.assert_called_once_with("text")
@@ -1,13 +1,34 @@
-from typing import AsyncIterator
+from typing import AsyncIterator, Iterator
 
 from mock import patch
 
 import pytest
 from notify_server.clients.serdes import TopicEvent
+from notify_server.clients.subscriber import Subscriber
 from starlette.testclient import TestClient
 from starlette.websockets import WebSocketDisconnect
 
 from robot_server.service.notifications import handle_subscriber
+from robot_server.service.notifications.dependencies import get_event_fanout
+from robot_server.service.notifications.fanout import EventFanout
+
+
+@pytest.fixture(autouse=True)
+def override_fanout(
+    api_client: TestClient, mock_subscriber: Subscriber
+) -> Iterator[None]:
+    """Get events from the mock subscriber rather than the notify-server."""
+
+    async def _get_event_fanout() -> AsyncIterator[EventFanout]:
+        # Each websocket runs in its own event loop, so each gets its own
+        # fanout, closed before the loop is.
+        fanout = EventFanout(mock_subscriber)
+        yield fanout
+        await fanout.close()
+
+    api_client.app.dependency_overrides[get_event_fanout] = _get_event_fanout
+    yield
+    del api_client.app.dependency_overrides[get_event_fanout]
 
 
 def test_subscribe(api_client: TestClient):
@@ -24,15 +45,10 @@ def test_subscribe_no_topic(api_client: TestClient):
         api_client.websocket_connect("/notifications/subscribe")
 
 
-def test_integration(
-    api_client: TestClient,
-    mock_subscriber: AsyncIterator[TopicEvent],
-    topic_event: TopicEvent,
-) -> None:
+def test_integration(api_client: TestClient, topic_event: TopicEvent) -> None:
     """Test receiving a single event."""
-    with patch.object(handle_subscriber, "create", return_value=mock_subscriber):
-        sock = api_client.websocket_connect("/notifications/subscribe?topic=t")
-        event = sock.receive()
-        assert event["text"] == topic_event.json()
-        assert event["type"] == "websocket.send"
-        sock.close()
+    sock = api_client.websocket_connect("/notifications/subscribe?topic=some")
+    event = sock.receive()
+    assert event["text"] == topic_event.json()
+    assert event["type"] == "websocket.send"
+    sock.close()
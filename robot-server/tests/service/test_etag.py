@@ -0,0 +1,53 @@
+"""Tests for conditional GET support."""
+import pytest
+from fastapi import Response
+from typing import Optional
+
+from robot_server.service.etag import get_not_modified_response
+
+
+def test_sets_etag() -> None:
+    """It should set the ETag header on the route's response."""
+    response = Response()
+    result = get_not_modified_response(
+        response=response,
+        etag='"abc"',
+        if_none_match=None,
+    )
+
+    assert result is None
+    assert response.headers["ETag"] == '"abc"'
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    ['"abc"', 'W/"abc"', '"xyz", "abc"', "*"],
+)
+def test_not_modified(if_none_match: str) -> None:
+    """It should get a 304 response with the route's headers on an ETag match."""
+    response = Response()
+    response.headers["Opentrons-Version"] = "2"
+
+    result = get_not_modified_response(
+        response=response,
+        etag='"abc"',
+        if_none_match=if_none_match,
+    )
+
+    assert result is not None
+    assert result.status_code == 304
+    assert result.body == b""
+    assert result.headers["ETag"] == '"abc"'
+    assert result.headers["Opentrons-Version"] == "2"
+
+
+@pytest.mark.parametrize("if_none_match", ['"xyz"', '"abc-1"', None])
+def test_modified(if_none_match: Optional[str]) -> None:
+    """It should not get a 304 response if the client's ETag does not match."""
+    result = get_not_modified_response(
+        response=Response(),
+        etag='"abc"',
+        if_none_match=if_none_match,
+    )
+
+    assert result is None
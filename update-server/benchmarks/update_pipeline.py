@@ -0,0 +1,144 @@
+"""
+Compare the time and disk writes of the update pipelines
+
+Builds an update zip in a temporary directory, then installs it to a
+file-backed fake partition: by saving, unzipping, hashing and copying it in
+separate passes, by streaming it as it is received, and by streaming a delta
+against a fake running partition that differs in a few percent of its blocks.
+
+Usage:
+    python benchmarks/update_pipeline.py --size-mb 256
+"""
+import argparse
+import binascii
+import hashlib
+import os
+import random
+import tempfile
+import time
+import zipfile
+from unittest import mock
+
+from otupdate.buildroot import file_actions
+
+# The size of the chunks an upload arrives in
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def make_update(directory, size):
+    """ Make an update whose rootfs is half random and half empty, like a
+    real image """
+    rootfs = os.urandom(size // 2) + bytes(size - size // 2)
+    path = os.path.join(directory, 'upload.zip')
+    rootfs_hash = binascii.hexlify(hashlib.sha256(rootfs).digest())
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(file_actions.ROOTFS_NAME, rootfs)
+        zf.writestr(file_actions.ROOTFS_HASH_NAME, rootfs_hash)
+    return path
+
+
+def make_current(directory, update_path, changed):
+    """ Make a running partition that differs from the update in a fraction
+    of its blocks """
+    with zipfile.ZipFile(update_path) as zf:
+        image = bytearray(zf.read(file_actions.ROOTFS_NAME))
+    blocks = len(image) // file_actions.BLOCK_SIZE
+    for index in random.sample(range(blocks), int(blocks * changed)):
+        start = index * file_actions.BLOCK_SIZE
+        image[start:start + 16] = os.urandom(16)
+    path = os.path.join(directory, 'current-partition')
+    with open(path, 'wb') as f:
+        f.write(image)
+    return path
+
+
+def upload_chunks(path):
+    with open(path, 'rb') as upload:
+        yield from iter(lambda: upload.read(UPLOAD_CHUNK_SIZE), b'')
+
+
+def multi_pass(update_path, directory):
+    """ Save, unzip, hash and copy the update in separate passes """
+    download_dir = os.path.join(directory, 'download')
+    os.makedirs(download_dir)
+    saved = os.path.join(download_dir, 'ot2-system.zip')
+    with open(saved, 'wb') as f:
+        for chunk in upload_chunks(update_path):
+            f.write(chunk)
+    rootfs = file_actions.validate_update(saved, lambda p: None, None)
+    file_actions.write_update(rootfs, lambda p: None)
+    return sum(os.path.getsize(os.path.join(download_dir, name))
+               for name in os.listdir(download_dir))
+
+
+def streaming(update_path, directory):
+    """ Unzip, hash and write the update as it is received """
+    pipeline = file_actions.StreamingUpdate(
+        lambda p: None, os.path.getsize(update_path))
+    for chunk in upload_chunks(update_path):
+        pipeline.feed(chunk)
+    pipeline.finish(None)
+    return 0
+
+
+def delta(delta_path, current_path, current_blocks):
+    """ Rebuild the update from a delta and the running partition """
+    current = mock.Mock()
+    current.value.path = current_path
+    with mock.patch.object(file_actions, '_find_current_partition',
+                           return_value=current):
+        pipeline = file_actions.StreamingUpdate(
+            lambda p: None, os.path.getsize(delta_path),
+            current_blocks=current_blocks)
+        for chunk in upload_chunks(delta_path):
+            pipeline.feed(chunk)
+        pipeline.finish(None)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--size-mb', type=int, default=64,
+                        help='size of the rootfs image')
+    parser.add_argument('--changed', type=float, default=0.02,
+                        help='fraction of blocks that differ for the delta')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        update_path = make_update(directory, args.size_mb * 1024 * 1024)
+        print(f'{args.size_mb} MiB rootfs,'
+              f' {os.path.getsize(update_path) / 2**20:.1f} MiB update')
+        current_path = make_current(directory, update_path, args.changed)
+        start = time.monotonic()
+        current_blocks = file_actions.hash_blocks(current_path,
+                                                  lambda p: None)
+        hashed = time.monotonic() - start
+        delta_path = os.path.join(directory, 'delta.zip')
+        file_actions.make_delta_update(update_path, current_blocks,
+                                       delta_path)
+        print(f'{args.changed:.0%} of blocks changed,'
+              f' {os.path.getsize(delta_path) / 2**20:.1f} MiB delta update,'
+              f' {hashed:.2f} s to hash the running partition')
+        for name, pipeline in (
+                ('multi-pass', multi_pass),
+                ('streaming', streaming),
+                ('delta', lambda update, run: delta(delta_path, current_path,
+                                                    current_blocks))):
+            run_dir = os.path.join(directory, name)
+            os.makedirs(run_dir)
+            partition = os.path.join(run_dir, 'fake-partition')
+            unused = mock.Mock()
+            unused.value.path = partition
+            with mock.patch.object(file_actions, '_find_unused_partition',
+                                   return_value=unused):
+                start = time.monotonic()
+                staged = pipeline(update_path, run_dir)
+                elapsed = time.monotonic() - start
+            written = staged + os.path.getsize(partition)
+            print(f'  {name:<10} {elapsed:6.2f} s'
+                  f'   {written / 2**20:7.1f} MiB written to disk'
+                  f' ({staged / 2**20:.1f} MiB staged)')
+
+
+if __name__ == '__main__':
+    main()
@@ -5,7 +5,8 @@ systems from update zips. Note that if you just want to do dev scale work
 of modifying the api server, you can probably use the update-api-buildroot
 makefile target in the api project.
 
-This requires aiohttp
+This requires aiohttp. Delta updates (--delta) also need the otupdate package
+next to this script.
 """
 
 import argparse
@@ -13,6 +14,7 @@ import asyncio
 import enum
 import json
 import sys
+import tempfile
 
 import aiohttp
 
@@ -28,8 +30,24 @@ async def poll_status(sess, token, root):
     return await resp.json()
 
 
+async def make_delta(sess, token, root, update_file):
+    """ Build a delta of the update against the robot's running system """
+    from otupdate.buildroot.file_actions import BlockHashes, make_delta_update
+    resp = await sess.get(root + '/' + token + '/blocks')
+    if resp.status != 200:
+        body = await resp.text()
+        print(f'Error getting block hashes: {resp.status}: {body}')
+        sys.exit(-1)
+    current = BlockHashes.from_json(await resp.json())
+    delta_file = tempfile.NamedTemporaryFile(suffix='.zip')
+    sent = make_delta_update(update_file.name, current, delta_file.name)
+    print(f'Delta update has {sent} of {-(-current.size//current.block_size)}'
+          ' blocks')
+    return delta_file
+
+
 async def do_update(update_file: str, host: str, kind: UPDATE_KIND,
-                    pause_between_steps: bool = False):
+                    pause_between_steps: bool = False, delta: bool = False):
     async with aiohttp.ClientSession() as session:
         if kind == UPDATE_KIND.MIGRATE:
             root = host + '/server/update/migration'
@@ -66,6 +84,10 @@ async def do_update(update_file: str, host: str, kind: UPDATE_KIND,
         else:
             print(msg)
 
+        if delta:
+            print('Hashing robot system for delta update...')
+            update_file = await make_delta(session, token, root, update_file)
+
         print(f"Uploading file...")
         file_resp = await session.post(root + '/' + token + '/file',
                                        data={filename: update_file})
@@ -163,13 +185,19 @@ def main():
     parser.add_argument('-s', '--step-by-step', action='store_true',
                         help='Pause until the user hits enter in between each '
                         'stage. Useful for dev workflows')
+    parser.add_argument('-d', '--delta', action='store_true',
+                        help='Only upload the parts of the system that differ '
+                        'from the one the robot is running')
     args = parser.parse_args()
+    if args.delta and args.action != 'update':
+        parser.error('--delta only works with update')
     asyncio.get_event_loop().run_until_complete(
         do_update(
             args.update,
             assure_host(args.host),
             UPDATE_KIND[args.action.upper()],
-            pause_between_steps=args.step_by_step))
+            pause_between_steps=args.step_by_step,
+            delta=args.delta))
 
 
 if __name__ == '__main__':
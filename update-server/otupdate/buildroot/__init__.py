@@ -79,6 +79,7 @@ def get_app(system_version_file: str = None,
         web.post('/server/update/begin', update.begin),
         web.post('/server/update/cancel', update.cancel),
         web.get('/server/update/{session}/status', update.status),
+        web.get('/server/update/{session}/blocks', update.blocks),
         web.post('/server/update/{session}/file', update.file_upload),
         web.post('/server/update/{session}/commit', update.commit),
         web.post('/server/restart', control.restart),
@@ -9,22 +9,40 @@ import binascii
 import contextlib
 import enum
 import hashlib
+import json
 import logging
 import os
 import re
 import subprocess
 import tempfile
 from typing import (Callable, Dict, List, Mapping, NamedTuple,
-                    Optional, Sequence, Tuple)
+                    Optional, Sequence, Set, Tuple)
 import zipfile
 
+from .zip_stream import BadZip, MemberWriter, ZipStreamReader
+
 
 ROOTFS_SIG_NAME = 'rootfs.ext4.hash.sig'
 ROOTFS_HASH_NAME = 'rootfs.ext4.hash'
 ROOTFS_NAME = 'rootfs.ext4'
 UPDATE_FILES = [ROOTFS_NAME, ROOTFS_SIG_NAME, ROOTFS_HASH_NAME]
+# A delta update replaces the rootfs with a manifest of the rootfs's block
+# hashes, and the blocks the running partition doesn't already have
+ROOTFS_BLOCKS_NAME = 'rootfs.ext4.blocks'
+ROOTFS_DELTA_NAME = 'rootfs.ext4.delta'
+DELTA_FILES = [ROOTFS_BLOCKS_NAME, ROOTFS_DELTA_NAME]
 LOG = logging.getLogger(__name__)
 
+# Writes to the partition are whole multiples of this size, which is a
+# multiple of the SD card's erase block size
+WRITE_CHUNK_SIZE = 4 * 1024 * 1024
+# The hash and signature are tiny; anything much bigger is not an update
+MAX_SMALL_FILE_SIZE = 64 * 1024
+# The manifest holds a hash for each block of a rootfs of up to a few GB
+MAX_MANIFEST_SIZE = 16 * 1024 * 1024
+# The size of the blocks compared between images for a delta update
+BLOCK_SIZE = 64 * 1024
+
 
 class Partition(NamedTuple):
     number: int
@@ -60,6 +78,33 @@ class HashMismatch(ValueError):
         return self.message
 
 
+class BlockHashes(NamedTuple):
+    block_size: int
+    size: int
+    hashes: List[bytes]
+
+    def to_json(self) -> Dict:
+        return {'blockSize': self.block_size,
+                'size': self.size,
+                'blocks': [binascii.hexlify(h).decode() for h in self.hashes]}
+
+    @classmethod
+    def from_json(cls, obj: Mapping) -> 'BlockHashes':
+        """ Parse a manifest made by :py:meth:`to_json`
+
+        :raises ValueError: If the manifest isn't consistent
+        """
+        block_size = obj['blockSize']
+        size = obj['size']
+        hashes = [binascii.unhexlify(h) for h in obj['blocks']]
+        if not isinstance(block_size, int) or block_size <= 0\
+                or not isinstance(size, int) or size < 0:
+            raise ValueError(f'Bad block size {block_size} or size {size}')
+        if len(hashes) != -(-size // block_size):
+            raise ValueError(f'{len(hashes)} blocks do not make {size}B')
+        return cls(block_size, size, hashes)
+
+
 class FileMissing(ValueError):
     def __init__(self, message):
         self.message = message
@@ -293,6 +338,103 @@ def _find_unused_partition() -> RootPartitions:
             b'3': RootPartitions.THREE}[which]
 
 
+def _find_current_partition() -> RootPartitions:
+    """ Find the root partition that is currently running """
+    unused = _find_unused_partition()
+    return {RootPartitions.TWO: RootPartitions.THREE,
+            RootPartitions.THREE: RootPartitions.TWO}[unused]
+
+
+def hash_blocks(path: str,
+                progress_callback: Callable[[float], None],
+                block_size: int = BLOCK_SIZE,
+                chunk_size: int = WRITE_CHUNK_SIZE) -> BlockHashes:
+    """
+    Hash each block of a file or partition
+
+    :param path: The file to hash
+    :param progress_callback: The callback to call with progress between 0 and
+                              1. May not ever be precisely 1.0.
+    :param block_size: The size of the blocks to hash. The last block may be
+                       shorter.
+    :param chunk_size: The size of the reads from the file, which should be a
+                       multiple of ``block_size``
+    :returns: The sha256 hash of each block
+    """
+    chunk_size -= chunk_size % block_size
+    hashes: List[bytes] = []
+    size = 0
+    with open(path, 'rb') as to_hash:
+        file_size = to_hash.seek(0, 2)
+        to_hash.seek(0)
+        while True:
+            chunk = to_hash.read(max(chunk_size, block_size))
+            with memoryview(chunk) as view:
+                for start in range(0, len(chunk), block_size):
+                    hashes.append(hashlib.sha256(
+                        view[start:start + block_size]).digest())
+            size += len(chunk)
+            if file_size:
+                progress_callback(size / file_size)
+            if not chunk:
+                break
+    return BlockHashes(block_size, size, hashes)
+
+
+def hash_current_partition(
+        progress_callback: Callable[[float], None]) -> BlockHashes:
+    """ Hash the blocks of the running root partition, for a delta update """
+    return hash_blocks(_find_current_partition().value.path,
+                       progress_callback)
+
+
+def make_delta_update(update_path: str,
+                      current: BlockHashes,
+                      delta_path: str) -> int:
+    """
+    Make a delta update from a full update file
+
+    The delta has the same hash and signature as the full update, since the
+    rootfs it rebuilds is the same.
+
+    :param update_path: The path to the full update zip file
+    :param current: The block hashes of the partition the update will be
+                    applied on, from :py:func:`hash_current_partition`
+    :param delta_path: The path to write the delta update zip file to
+    :returns: The number of blocks in the delta
+    """
+    block_size = current.block_size
+    have = set(current.hashes)
+    with zipfile.ZipFile(update_path, 'r') as update:
+        hashes: List[bytes] = []
+        size = 0
+        with update.open(ROOTFS_NAME) as rootfs:
+            for block in iter(lambda: rootfs.read(block_size), b''):
+                hashes.append(hashlib.sha256(block).digest())
+                size += len(block)
+        manifest = BlockHashes(block_size, size, hashes)
+
+        sent = 0
+        with zipfile.ZipFile(delta_path, 'w', zipfile.ZIP_DEFLATED) as delta:
+            # The manifest must come first so the delta can be applied as
+            # it is received
+            delta.writestr(ROOTFS_BLOCKS_NAME, json.dumps(manifest.to_json()))
+            with update.open(ROOTFS_NAME) as rootfs:
+                with delta.open(ROOTFS_DELTA_NAME, 'w',
+                                force_zip64=True) as out:
+                    for block_hash in hashes:
+                        block = rootfs.read(block_size)
+                        if len(block) < block_size or block_hash not in have:
+                            out.write(block)
+                            sent += 1
+            for name in (ROOTFS_HASH_NAME, ROOTFS_SIG_NAME):
+                if name in update.namelist():
+                    delta.writestr(name, update.read(name))
+    LOG.info(f'Made delta update {delta_path}: {sent} of {len(hashes)}'
+             ' blocks')
+    return sent
+
+
 def write_file(infile: str,
                outfile: str,
                progress_callback: Callable[[float], None],
@@ -355,6 +497,262 @@ def write_update(rootfs_filepath: str,
     return unused
 
 
+class _DeltaReader:
+    """
+    Rebuild a rootfs from the blocks of another partition and a delta
+
+    Each block of the rootfs in the manifest is copied from the running
+    partition if it has a block with the same hash, and otherwise read from
+    the delta, which holds the rest of the blocks in order. Every block is
+    checked against the manifest before it is written.
+    """
+    def __init__(self,
+                 manifest: BlockHashes,
+                 current_path: str,
+                 current: BlockHashes,
+                 write: Callable[[bytes], None]) -> None:
+        self._manifest = manifest
+        self._write = write
+        self._offsets: Dict[bytes, int] = {}
+        for index, block_hash in enumerate(current.hashes):
+            self._offsets.setdefault(block_hash, index * current.block_size)
+        self._current = open(current_path, 'rb')
+        self._buffer = bytearray()
+        self._next = 0
+        self.copied = 0
+
+    @property
+    def progress(self) -> float:
+        return self._next / max(len(self._manifest.hashes), 1)
+
+    def feed(self, chunk: bytes) -> None:
+        self._buffer += chunk
+        self._advance()
+
+    def finish(self) -> None:
+        """
+        Check that the whole rootfs was rebuilt
+
+        :raises zip_stream.BadZip: If the delta is too short or too long
+        """
+        if self._next != len(self._manifest.hashes) or self._buffer:
+            raise BadZip(f'{ROOTFS_DELTA_NAME} does not match its manifest')
+        LOG.info(f'Copied {self.copied} of {self._next} blocks'
+                 ' from the running partition')
+
+    def close(self) -> None:
+        self._current.close()
+
+    def _advance(self) -> None:
+        block_size = self._manifest.block_size
+        while self._next < len(self._manifest.hashes):
+            start = self._next * block_size
+            length = min(block_size, self._manifest.size - start)
+            expected = self._manifest.hashes[self._next]
+            offset = self._offsets.get(expected)\
+                if length == block_size else None
+            if offset is not None:
+                self._current.seek(offset)
+                block = self._current.read(length)
+                self.copied += 1
+            elif len(self._buffer) >= length:
+                block = bytes(self._buffer[:length])
+                del self._buffer[:length]
+            else:
+                return
+            if hashlib.sha256(block).digest() != expected:
+                msg = f'Hash mismatch in block {self._next}'
+                LOG.error(msg)
+                raise HashMismatch(msg)
+            self._write(block)
+            self._next += 1
+
+
+class StreamingUpdate:
+    """
+    Validate an update and write its rootfs while the update is received
+
+    The update zip is fed to :py:meth:`feed` in order as it arrives. The
+    rootfs is hashed and written to the unused root partition as it is
+    unzipped, so the update is only read once and never saved to disk. The
+    hash and signature are checked by :py:meth:`finish` once the whole
+    update has been fed, and the partition must not be booted if it fails.
+
+    The update may instead be a delta, made by :py:func:`make_delta_update`,
+    holding a manifest of the rootfs's block hashes followed by only the
+    blocks the running partition doesn't have. The rest are copied from the
+    running partition, and the rebuilt rootfs is checked the same way.
+
+    These methods are blocking, so call them in an executor.
+    """
+    def __init__(self,
+                 progress_callback: Callable[[float], None],
+                 file_size: Optional[int] = None,
+                 chunk_size: int = WRITE_CHUNK_SIZE,
+                 current_blocks: Optional[BlockHashes] = None) -> None:
+        """
+        :param progress_callback: A callback to call with progress between 0
+                                  and 1.0 as the update is fed. May never
+                                  reach precisely 1.0, best only for user
+                                  information.
+        :param file_size: The total size of the update file (for generating
+                          progress percentage). If ``None``, progress is not
+                          reported.
+        :param chunk_size: The size of the writes to the partition
+        :param current_blocks: The block hashes of the running partition, if
+                               already known, for a delta update. If
+                               ``None`` and the update is a delta, they are
+                               computed when the delta is found.
+        """
+        self._progress_callback = progress_callback
+        self._file_size = file_size
+        self._chunk_size = chunk_size
+        self._fed = 0
+        self.partition = _find_unused_partition()
+        LOG.info(f'Streaming update to {self.partition.value.path}'
+                 f' in {chunk_size}B chunks')
+        self._part = open(self.partition.value.path, 'wb', buffering=0)
+        self._rootfs_buffer = bytearray()
+        self._rootfs_hasher = hashlib.sha256()
+        self._found: Set[str] = set()
+        self._small_files: Dict[str, bytearray] = {}
+        self._current_blocks = current_blocks
+        self._delta: Optional[_DeltaReader] = None
+        self._unzipper = ZipStreamReader(self._open_member)
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Handle the next chunk of the update file
+
+        :raises zip_stream.BadZip: If the update isn't a valid zip file
+        """
+        self._unzipper.feed(chunk)
+        self._fed += len(chunk)
+        if self._delta:
+            # Most of a delta's rootfs is copied rather than received
+            self._progress_callback(self._delta.progress)
+        elif self._file_size:
+            self._progress_callback(min(self._fed / self._file_size, 1.0))
+
+    def finish(self, cert_path: Optional[str]) -> RootPartitions:
+        """
+        Finish writing the rootfs, and check it against its hash
+
+        :param cert_path: Path to an x.509 certificate to check the signature
+                          against. If ``None``, signature checking is disabled
+        :returns: The root partition that the rootfs image was written to
+        :raises FileMissing: If a mandatory file is missing
+        :raises zip_stream.BadZip: If a delta doesn't match its manifest
+        :raises HashMismatch: If the rootfs doesn't match its hash
+        :raises SignatureMismatch: If the hash's signature doesn't verify
+        """
+        try:
+            self._unzipper.close()
+            if self._delta:
+                self._delta.finish()
+            self._write_aligned(len(self._rootfs_buffer))
+            os.fsync(self._part.fileno())
+        finally:
+            self.close()
+
+        self._check_found(cert_path)
+
+        rootfs_hash = binascii.hexlify(self._rootfs_hasher.digest())
+        packaged_hash = bytes(self._small_files[ROOTFS_HASH_NAME]).strip()
+        if packaged_hash != rootfs_hash:
+            msg = f"Hash mismatch: calculated {rootfs_hash!r} != "\
+                f"packaged {packaged_hash!r}"
+            LOG.error(msg)
+            raise HashMismatch(msg)
+
+        if cert_path:
+            with tempfile.TemporaryDirectory() as sig_dir:
+                hashfile = os.path.join(sig_dir, ROOTFS_HASH_NAME)
+                sigfile = os.path.join(sig_dir, ROOTFS_SIG_NAME)
+                for name, path in ((ROOTFS_HASH_NAME, hashfile),
+                                   (ROOTFS_SIG_NAME, sigfile)):
+                    with open(path, 'wb') as f:
+                        f.write(self._small_files[name])
+                verify_signature(hashfile, sigfile, cert_path)
+
+        return self.partition
+
+    def _check_found(self, cert_path: Optional[str]) -> None:
+        if self._delta:
+            required = [ROOTFS_BLOCKS_NAME, ROOTFS_DELTA_NAME,
+                        ROOTFS_HASH_NAME]
+        else:
+            required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
+        if cert_path:
+            required.append(ROOTFS_SIG_NAME)
+        for name in required:
+            if name not in self._found:
+                raise FileMissing(f'File {name} missing from zip')
+
+    def close(self) -> None:
+        """ Close the partition, for example if the update is abandoned """
+        self._part.close()
+        if self._delta:
+            self._delta.close()
+
+    def _open_member(self, name: str) -> Optional[MemberWriter]:
+        if name not in UPDATE_FILES and name not in DELTA_FILES:
+            LOG.debug(f"Ignoring {name}")
+            return None
+        if name in (ROOTFS_NAME, ROOTFS_DELTA_NAME)\
+                and {ROOTFS_NAME, ROOTFS_DELTA_NAME} & self._found:
+            raise BadZip('Update has both a rootfs and a delta')
+        self._found.add(name)
+        if name == ROOTFS_NAME:
+            return self._write_rootfs
+        if name == ROOTFS_DELTA_NAME:
+            self._delta = self._open_delta()
+            return self._delta.feed
+
+        limit = MAX_MANIFEST_SIZE if name == ROOTFS_BLOCKS_NAME\
+            else MAX_SMALL_FILE_SIZE
+        contents = self._small_files[name] = bytearray()
+
+        def write_small(chunk: bytes) -> None:
+            if len(contents) + len(chunk) > limit:
+                raise BadZip(f'{name} is too big')
+            contents.extend(chunk)
+        return write_small
+
+    def _open_delta(self) -> _DeltaReader:
+        if ROOTFS_BLOCKS_NAME not in self._small_files:
+            raise BadZip(f'{ROOTFS_BLOCKS_NAME} must come before'
+                         f' {ROOTFS_DELTA_NAME}')
+        try:
+            manifest = BlockHashes.from_json(
+                json.loads(self._small_files[ROOTFS_BLOCKS_NAME]))
+        except (ValueError, KeyError, TypeError) as e:
+            raise BadZip(f'Bad {ROOTFS_BLOCKS_NAME}: {e}')
+        current_path = _find_current_partition().value.path
+        current = self._current_blocks
+        if not current or current.block_size != manifest.block_size:
+            LOG.info(f'Hashing {current_path} for delta update')
+            current = hash_blocks(current_path, lambda progress: None,
+                                  manifest.block_size)
+        return _DeltaReader(manifest, current_path, current,
+                            self._write_rootfs)
+
+    def _write_rootfs(self, chunk: bytes) -> None:
+        self._rootfs_hasher.update(chunk)
+        self._rootfs_buffer += chunk
+        if len(self._rootfs_buffer) >= self._chunk_size:
+            self._write_aligned(len(self._rootfs_buffer)
+                                - len(self._rootfs_buffer) % self._chunk_size)
+
+    def _write_aligned(self, length: int) -> None:
+        """ Write and drop the first ``length`` bytes of the buffer """
+        written = 0
+        with memoryview(self._rootfs_buffer) as view:
+            while written < length:
+                written += self._part.write(view[written:length])
+        del self._rootfs_buffer[:length]
+
+
 def _mountpoint_root():
     """ provides mountpoint location for :py:meth:`mount_update`.
 
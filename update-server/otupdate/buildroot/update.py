@@ -7,7 +7,6 @@ This has endpoints like update session management, validation, and execution
 import asyncio
 import functools
 import logging
-import os
 from subprocess import CalledProcessError
 
 from typing import Optional
@@ -20,6 +19,11 @@ from . import config, file_actions
 from .update_session import UpdateSession, Stages
 
 SESSION_VARNAME = APP_VARIABLE_PREFIX + 'session'
+# The running partition doesn't change until a restart, so its block hashes
+# are kept for every session
+CURRENT_BLOCKS_VARNAME = APP_VARIABLE_PREFIX + 'current_blocks'
+# The most of the upload to read and hand to the executor at a time
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 LOG = logging.getLogger(__name__)
 
 
@@ -76,64 +80,89 @@ async def status(request: web.Request, session: UpdateSession) -> web.Response:
         status=200)
 
 
-async def _save_file(part: BodyPartReader, path: str):
-    with open(os.path.join(path, part.name), 'wb') as write:
-        while not part.at_eof():
-            chunk = await part.read_chunk()
-            decoded = part.decode(chunk)
-            write.write(decoded)
+def _current_blocks(app: web.Application,
+                    loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+    """ Get the running partition's block hashes, hashing it if needed.
 
+    Concurrent requests share one hashing of the partition.
+    """
+    hashing = app.get(CURRENT_BLOCKS_VARNAME)
+    if hashing is None or (hashing.done() and hashing.exception()):
+        hashing = asyncio.ensure_future(loop.run_in_executor(
+            None, file_actions.hash_current_partition, lambda progress: None))
+        app[CURRENT_BLOCKS_VARNAME] = hashing
+    return hashing
 
-def _begin_write(session: UpdateSession,
-                 loop: asyncio.AbstractEventLoop,
-                 rootfs_file_path: str):
-    """ Start the write process. """
-    session.set_progress(0)
-    session.set_stage(Stages.WRITING)
-    write_future = asyncio.ensure_future(loop.run_in_executor(
-        None, file_actions.write_update, rootfs_file_path,
-        session.set_progress))
 
-    def write_done(fut):
-        exc = fut.exception()
-        if exc:
-            session.set_error(getattr(exc, 'short', str(type(exc))),
-                              str(exc))
-        else:
-            session.set_stage(Stages.DONE)
+@require_session
+async def blocks(request: web.Request, session: UpdateSession) -> web.Response:
+    """ Serves /update/:session/blocks
+
+    Returns the sha256 hash of each block of the running root partition, for
+    building a delta update that only holds the blocks that changed.
+    """
+    loop = asyncio.get_event_loop()
+    try:
+        current = await asyncio.shield(_current_blocks(request.app, loop))
+    except (OSError, CalledProcessError) as exc:
+        return web.json_response(
+            data={'error': 'hash-failed',
+                  'message': f'Could not hash the running partition: {exc}'},
+            status=500)
+    return web.json_response(
+        data=current.to_json(),
+        status=200)
 
-    write_future.add_done_callback(write_done)
 
+async def _stream_update(part: BodyPartReader,
+                         pipeline: file_actions.StreamingUpdate,
+                         loop: asyncio.AbstractEventLoop):
+    """ Feed an uploaded update to the pipeline as it is received.
 
-def _begin_validation(
+    Each chunk is handled in an executor while the next one is received.
+    """
+    handling: Optional[asyncio.Future] = None
+    while not part.at_eof():
+        chunk = part.decode(await part.read_chunk(UPLOAD_CHUNK_SIZE))
+        if handling:
+            await handling
+        handling = loop.run_in_executor(None, pipeline.feed, chunk)
+    if handling:
+        await handling
+
+
+def _begin_finish(
         session: UpdateSession,
         config: config.Config,
         loop: asyncio.AbstractEventLoop,
-        downloaded_update_path: str)\
+        pipeline: file_actions.StreamingUpdate)\
         -> asyncio.futures.Future:
-    """ Start the validation process. """
+    """ Start checking the written update. """
+    session.set_progress(0)
     session.set_stage(Stages.VALIDATING)
     cert_path = config.update_cert_path\
         if config.signature_required else None
 
-    validation_future \
-        = asyncio.ensure_future(loop.run_in_executor(
-            None, file_actions.validate_update,
-            downloaded_update_path, session.set_progress, cert_path))
+    finish_future = asyncio.ensure_future(loop.run_in_executor(
+        None, pipeline.finish, cert_path))
 
-    def validation_done(fut):
+    def finish_done(fut):
         exc = fut.exception()
         if exc:
             session.set_error(getattr(exc, 'short', str(type(exc))),
                               str(exc))
         else:
-            rootfs_file = fut.result()
-            loop.call_soon_threadsafe(_begin_write,
-                                      session,
-                                      loop,
-                                      rootfs_file)
-    validation_future.add_done_callback(validation_done)
-    return validation_future
+            session.set_progress(1.0)
+            session.set_stage(Stages.DONE)
+
+    finish_future.add_done_callback(finish_done)
+    return finish_future
+
+
+def _upload_failed(session: UpdateSession, exc: Exception) -> web.Response:
+    session.set_error(getattr(exc, 'short', str(type(exc))), str(exc))
+    return web.json_response(data=session.state,
+                             status=400)
 
 
 @require_session
@@ -143,26 +172,49 @@ async def file_upload(
 
     Requires multipart (encoding doesn't matter) with a file field in the
     body called 'ot2-system.zip'.
+
+    The update is unzipped, hashed and written to the unused partition as it
+    is received. Once it's all received, the hash and signature are checked.
+    The file may be a delta update built against the hashes from
+    /update/:session/blocks.
     """
     if session.stage != Stages.AWAITING_FILE:
         return web.json_response(
             data={'error': 'file-already-uploaded',
                   'message': 'A file has already been sent for this update'},
             status=409)
-    reader = await request.multipart()
-    async for part in reader:
-        if part.name != 'ot2-system.zip':
-            LOG.warning(
-                f"Unknown field name {part.name} in file_upload, ignoring")
-            await part.release()
-        else:
-            await _save_file(part, session.download_path)
-
-    _begin_validation(
+    loop = asyncio.get_event_loop()
+    session.set_progress(0)
+    session.set_stage(Stages.WRITING)
+    hashing = request.app.get(CURRENT_BLOCKS_VARNAME)
+    current_blocks = hashing.result()\
+        if hashing and hashing.done() and not hashing.exception() else None
+    try:
+        pipeline = await loop.run_in_executor(
+            None, functools.partial(
+                file_actions.StreamingUpdate, session.set_progress,
+                request.content_length, current_blocks=current_blocks))
+    except (OSError, CalledProcessError) as exc:
+        return _upload_failed(session, exc)
+
+    try:
+        reader = await request.multipart()
+        async for part in reader:
+            if part.name != 'ot2-system.zip':
+                LOG.warning(
+                    f"Unknown field name {part.name} in file_upload, ignoring")
+                await part.release()
+            else:
+                await _stream_update(part, pipeline, loop)
+    except (ValueError, OSError) as exc:
+        pipeline.close()
+        return _upload_failed(session, exc)
+
+    _begin_finish(
         session,
         config.config_from_request(request),
-        asyncio.get_event_loop(),
-        os.path.join(session.download_path, 'ot2-system.zip'))
+        loop,
+        pipeline)
 
     return web.json_response(data=session.state,
                              status=201)
@@ -0,0 +1,261 @@
+"""
+otupdate.buildroot.zip_stream: unzip a file as it is received
+
+Zip files are usually read from their central directory at the end of the
+file. Each member is also preceded by a local header, though, so a zip can
+be unpacked front to back without seeking, as long as its members are
+stored or deflated. This lets an update be unpacked while it is uploaded,
+without saving it first.
+"""
+import logging
+import struct
+import zlib
+from typing import Callable, Optional
+
+
+LOG = logging.getLogger(__name__)
+
+LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+LOCAL_HEADER_SIG = 0x04034b50
+CENTRAL_DIRECTORY_SIGS = (0x02014b50, 0x06054b50, 0x06064b50)
+DATA_DESCRIPTOR_SIG = 0x08074b50
+ZIP64_EXTRA_ID = 0x0001
+
+STORED = 0
+DEFLATED = 8
+
+FLAG_ENCRYPTED = 0x1
+FLAG_DATA_DESCRIPTOR = 0x8
+FLAG_UTF8 = 0x800
+
+# The most output to decompress at a time, since a small chunk of a
+# compressed disk image can inflate to a very large one
+MAX_OUTPUT_CHUNK = 1024 * 1024
+
+MemberWriter = Callable[[bytes], None]
+
+
+class BadZip(ValueError):
+    def __init__(self, message):
+        self.message = message
+        self.short = 'Bad Zip'
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}: {self.message}>'
+
+    def __str__(self):
+        return self.message
+
+
+class _Member:
+    def __init__(self, name: str, flags: int, method: int, crc: int,
+                 compressed_size: Optional[int], zip64: bool,
+                 writer: Optional[MemberWriter]) -> None:
+        self.name = name
+        self.flags = flags
+        self.method = method
+        self.crc = crc
+        self.zip64 = zip64
+        self.remaining = compressed_size
+        self.writer = writer
+        self.actual_crc = 0
+        self.size = 0
+        self.decompressor = zlib.decompressobj(-zlib.MAX_WBITS)\
+            if method == DEFLATED else None
+
+    def emit(self, data: bytes):
+        if not data:
+            return
+        self.actual_crc = zlib.crc32(data, self.actual_crc)
+        self.size += len(data)
+        if self.writer:
+            self.writer(data)
+
+
+class ZipStreamReader:
+    """
+    Unpack a zip file from chunks fed to it in order
+
+    :param open_member: Called with the name of each member as it is
+                        found. Returns a callable to write the member's
+                        contents to, in chunks, or ``None`` to skip it.
+    """
+    def __init__(self,
+                 open_member: Callable[[str], Optional[MemberWriter]]) -> None:
+        self._open_member = open_member
+        self._buffer = bytearray()
+        self._member: Optional[_Member] = None
+        self._awaiting_descriptor = False
+        self._done = False
+
+    def feed(self, data: bytes) -> None:
+        """
+        Unpack the next chunk of the zip file
+
+        :raises BadZip: If the data isn't a zip file that can be streamed, or
+                        a member doesn't match its checksum
+        """
+        if self._done:
+            return
+        self._buffer += data
+        while self._step():
+            pass
+
+    def close(self) -> None:
+        """
+        Check that the whole zip file was fed
+
+        :raises BadZip: If the zip file ended early
+        """
+        if not self._done:
+            raise BadZip('Zip file is truncated')
+
+    def _step(self) -> bool:
+        """ Make what progress is possible with the buffered data.
+
+        Returns whether to step again.
+        """
+        if self._done:
+            self._buffer.clear()
+            return False
+        elif self._awaiting_descriptor:
+            return self._read_descriptor()
+        elif self._member:
+            return self._read_data(self._member)
+        else:
+            return self._read_header()
+
+    def _read_header(self) -> bool:
+        if len(self._buffer) < 4:
+            return False
+        signature, = struct.unpack_from('<I', self._buffer)
+        if signature in CENTRAL_DIRECTORY_SIGS:
+            # Every member has been read; the rest is the index
+            self._done = True
+            return True
+        if signature != LOCAL_HEADER_SIG:
+            raise BadZip(f'Bad zip header signature {signature:#x}')
+        if len(self._buffer) < LOCAL_HEADER.size:
+            return False
+
+        (_, _, flags, method, _, _, crc, compressed_size, _,
+         name_length, extra_length) = LOCAL_HEADER.unpack_from(self._buffer)
+        header_length = LOCAL_HEADER.size + name_length + extra_length
+        if len(self._buffer) < header_length:
+            return False
+
+        raw_name = bytes(
+            self._buffer[LOCAL_HEADER.size:LOCAL_HEADER.size + name_length])
+        name = raw_name.decode('utf-8' if flags & FLAG_UTF8 else 'cp437')
+        extra = bytes(
+            self._buffer[LOCAL_HEADER.size + name_length:header_length])
+        del self._buffer[:header_length]
+
+        size = _compressed_size(name, flags, method, compressed_size, extra)
+        zip64 = _find_extra_field(extra, ZIP64_EXTRA_ID) is not None
+        LOG.debug(f'Unzipping {name}')
+        self._member = _Member(name, flags, method, crc, size, zip64,
+                               self._open_member(name))
+        return True
+
+    def _read_data(self, member: _Member) -> bool:
+        if not self._buffer and member.remaining != 0:
+            return False
+        if member.remaining is None:
+            take = len(self._buffer)
+        else:
+            take = min(len(self._buffer), member.remaining)
+            member.remaining -= take
+        data = bytes(self._buffer[:take])
+        del self._buffer[:take]
+
+        if member.decompressor:
+            while True:
+                out = member.decompressor.decompress(data, MAX_OUTPUT_CHUNK)
+                member.emit(out)
+                data = member.decompressor.unconsumed_tail
+                if member.decompressor.eof\
+                        or (not data and len(out) < MAX_OUTPUT_CHUNK):
+                    break
+            finished = member.decompressor.eof
+            # Whatever follows the end of the deflate stream is the next
+            # part of the zip
+            self._buffer[:0] = member.decompressor.unused_data
+            if member.remaining == 0 and not finished:
+                raise BadZip(f'{member.name} is truncated')
+        else:
+            member.emit(data)
+            finished = member.remaining == 0
+
+        if finished:
+            if member.flags & FLAG_DATA_DESCRIPTOR:
+                self._awaiting_descriptor = True
+            else:
+                self._end_member(member.crc)
+        return True
+
+    def _read_descriptor(self) -> bool:
+        # The descriptor is an optional signature, then the crc and sizes,
+        # which are 8 bytes each if the member's header has a zip64 field
+        member = self._member
+        assert member
+        sizes_length = 16 if member.zip64 else 8
+        if len(self._buffer) < 8 + sizes_length:
+            return False
+        signature, crc = struct.unpack_from('<II', self._buffer)
+        if signature == DATA_DESCRIPTOR_SIG:
+            del self._buffer[:8 + sizes_length]
+        else:
+            crc = signature
+            del self._buffer[:4 + sizes_length]
+        self._awaiting_descriptor = False
+        self._end_member(crc)
+        return True
+
+    def _end_member(self, crc: int):
+        member = self._member
+        assert member
+        if member.actual_crc != crc:
+            raise BadZip(f'{member.name} failed its checksum')
+        LOG.debug(f'Unzipped {member.name} ({member.size}B)')
+        self._member = None
+
+
+def _compressed_size(name: str, flags: int, method: int,
+                     compressed_size: int, extra: bytes) -> Optional[int]:
+    """ Check a member can be streamed, and find its compressed size
+
+    Returns ``None`` if the size isn't known until the member's end.
+    """
+    if flags & FLAG_ENCRYPTED:
+        raise BadZip(f'{name} is encrypted')
+    if method not in (STORED, DEFLATED):
+        raise BadZip(f'{name} uses unsupported compression {method}')
+    if flags & FLAG_DATA_DESCRIPTOR:
+        if method == STORED:
+            raise BadZip(f'{name} is stored without a size')
+        return None
+    if compressed_size == 0xffffffff:
+        return _zip64_compressed_size(name, extra)
+    return compressed_size
+
+
+def _zip64_compressed_size(name: str, extra: bytes) -> int:
+    """ Find the compressed size of a member in its zip64 extra field """
+    field = _find_extra_field(extra, ZIP64_EXTRA_ID)
+    # The field holds the uncompressed size, then the compressed size
+    if field is None or len(field) < 16:
+        raise BadZip(f'{name} is missing its zip64 size')
+    size, = struct.unpack_from('<Q', field, 8)
+    return size
+
+
+def _find_extra_field(extra: bytes, field_id: int) -> Optional[bytes]:
+    """ Find the data of a field in a local header's extra fields """
+    offset = 0
+    while offset + 4 <= len(extra):
+        this_id, length = struct.unpack_from('<HH', extra, offset)
+        if this_id == field_id:
+            return extra[offset + 4:offset + 4 + length]
+        offset += 4 + length
+    return None
@@ -147,3 +147,27 @@ def testing_partition(monkeypatch, tmpdir):
     find_unused.return_value = FakeRootPartElem(
         'TWO', buildroot.file_actions.Partition(2, partfile))
     return partfile
+
+
+@pytest.fixture
+def current_partition(monkeypatch, tmpdir, downloaded_update_file):
+    """
+    Return the path to a fake running partition for delta updates
+
+    It holds the rootfs of ``downloaded_update_file`` with a couple of its
+    blocks changed and some extra data at the end.
+    """
+    partfile = os.path.join(tmpdir, 'fake-current-partition')
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        contents = bytearray(zf.read('rootfs.ext4'))
+    for offset in (4096 * 3, 70000):
+        contents[offset:offset + 100] = os.urandom(100)
+    contents += os.urandom(5000)
+    with open(partfile, 'wb') as part:
+        part.write(contents)
+    find_current = mock.Mock()
+    monkeypatch.setattr(buildroot.file_actions, '_find_current_partition',
+                        find_current)
+    find_current.return_value = FakeRootPartElem(
+        'THREE', buildroot.file_actions.Partition(3, partfile))
+    return partfile
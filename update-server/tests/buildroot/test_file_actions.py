@@ -12,6 +12,7 @@ import zipfile
 import pytest
 
 from otupdate.buildroot import file_actions
+from otupdate.buildroot.zip_stream import BadZip
 
 
 def test_unzip(downloaded_update_file):
@@ -200,6 +201,199 @@ def test_write_update(extracted_update_file, testing_partition):
             'rb').read().strip()
 
 
+def stream_update(path, chunk_size=4096, write_chunk_size=4096):
+    cb = mock.Mock()
+    size = os.path.getsize(path)
+    pipeline = file_actions.StreamingUpdate(cb, size, write_chunk_size)
+    with open(path, 'rb') as update:
+        for chunk in iter(lambda: update.read(chunk_size), b''):
+            pipeline.feed(chunk)
+    return pipeline, cb
+
+
+def test_stream_update(downloaded_update_file, testing_partition,
+                       testing_cert):
+    pipeline, cb = stream_update(downloaded_update_file)
+    cb.assert_called()
+    assert cb.call_args[0][0] == 1.0
+    assert pipeline.finish(testing_cert).value.path == testing_partition
+
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        assert open(testing_partition, 'rb').read()\
+            == zf.read(file_actions.ROOTFS_NAME)
+
+
+def test_stream_update_aligned_writes(downloaded_update_file,
+                                      testing_partition, monkeypatch):
+    writes = []
+    real_open = open
+
+    class RecordingFile:
+        def __init__(self, *args, **kwargs):
+            self._file = real_open(*args, **kwargs)
+
+        def write(self, data):
+            writes.append(len(data))
+            return self._file.write(data)
+
+        def __getattr__(self, name):
+            return getattr(self._file, name)
+
+    monkeypatch.setattr(file_actions, 'open', RecordingFile, raising=False)
+    pipeline, _ = stream_update(downloaded_update_file,
+                                chunk_size=1000, write_chunk_size=8192)
+    pipeline.finish(None)
+
+    # Every write but the last is a whole number of chunks
+    assert all(size % 8192 == 0 for size in writes[:-1])
+    assert sum(writes) == os.path.getsize(testing_partition)
+
+
+@pytest.mark.exclude_rootfs_ext4_hash_sig
+def test_stream_update_hash_only(downloaded_update_file, testing_partition):
+    pipeline, _ = stream_update(downloaded_update_file)
+    pipeline.finish(None)
+
+
+@pytest.mark.bad_hash
+def test_stream_update_catches_bad_hash(downloaded_update_file,
+                                        testing_partition):
+    pipeline, _ = stream_update(downloaded_update_file)
+    with pytest.raises(file_actions.HashMismatch):
+        pipeline.finish(None)
+
+
+@pytest.mark.bad_sig
+def test_stream_update_catches_bad_sig(downloaded_update_file,
+                                       testing_partition, testing_cert):
+    pipeline, _ = stream_update(downloaded_update_file)
+    with pytest.raises(file_actions.SignatureMismatch):
+        pipeline.finish(testing_cert)
+
+
+@pytest.mark.exclude_rootfs_ext4_hash_sig
+def test_stream_update_catches_missing_sig(downloaded_update_file,
+                                           testing_partition, testing_cert):
+    pipeline, _ = stream_update(downloaded_update_file)
+    with pytest.raises(file_actions.FileMissing):
+        pipeline.finish(testing_cert)
+
+
+@pytest.mark.exclude_rootfs_ext4
+def test_stream_update_catches_missing_image(downloaded_update_file,
+                                             testing_partition, testing_cert):
+    pipeline, _ = stream_update(downloaded_update_file)
+    with pytest.raises(file_actions.FileMissing):
+        pipeline.finish(testing_cert)
+
+
+def test_stream_update_catches_truncation(downloaded_update_file,
+                                          testing_partition):
+    cb = mock.Mock()
+    pipeline = file_actions.StreamingUpdate(cb)
+    with open(downloaded_update_file, 'rb') as update:
+        pipeline.feed(update.read(50000))
+    with pytest.raises(BadZip):
+        pipeline.finish(None)
+
+
+def test_hash_blocks(tmpdir):
+    path = os.path.join(tmpdir, 'image')
+    contents = os.urandom(10000)
+    open(path, 'wb').write(contents)
+    cb = mock.Mock()
+    blocks = file_actions.hash_blocks(path, cb, block_size=4096,
+                                      chunk_size=8192)
+    assert blocks.block_size == 4096
+    assert blocks.size == 10000
+    assert blocks.hashes == [
+        hashlib.sha256(contents[start:start + 4096]).digest()
+        for start in range(0, 10000, 4096)]
+    assert cb.call_args[0][0] == 1.0
+    assert file_actions.BlockHashes.from_json(blocks.to_json()) == blocks
+
+
+def make_delta(downloaded_update_file, current_partition, block_size=4096):
+    current = file_actions.hash_blocks(current_partition, mock.Mock(),
+                                       block_size=block_size)
+    delta_path = downloaded_update_file + '.delta.zip'
+    sent = file_actions.make_delta_update(
+        downloaded_update_file, current, delta_path)
+    return delta_path, current, sent
+
+
+@pytest.mark.parametrize('hashed', [True, False])
+def test_stream_delta_update(downloaded_update_file, testing_partition,
+                             current_partition, testing_cert, hashed):
+    delta_path, current, sent = make_delta(downloaded_update_file,
+                                           current_partition)
+    # The two changed blocks and the partial last block
+    assert sent == 3
+    cb = mock.Mock()
+    pipeline = file_actions.StreamingUpdate(
+        cb, os.path.getsize(delta_path), 4096,
+        current_blocks=current if hashed else None)
+    with open(delta_path, 'rb') as update:
+        for chunk in iter(lambda: update.read(1000), b''):
+            pipeline.feed(chunk)
+    assert cb.call_args[0][0] == 1.0
+    assert pipeline.finish(testing_cert).value.path == testing_partition
+
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        assert open(testing_partition, 'rb').read()\
+            == zf.read(file_actions.ROOTFS_NAME)
+
+
+def test_stream_delta_update_catches_changed_partition(
+        downloaded_update_file, testing_partition, current_partition):
+    delta_path, current, _ = make_delta(downloaded_update_file,
+                                        current_partition)
+    # The partition changes after its blocks were hashed
+    with open(current_partition, 'r+b') as part:
+        part.write(b'not the hashed contents')
+    pipeline = file_actions.StreamingUpdate(mock.Mock(),
+                                            current_blocks=current)
+    with pytest.raises(file_actions.HashMismatch):
+        pipeline.feed(open(delta_path, 'rb').read())
+    pipeline.close()
+
+
+def test_stream_delta_update_catches_truncated_delta(
+        downloaded_update_file, testing_partition, current_partition):
+    delta_path, current, _ = make_delta(downloaded_update_file,
+                                        current_partition)
+    with zipfile.ZipFile(delta_path) as zf:
+        members = {name: zf.read(name) for name in zf.namelist()}
+    members[file_actions.ROOTFS_DELTA_NAME]\
+        = members[file_actions.ROOTFS_DELTA_NAME][:-10]
+    with zipfile.ZipFile(delta_path, 'w') as zf:
+        for name, contents in members.items():
+            zf.writestr(name, contents)
+    pipeline, _ = stream_update(delta_path)
+    with pytest.raises(BadZip):
+        pipeline.finish(None)
+
+
+@pytest.mark.parametrize('names', [
+    [file_actions.ROOTFS_DELTA_NAME, file_actions.ROOTFS_BLOCKS_NAME],
+    [file_actions.ROOTFS_BLOCKS_NAME, file_actions.ROOTFS_DELTA_NAME,
+     file_actions.ROOTFS_NAME],
+])
+def test_stream_delta_update_catches_bad_layout(
+        downloaded_update_file, testing_partition, current_partition, names):
+    delta_path, current, _ = make_delta(downloaded_update_file,
+                                        current_partition)
+    with zipfile.ZipFile(delta_path) as zf:
+        members = {name: zf.read(name) for name in zf.namelist()}
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        members[file_actions.ROOTFS_NAME] = zf.read(file_actions.ROOTFS_NAME)
+    with zipfile.ZipFile(delta_path, 'w') as zf:
+        for name in names:
+            zf.writestr(name, members[name])
+    with pytest.raises(BadZip):
+        stream_update(delta_path)
+
+
 def test_commit_update(monkeypatch):
     unused = file_actions.RootPartitions.TWO
     new = file_actions.RootPartitions.TWO
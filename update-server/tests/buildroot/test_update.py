@@ -60,44 +60,44 @@ async def test_commit_fails_wrong_state(test_cli, update_session):
     assert resp.status == 409
 
 
+def _stream(downloaded_update_file, session):
+    pipeline = file_actions.StreamingUpdate(session.set_progress)
+    with open(downloaded_update_file, 'rb') as update:
+        pipeline.feed(update.read())
+    return pipeline
+
+
 async def test_future_chain(otupdate_config, downloaded_update_file,
                             loop, testing_partition):
     conf = config.load_from_path(otupdate_config)
     session = UpdateSession(conf.download_storage_path)
-    fut = update._begin_validation(session,
-                                   conf,
-                                   loop,
-                                   downloaded_update_file)
+    pipeline = _stream(downloaded_update_file, session)
+    fut = update._begin_finish(session,
+                               conf,
+                               loop,
+                               pipeline)
     assert session.stage == Stages.VALIDATING
-    last_progress = 0.0
-    while session.stage == Stages.VALIDATING:
-        assert session.state['progress'] >= last_progress
-        assert session.state['stage'] == 'validating'
-        assert session.stage == Stages.VALIDATING
-        last_progress = session.state['progress']
-        await asyncio.sleep(0.01)
-    assert fut.done()
-    last_progress = 0.0
-    while session.stage == Stages.WRITING:
-        assert session.state['progress'] >= last_progress
-        last_progress = session.state['progress']
-        await asyncio.sleep(0.1)
+    assert session.state['stage'] == 'validating'
+    await fut
+    await asyncio.sleep(0)
     assert session.stage == Stages.DONE, session.error
 
 
 @pytest.mark.exclude_rootfs_ext4
 async def test_session_catches_validation_fail(otupdate_config,
                                                downloaded_update_file,
-                                               loop):
+                                               loop, testing_partition):
     conf = config.load_from_path(otupdate_config)
     session = UpdateSession(conf.download_storage_path)
-    fut = update._begin_validation(
+    pipeline = _stream(downloaded_update_file, session)
+    fut = update._begin_finish(
         session,
         conf,
         loop,
-        downloaded_update_file)
+        pipeline)
     with pytest.raises(file_actions.FileMissing):
         await fut
+    await asyncio.sleep(0)
     assert session.state['stage'] == 'error'
     assert session.stage == Stages.ERROR
     assert 'error' in session.state
@@ -168,3 +168,43 @@ async def test_update_catches_validation_fail(test_cli, update_session,
         body = await resp.json()
     assert body['stage'] == 'error'
     assert body['error'] == 'File Missing'
+
+
+async def test_update_catches_bad_zip(test_cli, update_session,
+                                      testing_partition):
+    resp = await test_cli.post(
+        session_endpoint(update_session, 'file'),
+        data={'ot2-system.zip': b'not a zip file at all'})
+    assert resp.status == 400
+    body = await resp.json()
+    assert body['stage'] == 'error'
+    assert body['error'] == 'Bad Zip'
+
+
+async def test_delta_update(test_cli, update_session, downloaded_update_file,
+                            loop, testing_partition, current_partition):
+    resp = await test_cli.get(session_endpoint(update_session, 'blocks'))
+    assert resp.status == 200
+    current = file_actions.BlockHashes.from_json(await resp.json())
+    assert current == file_actions.hash_blocks(current_partition,
+                                               lambda progress: None)
+
+    delta_path = downloaded_update_file + '.delta.zip'
+    file_actions.make_delta_update(downloaded_update_file, current,
+                                   delta_path)
+    resp = await test_cli.post(
+        session_endpoint(update_session, 'file'),
+        data={'ot2-system.zip': open(delta_path, 'rb')})
+    assert resp.status == 201
+    body = await resp.json()
+    then = loop.time()
+    while body['stage'] == 'validating':
+        resp = await test_cli.get(
+            session_endpoint(update_session, 'status'))
+        body = await resp.json()
+        assert loop.time() - then <= 300
+    assert body['stage'] == 'done', body
+
+    with zipfile.ZipFile(downloaded_update_file, 'r') as zf:
+        assert open(testing_partition, 'rb').read()\
+            == zf.read('rootfs.ext4')
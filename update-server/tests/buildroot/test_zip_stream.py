@@ -0,0 +1,111 @@
+""" tests for otupdate.buildroot.zip_stream
+
+Checks that zips made in the ways zipfile can make them unpack correctly
+when fed in pieces, and that bad zips are caught
+"""
+import io
+import os
+import zipfile
+
+import pytest
+
+from otupdate.buildroot import zip_stream
+
+
+class Unseekable(io.RawIOBase):
+    """ A write-only stream, which makes zipfile use data descriptors """
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+
+CONTENTS = {
+    'rootfs.ext4': os.urandom(50000) + bytes(100000),
+    'rootfs.ext4.hash': b'abc123',
+    'empty': b'',
+}
+
+
+def make_zip(compression, seekable=True, force_zip64=False):
+    out = io.BytesIO() if seekable else Unseekable()
+    with zipfile.ZipFile(out, 'w', compression=compression) as zf:
+        for name, contents in CONTENTS.items():
+            with zf.open(name, 'w', force_zip64=force_zip64) as member:
+                member.write(contents)
+    return bytes(out.getvalue() if seekable else out.data)
+
+
+def unzip(data, chunk_size):
+    members = {}
+
+    def open_member(name):
+        members[name] = bytearray()
+        return members[name].extend
+
+    reader = zip_stream.ZipStreamReader(open_member)
+    for offset in range(0, len(data), chunk_size):
+        reader.feed(data[offset:offset + chunk_size])
+    reader.close()
+    return {name: bytes(contents) for name, contents in members.items()}
+
+
+# Stored members need their size up front, so can't be unseekable
+@pytest.mark.parametrize('compression,seekable',
+                         [(zipfile.ZIP_STORED, True),
+                          (zipfile.ZIP_DEFLATED, True),
+                          (zipfile.ZIP_DEFLATED, False)])
+@pytest.mark.parametrize('chunk_size', [1, 1000, 1000000])
+def test_unzip(compression, seekable, chunk_size):
+    assert unzip(make_zip(compression, seekable), chunk_size) == CONTENTS
+
+
+@pytest.mark.parametrize('seekable', [True, False])
+@pytest.mark.parametrize('chunk_size', [1, 4096])
+def test_unzip_zip64(seekable, chunk_size):
+    # Unseekable zip64 members end with 24 byte data descriptors
+    assert unzip(make_zip(zipfile.ZIP_DEFLATED, seekable, force_zip64=True),
+                 chunk_size) == CONTENTS
+
+
+def test_skip_member():
+    reader = zip_stream.ZipStreamReader(lambda name: None)
+    reader.feed(make_zip(zipfile.ZIP_DEFLATED))
+    reader.close()
+
+
+def test_large_output_is_chunked():
+    written = []
+    reader = zip_stream.ZipStreamReader(lambda name: written.append)
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('zeroes', bytes(10 * zip_stream.MAX_OUTPUT_CHUNK))
+    reader.feed(out.getvalue())
+    reader.close()
+    assert sum(len(chunk) for chunk in written)\
+        == 10 * zip_stream.MAX_OUTPUT_CHUNK
+    assert max(len(chunk) for chunk in written)\
+        <= zip_stream.MAX_OUTPUT_CHUNK
+
+
+def test_truncated():
+    data = make_zip(zipfile.ZIP_DEFLATED)
+    with pytest.raises(zip_stream.BadZip):
+        unzip(data[:len(data) // 2], 4096)
+
+
+def test_corrupted():
+    data = bytearray(make_zip(zipfile.ZIP_STORED))
+    data[1000] ^= 0xff
+    with pytest.raises(zip_stream.BadZip):
+        unzip(bytes(data), 4096)
+
+
+def test_not_a_zip():
+    with pytest.raises(zip_stream.BadZip):
+        unzip(os.urandom(1000), 4096)